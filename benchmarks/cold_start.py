@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+"""
+Benchmarks the cold-start costs of the SDK: the time taken (and memory used) to import each of its
+top-level packages, and the latency of the first call made through a new client (against a local
+stub server, so that only the SDK's own costs are measured). Every sample is taken in a new Python
+interpreter, so that nothing has already been imported.
+
+Results are written as JSON, so they can be compared across versions:
+
+    python benchmarks/cold_start.py --output current.json
+    python benchmarks/cold_start.py --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess  # nosec
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+# Packages whose import is timed, each in a new interpreter
+PACKAGES = [
+    "pyatlan.model.enums",
+    "pyatlan.model.fields",
+    "pyatlan.model.assets",
+    "pyatlan.client",
+    "pyatlan.client.atlan",
+]
+
+PEAK_RSS = """
+def peak_rss():
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, but in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+"""
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+{peak_rss}
+start = time.perf_counter()
+import {package}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "peak_rss_bytes": peak_rss(), "modules": len(sys.modules)}}))
+"""
+
+FIRST_CALL_SCRIPT = """
+import json
+import sys
+import time
+{peak_rss}
+start = time.perf_counter()
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.model.assets import Table
+from pyatlan.model.fluent_search import FluentSearch
+
+imported = time.perf_counter()
+client = AtlanClient(base_url=sys.argv[1], api_key="benchmark")
+created = time.perf_counter()
+request = FluentSearch().where(FluentSearch.asset_type(Table)).to_request()
+assert [asset.guid for asset in client.asset.search(request)] == ["benchmark"]
+called = time.perf_counter()
+print(
+    json.dumps(
+        {{
+            "import_seconds": imported - start,
+            "client_seconds": created - imported,
+            "call_seconds": called - created,
+            "total_seconds": called - start,
+            "peak_rss_bytes": peak_rss(),
+        }}
+    )
+)
+"""
+
+VERSION_SCRIPT = """
+import importlib.util
+import pathlib
+
+spec = importlib.util.find_spec("pyatlan")
+print((pathlib.Path(spec.origin).parent / "version.txt").read_text().strip())
+"""
+
+SEARCH_RESPONSE = {
+    "queryType": "INDEX",
+    "approximateCount": 1,
+    "entities": [
+        {
+            "typeName": "Table",
+            "guid": "benchmark",
+            "status": "ACTIVE",
+            "attributes": {
+                "qualifiedName": "default/snowflake/123/DB/SCHEMA/TABLE",
+                "name": "TABLE",
+            },
+        }
+    ],
+}
+
+LAST_PAGE = {"queryType": "INDEX", "approximateCount": 1, "entities": []}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Responds to searches with a single table, and to any other request with an error.
+    """
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path.rstrip("/").endswith("search/indexsearch"):
+            # Only the first page of results has any assets in it
+            first_page = not request.get("dsl", {}).get("from")
+            self._respond(200, SEARCH_RESPONSE if first_page else LAST_PAGE)
+        else:
+            self._respond(404, {"errorMessage": f"Not stubbed: {self.path}"})
+
+    def do_GET(self):
+        self._respond(404, {"errorMessage": f"Not stubbed: {self.path}"})
+
+    def _respond(self, status: int, body: Dict[str, Any]):
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_script(script: str, *args: str) -> Dict[str, Any]:
+    """
+    Run a script in a new interpreter.
+
+    :param script: source of the script, which must print its results as JSON
+    :param args: arguments to pass to the script
+    :returns: the results of the script
+    """
+    result = subprocess.run(  # nosec
+        [sys.executable, "-c", script, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize the samples of a benchmark.
+
+    :param samples: results of each run of the benchmark
+    :returns: the minimum, median and maximum of each of the benchmark's metrics, and every sample
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    for metric in samples[0]:
+        values = [sample[metric] for sample in samples]
+        if any(value is None for value in values):
+            summary[metric] = {
+                "min": None,
+                "median": None,
+                "max": None,
+                "samples": values,
+            }
+        else:
+            summary[metric] = {
+                "min": min(values),
+                "median": statistics.median(values),
+                "max": max(values),
+                "samples": values,
+            }
+    return summary
+
+
+def run(repeat: int, packages: List[str]) -> Dict[str, Any]:
+    """
+    Run every benchmark.
+
+    :param repeat: number of samples to take of each benchmark
+    :param packages: packages whose import to time
+    :returns: the results of the benchmarks, with details of the environment in which they ran
+    """
+    benchmarks = {}
+    for package in packages:
+        script = IMPORT_SCRIPT.format(peak_rss=PEAK_RSS, package=package)
+        benchmarks[f"import:{package}"] = summarize(
+            [run_script(script) for _ in range(repeat)]
+        )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        script = FIRST_CALL_SCRIPT.format(peak_rss=PEAK_RSS)
+        benchmarks["first_call:search"] = summarize(
+            [run_script(script, url) for _ in range(repeat)]
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return {
+        "version": version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "benchmarks": benchmarks,
+    }
+
+
+def version() -> str:
+    """
+    :returns: version of the SDK being benchmarked (as imported by a new interpreter)
+    """
+    return subprocess.run(  # nosec
+        [sys.executable, "-c", VERSION_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> bool:
+    """
+    Print how the median of each metric has changed since a baseline.
+
+    :param baseline: results of the benchmarks to compare against
+    :param current: results of the benchmarks now
+    :param threshold: largest increase of a median (as a proportion) that is not a regression
+    :returns: True if any metric has regressed by more than the threshold
+    """
+    regressed = False
+    print(f"Comparing {current['version']} against {baseline['version']}:")
+    for name, metrics in current["benchmarks"].items():
+        for metric, summary in metrics.items():
+            before = baseline["benchmarks"].get(name, {}).get(metric, {}).get("median")
+            after = summary["median"]
+            if not before or after is None:
+                continue
+            change = after / before - 1
+            flag = ""
+            if change > threshold:
+                regressed = True
+                flag = "  REGRESSION"
+            print(
+                f"  {name} {metric}: {before:.4g} -> {after:.4g} ({change:+.1%}){flag}"
+            )
+    return regressed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of samples of each benchmark"
+    )
+    parser.add_argument(
+        "--package",
+        action="append",
+        dest="packages",
+        help="package whose import to time (repeatable, defaults to the SDK's top-level packages)",
+    )
+    parser.add_argument("--output", help="file to which to write the results as JSON")
+    parser.add_argument("--compare", help="file of earlier results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="largest increase of a median (as a proportion) not reported as a regression",
+    )
+    args = parser.parse_args(argv)
+    results = run(args.repeat, args.packages or PACKAGES)
+    content = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(content)
+    if args.compare:
+        with open(args.compare) as baseline:
+            return int(compare(json.load(baseline), results, args.threshold))
+    if not args.output:
+        print(content)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
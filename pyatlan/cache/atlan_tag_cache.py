@@ -1,14 +1,45 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
-from threading import Lock
-from typing import Dict, Optional, Set
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, NamedTuple, Optional
 
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    new_translations,
+    translate_all,
+)
+from pyatlan.cache.single_flight import SingleFlight
+from pyatlan.cache.stats import CacheStats, MetricsCallback
+from pyatlan.cache.typedef_snapshot import TypeDefSnapshot, fingerprint, typedefs_of
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.errors import ErrorCode
 from pyatlan.model.enums import AtlanTypeCategory
-from pyatlan.model.typedef import AtlanTagDef
+from pyatlan.model.typedef import AtlanTagDef, TypeDefResponse
 
-lock: Lock = Lock()
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+
+CATEGORIES: List[AtlanTypeCategory] = [
+    AtlanTypeCategory.CLASSIFICATION,
+    AtlanTypeCategory.STRUCT,
+]
+
+
+class AtlanTagTranslations(NamedTuple):
+    """
+    Complete set of translations for Atlan tags, published as a whole when the cache is refreshed.
+    """
+
+    # Atlan tag definitions, by Atlan-internal ID string
+    cache_by_id: TranslationMap[str, AtlanTagDef]
+    # human-readable names of Atlan tags, by Atlan-internal ID string
+    map_id_to_name: TranslationMap[str, str]
+    # Atlan-internal ID strings of Atlan tags, by human-readable name
+    map_name_to_id: TranslationMap[str, str]
+    # Atlan-internal names of source tag attachment attributes, by Atlan tag ID string
+    map_id_to_source_tags_attr_id: TranslationMap[str, str]
 
 
 class AtlanTagCache:
@@ -17,18 +48,32 @@ class AtlanTagCache:
     for Atlan tags.
     """
 
-    caches: Dict[int, "AtlanTagCache"] = {}
+    # Atlan tags that could not be found are remembered until evicted, as they always have been
+    default_policy: ClassVar[CachePolicy] = CachePolicy(negative_ttl=None)
+    # Categories of type definitions from which the cache is populated
+    categories: ClassVar[List[AtlanTypeCategory]] = CATEGORIES
 
     @classmethod
-    def get_cache(cls) -> "AtlanTagCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "AtlanTagCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = AtlanTagCache(typedef_client=client.typedef)
-            return cls.caches[cache_key]
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "AtlanTagCache":
+        return AtlanTagCache(
+            typedef_client=client.typedef,
+            snapshot=client.typedef_snapshot,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
 
     @classmethod
     def refresh_cache(cls) -> None:
@@ -57,6 +102,28 @@ class AtlanTagCache:
         """
         return cls.get_cache()._get_name_for_id(idstr=idstr)
 
+    @classmethod
+    def get_ids_for_names(cls, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided human-readable Atlan tag names to their Atlan-internal ID strings,
+        refreshing the cache at most once for any that are not yet cached.
+
+        :param names: human-readable names of the Atlan tags
+        :returns: a dict from each name to the Atlan-internal ID string of the Atlan tag (or None if not found)
+        """
+        return cls.get_cache()._get_ids_for_names(names)
+
+    @classmethod
+    def get_names_for_ids(cls, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided Atlan-internal Atlan tag ID strings to their human-readable names,
+        refreshing the cache at most once for any that are not yet cached.
+
+        :param ids: Atlan-internal ID strings of the Atlan tags
+        :returns: a dict from each ID string to the human-readable name of the Atlan tag (or None if not found)
+        """
+        return cls.get_cache()._get_names_for_ids(ids)
+
     @classmethod
     def get_source_tags_attr_id(cls, id: str) -> Optional[str]:
         """
@@ -68,44 +135,80 @@ class AtlanTagCache:
         """
         return cls.get_cache()._get_source_tags_attr_id(id)
 
-    def __init__(self, typedef_client: TypeDefClient):
+    def __init__(
+        self,
+        typedef_client: TypeDefClient,
+        snapshot: Optional[TypeDefSnapshot] = None,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.typdef_client: TypeDefClient = typedef_client
-        self.cache_by_id: Dict[str, AtlanTagDef] = {}
-        self.map_id_to_name: Dict[str, str] = {}
-        self.map_name_to_id: Dict[str, str] = {}
-        self.deleted_ids: Set[str] = set()
-        self.deleted_names: Set[str] = set()
-        self.map_id_to_source_tags_attr_id: Dict[str, str] = {}
-        self.lock: Lock = Lock()
+        self.policy: CachePolicy = policy or AtlanTagCache.default_policy
+        self.stats: CacheStats = CacheStats(AtlanTagCache.__name__, metrics_callback)
+        self.translations: AtlanTagTranslations = new_translations(
+            AtlanTagTranslations, self.policy, self.stats
+        )
+        self.deleted_ids: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+        self.snapshot: Optional[TypeDefSnapshot] = snapshot
+        # Fingerprint of the type definitions from which the cache was last populated
+        self.fingerprint: Optional[str] = None
+        if snapshot is not None:
+            # Start from the persisted snapshot (if recent enough), rather than downloading every Atlan tag
+            if response := snapshot.load(CATEGORIES):
+                self._cache_response(response)
+
+    @property
+    def cache_by_id(self) -> TranslationMap[str, AtlanTagDef]:
+        return self.translations.cache_by_id
+
+    @property
+    def map_id_to_name(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_name
 
-    def _refresh_cache(self) -> None:
+    @property
+    def map_name_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_name_to_id
+
+    @property
+    def map_id_to_source_tags_attr_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_source_tags_attr_id
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
         """
         Refreshes the cache of Atlan tags by requesting the full set of Atlan tags from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
         """
-        with self.lock:
-            response = self.typdef_client.get(
-                type_category=[
-                    AtlanTypeCategory.CLASSIFICATION,
-                    AtlanTypeCategory.STRUCT,
-                ]
-            )
-            if not response or not response.struct_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-            if response is not None:
-                self.cache_by_id = {}
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                for atlan_tag in response.atlan_tag_defs:
-                    atlan_tag_id = atlan_tag.name
-                    atlan_tag_name = atlan_tag.display_name
-                    self.cache_by_id[atlan_tag_id] = atlan_tag
-                    self.map_id_to_name[atlan_tag_id] = atlan_tag_name
-                    self.map_name_to_id[atlan_tag_name] = atlan_tag_id
-                    sourceTagsId = ""
-                    for attr_def in atlan_tag.attribute_defs or []:
-                        if attr_def.display_name == "sourceTagAttachment":
-                            sourceTagsId = attr_def.name or ""
-                    self.map_id_to_source_tags_attr_id[atlan_tag_id] = sourceTagsId
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        response = self.typdef_client.get(type_category=CATEGORIES)
+        if not response or not response.struct_defs:
+            raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+        if self.snapshot is not None:
+            self.snapshot.save(CATEGORIES, response)
+        self._cache_response(response)
+
+    def _cache_response(self, response: TypeDefResponse) -> None:
+        translations = new_translations(AtlanTagTranslations, self.policy, self.stats)
+        for atlan_tag in response.atlan_tag_defs:
+            atlan_tag_id = atlan_tag.name
+            atlan_tag_name = atlan_tag.display_name
+            translations.cache_by_id[atlan_tag_id] = atlan_tag
+            translations.map_id_to_name[atlan_tag_id] = atlan_tag_name
+            translations.map_name_to_id[atlan_tag_name] = atlan_tag_id
+            sourceTagsId = ""
+            for attr_def in atlan_tag.attribute_defs or []:
+                if attr_def.display_name == "sourceTagAttachment":
+                    sourceTagsId = attr_def.name or ""
+            translations.map_id_to_source_tags_attr_id[atlan_tag_id] = sourceTagsId
+        self.translations = translations
+        self.fingerprint = fingerprint(typedefs_of(response, CATEGORIES))
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -114,10 +217,11 @@ class AtlanTagCache:
         :param name: human-readable name of the Atlan tag
         :returns: Atlan-internal ID string of the Atlan tag
         """
+        generation = self.refresher.generation
         cls_id = self.map_name_to_id.get(name)
         if not cls_id and name not in self.deleted_names:
             # If not found, refresh the cache and look again (could be stale)
-            self._refresh_cache()
+            self._refresh_cache(since=generation)
             cls_id = self.map_name_to_id.get(name)
             if not cls_id:
                 # If still not found after refresh, mark it as deleted (could be
@@ -133,10 +237,11 @@ class AtlanTagCache:
         :param idstr: Atlan-internal ID string of the Atlan tag
         :returns: human-readable name of the Atlan tag
         """
+        generation = self.refresher.generation
         cls_name = self.map_id_to_name.get(idstr)
         if not cls_name and idstr not in self.deleted_ids:
             # If not found, refresh the cache and look again (could be stale)
-            self._refresh_cache()
+            self._refresh_cache(since=generation)
             cls_name = self.map_id_to_name.get(idstr)
             if not cls_name:
                 # If still not found after refresh, mark it as deleted (could be
@@ -145,6 +250,36 @@ class AtlanTagCache:
                 self.deleted_ids.add(idstr)
         return cls_name
 
+    def _get_ids_for_names(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided human-readable Atlan tag names to their Atlan-internal ID strings.
+
+        :param names: human-readable names of the Atlan tags
+        :returns: a dict from each name to the Atlan-internal ID string of the Atlan tag (or None if not found)
+        """
+        generation = self.refresher.generation
+        return translate_all(
+            names,
+            lambda: self.map_name_to_id,
+            self.deleted_names,
+            lambda _: self._refresh_cache(since=generation),
+        )
+
+    def _get_names_for_ids(self, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided Atlan-internal Atlan tag ID strings to their human-readable names.
+
+        :param ids: Atlan-internal ID strings of the Atlan tags
+        :returns: a dict from each ID string to the human-readable name of the Atlan tag (or None if not found)
+        """
+        generation = self.refresher.generation
+        return translate_all(
+            ids,
+            lambda: self.map_id_to_name,
+            self.deleted_ids,
+            lambda _: self._refresh_cache(since=generation),
+        )
+
     def _get_source_tags_attr_id(self, id: str) -> Optional[str]:
         """
         Translate the provided Atlan-internal Atlan tag ID string to the Atlan-internal name of the attribute that
@@ -153,11 +288,12 @@ class AtlanTagCache:
         :param id: Atlan-internal ID string of the Atlan tag
         :returns: Atlan-internal ID string of the attribute containing source-synced tag attachment details
         """
+        generation = self.refresher.generation
         if id and id.strip():
             attr_id = self.map_id_to_source_tags_attr_id.get(id)
             if attr_id is not None or id in self.deleted_ids:
                 return attr_id
-            self.refresh_cache()
+            self._refresh_cache(since=generation)
             if attr_id := self.map_id_to_source_tags_attr_id.get(id):
                 return attr_id
             self.deleted_ids.add(id)
@@ -1,14 +1,60 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
-from threading import Lock
-from typing import Dict, List, Optional, Set
-
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    new_translations,
+    translate_all,
+)
+from pyatlan.cache.single_flight import SingleFlight
+from pyatlan.cache.stats import CacheStats, MetricsCallback
+from pyatlan.cache.typedef_snapshot import TypeDefSnapshot, fingerprint, typedefs_of
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.errors import ErrorCode
 from pyatlan.model.enums import AtlanTypeCategory
-from pyatlan.model.typedef import AttributeDef, CustomMetadataDef
+from pyatlan.model.typedef import AttributeDef, CustomMetadataDef, TypeDefResponse
+
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+CATEGORIES: List[AtlanTypeCategory] = [
+    AtlanTypeCategory.CUSTOM_METADATA,
+    AtlanTypeCategory.STRUCT,
+]
+
 
-lock = Lock()
+class CustomMetadataTranslations(NamedTuple):
+    """
+    Complete set of translations for custom metadata, published as a whole when the cache is refreshed.
+    """
+
+    # custom metadata definitions, by Atlan-internal ID string
+    cache_by_id: TranslationMap[str, CustomMetadataDef]
+    # attribute definitions, by Atlan-internal ID string
+    attr_cache_by_id: TranslationMap[str, AttributeDef]
+    # human-readable names of custom metadata sets, by Atlan-internal ID string
+    map_id_to_name: TranslationMap[str, str]
+    # Atlan-internal ID strings of custom metadata sets, by human-readable name
+    map_name_to_id: TranslationMap[str, str]
+    # human-readable attribute names by attribute ID, by set ID
+    map_attr_id_to_name: TranslationMap[str, Dict[str, str]]
+    # attribute IDs by human-readable attribute name, by set ID
+    map_attr_name_to_id: TranslationMap[str, Dict[str, str]]
+    # human-readable names of archived attributes, by attribute ID
+    archived_attr_ids: TranslationMap[str, str]
 
 
 class CustomMetadataCache:
@@ -17,21 +63,31 @@ class CustomMetadataCache:
     for custom metadata (including attributes).
     """
 
-    caches: Dict[int, "CustomMetadataCache"] = dict()
+    default_policy: ClassVar[CachePolicy] = CachePolicy()
+    # Categories of type definitions from which the cache is populated
+    categories: ClassVar[List[AtlanTypeCategory]] = CATEGORIES
 
     @classmethod
-    def get_cache(cls) -> "CustomMetadataCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "CustomMetadataCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = CustomMetadataCache(
-                    typedef_client=client.typedef
-                )
-            cache = cls.caches[cache_key]
-        return cache
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "CustomMetadataCache":
+        return CustomMetadataCache(
+            typedef_client=client.typedef,
+            snapshot=client.typedef_snapshot,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
 
     @classmethod
     def refresh_cache(cls) -> None:
@@ -114,6 +170,33 @@ class CustomMetadataCache:
         """
         return cls.get_cache()._get_attr_name_for_id(set_id=set_id, attr_id=attr_id)
 
+    @classmethod
+    def get_names_for_ids(cls, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided Atlan-internal custom metadata ID strings to their human-readable
+        custom metadata set names, refreshing the cache at most once for any that are not yet cached.
+
+        :param ids: Atlan-internal ID strings of the custom metadata sets
+        :returns: a dict from each ID string to the human-readable name of the set (or None if not found)
+        """
+        return cls.get_cache()._get_names_for_ids(ids)
+
+    @classmethod
+    def get_attr_names_for_ids(
+        cls, set_id: str, attr_ids: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Given the Atlan-internal ID string for the set and the Atlan-internal IDs for some of its attributes,
+        return the human-readable names of the attributes, refreshing the cache at most once for any that
+        are not yet cached.
+
+        :param set_id: Atlan-internal ID string for the custom metadata set
+        :param attr_ids: Atlan-internal ID strings for the attributes
+        :returns: a dict from each attribute ID string to the human-readable name of the attribute
+                  (or None if not found)
+        """
+        return cls.get_cache()._get_attr_names_for_ids(set_id=set_id, attr_ids=attr_ids)
+
     @classmethod
     def is_attr_archived(cls, attr_id: str) -> bool:
         """
@@ -173,63 +256,118 @@ class CustomMetadataCache:
         """
         return cls.get_cache()._get_attribute_def(attr_id=attr_id)
 
-    def __init__(self, typedef_client: TypeDefClient):
+    def __init__(
+        self,
+        typedef_client: TypeDefClient,
+        snapshot: Optional[TypeDefSnapshot] = None,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.typedef_client: TypeDefClient = typedef_client
-        self.cache_by_id: Dict[str, CustomMetadataDef] = {}
-        self.attr_cache_by_id: Dict[str, AttributeDef] = {}
-        self.map_id_to_name: Dict[str, str] = {}
-        self.map_name_to_id: Dict[str, str] = {}
-        self.map_attr_id_to_name: Dict[str, Dict[str, str]] = {}
-        self.map_attr_name_to_id: Dict[str, Dict[str, str]] = {}
-        self.archived_attr_ids: Dict[str, str] = {}
+        self.policy: CachePolicy = policy or CustomMetadataCache.default_policy
+        self.stats: CacheStats = CacheStats(
+            CustomMetadataCache.__name__, metrics_callback
+        )
+        self.translations: CustomMetadataTranslations = new_translations(
+            CustomMetadataTranslations, self.policy, self.stats
+        )
+        self.deleted_ids: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        # Attributes that could not be found, as (set ID, attribute name or ID)
+        self.deleted_attrs: NegativeCache[Tuple[str, str]] = NegativeCache(self.policy)
         self.types_by_asset: Dict[str, Set[type]] = {}
-        self.lock: Lock = Lock()
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+        self.snapshot: Optional[TypeDefSnapshot] = snapshot
+        # Fingerprint of the type definitions from which the cache was last populated
+        self.fingerprint: Optional[str] = None
+        if snapshot is not None:
+            # Start from the persisted snapshot (if recent enough), rather than downloading every structure
+            if response := snapshot.load(CATEGORIES):
+                self._cache_response(response)
+
+    @property
+    def cache_by_id(self) -> TranslationMap[str, CustomMetadataDef]:
+        return self.translations.cache_by_id
+
+    @property
+    def attr_cache_by_id(self) -> TranslationMap[str, AttributeDef]:
+        return self.translations.attr_cache_by_id
+
+    @property
+    def map_id_to_name(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_name
+
+    @property
+    def map_name_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_name_to_id
+
+    @property
+    def map_attr_id_to_name(self) -> TranslationMap[str, Dict[str, str]]:
+        return self.translations.map_attr_id_to_name
+
+    @property
+    def map_attr_name_to_id(self) -> TranslationMap[str, Dict[str, str]]:
+        return self.translations.map_attr_name_to_id
 
-    def _refresh_cache(self) -> None:
+    @property
+    def archived_attr_ids(self) -> TranslationMap[str, str]:
+        return self.translations.archived_attr_ids
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
         """
         Refreshes the cache of custom metadata structures by requesting the full set of custom metadata
         structures from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
         :raises LogicError: if duplicate custom attributes are detected
         """
-        with self.lock:
-            response = self.typedef_client.get(
-                type_category=[
-                    AtlanTypeCategory.CUSTOM_METADATA,
-                    AtlanTypeCategory.STRUCT,
-                ]
-            )
-            if not response or not response.struct_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-            if response is not None:
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                self.map_attr_id_to_name = {}
-                self.map_attr_name_to_id = {}
-                self.archived_attr_ids = {}
-                self.cache_by_id = {}
-                self.attr_cache_by_id = {}
-                for cm in response.custom_metadata_defs:
-                    type_id = cm.name
-                    type_name = cm.display_name
-                    self.cache_by_id[type_id] = cm
-                    self.map_id_to_name[type_id] = type_name
-                    self.map_name_to_id[type_name] = type_id
-                    self.map_attr_id_to_name[type_id] = {}
-                    self.map_attr_name_to_id[type_id] = {}
-                    if cm.attribute_defs:
-                        for attr in cm.attribute_defs:
-                            attr_id = str(attr.name)
-                            attr_name = str(attr.display_name)
-                            self.map_attr_id_to_name[type_id][attr_id] = attr_name
-                            self.attr_cache_by_id[attr_id] = attr
-                            if attr.options and attr.options.is_archived:
-                                self.archived_attr_ids[attr_id] = attr_name
-                            elif attr_name in self.map_attr_name_to_id[type_id]:
-                                raise ErrorCode.DUPLICATE_CUSTOM_ATTRIBUTES.exception_with_parameters(
-                                    attr_name, type_name
-                                )
-                            else:
-                                self.map_attr_name_to_id[type_id][attr_name] = attr_id
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        response = self.typedef_client.get(type_category=CATEGORIES)
+        if not response or not response.struct_defs:
+            raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+        if self.snapshot is not None:
+            self.snapshot.save(CATEGORIES, response)
+        self._cache_response(response)
+
+    def _cache_response(self, response: TypeDefResponse) -> None:
+        """
+        Replaces the contents of the cache with the custom metadata structures in the response.
+
+        :param response: custom metadata (and struct) type definitions
+        :raises LogicError: if duplicate custom attributes are detected
+        """
+        translations = new_translations(
+            CustomMetadataTranslations, self.policy, self.stats
+        )
+        for cm in response.custom_metadata_defs:
+            type_id = cm.name
+            type_name = cm.display_name
+            translations.cache_by_id[type_id] = cm
+            translations.map_id_to_name[type_id] = type_name
+            translations.map_name_to_id[type_name] = type_id
+            translations.map_attr_id_to_name[type_id] = {}
+            translations.map_attr_name_to_id[type_id] = {}
+            if cm.attribute_defs:
+                for attr in cm.attribute_defs:
+                    attr_id = str(attr.name)
+                    attr_name = str(attr.display_name)
+                    translations.map_attr_id_to_name[type_id][attr_id] = attr_name
+                    translations.attr_cache_by_id[attr_id] = attr
+                    if attr.options and attr.options.is_archived:
+                        translations.archived_attr_ids[attr_id] = attr_name
+                    elif attr_name in translations.map_attr_name_to_id[type_id]:
+                        raise ErrorCode.DUPLICATE_CUSTOM_ATTRIBUTES.exception_with_parameters(
+                            attr_name, type_name
+                        )
+                    else:
+                        translations.map_attr_name_to_id[type_id][attr_name] = attr_id
+        self.translations = translations
+        self.fingerprint = fingerprint(typedefs_of(response, CATEGORIES))
 
     def _get_id_for_name(self, name: str) -> str:
         """
@@ -240,14 +378,17 @@ class CustomMetadataCache:
         :raises InvalidRequestError: if no name was provided
         :raises NotFoundError: if the custom metadata cannot be found
         """
+        generation = self.refresher.generation
         if name is None or not name.strip():
             raise ErrorCode.MISSING_CM_NAME.exception_with_parameters()
         if cm_id := self.map_name_to_id.get(name):
             return cm_id
-        # If not found, refresh the cache and look again (could be stale)
-        self._refresh_cache()
-        if cm_id := self.map_name_to_id.get(name):
-            return cm_id
+        if name not in self.deleted_names:
+            # If not found, refresh the cache and look again (could be stale)
+            self._refresh_cache(since=generation)
+            if cm_id := self.map_name_to_id.get(name):
+                return cm_id
+            self.deleted_names.add(name)
         raise ErrorCode.CM_NOT_FOUND_BY_NAME.exception_with_parameters(name)
 
     def _get_name_for_id(self, idstr: str) -> str:
@@ -259,14 +400,17 @@ class CustomMetadataCache:
         :raises InvalidRequestError: if no ID was provided
         :raises NotFoundError: if the custom metadata cannot be found
         """
+        generation = self.refresher.generation
         if idstr is None or not idstr.strip():
             raise ErrorCode.MISSING_CM_ID.exception_with_parameters()
         if cm_name := self.map_id_to_name.get(idstr):
             return cm_name
-        # If not found, refresh the cache and look again (could be stale)
-        self._refresh_cache()
-        if cm_name := self.map_id_to_name.get(idstr):
-            return cm_name
+        if idstr not in self.deleted_ids:
+            # If not found, refresh the cache and look again (could be stale)
+            self._refresh_cache(since=generation)
+            if cm_name := self.map_id_to_name.get(idstr):
+                return cm_name
+            self.deleted_ids.add(idstr)
         raise ErrorCode.CM_NOT_FOUND_BY_ID.exception_with_parameters(idstr)
 
     def _get_all_custom_attributes(
@@ -284,8 +428,10 @@ class CustomMetadataCache:
         :returns: a dict from custom metadata set name to all details about its attributes
         :raises NotFoundError: if the custom metadata cannot be found
         """
-        if len(self.cache_by_id) == 0 or force_refresh:
+        if force_refresh:
             self._refresh_cache()
+        elif len(self.cache_by_id) == 0:
+            self._refresh_cache(since=self.refresher.generation)
         m = {}
         for type_id, cm in self.cache_by_id.items():
             type_name = self._get_name_for_id(type_id)
@@ -315,17 +461,20 @@ class CustomMetadataCache:
         :returns: Atlan-internal ID string for the attribute
         :raises NotFoundError: if the custom metadata attribute cannot be found
         """
+        generation = self.refresher.generation
         set_id = self._get_id_for_name(set_name)
         if sub_map := self.map_attr_name_to_id.get(set_id):
             if attr_id := sub_map.get(attr_name):
                 # If found, return straight away
                 return attr_id
-        # Otherwise, refresh the cache and look again (could be stale)
-        self._refresh_cache()
+        if (set_id, attr_name) not in self.deleted_attrs:
+            # Otherwise, refresh the cache and look again (could be stale)
+            self._refresh_cache(since=generation)
         if sub_map := self.map_attr_name_to_id.get(set_id):
             if attr_id := sub_map.get(attr_name):
                 # If found, return straight away
                 return attr_id
+            self.deleted_attrs.add((set_id, attr_name))
             raise ErrorCode.CM_ATTR_NOT_FOUND_BY_NAME.exception_with_parameters(
                 set_name
             )
@@ -341,17 +490,66 @@ class CustomMetadataCache:
         :returns: human-readable name of the attribute
         :raises NotFoundError: if the custom metadata attribute cannot be found
         """
+        generation = self.refresher.generation
         if sub_map := self.map_attr_id_to_name.get(set_id):
             if attr_name := sub_map.get(attr_id):
                 return attr_name
-            self._refresh_cache()
-            if sub_map := self.map_attr_id_to_name.get(set_id):
-                if attr_name := sub_map.get(attr_id):
-                    return attr_name
+            if (set_id, attr_id) not in self.deleted_attrs:
+                self._refresh_cache(since=generation)
+                if sub_map := self.map_attr_id_to_name.get(set_id):
+                    if attr_name := sub_map.get(attr_id):
+                        return attr_name
+                self.deleted_attrs.add((set_id, attr_id))
         raise ErrorCode.CM_ATTR_NOT_FOUND_BY_ID.exception_with_parameters(
             attr_id, set_id
         )
 
+    def _get_names_for_ids(self, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided Atlan-internal custom metadata ID strings to their human-readable
+        custom metadata set names.
+
+        :param ids: Atlan-internal ID strings of the custom metadata sets
+        :returns: a dict from each ID string to the human-readable name of the set (or None if not found)
+        """
+        generation = self.refresher.generation
+        return translate_all(
+            ids,
+            lambda: self.map_id_to_name,
+            self.deleted_ids,
+            lambda _: self._refresh_cache(since=generation),
+        )
+
+    def _get_attr_names_for_ids(
+        self, set_id: str, attr_ids: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Given the Atlan-internal ID string for the set and the Atlan-internal IDs for some of its attributes,
+        return the human-readable names of the attributes.
+
+        :param set_id: Atlan-internal ID string for the custom metadata set
+        :param attr_ids: Atlan-internal ID strings for the attributes
+        :returns: a dict from each attribute ID string to the human-readable name of the attribute
+                  (or None if not found)
+        """
+        generation = self.refresher.generation
+        sub_map = self.map_attr_id_to_name.get(set_id) or {}
+        names = {attr_id: sub_map.get(attr_id) for attr_id in attr_ids}
+        missing = [
+            attr_id
+            for attr_id, attr_name in names.items()
+            if attr_name is None and (set_id, attr_id) not in self.deleted_attrs
+        ]
+        if missing:
+            self._refresh_cache(since=generation)
+            sub_map = self.map_attr_id_to_name.get(set_id) or {}
+            for attr_id in missing:
+                if attr_name := sub_map.get(attr_id):
+                    names[attr_id] = attr_name
+                else:
+                    self.deleted_attrs.add((set_id, attr_id))
+        return names
+
     def _is_attr_archived(self, attr_id: str) -> bool:
         """
         Determine if an attribute id is archived
@@ -381,10 +579,11 @@ class CustomMetadataCache:
         :param set_name: human-readable name of the custom metadata set for which to retrieve attribute names
         :returns: a list of the attribute names, strictly useful for inclusion in search results
         """
+        generation = self.refresher.generation
         if set_id := self._get_id_for_name(set_name):
             if dot_names := self._get_attributes_for_search_results_(set_id):
                 return dot_names
-            self._refresh_cache()
+            self._refresh_cache(since=generation)
             return self._get_attributes_for_search_results_(set_id)
         return None
 
@@ -399,11 +598,16 @@ class CustomMetadataCache:
         :param attr_name: human-readable name of the attribute
         :returns: the attribute name, strictly useful for inclusion in search results
         """
+        generation = self.refresher.generation
         if set_id := self._get_id_for_name(set_name):
             if attr_id := self._get_attribute_for_search_results_(set_id, attr_name):
                 return attr_id
-            self._refresh_cache()
-            return self._get_attribute_for_search_results_(set_id, attr_name)
+            if (set_id, attr_name) in self.deleted_attrs:
+                return None
+            self._refresh_cache(since=generation)
+            if attr_id := self._get_attribute_for_search_results_(set_id, attr_name):
+                return attr_id
+            self.deleted_attrs.add((set_id, attr_name))
         return None
 
     def _get_custom_metadata_def(self, name: str) -> CustomMetadataDef:
@@ -430,10 +634,11 @@ class CustomMetadataCache:
         :raises InvalidRequestError: if no attribute ID was provided
         :raises NotFoundError: if the custom metadata attribute cannot be found
         """
+        generation = self.refresher.generation
         if not attr_id:
             raise ErrorCode.MISSING_CM_ATTR_ID.exception_with_parameters()
         if self.attr_cache_by_id is None:
-            self._refresh_cache()
+            self._refresh_cache(since=generation)
         if attr_def := self.attr_cache_by_id.get(attr_id):
             return attr_def
         raise ErrorCode.CM_ATTR_NOT_FOUND_BY_ID.exception_with_parameters(
@@ -1,14 +1,35 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2023 Atlan Pte. Ltd.
-from threading import Lock
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, ClassVar, List, NamedTuple, Optional
 
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    new_translations,
+)
+from pyatlan.cache.single_flight import SingleFlight
+from pyatlan.cache.stats import CacheStats, MetricsCallback
+from pyatlan.cache.typedef_snapshot import TypeDefSnapshot, fingerprint, typedefs_of
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.errors import ErrorCode
 from pyatlan.model.enums import AtlanTypeCategory
-from pyatlan.model.typedef import EnumDef
+from pyatlan.model.typedef import EnumDef, TypeDefResponse
 
-lock: Lock = Lock()
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+
+CATEGORIES: List[AtlanTypeCategory] = [AtlanTypeCategory.ENUM]
+
+
+class EnumTranslations(NamedTuple):
+    """
+    Complete set of translations for enumerations, published as a whole when the cache is refreshed.
+    """
+
+    # enumeration definitions, by name
+    cache_by_name: TranslationMap[str, EnumDef]
 
 
 class EnumCache:
@@ -16,18 +37,31 @@ class EnumCache:
     Lazily-loaded cache for accessing details of an enumeration.
     """
 
-    caches: Dict[int, "EnumCache"] = {}
+    default_policy: ClassVar[CachePolicy] = CachePolicy()
+    # Categories of type definitions from which the cache is populated
+    categories: ClassVar[List[AtlanTypeCategory]] = CATEGORIES
 
     @classmethod
-    def get_cache(cls) -> "EnumCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "EnumCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = EnumCache(typedef_client=client.typedef)
-            return cls.caches[cache_key]
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "EnumCache":
+        return EnumCache(
+            typedef_client=client.typedef,
+            snapshot=client.typedef_snapshot,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
 
     @classmethod
     def refresh_cache(cls) -> None:
@@ -49,24 +83,59 @@ class EnumCache:
             raise ErrorCode.ENUM_NOT_FOUND.exception_with_parameters(name)
         return enum
 
-    def __init__(self, typedef_client: TypeDefClient):
+    def __init__(
+        self,
+        typedef_client: TypeDefClient,
+        snapshot: Optional[TypeDefSnapshot] = None,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.typedef_client: TypeDefClient = typedef_client
-        self.cache_by_name: Dict[str, EnumDef] = {}
-        self.lock: Lock = Lock()
+        self.policy: CachePolicy = policy or EnumCache.default_policy
+        self.stats: CacheStats = CacheStats(EnumCache.__name__, metrics_callback)
+        self.translations: EnumTranslations = new_translations(
+            EnumTranslations, self.policy, self.stats
+        )
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+        self.snapshot: Optional[TypeDefSnapshot] = snapshot
+        # Fingerprint of the type definitions from which the cache was last populated
+        self.fingerprint: Optional[str] = None
+        if snapshot is not None:
+            # Start from the persisted snapshot (if recent enough), rather than downloading every enumeration
+            if response := snapshot.load(CATEGORIES):
+                self._cache_response(response)
 
-    def _refresh_cache(self) -> None:
+    @property
+    def cache_by_name(self) -> TranslationMap[str, EnumDef]:
+        return self.translations.cache_by_name
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
         """
         Refreshes the cache of enumerations by requesting the full set of enumerations from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
         """
-        with self.lock:
-            response = self.typedef_client.get(type_category=AtlanTypeCategory.ENUM)
-            if not response or not response.enum_defs:
-                raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
-            self.cache_by_name = {}
-            if response is not None:
-                for enum in response.enum_defs:
-                    type_name = enum.name
-                    self.cache_by_name[type_name] = enum
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        response = self.typedef_client.get(type_category=CATEGORIES)
+        if not response or not response.enum_defs:
+            raise ErrorCode.EXPIRED_API_TOKEN.exception_with_parameters()
+        if self.snapshot is not None:
+            self.snapshot.save(CATEGORIES, response)
+        self._cache_response(response)
+
+    def _cache_response(self, response: TypeDefResponse) -> None:
+        translations = new_translations(EnumTranslations, self.policy, self.stats)
+        for enum in response.enum_defs:
+            type_name = enum.name
+            translations.cache_by_name[type_name] = enum
+        self.translations = translations
+        self.fingerprint = fingerprint(typedefs_of(response, CATEGORIES))
 
     def _get_by_name(self, name: str) -> Optional[EnumDef]:
         """
@@ -75,9 +144,14 @@ class EnumCache:
         :param name: human-readable name of the enumeration
         :returns: the enumeration definition
         """
+        generation = self.refresher.generation
         if name:
             if enum_def := self.cache_by_name.get(name):
                 return enum_def
-            self._refresh_cache()
-            return self.cache_by_name.get(name)
+            if name in self.deleted_names:
+                return None
+            self._refresh_cache(since=generation)
+            if enum_def := self.cache_by_name.get(name):
+                return enum_def
+            self.deleted_names.add(name)
         return None
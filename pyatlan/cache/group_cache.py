@@ -1,11 +1,36 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+from json import dumps
 from threading import Lock
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, ClassVar, Iterable, List, NamedTuple, Optional
 
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    copy_translations,
+    new_translations,
+)
+from pyatlan.cache.single_flight import SingleFlight, SingleFlightGroup
+from pyatlan.cache.stats import CacheStats, MetricsCallback
 from pyatlan.client.group import GroupClient
+from pyatlan.model.group import AtlanGroup
 
-lock: Lock = Lock()
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+
+class GroupTranslations(NamedTuple):
+    """
+    Complete set of translations for groups, published as a whole when the cache is refreshed.
+    """
+
+    # internal names of groups, by GUID
+    map_id_to_name: TranslationMap[str, str]
+    # GUIDs of groups, by internal name
+    map_name_to_id: TranslationMap[str, str]
+    # GUIDs of groups, by name as it appears in the UI
+    map_alias_to_id: TranslationMap[str, str]
 
 
 class GroupCache:
@@ -13,18 +38,35 @@ class GroupCache:
     Lazily-loaded cache for translating Atlan-internal groups into their various IDs.
     """
 
-    caches: Dict[int, "GroupCache"] = {}
+    default_policy: ClassVar[CachePolicy] = CachePolicy()
 
     @classmethod
-    def get_cache(cls) -> "GroupCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "GroupCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = GroupCache(group_client=client.group)
-            return cls.caches[cache_key]
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "GroupCache":
+        return GroupCache(
+            group_client=client.group,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
+
+    @classmethod
+    def refresh_cache(cls) -> None:
+        """
+        Refreshes the cache of groups by requesting the full set of groups from Atlan.
+        """
+        cls.get_cache()._refresh_cache()
 
     @classmethod
     def get_id_for_name(cls, name: str) -> Optional[str]:
@@ -65,27 +107,93 @@ class GroupCache:
         """
         return cls.get_cache()._validate_aliases(aliases)
 
-    def __init__(self, group_client: GroupClient):
+    def __init__(
+        self,
+        group_client: GroupClient,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.group_client: GroupClient = group_client
-        self.map_id_to_name: Dict[str, str] = {}
-        self.map_name_to_id: Dict[str, str] = {}
-        self.map_alias_to_id: Dict[str, str] = {}
-        self.lock: Lock = Lock()
-
-    def _refresh_cache(self) -> None:
-        with self.lock:
-            groups = self.group_client.get_all()
-            if groups is not None:
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                self.map_alias_to_id = {}
-                for group in groups:
-                    group_id = str(group.id)
-                    group_name = str(group.name)
-                    group_alias = str(group.alias)
-                    self.map_id_to_name[group_id] = group_name
-                    self.map_name_to_id[group_name] = group_id
-                    self.map_alias_to_id[group_alias] = group_id
+        self.policy: CachePolicy = policy or GroupCache.default_policy
+        self.stats: CacheStats = CacheStats(GroupCache.__name__, metrics_callback)
+        self.translations: GroupTranslations = new_translations(
+            GroupTranslations, self.policy, self.stats
+        )
+        self.deleted_ids: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_aliases: NegativeCache[str] = NegativeCache(self.policy)
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+        self.lookups: SingleFlightGroup = SingleFlightGroup(self.stats)
+        # Serializes publishing the translations, so that refreshes and lookups never overwrite each other
+        self.publishing: Lock = Lock()
+
+    @property
+    def map_id_to_name(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_name
+
+    @property
+    def map_name_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_name_to_id
+
+    @property
+    def map_alias_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_alias_to_id
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of groups by requesting the full set of groups from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
+        """
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        groups = self.group_client.get_all()
+        if groups is not None:
+            translations = new_translations(GroupTranslations, self.policy, self.stats)
+            self._cache_groups(groups, translations)
+            with self.publishing:
+                self.translations = translations
+
+    def _cache_groups(
+        self, groups: List[AtlanGroup], translations: GroupTranslations
+    ) -> None:
+        for group in groups:
+            group_id = str(group.id)
+            group_name = str(group.name)
+            group_alias = str(group.alias)
+            translations.map_id_to_name[group_id] = group_name
+            translations.map_name_to_id[group_name] = group_id
+            translations.map_alias_to_id[group_alias] = group_id
+            self.deleted_ids.discard(group_id)
+            self.deleted_names.discard(group_name)
+            self.deleted_aliases.discard(group_alias)
+
+    def _lookup(self, field: str, value: str) -> None:
+        """
+        Looks up only the group(s) with the given value for a field, adding them to the cache,
+        rather than refreshing the full set of groups. Concurrent lookups of the same group are coalesced.
+
+        :param field: field by which to look up the group (id, name or alias)
+        :param value: value of the field for the group to look up
+        """
+
+        def lookup():
+            # Filter on the exact value (even for aliases, which get_by_name would only match as a substring)
+            groups = self.group_client.get(
+                limit=1, post_filter=dumps({field: value})
+            ).records
+            if groups:
+                # Extend a copy of the latest translations, so that a refresh published meanwhile is not lost
+                with self.publishing:
+                    translations = copy_translations(self.translations)
+                    self._cache_groups(groups, translations)
+                    self.translations = translations
+
+        self.lookups.run((field, value), lookup)
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -96,8 +204,13 @@ class GroupCache:
         """
         if group_id := self.map_name_to_id.get(name):
             return group_id
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        if name in self.deleted_names:
+            return None
+        self._lookup("name", name)
+        if group_id := self.map_name_to_id.get(name):
+            return group_id
+        self.deleted_names.add(name)
+        return None
 
     def _get_id_for_alias(self, alias: str) -> Optional[str]:
         """
@@ -108,8 +221,13 @@ class GroupCache:
         """
         if group_id := self.map_alias_to_id.get(alias):
             return group_id
-        self._refresh_cache()
-        return self.map_alias_to_id.get(alias)
+        if alias in self.deleted_aliases:
+            return None
+        self._lookup("alias", alias)
+        if group_id := self.map_alias_to_id.get(alias):
+            return group_id
+        self.deleted_aliases.add(alias)
+        return None
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -120,8 +238,13 @@ class GroupCache:
         """
         if group_name := self.map_id_to_name.get(idstr):
             return group_name
-        self._refresh_cache()
-        return self.map_id_to_name.get(idstr)
+        if idstr in self.deleted_ids:
+            return None
+        self._lookup("id", idstr)
+        if group_name := self.map_id_to_name.get(idstr):
+            return group_name
+        self.deleted_ids.add(idstr)
+        return None
 
     def _validate_aliases(self, aliases: Iterable[str]):
         """
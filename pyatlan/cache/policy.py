@@ -0,0 +1,270 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import dataclasses
+import math
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from pyatlan.cache.stats import CacheStats
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T", bound=tuple)
+
+
+@dataclasses.dataclass(frozen=True)
+class CachePolicy:
+    """
+    Controls how long, and how many, translations are held by a cache. To change the policy
+    of a cache, set it on the cache's class before the cache is first used, for example:
+    UserCache.default_policy = CachePolicy(ttl=3600, max_entries=10000)
+    """
+
+    # Seconds for which each translation is used before it must be refreshed (None: forever)
+    ttl: Optional[float] = None
+    # Maximum number of translations of each kind to hold, evicting the least-recently used
+    # first (None: unbounded)
+    max_entries: Optional[int] = None
+    # Seconds for which a translation that could not be found is remembered, so repeated
+    # lookups of it do not each refresh the cache (None: until evicted, 0: never remembered)
+    negative_ttl: Optional[float] = 0
+    # Maximum number of translations that could not be found to remember
+    max_negative_entries: int = 1000
+
+
+def _expiry(ttl: Optional[float]) -> float:
+    return math.inf if ttl is None else time.monotonic() + ttl
+
+
+class TranslationMap(MutableMapping[K, V], Generic[K, V]):
+    """
+    Mapping that holds translations according to a cache policy: each translation expires once it
+    is older than the policy's TTL, and once the policy's maximum number of entries is exceeded the
+    least-recently used translations are evicted.
+    """
+
+    def __init__(
+        self,
+        policy: CachePolicy,
+        entries: Optional[Dict[K, V]] = None,
+        stats: Optional["CacheStats"] = None,
+    ):
+        """
+        :param policy: policy under which to hold the translations
+        :param entries: any initial translations
+        :param stats: statistics in which to count each lookup as a hit or miss
+        """
+        self._policy = policy
+        self._stats = stats
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        # Guards every change to the entries (including to their order), so that concurrent
+        # lookups of a bounded map neither fail nor lose entries
+        self._lock = Lock()
+        for key, value in (entries or {}).items():
+            self[key] = value
+
+    def __getitem__(self, key: K) -> V:
+        try:
+            expires, value = self._entries[key]
+        except KeyError:
+            if self._stats is not None:
+                self._stats.record_miss()
+            raise
+        if expires < time.monotonic():
+            with self._lock:
+                self._entries.pop(key, None)
+            if self._stats is not None:
+                self._stats.record_miss()
+            raise KeyError(key)
+        if self._stats is not None:
+            self._stats.hits += 1
+        if self._policy.max_entries is not None:
+            with self._lock:
+                # Unless evicted by another thread since it was read
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V):
+        with self._lock:
+            self._entries[key] = (_expiry(self._policy.ttl), value)
+            max_entries = self._policy.max_entries
+            if max_entries is not None:
+                self._entries.move_to_end(key)
+                while len(self._entries) > max_entries:
+                    self._entries.popitem(last=False)
+
+    def __delitem__(self, key: K):
+        with self._lock:
+            del self._entries[key]
+
+    def copy(self) -> "TranslationMap[K, V]":
+        """
+        :returns: a new map holding the same translations (each expiring when it would have in this map),
+                  under the same policy
+        """
+        copied: TranslationMap[K, V] = TranslationMap(self._policy, stats=self._stats)
+        with self._lock:
+            copied._entries = self._entries.copy()
+        return copied
+
+    def _live_keys(self):
+        now = time.monotonic()
+        with self._lock:
+            entries = list(self._entries.items())
+        return [key for key, (expires, _) in entries if expires >= now]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._live_keys())
+
+    def __len__(self) -> int:
+        return len(self._live_keys())
+
+    def __repr__(self) -> str:
+        return f"TranslationMap({dict(self.items())!r})"
+
+
+class NegativeCache(Generic[K]):
+    """
+    Bounded set of translations that could not be found, each remembered for the policy's
+    negative TTL so that repeated lookups of them do not each refresh the cache.
+    """
+
+    def __init__(self, policy: CachePolicy):
+        """
+        :param policy: policy under which to remember translations that could not be found
+        """
+        self._policy = policy
+        self._expiries: "OrderedDict[K, float]" = OrderedDict()
+        # Guards every change to the translations remembered (including to their order), so that
+        # concurrent lookups neither fail nor lose track of the least-recently remembered
+        self._lock = Lock()
+
+    def add(self, key: K):
+        """
+        Remember that a translation could not be found.
+
+        :param key: the translation that could not be found
+        """
+        if self._policy.negative_ttl == 0:
+            return
+        with self._lock:
+            self._expiries[key] = _expiry(self._policy.negative_ttl)
+            self._expiries.move_to_end(key)
+            while len(self._expiries) > self._policy.max_negative_entries:
+                self._expiries.popitem(last=False)
+
+    def discard(self, key: K):
+        """
+        Forget that a translation could not be found.
+
+        :param key: the translation to forget
+        """
+        with self._lock:
+            self._expiries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._expiries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        expires = self._expiries.get(key)  # type: ignore[arg-type]
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            with self._lock:
+                # Unless remembered again by another thread since it was read
+                if self._expiries.get(key) == expires:  # type: ignore[arg-type]
+                    del self._expiries[key]  # type: ignore[arg-type]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+
+def new_translations(
+    translations_type: Type[T],
+    policy: CachePolicy,
+    stats: Optional["CacheStats"] = None,
+) -> T:
+    """
+    Create a set of empty translation maps, to be populated and then published as a whole.
+    Caches publish their translations by replacing the set in a single assignment, so that
+    readers (which never lock) always see a complete set of translations, never a partial one.
+
+    :param translations_type: named tuple type whose every field is a translation map
+    :param policy: policy under which to hold the translations
+    :param stats: statistics in which to count each lookup of the translations as a hit or miss
+    :returns: a new set of empty translation maps
+    """
+    return translations_type(  # type: ignore[call-arg]
+        *(
+            TranslationMap(policy, stats=stats)
+            for _ in translations_type._fields  # type: ignore[attr-defined]
+        )
+    )
+
+
+def copy_translations(translations: T) -> T:
+    """
+    Copy a set of translation maps, to be extended and then published in place of the original.
+    Caches extend their translations this way (rather than changing the published maps), so that
+    a set of translations never changes once it has been published.
+
+    :param translations: set of translation maps to copy
+    :returns: a new set of the same translation maps
+    """
+    return type(translations)(
+        *(translation_map.copy() for translation_map in translations)
+    )
+
+
+def translate_all(
+    keys: Iterable[K],
+    translations: Callable[[], Mapping[K, V]],
+    deleted: NegativeCache[K],
+    refresh: Callable[[List[K]], None],
+) -> Dict[K, Optional[V]]:
+    """
+    Translate a batch of keys in a single pass over the current translations, refreshing (at most once)
+    for all the keys that could not be found, rather than once for each of them.
+
+    :param keys: the keys to translate
+    :param translations: function returning the current translations
+    :param deleted: translations that could not be found, to skip and to add any still not found to
+    :param refresh: function that refreshes the translations of the given keys
+    :returns: a dict from each key to its translation (or None if it could not be found)
+    """
+    current = translations()
+    results: Dict[K, Optional[V]] = {key: current.get(key) for key in keys}
+    missing = [
+        key for key, value in results.items() if value is None and key not in deleted
+    ]
+    if missing:
+        refresh(missing)
+        current = translations()
+        for key in missing:
+            if (value := current.get(key)) is not None:
+                results[key] = value
+            else:
+                deleted.add(key)
+    return results
@@ -0,0 +1,209 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import logging
+import time
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Union
+
+from pyatlan.cache.atlan_tag_cache import AtlanTagCache
+from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
+from pyatlan.cache.enum_cache import EnumCache
+from pyatlan.cache.typedef_snapshot import fingerprint
+from pyatlan.client.typedef import TypeDefClient
+from pyatlan.model.enums import AtlanTypeCategory
+
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+    from pyatlan.model.events import AtlanEvent
+
+LOGGER = logging.getLogger(__name__)
+
+TypeDefCache = Union[AtlanTagCache, CustomMetadataCache, EnumCache]
+
+
+class CacheRefresher:
+    """
+    Keeps the type definition caches of a client warm in the background, so that changes to type
+    definitions are picked up without waiting for a lookup to miss (and without that lookup having
+    to wait for the refresh). Every poll_interval the refresher cheaply checks whether any type
+    definitions have been added or removed, and refreshes only the caches affected. Changes within
+    an existing type definition (for example, a renamed custom metadata attribute) cannot be detected
+    this way: they are picked up when the type definition is changed through this SDK, when a webhook
+    event refers to them, or (if a refresh_interval is given) by periodically refreshing every cache.
+    Lookups continue to be served from the current translations while any refresh runs.
+    """
+
+    def __init__(
+        self,
+        typedef_client: TypeDefClient,
+        caches: Iterable[TypeDefCache],
+        poll_interval: float = 30.0,
+        refresh_interval: Optional[float] = None,
+    ):
+        """
+        :param typedef_client: client through which to check for changes to type definitions
+        :param caches: the caches to keep warm
+        :param poll_interval: number of seconds between each check for changes to type definitions
+        :param refresh_interval: number of seconds after which to fully refresh each cache, even if no
+                                 changes have been detected (by default, caches are only refreshed on changes)
+        """
+        self.typedef_client = typedef_client
+        self.caches: List[TypeDefCache] = list(caches)
+        self.poll_interval = poll_interval
+        self.refresh_interval = refresh_interval
+        self._lock = Lock()
+        self._invalidated: Set[int] = set()
+        self._refreshed_at: Dict[int, float] = {}
+        self._wake = Event()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @classmethod
+    def for_client(
+        cls,
+        client: "AtlanClient",
+        poll_interval: float = 30.0,
+        refresh_interval: Optional[float] = None,
+    ) -> "CacheRefresher":
+        """
+        Create a refresher for all the type definition caches of a client.
+
+        :param client: client whose caches to keep warm
+        :param poll_interval: number of seconds between each check for changes to type definitions
+        :param refresh_interval: number of seconds after which to fully refresh each cache, even if no
+                                 changes have been detected (by default, caches are only refreshed on changes)
+        :returns: the (not yet started) refresher
+        """
+        return cls(
+            typedef_client=client.typedef,
+            caches=[
+                AtlanTagCache.get_cache(client),
+                CustomMetadataCache.get_cache(client),
+                EnumCache.get_cache(client),
+            ],
+            poll_interval=poll_interval,
+            refresh_interval=refresh_interval,
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "CacheRefresher":
+        """
+        Start refreshing the caches in the background (in a daemon thread).
+
+        :returns: the refresher
+        """
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = Thread(
+                    target=self._run, name="pyatlan-cache-refresher", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop refreshing the caches in the background, waiting for any refresh in progress to complete.
+
+        :param timeout: maximum number of seconds to wait for a refresh in progress to complete
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def invalidate(self, *categories: AtlanTypeCategory) -> None:
+        """
+        Mark the caches populated from the given categories of type definitions as stale, so that they
+        are refreshed in the background as soon as possible. If the refresher is not running, the caches
+        are instead refreshed immediately.
+
+        :param categories: categories of type definitions that have changed (by default, all of them)
+        """
+        caches = [
+            cache
+            for cache in self.caches
+            if not categories or set(categories) & set(cache.categories)
+        ]
+        if not self.running:
+            for cache in caches:
+                cache._refresh_cache()
+            return
+        with self._lock:
+            self._invalidated.update(id(cache) for cache in caches)
+        self._wake.set()
+
+    def observe(self, event: "AtlanEvent") -> None:
+        """
+        Check a webhook event for references to custom metadata that is not yet cached, and if there are any
+        invalidate the custom metadata cache, so that it has been refreshed by the time the event is handled.
+
+        :param event: the event received from Atlan
+        """
+        from pyatlan.model.events import CustomMetadataUpdatePayload
+
+        payload = event.payload
+        if isinstance(payload, CustomMetadataUpdatePayload):
+            names = (payload.mutated_details or {}).keys()
+            for cache in self.caches:
+                if isinstance(cache, CustomMetadataCache) and any(
+                    name not in cache.map_name_to_id for name in names
+                ):
+                    self.invalidate(AtlanTypeCategory.CUSTOM_METADATA)
+                    return
+
+    def poll(self) -> None:
+        """
+        Refresh any caches that have been invalidated, are due a periodic refresh, or whose type definitions
+        have been added to or removed from Atlan since they were last refreshed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            stale = set(self._invalidated)
+            self._invalidated.clear()
+        if self.refresh_interval is not None:
+            stale.update(
+                id(cache)
+                for cache in self.caches
+                if now - self._refreshed_at.get(id(cache), now) >= self.refresh_interval
+            )
+        if unchecked := [cache for cache in self.caches if id(cache) not in stale]:
+            categories = sorted(
+                {category for cache in unchecked for category in cache.categories},
+                key=lambda category: category.value,
+            )
+            headers = self.typedef_client.get_headers(type_category=categories)
+            for cache in unchecked:
+                cache_categories = {category.value for category in cache.categories}
+                current = fingerprint(
+                    header for header in headers if header.category in cache_categories
+                )
+                if current != cache.fingerprint:
+                    stale.add(id(cache))
+        for cache in self.caches:
+            self._refreshed_at.setdefault(id(cache), now)
+            if id(cache) not in stale:
+                continue
+            try:
+                cache._refresh_cache()
+            except Exception as err:
+                LOGGER.warning("Unable to refresh %s: %s", type(cache).__name__, err)
+                # Try again on the next poll
+                with self._lock:
+                    self._invalidated.add(id(cache))
+            else:
+                self._refreshed_at[id(cache)] = time.monotonic()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.poll()
+            except Exception as err:
+                LOGGER.warning("Unable to refresh caches in the background: %s", err)
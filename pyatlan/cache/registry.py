@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Type, TypeVar
+
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+C = TypeVar("C")
+
+
+class CacheRegistry:
+    """
+    Caches owned by a single client, each constructed lazily the first time it is used. The registry
+    is held only by its client, so that discarding the client releases the registry and all of its
+    caches (which refer back to the client, so are collected along with it), rather than leaving them
+    in a global registry.
+    """
+
+    def __init__(self, client: "AtlanClient"):
+        """
+        :param client: client that owns the caches
+        """
+        self._client = client
+        self._lock = Lock()
+        self._caches: Dict[type, Any] = {}
+
+    def get(self, cache_type: Type[C], create: Callable[["AtlanClient"], C]) -> C:
+        """
+        Retrieve the client's cache of the given type, creating it if it does not yet exist.
+
+        :param cache_type: type of cache to retrieve
+        :param create: function that creates the cache for the client
+        :returns: the client's cache of that type
+        """
+        # Only lock (per client) to create the cache, so that lookups never contend on the lock
+        if (cache := self._caches.get(cache_type)) is None:
+            with self._lock:
+                if (cache := self._caches.get(cache_type)) is None:
+                    cache = self._caches[cache_type] = create(self._client)
+        return cache
+
+    def __contains__(self, cache_type: object) -> bool:
+        return cache_type in self._caches
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._caches.values()))
+
+    def __len__(self) -> int:
+        return len(self._caches)
@@ -1,12 +1,33 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
-from threading import Lock
-from typing import Dict, Iterable, Optional
-
+from typing import TYPE_CHECKING, ClassVar, Iterable, NamedTuple, Optional
+
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    new_translations,
+)
+from pyatlan.cache.single_flight import SingleFlight
+from pyatlan.cache.stats import CacheStats, MetricsCallback
 from pyatlan.client.role import RoleClient
 from pyatlan.model.role import AtlanRole
 
-lock: Lock = Lock()
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+
+class RoleTranslations(NamedTuple):
+    """
+    Complete set of translations for roles, published as a whole when the cache is refreshed.
+    """
+
+    # roles, by GUID
+    cache_by_id: TranslationMap[str, AtlanRole]
+    # names of roles, by GUID
+    map_id_to_name: TranslationMap[str, str]
+    # GUIDs of roles, by name
+    map_name_to_id: TranslationMap[str, str]
 
 
 class RoleCache:
@@ -14,18 +35,28 @@ class RoleCache:
     Lazily-loaded cache for translating Atlan-internal roles into their various IDs.
     """
 
-    caches: Dict[int, "RoleCache"] = {}
+    default_policy: ClassVar[CachePolicy] = CachePolicy()
 
     @classmethod
-    def get_cache(cls) -> "RoleCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "RoleCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = RoleCache(role_client=client.role)
-            return cls.caches[cache_key]
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "RoleCache":
+        return RoleCache(
+            role_client=client.role,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
 
     @classmethod
     def get_id_for_name(cls, name: str) -> Optional[str]:
@@ -56,28 +87,58 @@ class RoleCache:
         """
         return cls.get_cache()._validate_idstrs(idstrs=idstrs)
 
-    def __init__(self, role_client: RoleClient):
+    def __init__(
+        self,
+        role_client: RoleClient,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.role_client: RoleClient = role_client
-        self.cache_by_id: Dict[str, AtlanRole] = {}
-        self.map_id_to_name: Dict[str, str] = {}
-        self.map_name_to_id: Dict[str, str] = {}
-        self.lock: Lock = Lock()
-
-    def _refresh_cache(self) -> None:
-        with self.lock:
-            response = self.role_client.get(
-                limit=100, post_filter='{"name":{"$ilike":"$%"}}'
-            )
-            if response is not None:
-                self.cache_by_id = {}
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                for role in response.records:
-                    role_id = role.id
-                    role_name = role.name
-                    self.cache_by_id[role_id] = role
-                    self.map_id_to_name[role_id] = role_name
-                    self.map_name_to_id[role_name] = role_id
+        self.policy: CachePolicy = policy or RoleCache.default_policy
+        self.stats: CacheStats = CacheStats(RoleCache.__name__, metrics_callback)
+        self.translations: RoleTranslations = new_translations(
+            RoleTranslations, self.policy, self.stats
+        )
+        self.deleted_ids: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+
+    @property
+    def cache_by_id(self) -> TranslationMap[str, AtlanRole]:
+        return self.translations.cache_by_id
+
+    @property
+    def map_id_to_name(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_name
+
+    @property
+    def map_name_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_name_to_id
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of roles by requesting the full set of roles from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
+        """
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        response = self.role_client.get(
+            limit=100, post_filter='{"name":{"$ilike":"$%"}}'
+        )
+        if response is not None:
+            translations = new_translations(RoleTranslations, self.policy, self.stats)
+            for role in response.records:
+                role_id = role.id
+                role_name = role.name
+                translations.cache_by_id[role_id] = role
+                translations.map_id_to_name[role_id] = role_name
+                translations.map_name_to_id[role_name] = role_id
+            self.translations = translations
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -86,10 +147,16 @@ class RoleCache:
         :param name: human-readable name of the role
         :returns: unique identifier (GUID) of the role
         """
+        generation = self.refresher.generation
         if role_id := self.map_name_to_id.get(name):
             return role_id
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        if name in self.deleted_names:
+            return None
+        self._refresh_cache(since=generation)
+        if role_id := self.map_name_to_id.get(name):
+            return role_id
+        self.deleted_names.add(name)
+        return None
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -98,10 +165,16 @@ class RoleCache:
         :param idstr: unique identifier (GUID) of the role
         :returns: human-readable name of the role
         """
+        generation = self.refresher.generation
+        if role_name := self.map_id_to_name.get(idstr):
+            return role_name
+        if idstr in self.deleted_ids:
+            return None
+        self._refresh_cache(since=generation)
         if role_name := self.map_id_to_name.get(idstr):
             return role_name
-        self._refresh_cache()
-        return self.map_id_to_name.get(idstr)
+        self.deleted_ids.add(idstr)
+        return None
 
     def _validate_idstrs(self, idstrs: Iterable[str]):
         """
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import time
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional
+
+if TYPE_CHECKING:
+    from pyatlan.cache.stats import CacheStats
+
+
+class _Flight:
+    def __init__(self, number: int):
+        self.number = number
+        self.done = Event()
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent refreshes of a cache into a single refresh. Callers that need a refresh
+    while one is already in flight wait for it and share its outcome, rather than each starting
+    (and serially waiting on) another. A caller that only needs the cache to be newer than when
+    it missed also reuses any refresh that completed since then.
+    """
+
+    def __init__(self, stats: Optional["CacheStats"] = None):
+        """
+        :param stats: statistics in which to count and time each refresh
+        """
+        self._lock = Lock()
+        self._stats = stats
+        self._flight: Optional[_Flight] = None
+        self._started = 0
+        self._completed = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        :returns: number of the most recent refresh to have completed successfully
+        """
+        return self._completed
+
+    def run(self, refresh: Callable[[], None], since: Optional[int] = None) -> None:
+        """
+        Ensure the cache has been refreshed.
+
+        :param refresh: function that refreshes the cache
+        :param since: generation of the cache that was found to be stale (for example, by a lookup that missed),
+                      in which case any refresh started after that generation is sufficient; if not provided, a
+                      refresh that starts after this call is required (for example, to pick up a known change)
+        :raises Exception: any error raised by the refresh (including to callers that waited on it)
+        """
+        with self._lock:
+            after = self._started if since is None else since
+        while True:
+            with self._lock:
+                if self._completed > after:
+                    return
+                flight = self._flight
+                leader = flight is None
+                if flight is None:
+                    self._started += 1
+                    flight = self._flight = _Flight(self._started)
+            if leader:
+                self._lead(flight, refresh)
+                return
+            flight.done.wait()
+            if flight.number > after:
+                if flight.error is not None:
+                    raise flight.error
+                return
+
+    def _lead(self, flight: _Flight, refresh: Callable[[], None]):
+        started = time.perf_counter()
+        try:
+            refresh()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            if self._stats is not None:
+                self._stats.record_refresh(
+                    time.perf_counter() - started, failed=flight.error is not None
+                )
+            with self._lock:
+                self._flight = None
+                if flight.error is None:
+                    self._completed = flight.number
+            flight.done.set()
+
+
+class SingleFlightGroup:
+    """
+    Coalesces concurrent lookups of the same key into a single lookup. Callers that look up a key
+    while a lookup of that key is already in flight wait for it and share its outcome.
+    """
+
+    def __init__(self, stats: Optional["CacheStats"] = None):
+        """
+        :param stats: statistics in which to count and time each lookup
+        """
+        self._lock = Lock()
+        self._stats = stats
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def run(self, key: Hashable, lookup: Callable[[], None]) -> None:
+        """
+        Ensure the key has been looked up.
+
+        :param key: the key being looked up
+        :param lookup: function that looks up the key
+        :raises Exception: any error raised by the lookup (including to callers that waited on it)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight(0)
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return
+        started = time.perf_counter()
+        try:
+            lookup()
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            if self._stats is not None:
+                self._stats.record_lookup(
+                    time.perf_counter() - started, failed=flight.error is not None
+                )
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import dataclasses
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from pyatlan.cache.policy import NegativeCache
+
+LOGGER = logging.getLogger(__name__)
+
+# Function to which a cache's metrics are exported, as each occurs: called with the name
+# of the cache, the name of the metric and its value (see CacheStats for the metrics)
+MetricsCallback = Callable[[str, str, float], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStatsSnapshot:
+    """
+    Statistics of a cache, as of a point in time.
+    """
+
+    # Name of the cache
+    cache: str
+    # Number of translations found in the cache (including when re-checked after a refresh)
+    hits: int
+    # Number of translations not found in the cache (including those then found by a refresh)
+    misses: int
+    # Number of full refreshes of the cache from Atlan (including any that failed)
+    refreshes: int
+    # Number of full refreshes of the cache that failed
+    refresh_errors: int
+    # Total seconds spent refreshing the cache
+    refresh_seconds: float
+    # Seconds taken by the most recent refresh of the cache (None: never refreshed)
+    last_refresh_seconds: Optional[float]
+    # Number of targeted lookups from Atlan, of only the translations missing from the cache
+    lookups: int
+    # Number of targeted lookups that failed
+    lookup_errors: int
+    # Total seconds spent on targeted lookups
+    lookup_seconds: float
+    # Number of translations held, by kind of translation
+    entries: Dict[str, int]
+    # Number of translations that could not be found being remembered
+    negative_entries: int
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        """
+        :returns: proportion of translations found in the cache (None: no translations yet)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+
+class CacheStats:
+    """
+    Running statistics of a cache. Lookups of translations are counted as hits or misses, and each
+    refresh (or targeted lookup) from Atlan is counted and timed. Counts are not locked, so may
+    undercount slightly when a cache is used from many threads at once.
+
+    If a metrics callback is set, each of the following metrics is exported to it as it occurs:
+    miss (value 1), refresh (seconds taken), refresh_error (seconds taken), lookup (seconds taken)
+    and lookup_error (seconds taken). Hits are not exported, to keep lookups fast; they are only
+    available from a snapshot of the statistics.
+    """
+
+    def __init__(self, name: str, callback: Optional[MetricsCallback] = None):
+        """
+        :param name: name of the cache
+        :param callback: function to which to export each metric as it occurs
+        """
+        self.name = name
+        self.callback = callback
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.refresh_seconds = 0.0
+        self.last_refresh_seconds: Optional[float] = None
+        self.lookups = 0
+        self.lookup_errors = 0
+        self.lookup_seconds = 0.0
+
+    def record_miss(self) -> None:
+        self.misses += 1
+        self._export("miss", 1)
+
+    def record_refresh(self, seconds: float, failed: bool = False) -> None:
+        self.refreshes += 1
+        self.refresh_seconds += seconds
+        self.last_refresh_seconds = seconds
+        if failed:
+            self.refresh_errors += 1
+        self._export("refresh_error" if failed else "refresh", seconds)
+
+    def record_lookup(self, seconds: float, failed: bool = False) -> None:
+        self.lookups += 1
+        self.lookup_seconds += seconds
+        if failed:
+            self.lookup_errors += 1
+        self._export("lookup_error" if failed else "lookup", seconds)
+
+    def _export(self, metric: str, value: float) -> None:
+        if (callback := self.callback) is not None:
+            try:
+                callback(self.name, metric, value)
+            except Exception as err:
+                # Never let a failure to export metrics fail a lookup
+                LOGGER.warning("Unable to export cache metric %s: %s", metric, err)
+
+    def snapshot(self, cache: Any) -> CacheStatsSnapshot:
+        """
+        Capture the statistics of a cache as of now.
+
+        :param cache: the cache whose statistics these are
+        :returns: the statistics, including the number of translations the cache currently holds
+        """
+        translations = cache.translations
+        return CacheStatsSnapshot(
+            cache=self.name,
+            hits=self.hits,
+            misses=self.misses,
+            refreshes=self.refreshes,
+            refresh_errors=self.refresh_errors,
+            refresh_seconds=self.refresh_seconds,
+            last_refresh_seconds=self.last_refresh_seconds,
+            lookups=self.lookups,
+            lookup_errors=self.lookup_errors,
+            lookup_seconds=self.lookup_seconds,
+            entries={
+                kind: len(translation_map)
+                for kind, translation_map in zip(translations._fields, translations)
+            },
+            negative_entries=sum(
+                len(value)
+                for value in vars(cache).values()
+                if isinstance(value, NegativeCache)
+            ),
+        )
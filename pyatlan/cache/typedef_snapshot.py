@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+from pydantic.v1 import ValidationError
+
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.typedef import TypeDef, TypeDefHeader, TypeDefResponse
+
+LOGGER = logging.getLogger(__name__)
+
+# File extensions that indicate a snapshot location is a SQLite database, rather than a directory
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+# Amount of a SQLite database to memory-map, so that reads share the operating system's page cache
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SnapshotEntry(NamedTuple):
+    saved_at: float
+    content: str
+
+
+class TypeDefSnapshotStore(ABC):
+    """
+    Persistent storage for snapshots of type definitions, which can be shared by any number of
+    processes on the same machine.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[SnapshotEntry]:
+        """
+        Load a snapshot.
+
+        :param key: unique key of the snapshot
+        :returns: the snapshot, or None if there is no snapshot with that key
+        """
+
+    @abstractmethod
+    def save(self, key: str, content: str) -> None:
+        """
+        Save (or replace) a snapshot, as of the current time.
+
+        :param key: unique key of the snapshot
+        :param content: serialized type definitions
+        """
+
+
+class FileTypeDefSnapshotStore(TypeDefSnapshotStore):
+    """
+    Stores each snapshot as a file within a directory. Files are replaced atomically, so
+    concurrent processes only ever see complete snapshots.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        :param directory: directory in which to store the snapshots (created if it does not exist)
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def load(self, key: str) -> Optional[SnapshotEntry]:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as file:
+                saved_at = os.fstat(file.fileno()).st_mtime
+                content = file.read()
+        except FileNotFoundError:
+            return None
+        return SnapshotEntry(saved_at, content)
+
+    def save(self, key: str, content: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            file.write(content)
+        os.replace(file.name, self._path(key))
+
+
+class SqliteTypeDefSnapshotStore(TypeDefSnapshotStore):
+    """
+    Stores snapshots in a SQLite database, which is memory-mapped so that processes reading
+    the same snapshot share a single copy of it in the operating system's page cache.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        :param path: path to the SQLite database (created if it does not exist)
+        """
+        self.path = Path(path)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        connection.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+        if not self._initialized:
+            # Allow readers to proceed while another process writes a snapshot
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS typedef_snapshot ("
+                "key TEXT PRIMARY KEY, saved_at REAL, content TEXT)"
+            )
+            connection.commit()
+            self._initialized = True
+        return connection
+
+    def load(self, key: str) -> Optional[SnapshotEntry]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT saved_at, content FROM typedef_snapshot WHERE key = ?",
+                (key,),
+            ).fetchone()
+        finally:
+            connection.close()
+        return SnapshotEntry(*row) if row else None
+
+    def save(self, key: str, content: str) -> None:
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO typedef_snapshot (key, saved_at, content) "
+                    "VALUES (?, ?, ?)",
+                    (key, time.time(), content),
+                )
+        finally:
+            connection.close()
+
+
+def fingerprint(headers: Iterable[Union[TypeDefHeader, TypeDef]]) -> str:
+    """
+    Fingerprint a set of type definitions by their identities. This changes whenever a type
+    definition is added or removed, but not when an existing type definition is updated.
+
+    :param headers: headers (or full type definitions) of the type definitions to fingerprint
+    :returns: the fingerprint of the type definitions
+    """
+    identities = sorted(
+        f"{getattr(header.category, 'value', header.category)}:{header.name}:{header.guid}"
+        for header in headers
+    )
+    return hashlib.sha256("\n".join(identities).encode()).hexdigest()
+
+
+def typedefs_of(
+    response: TypeDefResponse, categories: Iterable[AtlanTypeCategory]
+) -> List[TypeDef]:
+    """
+    Retrieve the type definitions of the given categories from a response.
+
+    :param response: the type definitions, as retrieved from Atlan
+    :param categories: categories of type definitions to retrieve
+    :returns: the type definitions of those categories
+    """
+    categories = set(categories)
+    return [
+        typedef
+        for typedefs in (
+            response.enum_defs,
+            response.struct_defs,
+            response.atlan_tag_defs,
+            response.custom_metadata_defs,
+            response.entity_defs,
+            response.relationship_defs,
+        )
+        for typedef in typedefs
+        if typedef.category in categories
+    ]
+
+
+class TypeDefSnapshot:
+    """
+    Persistent snapshot of type definitions for a tenant, used to populate the type definition
+    caches of a new process without downloading every type definition. A snapshot younger than
+    max_age is used as-is; an older snapshot is not used at all, so that the type definitions are
+    downloaded again (replacing the snapshot). Only this bounds how long an update to a type
+    definition (such as renaming an Atlan tag) can go unseen, as the headers of the type
+    definitions only reveal those that have been added or removed.
+    Any lookup that misses the cache still refreshes it from Atlan (updating the snapshot).
+    """
+
+    def __init__(
+        self, store: TypeDefSnapshotStore, tenant: str, max_age: float = 300.0
+    ):
+        """
+        :param store: where to persist the snapshots
+        :param tenant: URL of the tenant whose type definitions are in the snapshots
+        :param max_age: number of seconds for which a snapshot is used, before the type definitions
+        are downloaded again
+        """
+        self.store = store
+        self.tenant = tenant
+        self.max_age = max_age
+
+    @classmethod
+    def at(
+        cls, location: Union[str, Path], tenant: str, max_age: float = 300.0
+    ) -> "TypeDefSnapshot":
+        """
+        Create a snapshot backed by a SQLite database (if the location has a .db, .sqlite or
+        .sqlite3 extension) or otherwise by files within a directory.
+
+        :param location: path to the SQLite database or directory in which to store snapshots
+        :param tenant: URL of the tenant whose type definitions are in the snapshots
+        :param max_age: number of seconds for which a snapshot is used, before the type definitions
+        are downloaded again
+        :returns: the snapshot
+        """
+        store: TypeDefSnapshotStore
+        if Path(location).suffix.lower() in SQLITE_SUFFIXES:
+            store = SqliteTypeDefSnapshotStore(location)
+        else:
+            store = FileTypeDefSnapshotStore(location)
+        return cls(store=store, tenant=tenant, max_age=max_age)
+
+    def _key(self, categories: List[AtlanTypeCategory]) -> str:
+        return f"{self.tenant}|{','.join(sorted(c.value for c in categories))}"
+
+    def load(self, categories: List[AtlanTypeCategory]) -> Optional[TypeDefResponse]:
+        """
+        Load the type definitions of the given categories from the snapshot, if it is recent enough.
+
+        :param categories: categories of type definitions to load
+        :returns: the type definitions, or None if there is no snapshot younger than max_age
+        """
+        try:
+            entry = self.store.load(self._key(categories))
+            if entry is None or time.time() - entry.saved_at > self.max_age:
+                return None
+            return TypeDefResponse.parse_raw(entry.content)
+        except (OSError, sqlite3.Error, ValidationError, ValueError) as err:
+            LOGGER.warning("Unable to load type definition snapshot: %s", err)
+            return None
+
+    def save(
+        self, categories: List[AtlanTypeCategory], response: TypeDefResponse
+    ) -> None:
+        """
+        Save the type definitions of the given categories to the snapshot.
+
+        :param categories: categories of the type definitions
+        :param response: the type definitions, as retrieved from Atlan
+        """
+        content = response.json(by_alias=True, exclude_unset=True)
+        try:
+            self.store.save(self._key(categories), content)
+        except (OSError, sqlite3.Error) as err:
+            LOGGER.warning("Unable to save type definition snapshot: %s", err)
@@ -1,13 +1,39 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+from json import dumps
 from threading import Lock
-from typing import Dict, Iterable, Optional
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, NamedTuple, Optional
 
+from pyatlan.cache.policy import (
+    CachePolicy,
+    NegativeCache,
+    TranslationMap,
+    copy_translations,
+    new_translations,
+    translate_all,
+)
+from pyatlan.cache.single_flight import SingleFlight, SingleFlightGroup
+from pyatlan.cache.stats import CacheStats, MetricsCallback
 from pyatlan.client.token import SERVICE_ACCOUNT_, TokenClient
 from pyatlan.client.user import UserClient
 from pyatlan.errors import ErrorCode
+from pyatlan.model.user import AtlanUser
 
-lock = Lock()
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+
+class UserTranslations(NamedTuple):
+    """
+    Complete set of translations for users, published as a whole when the cache is refreshed.
+    """
+
+    # usernames of users, by GUID
+    map_id_to_name: TranslationMap[str, str]
+    # GUIDs of users, by username
+    map_name_to_id: TranslationMap[str, str]
+    # GUIDs of users, by email address
+    map_email_to_id: TranslationMap[str, str]
 
 
 class UserCache:
@@ -15,20 +41,36 @@ class UserCache:
     Lazily-loaded cache for translating Atlan-internal users into their various IDs.
     """
 
-    caches: Dict[int, "UserCache"] = {}
+    default_policy: ClassVar[CachePolicy] = CachePolicy()
 
     @classmethod
-    def get_cache(cls) -> "UserCache":
+    def get_cache(cls, client: Optional["AtlanClient"] = None) -> "UserCache":
+        """
+        Retrieve the cache for a client, creating it the first time it is used.
+
+        :param client: client whose cache to retrieve (by default, the default client)
+        :returns: the cache for the client
+        """
         from pyatlan.client.atlan import AtlanClient
 
-        with lock:
-            client = AtlanClient.get_default_client()
-            cache_key = client.cache_key
-            if cache_key not in cls.caches:
-                cls.caches[cache_key] = UserCache(
-                    user_client=client.user, token_client=client.token
-                )
-            return cls.caches[cache_key]
+        client = client or AtlanClient.get_default_client()
+        return client.caches.get(cls, cls._create)
+
+    @classmethod
+    def _create(cls, client: "AtlanClient") -> "UserCache":
+        return UserCache(
+            user_client=client.user,
+            token_client=client.token,
+            policy=cls.default_policy,
+            metrics_callback=client.cache_metrics_callback,
+        )
+
+    @classmethod
+    def refresh_cache(cls) -> None:
+        """
+        Refreshes the cache of users by requesting the full set of users from Atlan.
+        """
+        cls.get_cache()._refresh_cache()
 
     @classmethod
     def get_id_for_name(cls, name: str) -> Optional[str]:
@@ -60,6 +102,39 @@ class UserCache:
         """
         return cls.get_cache()._get_name_for_id(idstr=idstr)
 
+    @classmethod
+    def get_ids_for_names(cls, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided human-readable usernames to their GUIDs, looking up any users that
+        are not yet cached in a single request.
+
+        :param names: human-readable names of the users
+        :returns: a dict from each username to the unique identifier (GUID) of the user (or None if not found)
+        """
+        return cls.get_cache()._get_ids_for_names(names)
+
+    @classmethod
+    def get_ids_for_emails(cls, emails: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided emails to their GUIDs, looking up any users that are not yet cached
+        in a single request.
+
+        :param emails: email addresses of the users
+        :returns: a dict from each email address to the unique identifier (GUID) of the user (or None if not found)
+        """
+        return cls.get_cache()._get_ids_for_emails(emails)
+
+    @classmethod
+    def get_names_for_ids(cls, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided user GUIDs to their human-readable usernames, looking up any users that
+        are not yet cached in a single request.
+
+        :param ids: unique identifiers (GUIDs) of the users
+        :returns: a dict from each GUID to the username of the user (or None if not found)
+        """
+        return cls.get_cache()._get_names_for_ids(ids)
+
     @classmethod
     def validate_names(cls, names: Iterable[str]):
         """
@@ -69,28 +144,108 @@ class UserCache:
         """
         return cls.get_cache()._validate_names(names)
 
-    def __init__(self, user_client: UserClient, token_client: TokenClient):
+    def __init__(
+        self,
+        user_client: UserClient,
+        token_client: TokenClient,
+        policy: Optional[CachePolicy] = None,
+        metrics_callback: Optional[MetricsCallback] = None,
+    ):
         self.user_client: UserClient = user_client
         self.token_client: TokenClient = token_client
-        self.map_id_to_name: Dict[str, str] = {}
-        self.map_name_to_id: Dict[str, str] = {}
-        self.map_email_to_id: Dict[str, str] = {}
-        self.lock: Lock = Lock()
-
-    def _refresh_cache(self) -> None:
-        with self.lock:
-            users = self.user_client.get_all()
-            if users is not None:
-                self.map_id_to_name = {}
-                self.map_name_to_id = {}
-                self.map_email_to_id = {}
-                for user in users:
-                    user_id = str(user.id)
-                    username = str(user.username)
-                    user_email = str(user.email)
-                    self.map_id_to_name[user_id] = username
-                    self.map_name_to_id[username] = user_id
-                    self.map_email_to_id[user_email] = user_id
+        self.policy: CachePolicy = policy or UserCache.default_policy
+        self.stats: CacheStats = CacheStats(UserCache.__name__, metrics_callback)
+        self.translations: UserTranslations = new_translations(
+            UserTranslations, self.policy, self.stats
+        )
+        self.deleted_ids: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_names: NegativeCache[str] = NegativeCache(self.policy)
+        self.deleted_emails: NegativeCache[str] = NegativeCache(self.policy)
+        self.refresher: SingleFlight = SingleFlight(self.stats)
+        self.lookups: SingleFlightGroup = SingleFlightGroup(self.stats)
+        # Serializes publishing the translations, so that refreshes and lookups never overwrite each other
+        self.publishing: Lock = Lock()
+
+    @property
+    def map_id_to_name(self) -> TranslationMap[str, str]:
+        return self.translations.map_id_to_name
+
+    @property
+    def map_name_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_name_to_id
+
+    @property
+    def map_email_to_id(self) -> TranslationMap[str, str]:
+        return self.translations.map_email_to_id
+
+    def _refresh_cache(self, since: Optional[int] = None) -> None:
+        """
+        Refreshes the cache of users by requesting the full set of users from Atlan.
+        Concurrent refreshes are coalesced, so that only one request is made to Atlan at a time.
+
+        :param since: generation of the cache in which a lookup missed, so that any refresh completed
+                      after that generation can be reused rather than starting another (by default, a
+                      new refresh is always made)
+        """
+        self.refresher.run(self._load, since)
+
+    def _load(self) -> None:
+        users = self.user_client.get_all()
+        if users is not None:
+            translations = new_translations(UserTranslations, self.policy, self.stats)
+            self._cache_users(users, translations)
+            with self.publishing:
+                self.translations = translations
+
+    def _cache_users(
+        self, users: List[AtlanUser], translations: UserTranslations
+    ) -> None:
+        for user in users:
+            user_id = str(user.id)
+            username = str(user.username)
+            user_email = str(user.email)
+            translations.map_id_to_name[user_id] = username
+            translations.map_name_to_id[username] = user_id
+            translations.map_email_to_id[user_email] = user_id
+            self.deleted_ids.discard(user_id)
+            self.deleted_names.discard(username)
+            self.deleted_emails.discard(user_email)
+
+    def _lookup(self, field: str, value: str) -> None:
+        """
+        Looks up only the user(s) with the given value for a field, adding them to the cache,
+        rather than refreshing the full set of users. Concurrent lookups of the same user are coalesced.
+
+        :param field: field by which to look up the user (id, username or email)
+        :param value: value of the field for the user to look up
+        """
+
+        self.lookups.run((field, value), lambda: self._lookup_all(field, [value]))
+
+    def _lookup_all(self, field: str, values: List[str]) -> None:
+        """
+        Looks up only the users with any of the given values for a field (in a single request),
+        adding them to the cache.
+
+        :param field: field by which to look up the users (id, username or email)
+        :param values: values of the field for the users to look up
+        """
+        if field == "username":
+            users = self.user_client.get_by_usernames(
+                usernames=values, limit=len(values)
+            )
+        elif field == "email":
+            users = self.user_client.get_by_emails(emails=values, limit=len(values))
+        else:
+            users = self.user_client.get(
+                limit=len(values), post_filter=dumps({field: {"$in": values}})
+            ).records
+        if users:
+            # Extend a copy of the latest translations, so that a refresh published meanwhile is not lost
+            with self.publishing:
+                translations = copy_translations(self.translations)
+                self._cache_users(users, translations)
+                self.translations = translations
 
     def _get_id_for_name(self, name: str) -> Optional[str]:
         """
@@ -106,14 +261,22 @@ class UserCache:
         if name.startswith(SERVICE_ACCOUNT_):
             token = self.token_client.get_by_id(client_id=name)
             if token and token.guid:
-                self.map_name_to_id[name] = token.guid
+                with self.publishing:
+                    translations = copy_translations(self.translations)
+                    translations.map_name_to_id[name] = token.guid
+                    self.translations = translations
                 return token.guid
             else:
                 raise ErrorCode.API_TOKEN_NOT_FOUND_BY_NAME.exception_with_parameters(
                     name
                 )
-        self._refresh_cache()
-        return self.map_name_to_id.get(name)
+        if name in self.deleted_names:
+            return None
+        self._lookup("username", name)
+        if user_id := self.map_name_to_id.get(name):
+            return user_id
+        self.deleted_names.add(name)
+        return None
 
     def _get_id_for_email(self, email: str) -> Optional[str]:
         """
@@ -124,8 +287,13 @@ class UserCache:
         """
         if user_id := self.map_email_to_id.get(email):
             return user_id
-        self._refresh_cache()
-        return self.map_email_to_id.get(email)
+        if email in self.deleted_emails:
+            return None
+        self._lookup("email", email)
+        if user_id := self.map_email_to_id.get(email):
+            return user_id
+        self.deleted_emails.add(email)
+        return None
 
     def _get_name_for_id(self, idstr: str) -> Optional[str]:
         """
@@ -136,14 +304,77 @@ class UserCache:
         """
         if username := self.map_id_to_name.get(idstr):
             return username
+        if idstr in self.deleted_ids:
+            return None
         # If the username isn't found, check if it is an API token
         token = self.token_client.get_by_guid(guid=idstr)
         if token and token.client_id:
             username = f"{SERVICE_ACCOUNT_}{token.client_id}"
             return username
         else:
-            self._refresh_cache()
-            return self.map_id_to_name.get(idstr)
+            self._lookup("id", idstr)
+            if username := self.map_id_to_name.get(idstr):
+                return username
+            self.deleted_ids.add(idstr)
+            return None
+
+    def _get_ids_for_names(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided human-readable usernames to their GUIDs.
+
+        :param names: human-readable names of the users
+        :returns: a dict from each username to the unique identifier (GUID) of the user (or None if not found)
+        """
+        names = list(names)
+        # API tokens are translated individually, as they are not users
+        tokens = {name for name in names if name.startswith(SERVICE_ACCOUNT_)}
+        ids = translate_all(
+            (name for name in names if name not in tokens),
+            lambda: self.map_name_to_id,
+            self.deleted_names,
+            lambda missing: self._lookup_all("username", missing),
+        )
+        ids.update((name, self._get_id_for_name(name)) for name in tokens)
+        return ids
+
+    def _get_ids_for_emails(self, emails: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided emails to their GUIDs.
+
+        :param emails: email addresses of the users
+        :returns: a dict from each email address to the unique identifier (GUID) of the user (or None if not found)
+        """
+        return translate_all(
+            emails,
+            lambda: self.map_email_to_id,
+            self.deleted_emails,
+            lambda missing: self._lookup_all("email", missing),
+        )
+
+    def _get_names_for_ids(self, ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Translate the provided user GUIDs to their human-readable usernames.
+
+        :param ids: unique identifiers (GUIDs) of the users
+        :returns: a dict from each GUID to the username of the user (or None if not found)
+        """
+        looked_up: List[str] = []
+
+        def lookup(missing: List[str]):
+            looked_up.extend(missing)
+            self._lookup_all("id", missing)
+
+        names = translate_all(
+            ids, lambda: self.map_id_to_name, self.deleted_ids, lookup
+        )
+        # Any GUIDs that are not users could be API tokens
+        for idstr in looked_up:
+            if names[idstr] is None:
+                token = self.token_client.get_by_guid(guid=idstr)
+                if token and token.client_id:
+                    names[idstr] = f"{SERVICE_ACCOUNT_}{token.client_id}"
+                    self.deleted_ids.discard(idstr)
+        return names
 
     def _validate_names(self, names: Iterable[str]):
         """
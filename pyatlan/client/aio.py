@@ -0,0 +1,370 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncGenerator, Awaitable, Callable, List, Optional, TypeVar
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.errors import ErrorCode
+from pyatlan.model.assets import Asset
+from pyatlan.model.audit import AuditSearchRequest
+from pyatlan.model.search import IndexSearchRequest
+from pyatlan.model.search_log import SearchLogRequest
+
+DEFAULT_MAX_CONCURRENCY = 64
+# Number of results taken from a streamed or prefetching search in each call to a worker thread
+ITERATION_BATCH_SIZE = 100
+
+R = TypeVar("R")
+
+
+class AsyncSearchResults:
+    """
+    Wraps the (synchronous) results of a search so that they can be iterated
+    asynchronously. Each subsequent page is fetched without blocking the event loop.
+    Results that are streamed or prefetched are instead taken from the underlying
+    iterator in batches, on a worker thread, so that decoding a streamed page is
+    not done on the event loop and pages are still fetched ahead as requested.
+    Any other attribute (count, aggregations, etc) is read from the underlying results.
+    """
+
+    def __init__(self, client: AsyncAtlanClient, results: Any):
+        self._client = client
+        self._results = results
+
+    @property
+    def results(self) -> Any:
+        """
+        :returns: the underlying (synchronous) search results
+        """
+        return self._results
+
+    def current_page(self) -> list:
+        """
+        Retrieve the current page of results.
+
+        :returns: list of results on the current page
+        """
+        return self._results.current_page()
+
+    async def next_page(self, start=None, size=None) -> bool:
+        """
+        Fetches the next page of results, without blocking the event loop.
+
+        :returns: True if there is a next page of results, otherwise False
+        """
+        return await self._client.run(self._results.next_page, start, size)
+
+    async def __aiter__(self) -> AsyncGenerator[Any, None]:
+        """
+        Iterates through the results, lazily-fetching each next page until there
+        are no more results.
+
+        :returns: an asynchronous iterable form of each result, across all pages
+        """
+        if getattr(self._results, "stream", False) or (
+            getattr(self._results, "prefetch", 0) > 0
+        ):
+            iterator = iter(self._results)
+            try:
+                while True:
+                    batch: List[Any] = await self._client.run(
+                        list, islice(iterator, ITERATION_BATCH_SIZE)
+                    )
+                    if not batch:
+                        break
+                    for result in batch:
+                        yield result
+            finally:
+                # Release any page still being streamed, or pages still being prefetched
+                if close := getattr(iterator, "close", None):
+                    await self._client.run(close)
+            return
+        # Lineage results signal further pages through has_more,
+        # rather than through the result of fetching the next page
+        paged_by_has_more = hasattr(self._results, "has_more")
+        while True:
+            for result in self.current_page():
+                yield result
+            if paged_by_has_more:
+                if not self._results.has_more:
+                    break
+                await self.next_page()
+            elif not await self.next_page():
+                break
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._results, name)
+
+
+class _AsyncClientDelegate:
+    """
+    Exposes every public method of a synchronous client as a coroutine, run through
+    the executor of the AsyncAtlanClient, so that behaviour (endpoints, request and
+    response models, validation) is identical to the synchronous client.
+    """
+
+    def __init__(self, client: AsyncAtlanClient, delegate: Any):
+        self._client = client
+        self._delegate = delegate
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self._delegate, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self._client.run(method, *args, **kwargs)
+
+        return call
+
+
+class AsyncAssetClient(_AsyncClientDelegate):
+    """
+    Asynchronous variant of AssetClient. This class does not need to be instantiated
+    directly but can be obtained through the asset property of AsyncAtlanClient.
+    """
+
+    async def search(
+        self,
+        criteria: IndexSearchRequest,
+        prefetch: int = 0,
+        bulk: bool = False,
+        stream: bool = False,
+        lazy: bool = False,
+    ) -> AsyncSearchResults:
+        """
+        Search for assets using the provided criteria.
+        The options behave exactly as for the search method of AssetClient.
+
+        :param criteria: detailing the search query, parameters, and so on to run
+        :param prefetch: when iterating through the results, the number of pages to fetch ahead
+        of the page being processed
+        :param bulk: whether to page through the results by creation time (True) rather than by offset (False)
+        :param stream: whether to decode each page of results incrementally as it is iterated (True)
+        :param lazy: whether to return each result as a LazyAsset (True)
+        :returns: the results of the search, which can be iterated with `async for`
+        :raises InvalidRequestError: if bulk mode is requested for a search with sorting specified
+        :raises AtlanError: on any API communication issue
+        """
+        results = await self._client.run(
+            self._delegate.search,
+            criteria,
+            prefetch=prefetch,
+            bulk=bulk,
+            stream=stream,
+            lazy=lazy,
+        )
+        return AsyncSearchResults(self._client, results)
+
+    async def get_lineage_list(self, lineage_request) -> AsyncSearchResults:
+        """
+        Retrieve lineage using the higher-performance "list" API.
+
+        :param lineage_request: detailing the lineage query, parameters, and so on to run
+        :returns: the results of the lineage request, which can be iterated with `async for`
+        :raises AtlanError: on any API communication issue
+        """
+        results = await self._client.run(
+            self._delegate.get_lineage_list, lineage_request
+        )
+        return AsyncSearchResults(self._client, results)
+
+    async def get_by_guid(
+        self,
+        guid: str,
+        asset_type: type = Asset,
+        min_ext_info: bool = False,
+        ignore_relationships: bool = False,
+    ) -> Asset:
+        """
+        Retrieves an asset by its GUID.
+
+        :param guid: unique identifier (GUID) of the asset to retrieve
+        :param asset_type: type of asset to be retrieved, defaults to `Asset`
+        :param min_ext_info: whether to minimize extra info (True) or not (False)
+        :param ignore_relationships: whether to include relationships (False) or exclude them (True)
+        :returns: the requested asset
+        :raises NotFoundError: if the asset does not exist, or is not of the type requested
+        :raises AtlanError: on any API communication issue
+        """
+        return await self._client.run(
+            self._delegate.get_by_guid,
+            guid=guid,
+            asset_type=asset_type,
+            min_ext_info=min_ext_info,
+            ignore_relationships=ignore_relationships,
+        )
+
+
+class AsyncTypeDefClient(_AsyncClientDelegate):
+    """
+    Asynchronous variant of TypeDefClient. This class does not need to be instantiated
+    directly but can be obtained through the typedef property of AsyncAtlanClient.
+    """
+
+
+class AsyncAuditClient(_AsyncClientDelegate):
+    """
+    Asynchronous variant of AuditClient. This class does not need to be instantiated
+    directly but can be obtained through the audit property of AsyncAtlanClient.
+    """
+
+    async def search(self, criteria: AuditSearchRequest) -> AsyncSearchResults:
+        """
+        Search for assets using the provided criteria.
+
+        :param criteria: detailing the search query, parameters, and so on to run
+        :returns: the results of the search, which can be iterated with `async for`
+        :raises AtlanError: on any API communication issue
+        """
+        results = await self._client.run(self._delegate.search, criteria)
+        return AsyncSearchResults(self._client, results)
+
+
+class AsyncSearchLogClient(_AsyncClientDelegate):
+    """
+    Asynchronous variant of SearchLogClient. This class does not need to be instantiated
+    directly but can be obtained through the search_log property of AsyncAtlanClient.
+    """
+
+    async def search(self, criteria: SearchLogRequest) -> Any:
+        """
+        Search for search logs using the provided criteria.
+
+        :param criteria: detailing the search query, parameters, and so on to run
+        :returns: the view results of the search, or for log entries results which can be iterated with `async for`
+        :raises AtlanError: on any API communication issue
+        """
+        results = await self._client.run(self._delegate.search, criteria)
+        if hasattr(results, "next_page"):
+            return AsyncSearchResults(self._client, results)
+        return results
+
+
+class AsyncAtlanClient:
+    """
+    Asynchronous client for Atlan. Calls reuse the same API definitions and request /
+    response models as AtlanClient, but are awaitable so they can be issued from an
+    event loop without blocking it. This is not an asyncio-native HTTP stack: each call
+    still makes a blocking request, on one of a pool of worker threads sized by
+    max_concurrency, so at most that many calls are in flight at once (any others
+    wait for a free worker).
+    """
+
+    def __init__(
+        self,
+        client: Optional[AtlanClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ):
+        """
+        Create a new asynchronous client.
+
+        :param client: synchronous client whose configuration (and session) to use; if not
+        provided, one is created from the remaining keyword arguments (or the environment)
+        :param max_concurrency: maximum number of API calls that can be in flight at once,
+        which is also the number of worker threads (and pooled connections) used
+        """
+        if client is not None and not isinstance(client, AtlanClient):
+            raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
+                "client", "AtlanClient"
+            )
+        if max_concurrency < 1:
+            raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
+                "max_concurrency", "positive int"
+            )
+        self._client: AtlanClient = client or AtlanClient(**kwargs)
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pyatlan-async"
+        )
+        # Ensure every worker can hold a pooled connection, rather than
+        # opening (and discarding) a new connection per call
+        self._client.size_connection_pool(max_concurrency)
+        self._asset_client: Optional[AsyncAssetClient] = None
+        self._typedef_client: Optional[AsyncTypeDefClient] = None
+        self._audit_client: Optional[AsyncAuditClient] = None
+        self._search_log_client: Optional[AsyncSearchLogClient] = None
+
+    @property
+    def sync_client(self) -> AtlanClient:
+        """
+        :returns: the synchronous client through which calls are ultimately made
+        """
+        return self._client
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def asset(self) -> AsyncAssetClient:
+        if self._asset_client is None:
+            self._asset_client = AsyncAssetClient(self, self._client.asset)
+        return self._asset_client
+
+    @property
+    def typedef(self) -> AsyncTypeDefClient:
+        if self._typedef_client is None:
+            self._typedef_client = AsyncTypeDefClient(self, self._client.typedef)
+        return self._typedef_client
+
+    @property
+    def audit(self) -> AsyncAuditClient:
+        if self._audit_client is None:
+            self._audit_client = AsyncAuditClient(self, self._client.audit)
+        return self._audit_client
+
+    @property
+    def search_log(self) -> AsyncSearchLogClient:
+        if self._search_log_client is None:
+            self._search_log_client = AsyncSearchLogClient(
+                self, self._client.search_log
+            )
+        return self._search_log_client
+
+    async def run(self, func: Callable[..., R], *args, **kwargs) -> R:
+        """
+        Run any (blocking) SDK call on a worker thread, without blocking the event loop.
+        The call waits for a free worker if max_concurrency calls are already in flight.
+
+        :param func: the synchronous callable to run
+        :returns: the result of the callable
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def _call_api(
+        self, api, query_params=None, request_obj=None, exclude_unset: bool = True
+    ):
+        return await self.run(
+            self._client._call_api,
+            api,
+            query_params=query_params,
+            request_obj=request_obj,
+            exclude_unset=exclude_unset,
+        )
+
+    def close(self) -> None:
+        """
+        Release the worker threads used by this client. Calls already in flight are allowed to complete.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncAtlanClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
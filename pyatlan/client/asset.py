@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import logging
 import time
 from abc import ABC
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from enum import Enum
+from threading import BoundedSemaphore, Lock
 from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
     Dict,
     Generator,
     Iterable,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -45,8 +53,16 @@ from pyatlan.client.constants import (
     PARTIAL_UPDATE_ENTITY_BY_ATTRIBUTE,
     UPDATE_ENTITY_BY_ATTRIBUTE,
 )
-from pyatlan.errors import AtlanError, ErrorCode
+from pyatlan.client.streaming import JsonObjectStream
+from pyatlan.errors import (
+    AtlanError,
+    ConflictError,
+    ErrorCode,
+    InvalidRequestError,
+    NotFoundError,
+)
 from pyatlan.model.aggregation import Aggregations
+from pyatlan.model.arrow import ArrowConverter, import_parquet, import_pyarrow
 from pyatlan.model.assets import (
     Asset,
     AtlasGlossary,
@@ -82,24 +98,31 @@ from pyatlan.model.enums import (
     EntityStatus,
     SortOrder,
 )
-from pyatlan.model.fields.atlan_fields import AtlanField
+from pyatlan.model.fields.atlan_fields import AtlanField, CustomMetadataField
+from pyatlan.model.lazy import LazyAsset, raw_location
 from pyatlan.model.lineage import (
     LineageDirection,
     LineageListRequest,
     LineageRequest,
     LineageResponse,
 )
-from pyatlan.model.response import AssetMutationResponse
+from pyatlan.model.response import AssetMutationResponse, MutatedEntities
 from pyatlan.model.search import (
     DSL,
+    Bool,
     IndexSearchRequest,
     Query,
+    SortItem,
     Term,
     with_active_category,
     with_active_glossary,
     with_active_term,
 )
-from pyatlan.utils import API, unflatten_custom_metadata_for_entity
+from pyatlan.model.utils import to_snake_case
+from pyatlan.utils import API
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 T = TypeVar("T", bound=Referenceable)
 A = TypeVar("A", bound=Asset)
@@ -127,6 +150,12 @@ Asset_Types = Union[
 ]
 
 LOGGER = logging.getLogger(__name__)
+# Creation time first, so each page of a bulk search can continue from the last one seen,
+# then GUID to order any assets created at the same time consistently
+BULK_SORTS = [
+    Referenceable.CREATE_TIME.order(SortOrder.ASCENDING),
+    Referenceable.GUID.order(SortOrder.ASCENDING),
+]
 
 
 class AssetClient:
@@ -145,24 +174,59 @@ class AssetClient:
     # TODO: Try adding @validate_arguments to this method once
     # the issue below is fixed or when we switch to pydantic v2
     # https://github.com/atlanhq/atlan-python/pull/88#discussion_r1260892704
-    def search(self, criteria: IndexSearchRequest) -> IndexSearchResults:
+    def search(
+        self,
+        criteria: IndexSearchRequest,
+        prefetch: int = 0,
+        bulk: bool = False,
+        stream: bool = False,
+        lazy: bool = False,
+    ) -> IndexSearchResults:
         """
         Search for assets using the provided criteria.
+        Note: if the number of results exceeds the threshold that can be paged through by offset
+        (and no sorting has been specified), the search will automatically be re-run in bulk mode.
+        This costs a second request for the first page, the results are then sorted by creation time
+        and any prefetch is ignored (as for any bulk search). This is logged at INFO level.
+        To avoid it, either request bulk mode up-front for searches expected to be that large, or
+        specify a sort to keep paging by offset.
 
         :param criteria: detailing the search query, parameters, and so on to run
+        :param prefetch: when iterating through the results, the number of pages to fetch
+        ahead (in the background) of the page being processed; 0 (default) fetches each page only once
+        the previous one is exhausted (ignored in bulk mode, where each page depends on the previous one)
+        :param bulk: whether to page through the results by creation time (True) rather than by
+        offset (False), which allows any number of results to be iterated reliably; the results
+        are then always sorted by creation time, so no other sorting can be specified
+        :param stream: whether to decode each page of results incrementally as it is iterated (True), so that only
+        one asset at a time (rather than a page of them) is held in memory; the count and aggregations are then
+        only known once the first page has been iterated through (prefetch is ignored when streaming)
+        :param lazy: whether to return each result as a LazyAsset (True), which reads its GUID, type name,
+        qualified name, name and audit details directly from the response and only builds the full asset if any
+        other attribute is accessed or changed; this greatly reduces the cost of read-only scans of many results
         :returns: the results of the search
+        :raises InvalidRequestError: if bulk mode is requested for a search with sorting specified
         :raises AtlanError: on any API communication issue
         """
+        if bulk:
+            criteria.dsl.sort = self._sorts_for_bulk_search(criteria.dsl.sort)
+        if stream:
+            return self._search_streaming(criteria, bulk, lazy)
         raw_json = self._client._call_api(
             INDEX_SEARCH,
             request_obj=criteria,
         )
-        if "entities" in raw_json:
+        assets: List[Asset]
+        plan = criteria.custom_metadata_plan
+        if "entities" in raw_json and lazy:
+            assets = [
+                LazyAsset(entity, plan)  # type: ignore[misc]
+                for entity in raw_json["entities"]
+            ]
+        elif "entities" in raw_json:
             try:
                 for entity in raw_json["entities"]:
-                    unflatten_custom_metadata_for_entity(
-                        entity=entity, attributes=criteria.attributes
-                    )
+                    plan.apply(entity)
                 assets = parse_obj_as(List[Asset], raw_json["entities"])
             except ValidationError as err:
                 raise ErrorCode.JSON_ERROR.exception_with_parameters(
@@ -172,6 +236,13 @@ class AssetClient:
             assets = []
         aggregations = self._get_aggregations(raw_json)
         count = raw_json.get("approximateCount", 0)
+        if (
+            not bulk
+            and count > IndexSearchResults.MASS_EXTRACT_THRESHOLD
+            and not _has_explicit_sorts(criteria.dsl.sort)
+        ):
+            _log_switch_to_bulk(count)
+            return self.search(criteria, prefetch=prefetch, bulk=True, lazy=lazy)
         return IndexSearchResults(
             client=self._client,
             criteria=criteria,
@@ -180,8 +251,49 @@ class AssetClient:
             count=count,
             assets=assets,
             aggregations=aggregations,
+            prefetch=prefetch,
+            bulk=bulk,
+            lazy=lazy,
+        )
+
+    def _search_streaming(
+        self, criteria: IndexSearchRequest, bulk: bool, lazy: bool
+    ) -> IndexSearchResults:
+        page = self._client._call_api_streaming(
+            INDEX_SEARCH, array_key="entities", request_obj=criteria
+        )
+        # Decoding up to the first asset also decodes anything that precedes the
+        # assets in the response, which may include the count
+        if page is not None and page.has_items():
+            count = page.fields.get("approximateCount", 0)
+            if (
+                not bulk
+                and count > IndexSearchResults.MASS_EXTRACT_THRESHOLD
+                and not _has_explicit_sorts(criteria.dsl.sort)
+            ):
+                page.close()
+                _log_switch_to_bulk(count)
+                return self.search(criteria, bulk=True, stream=True, lazy=lazy)
+        return IndexSearchResults(
+            client=self._client,
+            criteria=criteria,
+            start=criteria.dsl.from_,
+            size=criteria.dsl.size,
+            count=0,
+            assets=[],
+            aggregations=None,
+            bulk=bulk,
+            stream=True,
+            page=page,
+            lazy=lazy,
         )
 
+    @staticmethod
+    def _sorts_for_bulk_search(sorts: List[SortItem]) -> List[SortItem]:
+        if _has_explicit_sorts(sorts):
+            raise ErrorCode.UNABLE_TO_RUN_BULK_WITH_SORTS.exception_with_parameters()
+        return list(BULK_SORTS)
+
     def _get_aggregations(self, raw_json) -> Optional[Aggregations]:
         aggregations = None
         if "aggregations" in raw_json:
@@ -234,10 +346,9 @@ class AssetClient:
         )
         if "entities" in raw_json:
             try:
+                plan = lineage_request.custom_metadata_plan
                 for entity in raw_json["entities"]:
-                    unflatten_custom_metadata_for_entity(
-                        entity=entity, attributes=lineage_request.attributes
-                    )
+                    plan.apply(entity)
                 assets = parse_obj_as(List[Asset], raw_json["entities"])
                 has_more = parse_obj_as(bool, raw_json["hasMore"])
             except ValidationError as err:
@@ -1694,13 +1805,36 @@ class SearchResults(ABC, Iterable):
         if "entities" not in raw_json:
             self._assets = []
             return None
+        self._assets = self._parse_assets(raw_json)
+        return raw_json
+
+    def _parse_asset(self, entity: Dict[str, Any]) -> Asset:
+        """
+        Translates a single entity within the raw JSON of a page of results into an asset.
+
+        :param entity: JSON for a single result, as-is
+        :returns: the asset
+        """
+        try:
+            self._criteria.custom_metadata_plan.apply(entity)
+            return Asset._convert_to_real_type_(entity)
+        except ValidationError as err:
+            raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                entity, 200, str(err)
+            ) from err
+
+    def _parse_assets(self, raw_json) -> List[Asset]:
+        """
+        Translates the entities within the raw JSON of a page of results into assets.
+
+        :param raw_json: JSON for a page of results, as-is
+        :returns: the assets on that page of results
+        """
         try:
+            plan = self._criteria.custom_metadata_plan
             for entity in raw_json["entities"]:
-                unflatten_custom_metadata_for_entity(
-                    entity=entity, attributes=self._criteria.attributes
-                )
-            self._assets = parse_obj_as(List[Asset], raw_json["entities"])
-            return raw_json
+                plan.apply(entity)
+            return parse_obj_as(List[Asset], raw_json["entities"])
         except ValidationError as err:
             raise ErrorCode.JSON_ERROR.exception_with_parameters(
                 raw_json, 200, str(err)
@@ -1719,6 +1853,29 @@ class SearchResults(ABC, Iterable):
                 break
 
 
+def _has_explicit_sorts(sorts: List[SortItem]) -> bool:
+    """
+    Indicates whether any sorting was specified, beyond the (ascending) sort by GUID that is always
+    added to a search and the sorting of a bulk search itself. Any other order of results, including
+    a descending sort by creation time or GUID, is explicit and would be lost in bulk mode.
+    """
+    return list(sorts or []) not in (
+        [],
+        BULK_SORTS,
+        BULK_SORTS[:1],
+        BULK_SORTS[1:],
+    )
+
+
+def _log_switch_to_bulk(count: int):
+    LOGGER.info(
+        "Result size (%s) exceeds threshold (%s), so re-running search in bulk mode (sorted by creation time). "
+        "Request bulk mode up-front to avoid searching twice.",
+        count,
+        IndexSearchResults.MASS_EXTRACT_THRESHOLD,
+    )
+
+
 class IndexSearchResults(SearchResults, Iterable):
     """
     Captures the response from a search against Atlan. Also provides the ability to
@@ -1726,6 +1883,9 @@ class IndexSearchResults(SearchResults, Iterable):
     query.
     """
 
+    # Beyond this many results, a search can no longer be paged through by offset
+    MASS_EXTRACT_THRESHOLD = 100000
+
     def __init__(
         self,
         client: ApiCaller,
@@ -1735,15 +1895,86 @@ class IndexSearchResults(SearchResults, Iterable):
         count: int,
         assets: List[Asset],
         aggregations: Optional[Aggregations],
+        prefetch: int = 0,
+        bulk: bool = False,
+        stream: bool = False,
+        page: Optional[JsonObjectStream] = None,
+        lazy: bool = False,
     ):
         super().__init__(client, INDEX_SEARCH, criteria, start, size, assets)
         self._count = count
         self._aggregations = aggregations
+        self._prefetch = prefetch
+        self._bulk = bulk
+        self._stream = stream
+        # Page of results still being decoded, when streaming
+        self._page: Optional[JsonObjectStream] = page
+        self._lazy = lazy
+        self._base_query: Optional[Query] = criteria.dsl.query
+        # Creation time of the last asset seen, and the GUIDs of all assets seen with
+        # that same creation time: the next page starts from that time, skipping them
+        self._boundary_time: Optional[int] = None
+        self._boundary_guids: Set[str] = set()
+        if bulk:
+            self._track_boundary(assets)
 
     @property
     def aggregations(self) -> Optional[Aggregations]:
+        if self._page is not None:
+            # Aggregations follow the assets in the response
+            self.current_page()
         return self._aggregations
 
+    @property
+    def prefetch(self) -> int:
+        return self._prefetch
+
+    @property
+    def bulk(self) -> bool:
+        return self._bulk
+
+    @property
+    def stream(self) -> bool:
+        return self._stream
+
+    @property
+    def lazy(self) -> bool:
+        return self._lazy
+
+    def _parse_asset(self, entity: Dict[str, Any]) -> Asset:
+        if self._lazy:
+            return LazyAsset(  # type: ignore[return-value]
+                entity, self._criteria.custom_metadata_plan
+            )
+        return super()._parse_asset(entity)
+
+    def _parse_assets(self, raw_json) -> List[Asset]:
+        if self._lazy:
+            return [self._parse_asset(entity) for entity in raw_json["entities"]]
+        return super()._parse_assets(raw_json)
+
+    def current_page(self) -> List[Asset]:
+        """
+        Retrieve the current page of results. When streaming, this decodes the
+        remainder of the page (holding all of its assets in memory).
+
+        :returns: list of assets on the current page of results
+        """
+        if self._page is not None:
+            self._assets.extend(self._streamed_assets())
+        return self._assets
+
+    def next_page(self, start=None, size=None) -> bool:
+        """
+        Indicates whether there is a next page of results.
+
+        :returns: True if there is a next page of results, otherwise False
+        """
+        if self._page is not None:
+            # The current page must be fully read before the next one can be requested
+            self.current_page()
+        return super().next_page(start, size)
+
     def _get_next_page(self):
         """
         Fetches the next page of results.
@@ -1752,16 +1983,297 @@ class IndexSearchResults(SearchResults, Iterable):
         """
         self._criteria.dsl.from_ = self._start
         self._criteria.dsl.size = self._size
+        if self._bulk and self._boundary_time is not None:
+            self._criteria.dsl.query = self._query_from_boundary(self._boundary_time)
+            self._criteria.dsl.from_ = len(self._boundary_guids)
+        if self._stream:
+            return self._get_next_streamed_page()
         if raw_json := super()._get_next_page_json():
             self._count = raw_json.get("approximateCount", 0)
+            if self._bulk:
+                # Suppress any assets already seen (for example, if assets were
+                # created at the boundary time since the previous page was fetched)
+                self._assets = [
+                    asset
+                    for asset in self._assets
+                    if asset.guid not in self._boundary_guids
+                ]
+                self._track_boundary(self._assets)
             return True
         return False
 
+    def _get_next_streamed_page(self) -> bool:
+        self._assets = []
+        page = self._client._call_api_streaming(
+            INDEX_SEARCH, array_key="entities", request_obj=self._criteria
+        )
+        if page is None or not page.has_items():
+            return False
+        self._page = page
+        return True
+
+    def _streamed_assets(self) -> Generator[Asset, None, None]:
+        """
+        Decodes each asset on the current (streamed) page in turn, and once
+        the page is complete captures the count and aggregations that follow them.
+        """
+        page = self._page
+        if page is None:
+            return
+        for entity in page:
+            asset = self._parse_asset(entity)
+            if self._bulk:
+                if (
+                    asset.create_time == self._boundary_time
+                    and asset.guid in self._boundary_guids
+                ):
+                    continue
+                self._track_boundary([asset])
+            yield asset
+        self._page = None
+        if "approximateCount" in page.fields:
+            self._count = page.fields["approximateCount"]
+        if self._aggregations is None and "aggregations" in page.fields:
+            with contextlib.suppress(ValidationError):
+                self._aggregations = Aggregations.parse_obj(page.fields["aggregations"])
+
+    def _iter_streamed(self) -> Generator[Asset, None, None]:
+        while True:
+            yielded = 0
+            for asset in self._streamed_assets():
+                yielded += 1
+                yield asset
+            # Any of the page's assets decoded through current_page() (rather than here)
+            for asset in self._assets:
+                yielded += 1
+                yield asset
+            if not yielded:
+                break
+            self._start += self._size
+            if not self._get_next_page():
+                break
+
+    def _query_from_boundary(self, boundary_time: int) -> Query:
+        """
+        Restricts the original query to assets created no earlier than the last asset seen.
+
+        :param boundary_time: creation time of the last asset seen
+        """
+        since = Referenceable.CREATE_TIME.gte(boundary_time)
+        if self._base_query is None:
+            return Bool(filter=[since])  # type: ignore[call-arg]
+        return Bool(filter=[self._base_query, since])  # type: ignore[call-arg]
+
+    def _track_boundary(self, assets: List[Asset]):
+        for asset in assets:
+            if asset.create_time != self._boundary_time:
+                self._boundary_time = asset.create_time
+                self._boundary_guids = set()
+            self._boundary_guids.add(asset.guid)
+
+    def _fetch_page(self, criteria: IndexSearchRequest) -> Tuple[List[Asset], int]:
+        """
+        Fetches a single page of results, without changing the current page.
+        Used to fetch pages ahead of the one being processed.
+
+        :param criteria: search request (with its own offset) for the page to fetch
+        :returns: the assets on the page, and the approximate count of all results
+        """
+        raw_json = self._client._call_api(INDEX_SEARCH, request_obj=criteria)
+        count = raw_json.get("approximateCount", 0)
+        if "entities" not in raw_json:
+            return [], count
+        return self._parse_assets(raw_json), count
+
+    def _page_criteria(self, start: int) -> IndexSearchRequest:
+        criteria: IndexSearchRequest = self._criteria.copy(deep=True)  # type: ignore[assignment]
+        criteria.dsl.from_ = start
+        criteria.dsl.size = self._size
+        return criteria
+
+    def __iter__(self) -> Generator[Asset, None, None]:
+        """
+        Iterates through the results, lazily-fetching each next page until there
+        are no more results. When prefetching, up to that many subsequent pages are
+        fetched in the background while the current page is being processed.
+
+        :returns: an iterable form of each result, across all pages
+        """
+        if self._stream:
+            yield from self._iter_streamed()
+            return
+        if self._prefetch < 1 or self._bulk:
+            yield from super().__iter__()
+            return
+        yield from self.current_page()
+        if not self._assets:
+            return
+        next_start = self._start + self._size
+        pending: Deque[Future] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self._prefetch, thread_name_prefix="pyatlan-prefetch"
+        )
+
+        def fill(force: bool = False):
+            nonlocal next_start
+            # Only fetch ahead as far as the known count, so the number of
+            # pages held in memory never exceeds the prefetch limit
+            while len(pending) < self._prefetch and (force or next_start < self._count):
+                pending.append(
+                    executor.submit(self._fetch_page, self._page_criteria(next_start))
+                )
+                next_start += self._size
+                force = False
+
+        try:
+            fill(force=len(self._assets) == self._size)
+            while pending:
+                self._assets, self._count = pending.popleft().result()
+                self._start += self._size
+                if not self._assets:
+                    break
+                # The approximate count may be an underestimate,
+                # so keep going for as long as pages come back full
+                fill(force=not pending and len(self._assets) == self._size)
+                yield from self._assets
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     @property
     def count(self) -> int:
+        if self._page is not None and "approximateCount" not in self._page.fields:
+            # The count may follow the assets in the response
+            self.current_page()
         return self._count
 
 
+class ProjectionResults(Iterable):
+    """
+    Captures the results of a search projected onto a fixed set of fields, without building
+    any assets: each result is a named tuple of the values of those fields, exactly as they
+    were returned by the search (for example, times remain epoch milliseconds).
+    """
+
+    def __init__(self, results: IndexSearchResults, fields: List[AtlanField]):
+        """
+        :param results: the (lazy) results of the search
+        :param fields: fields onto which to project each result, in order
+        """
+        self._results = results
+        self._fields = fields
+        self._locations = [raw_location(field) for field in fields]
+        self._row_type: Any = namedtuple(  # type: ignore[misc]
+            "ProjectedAsset",
+            [self._column_name(field) for field in fields],
+            rename=True,
+        )
+
+    @staticmethod
+    def _column_name(field: AtlanField) -> str:
+        if isinstance(field, CustomMetadataField):
+            return to_snake_case(field.attribute_name)
+        return to_snake_case(field.atlan_field_name)
+
+    @property
+    def count(self) -> int:
+        return self._results.count
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        :returns: names of the fields in each result (derived from the fields projected onto)
+        """
+        return list(self._row_type._fields)
+
+    def __iter__(self) -> Generator[Tuple, None, None]:
+        """
+        Iterates through the projected results, lazily-fetching each next page until
+        there are no more results.
+
+        :returns: a named tuple of the projected values of each result, across all pages
+        """
+        row_type = self._row_type
+        locations = self._locations
+        for asset in self._results:
+            entity = asset.raw_json  # type: ignore[attr-defined]
+            attributes = entity.get("attributes") or {}
+            yield row_type(
+                *(
+                    (attributes if nested else entity).get(key)
+                    for nested, key in locations
+                )
+            )
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """
+        Retrieve every projected result, organized by column rather than by row.
+
+        :returns: a list of the values of each projected field across all results, keyed by column name
+        """
+        values: List[List[Any]] = [[] for _ in self._locations]
+        for row in self:
+            for column, value in zip(values, row):
+                column.append(value)
+        return dict(zip(self.columns, values))
+
+    def to_record_batches(
+        self, batch_size: Optional[int] = None
+    ) -> Generator[pa.RecordBatch, None, None]:
+        """
+        Iterates through the projected results as Apache Arrow record batches, lazily-fetching
+        each next page until there are no more results (so only a single batch is held in memory
+        at a time). The schema of the batches is derived from the definitions of the projected
+        attributes in the asset classes: any values that are not simple (for example,
+        relationships or custom metadata) are encoded as JSON strings.
+
+        :param batch_size: maximum number of results in each record batch (defaults to the page size of the search)
+        :returns: a record batch of the projected results, for each batch of results across all pages
+        :raises InvalidRequestError: if pyarrow is not installed
+        """
+        converter = ArrowConverter(self._fields, self.columns)
+        size = batch_size or self._results._size
+        rows: List[Tuple] = []
+        for row in self:
+            rows.append(row)
+            if len(rows) >= size:
+                yield converter.record_batch(rows)
+                rows = []
+        if rows:
+            yield converter.record_batch(rows)
+
+    def to_arrow(self, batch_size: Optional[int] = None) -> pa.Table:
+        """
+        Retrieve every projected result as a single Apache Arrow table.
+
+        :param batch_size: maximum number of results in each record batch (defaults to the page size of the search)
+        :returns: a table of the projected results, across all pages
+        :raises InvalidRequestError: if pyarrow is not installed
+        """
+        pa = import_pyarrow()
+        converter = ArrowConverter(self._fields, self.columns)
+        return pa.Table.from_batches(
+            self.to_record_batches(batch_size), schema=converter.schema
+        )
+
+    def to_parquet(self, where: Any, batch_size: Optional[int] = None, **kwargs):
+        """
+        Write every projected result to a Parquet file, one record batch at a time
+        (so that only a single batch is held in memory at a time).
+
+        :param where: path (or writable file-like object) to which to write the Parquet file
+        :param batch_size: maximum number of results in each record batch (defaults to the page size of the search)
+        :param kwargs: any further options for the Parquet writer (for example, compression)
+        :raises InvalidRequestError: if pyarrow is not installed
+        """
+        parquet = import_parquet()
+        converter = ArrowConverter(self._fields, self.columns)
+        with parquet.ParquetWriter(where, converter.schema, **kwargs) as writer:
+            for batch in self.to_record_batches(batch_size):
+                writer.write_batch(batch)
+
+
 class LineageListResults(SearchResults, Iterable):
     """
     Captures the response from a lineage retrieval against Atlan. Also provides the ability to
@@ -1831,6 +2343,9 @@ class FailedBatch:
 class Batch:
     """Utility class for managing bulk updates in batches."""
 
+    # Errors caused by the content of a batch, which may be isolated to some of its assets
+    _SPLITTABLE_ERRORS = (InvalidRequestError, NotFoundError, ConflictError)
+
     def __init__(
         self,
         client: AssetClient,
@@ -1838,6 +2353,10 @@ class Batch:
         replace_atlan_tags: bool = False,
         custom_metadata_handling: CustomMetadataHandling = CustomMetadataHandling.IGNORE,
         capture_failures: bool = False,
+        adaptive: bool = False,
+        target_latency: float = 10.0,
+        max_payload_bytes: Optional[int] = None,
+        split_on_failure: bool = False,
     ):
         """
         Create a new batch of assets to be bulk-saved.
@@ -1849,9 +2368,22 @@ class Batch:
         anything pre-existing), or merge it)
         :param capture_failures: when True, any failed batches will be captured and retained rather than exceptions
          being raised (for large amounts of processing this could cause memory issues!)
+        :param adaptive: when True, the size of each batch is halved whenever saving a batch takes longer than the
+        target latency, and grown back (up to max_size) whenever full batches are saved well within it
+        :param target_latency: number of seconds within which saving a batch should complete, when adaptive
+        :param max_payload_bytes: if provided, a batch is saved as soon as the (estimated) serialized size of its
+        assets reaches this number of bytes, even if it has fewer than max_size assets
+        :param split_on_failure: when True, a batch that fails because of its content is split in half and each half
+        retried (recursively), so that only the asset(s) causing the failure are failed and the rest are saved
         """
         self._client: AssetClient = client
         self._max_size: int = max_size
+        self._size: int = max_size
+        self._adaptive: bool = adaptive
+        self._target_latency: float = target_latency
+        self._max_payload_bytes: Optional[int] = max_payload_bytes
+        self._payload_bytes: int = 0
+        self._split_on_failure: bool = split_on_failure
         self._replace_atlan_tags: bool = replace_atlan_tags
         self._custom_metadata_handling: CustomMetadataHandling = (
             custom_metadata_handling
@@ -1887,6 +2419,14 @@ class Batch:
         """
         return self._updated
 
+    @property
+    def size(self) -> int:
+        """Get the number of assets at which the batch will currently be saved
+
+        :returns: max_size, or when adaptive the size to which the batch has been adapted
+        """
+        return self._size
+
     @validate_arguments
     def add(self, single: Asset) -> Optional[AssetMutationResponse]:
         """
@@ -1896,15 +2436,29 @@ class Batch:
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
         """
         self._batch.append(single)
+        if self._max_payload_bytes:
+            self._payload_bytes += len(single.json(by_alias=True, exclude_unset=True))
         return self._process()
 
+    def _is_full(self) -> bool:
+        if len(self._batch) >= self._size:
+            return True
+        return bool(
+            self._max_payload_bytes and self._payload_bytes >= self._max_payload_bytes
+        )
+
+    def _take_batch(self) -> List[Asset]:
+        batch, self._batch = self._batch, []
+        self._payload_bytes = 0
+        return batch
+
     def _process(self) -> Optional[AssetMutationResponse]:
         """If the number of entities we have queued up is equal to the batch size, process them and reset our queue;
         otherwise do nothing.
 
         :returns: an AssetMutationResponse containing the results of the save or None if the batch is still queued.
         """
-        return self.flush() if len(self._batch) == self._max_size else None
+        return self.flush() if self._is_full() else None
 
     def flush(self) -> Optional[AssetMutationResponse]:
         """Flush any remaining assets in the batch.
@@ -1913,37 +2467,97 @@ class Batch:
         """
         response: Optional[AssetMutationResponse] = None
         if self._batch:
-            try:
-                if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
-                    response = self._client.save(
-                        self._batch, replace_atlan_tags=self._replace_atlan_tags
-                    )
-                elif self._custom_metadata_handling == CustomMetadataHandling.OVERWRITE:
-                    response = self._client.save_replacing_cm(
-                        self._batch, replace_atlan_tags=self._replace_atlan_tags
-                    )
-                elif self._custom_metadata_handling == CustomMetadataHandling.MERGE:
-                    response = self._client.save_merging_cm(
-                        self._batch, replace_atlan_tags=self._replace_atlan_tags
-                    )
-                else:
-                    raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
-                        self._custom_metadata_handling,
-                        "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
-                        "or CustomMetadataHandling.MERGE",
-                    )
-            except AtlanError as er:
-                if self._capture_failures:
-                    self._failures.append(
-                        FailedBatch(failed_assets=self._batch, failure_reason=er)
-                    )
-                else:
-                    raise er
-            self._batch = []
+            response = self._save_batch(self._batch)
+            self._take_batch()
+        return response
+
+    def _save_batch(self, batch: List[Asset]) -> Optional[AssetMutationResponse]:
+        """Save the given assets in a single API call, and track the results.
+        When splitting on failure, a batch that fails is instead saved as two halves.
+
+        :param batch: assets to save
+        :returns: an AssetMutationResponse containing the results of saving the assets
+        """
+        started = time.perf_counter()
+        try:
+            response = self._save(batch)
+        except self._SPLITTABLE_ERRORS as er:
+            if not self._split_on_failure or len(batch) == 1:
+                self._fail(batch, er)
+                return None
+            LOGGER.debug("Splitting failed batch of %d assets.", len(batch))
+            middle = len(batch) // 2
+            return self._merge_responses(
+                self._save_batch(batch[:middle]), self._save_batch(batch[middle:])
+            )
+        except AtlanError as er:
+            self._fail(batch, er)
+            return None
+        self._adapt(len(batch), time.perf_counter() - started)
         if response:
             self._track_response(response=response)
         return response
 
+    def _fail(self, batch: List[Asset], er: AtlanError) -> None:
+        if self._capture_failures:
+            self._record_failure(FailedBatch(failed_assets=batch, failure_reason=er))
+        else:
+            raise er
+
+    def _adapt(self, saved: int, elapsed: float):
+        if not self._adaptive:
+            return
+        if elapsed > self._target_latency:
+            self._size = max(1, self._size // 2)
+        elif elapsed < self._target_latency / 2 and saved >= self._size:
+            self._size = min(self._max_size, self._size + (self._size + 1) // 2)
+
+    @staticmethod
+    def _merge_responses(
+        first: Optional[AssetMutationResponse], second: Optional[AssetMutationResponse]
+    ) -> Optional[AssetMutationResponse]:
+        if not first or not second:
+            return first or second
+        mutated = MutatedEntities.construct()
+        for action in ("CREATE", "UPDATE", "DELETE", "PARTIAL_UPDATE"):
+            assets = [
+                asset
+                for response in (first, second)
+                if response.mutated_entities
+                for asset in getattr(response.mutated_entities, action) or []
+            ]
+            setattr(mutated, action, assets or None)
+        return AssetMutationResponse.construct(
+            guid_assignments={
+                **(first.guid_assignments or {}),
+                **(second.guid_assignments or {}),
+            },
+            mutated_entities=mutated,
+            partial_updated_entities=(first.partial_updated_entities or [])
+            + (second.partial_updated_entities or [])
+            or None,
+        )
+
+    def _save(self, batch: List[Asset]) -> Optional[AssetMutationResponse]:
+        if self._custom_metadata_handling == CustomMetadataHandling.IGNORE:
+            return self._client.save(batch, replace_atlan_tags=self._replace_atlan_tags)
+        if self._custom_metadata_handling == CustomMetadataHandling.OVERWRITE:
+            return self._client.save_replacing_cm(
+                batch, replace_atlan_tags=self._replace_atlan_tags
+            )
+        if self._custom_metadata_handling == CustomMetadataHandling.MERGE:
+            return self._client.save_merging_cm(
+                batch, replace_atlan_tags=self._replace_atlan_tags
+            )
+        raise ErrorCode.INVALID_PARAMETER_TYPE.exception_with_parameters(
+            self._custom_metadata_handling,
+            "CustomMetadataHandling.IGNORE, CustomMetadataHandling.OVERWRITE "
+            "or CustomMetadataHandling.MERGE",
+        )
+
+    def _record_failure(self, failure: FailedBatch):
+        self._failures.append(failure)
+
     def _track_response(self, response: AssetMutationResponse):
         if response and response.mutated_entities:
             if response.mutated_entities.CREATE:
@@ -1960,6 +2574,160 @@ class Batch:
         tracker.append(asset)
 
 
+class ParallelBatch(Batch):
+    """Utility class for managing bulk updates in batches, saving multiple batches concurrently.
+
+    Each full batch is handed to a pool of workers, so that adding assets does not wait for
+    the batch to be saved. Once the maximum number of batches are pending, adding assets
+    waits for one of them to complete. Any batch containing a connection is only saved once
+    every batch before it has completed, and every batch after it waits for it to complete,
+    as assets within a connection cannot be saved before the connection exists.
+    """
+
+    def __init__(
+        self,
+        client: AssetClient,
+        max_size: int,
+        replace_atlan_tags: bool = False,
+        custom_metadata_handling: CustomMetadataHandling = CustomMetadataHandling.IGNORE,
+        capture_failures: bool = False,
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        adaptive: bool = False,
+        target_latency: float = 10.0,
+        max_payload_bytes: Optional[int] = None,
+        split_on_failure: bool = False,
+    ):
+        """
+        Create a new batch of assets to be bulk-saved concurrently.
+        :param client: AssetClient to use
+        :param max_size: maximum size of each batch that should be processed (per API call)
+        :param replace_atlan_tags: if True, all Atlan tags on an existing asset will be overwritten; if False,
+        all Atlan tags will be ignored
+        :param custom_metadata_handling:  how to handle custom metadata (ignore it, replace it (wiping out
+        anything pre-existing), or merge it)
+        :param capture_failures: when True, any failed batches will be captured and retained rather than exceptions
+         being raised (for large amounts of processing this could cause memory issues!); when False, the first
+         failure is raised by the next call to add() or flush(). Errors other than an AtlanError are never
+         captured, and are always raised in the same way
+        :param max_workers: maximum number of batches to save at the same time
+        :param max_pending: maximum number of full batches to hold (saving or waiting to be saved) before adding
+        further assets blocks, defaults to twice max_workers
+        :param adaptive: when True, the size of each batch is adapted to the time taken to save batches (see Batch)
+        :param target_latency: number of seconds within which saving a batch should complete, when adaptive
+        :param max_payload_bytes: if provided, a batch is saved as soon as the (estimated) serialized size of its
+        assets reaches this number of bytes
+        :param split_on_failure: when True, a batch that fails because of its content is split in half and each half
+        retried (recursively), so that only the asset(s) causing the failure are failed
+        """
+        super().__init__(
+            client=client,
+            max_size=max_size,
+            replace_atlan_tags=replace_atlan_tags,
+            custom_metadata_handling=custom_metadata_handling,
+            capture_failures=capture_failures,
+            adaptive=adaptive,
+            target_latency=target_latency,
+            max_payload_bytes=max_payload_bytes,
+            split_on_failure=split_on_failure,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyatlan-batch"
+        )
+        self._slots = BoundedSemaphore(max_pending or max_workers * 2)
+        self._lock = Lock()
+        self._pending: Set[Future] = set()
+        self._error: Optional[Exception] = None
+
+    def _process(self) -> Optional[AssetMutationResponse]:
+        """If the number of entities we have queued up is equal to the batch size, hand them to a worker to save
+        and reset our queue; otherwise do nothing.
+
+        :returns: None, as batches are saved asynchronously (see created, updated and failures for the results)
+        """
+        self._raise_error()
+        if self._is_full():
+            self._submit()
+        return None
+
+    def flush(self) -> Optional[AssetMutationResponse]:
+        """Flush any remaining assets in the batch, and wait for every batch to be saved.
+
+        :returns: None, as batches are saved asynchronously (see created, updated and failures for the results)
+        """
+        self._raise_error()
+        self._submit()
+        self._wait_for_pending()
+        self._raise_error()
+        return None
+
+    def close(self):
+        """Flush any remaining assets in the batch, wait for every batch to be saved and release the workers."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> ParallelBatch:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _submit(self):
+        batch = self._take_batch()
+        if not batch:
+            return
+        if any(isinstance(asset, Connection) for asset in batch):
+            # Save connections once everything before them is saved, and before anything after them
+            self._wait_for_pending()
+            self._save_batch(batch)
+            return
+        self._slots.acquire()
+        future = self._executor.submit(self._save_pending_batch, batch)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._complete)
+
+    def _save_pending_batch(self, batch: List[Asset]):
+        try:
+            self._save_batch(batch)
+        except Exception as err:
+            # Any error (not only an AtlanError, such as a dropped connection) must be raised
+            # to the caller, as nothing else inspects the future of a pending batch
+            with self._lock:
+                if self._error is None:
+                    self._error = err
+
+    def _complete(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _wait_for_pending(self):
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+    def _raise_error(self):
+        with self._lock:
+            error, self._error = self._error, None
+        if error:
+            raise error
+
+    def _record_failure(self, failure: FailedBatch):
+        with self._lock:
+            self._failures.append(failure)
+
+    def _track_response(self, response: AssetMutationResponse):
+        with self._lock:
+            super()._track_response(response)
+
+    def _adapt(self, saved: int, elapsed: float):
+        with self._lock:
+            super()._adapt(saved, elapsed)
+
+
 def _bfs(bfs_list: List[AtlasGlossaryCategory], to_add: List[AtlasGlossaryCategory]):
     for nade in to_add:
         bfs_list.extend(nade.children_categories or [])
@@ -4,14 +4,15 @@
 from __future__ import annotations
 
 import contextlib
-import copy
 import json
 import logging
 import shutil
+import threading
 import uuid
+import weakref
 from contextvars import ContextVar
 from importlib.resources import read_text
-from types import SimpleNamespace
+from types import MappingProxyType, SimpleNamespace
 from typing import (
     Any,
     ClassVar,
@@ -19,6 +20,7 @@ from typing import (
     Generator,
     List,
     Literal,
+    Mapping,
     Optional,
     Set,
     Type,
@@ -30,19 +32,32 @@ from warnings import warn
 import requests
 from pydantic.v1 import (
     BaseSettings,
+    Field,
     HttpUrl,
     PrivateAttr,
     StrictStr,
     constr,
     validate_arguments,
+    validator,
 )
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 from urllib3.util.retry import Retry
 
+from pyatlan.cache.refresher import CacheRefresher
+from pyatlan.cache.registry import CacheRegistry
+from pyatlan.cache.stats import CacheStatsSnapshot, MetricsCallback
+from pyatlan.cache.typedef_snapshot import TypeDefSnapshot
 from pyatlan.client.admin import AdminClient
 from pyatlan.client.asset import A, AssetClient, IndexSearchResults, LineageListResults
 from pyatlan.client.audit import AuditClient
-from pyatlan.client.common import CONNECTION_RETRY, HTTP_PREFIX, HTTPS_PREFIX
+from pyatlan.client.common import (
+    CONNECTION_RETRY,
+    HTTP_PREFIX,
+    HTTPS_PREFIX,
+    PooledHTTPAdapter,
+    SessionStrategy,
+)
+from pyatlan.client.compression import Compression, compress, import_zstandard
 from pyatlan.client.constants import EVENT_STREAM, PARSE_QUERY, UPLOAD_IMAGE
 from pyatlan.client.credential import CredentialClient
 from pyatlan.client.file import FileClient
@@ -52,6 +67,7 @@ from pyatlan.client.query import QueryClient
 from pyatlan.client.role import RoleClient
 from pyatlan.client.search_log import SearchLogClient
 from pyatlan.client.sso import SSOClient
+from pyatlan.client.streaming import STREAM_CHUNK_SIZE, JsonObjectStream
 from pyatlan.client.task import TaskClient
 from pyatlan.client.token import TokenClient
 from pyatlan.client.typedef import TypeDefClient
@@ -80,6 +96,7 @@ from pyatlan.model.role import RoleResponse
 from pyatlan.model.search import IndexSearchRequest
 from pyatlan.model.typedef import TypeDef, TypeDefResponse
 from pyatlan.model.user import AtlanUser, UserMinimalResponse, UserResponse
+from pyatlan.model.utils import json_bytes
 from pyatlan.multipart_data_generator import MultipartDataGenerator
 from pyatlan.utils import (
     API,
@@ -120,9 +137,45 @@ def log_response(response, *args, **kwargs):
     LOGGER.debug("URL: %s", response.request.url)
 
 
-def get_session():
-    retry_strategy = DEFAULT_RETRY
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+def get_http_adapter(
+    max_retries: Retry = DEFAULT_RETRY,
+    pool_size: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    tcp_keepalive: Optional[int] = None,
+) -> PooledHTTPAdapter:
+    """
+    Create an HTTP adapter, with its own pool of connections.
+
+    :param max_retries: retry strategy for calls made through the adapter
+    :param pool_size: number of hosts for which to pool connections
+    :param pool_maxsize: maximum number of connections to pool for each host
+    :param pool_block: whether to wait for a pooled connection when all are in use (rather than open another)
+    :param tcp_keepalive: seconds a connection is idle before each TCP keep-alive probe (None: not enabled)
+    :returns: the HTTP adapter
+    """
+    return PooledHTTPAdapter(
+        max_retries=max_retries,
+        pool_connections=pool_size,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+    )
+
+
+def get_session(
+    pool_size: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    keep_alive: bool = True,
+    tcp_keepalive: Optional[int] = None,
+):
+    adapter = get_http_adapter(
+        pool_size=pool_size,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+    )
     session = requests.session()
     session.mount(HTTPS_PREFIX, adapter)
     session.mount(HTTP_PREFIX, adapter)
@@ -133,6 +186,9 @@ def get_session():
             "User-Agent": f"Atlan-PythonSDK/{VERSION}",
         }
     )
+    if not keep_alive:
+        # Close each connection once its call completes, rather than returning it to the pool
+        session.headers["Connection"] = "close"
     session.hooks["response"].append(log_response)
     return session
 
@@ -141,8 +197,34 @@ class AtlanClient(BaseSettings):
     _default_client: "ClassVar[Optional[AtlanClient]]" = None
     base_url: Union[Literal["INTERNAL"], HttpUrl]
     api_key: str
-    _session: requests.Session = PrivateAttr(default_factory=get_session)
-    _request_params: dict = PrivateAttr()
+    typedef_snapshot_path: Optional[str] = None
+    typedef_snapshot_max_age: float = 300.0
+    # Number of hosts for which to pool HTTP connections
+    http_pool_size: int = Field(default=DEFAULT_POOLSIZE, ge=1)
+    # Maximum number of HTTP connections to pool for each host (per session)
+    http_pool_maxsize: int = Field(default=DEFAULT_POOLSIZE, ge=1)
+    # Whether to wait for a pooled connection when all are in use, rather than opening
+    # another connection that is discarded once its call completes
+    http_pool_block: bool = DEFAULT_POOLBLOCK
+    # Whether to keep connections open (and pooled) between calls
+    http_keep_alive: bool = True
+    # Seconds a pooled connection is idle before each TCP keep-alive probe (None: not enabled)
+    http_tcp_keepalive: Optional[int] = Field(default=None, ge=1)
+    # Whether all threads share a single HTTP session, or each thread has a session of its own
+    session_strategy: SessionStrategy = SessionStrategy.SHARED
+    # Encoding with which to compress the body of each request (None: requests are not compressed).
+    # Responses are always compressed by Atlan using the best encoding installed (gzip by default,
+    # or zstd if the zstandard package is installed) and decompressed as they are read.
+    request_compression: Optional[Compression] = None
+    # Smallest body (in bytes) to compress, as compressing a small body costs more than it saves
+    request_compression_min_size: int = Field(default=1024, ge=0)
+    _session: requests.Session = PrivateAttr()
+    _thread_local: threading.local = PrivateAttr(default_factory=threading.local)
+    _thread_sessions: "weakref.WeakSet[requests.Session]" = PrivateAttr(
+        default_factory=weakref.WeakSet
+    )
+    _session_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _base_headers: Mapping[str, str] = PrivateAttr()
     _workflow_client: Optional[WorkflowClient] = PrivateAttr(default=None)
     _credential_client: Optional[CredentialClient] = PrivateAttr(default=None)
     _admin_client: Optional[AdminClient] = PrivateAttr(default=None)
@@ -159,6 +241,10 @@ class AtlanClient(BaseSettings):
     _task_client: Optional[TaskClient] = PrivateAttr(default=None)
     _sso_client: Optional[SSOClient] = PrivateAttr(default=None)
     _file_client: Optional[FileClient] = PrivateAttr(default=None)
+    _typedef_snapshot: Optional[TypeDefSnapshot] = PrivateAttr(default=None)
+    _cache_refresher: Optional[CacheRefresher] = PrivateAttr(default=None)
+    _cache_metrics_callback: Optional[MetricsCallback] = PrivateAttr(default=None)
+    _caches: CacheRegistry = PrivateAttr()
 
     class Config:
         env_prefix = "atlan_"
@@ -185,17 +271,173 @@ class AtlanClient(BaseSettings):
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._request_params = {
-            "headers": {
-                "authorization": f"Bearer {self.api_key}",
-            }
-        }
+        self._session = self._new_session()
+        # Headers sent with every call to Atlan (never modified, so each call can merge its own
+        # headers into a new dict rather than copying a template of the parameters)
+        self._base_headers = MappingProxyType(
+            {"authorization": f"Bearer {self.api_key}"}
+        )
+        self._caches = CacheRegistry(self)
         AtlanClient._default_client = self
 
+    @validator("request_compression")
+    def validate_request_compression(cls, v):
+        if v == Compression.ZSTD:
+            # Fail fast if zstandard is not installed, rather than on the first request
+            import_zstandard()
+        return v
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        HTTP session through which the current thread makes calls: the single session shared by every
+        thread or, with the PER_THREAD session strategy, a session of the current thread's own.
+        """
+        if self.session_strategy != SessionStrategy.PER_THREAD:
+            return self._session
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._thread_local.session = self._new_session()
+            # Carry over any headers since added to the client's sessions
+            session.headers.update(self._session.headers)
+            with self._session_lock:
+                self._thread_sessions.add(session)
+        return session
+
+    def _new_session(self) -> requests.Session:
+        return get_session(
+            pool_size=self.http_pool_size,
+            pool_maxsize=self.http_pool_maxsize,
+            pool_block=self.http_pool_block,
+            keep_alive=self.http_keep_alive,
+            tcp_keepalive=self.http_tcp_keepalive,
+        )
+
+    def _all_sessions(self) -> List[requests.Session]:
+        with self._session_lock:
+            return [self._session, *self._thread_sessions]
+
+    def size_connection_pool(self, pool_maxsize: int):
+        """
+        Ensure each HTTP session of this client can pool at least the given number of connections
+        to each host, for example so that every one of a number of concurrent workers can hold a
+        pooled connection, rather than opening (and discarding) a new connection for each call.
+
+        :param pool_maxsize: minimum number of connections to pool for each host
+        """
+        if pool_maxsize > self.http_pool_maxsize:
+            self.http_pool_maxsize = pool_maxsize
+        for session in self._all_sessions():
+            for prefix in (HTTPS_PREFIX, HTTP_PREFIX):
+                current = session.adapters[prefix]
+                if getattr(current, "_pool_maxsize", 0) < pool_maxsize:
+                    session.mount(
+                        prefix,
+                        get_http_adapter(
+                            max_retries=getattr(current, "max_retries", DEFAULT_RETRY),
+                            pool_size=self.http_pool_size,
+                            pool_maxsize=self.http_pool_maxsize,
+                            pool_block=self.http_pool_block,
+                            tcp_keepalive=self.http_tcp_keepalive,
+                        ),
+                    )
+
     @property
     def cache_key(self) -> int:
         return f"{self.base_url}/{self.api_key}".__hash__()
 
+    @property
+    def typedef_snapshot(self) -> Optional[TypeDefSnapshot]:
+        """
+        Persistent snapshot of type definitions, shared across processes, used to populate the
+        type definition caches without downloading every type definition. Only used when a
+        typedef_snapshot_path (a directory, or a SQLite database) has been configured.
+        """
+        if self._typedef_snapshot is None and self.typedef_snapshot_path:
+            self._typedef_snapshot = TypeDefSnapshot.at(
+                self.typedef_snapshot_path,
+                tenant=str(self.base_url),
+                max_age=self.typedef_snapshot_max_age,
+            )
+        return self._typedef_snapshot
+
+    @property
+    def caches(self) -> CacheRegistry:
+        """
+        Caches owned by this client (translating between Atlan-internal IDs and human-readable names),
+        each created the first time it is used and released along with the client.
+        """
+        return self._caches
+
+    @property
+    def cache_refresher(self) -> Optional[CacheRefresher]:
+        """
+        Background refresher keeping the type definition caches of this client warm,
+        if one has been started (see start_cache_refresher).
+        """
+        return self._cache_refresher
+
+    def start_cache_refresher(
+        self, poll_interval: float = 30.0, refresh_interval: Optional[float] = None
+    ) -> CacheRefresher:
+        """
+        Start keeping the type definition (Atlan tag, custom metadata and enumeration) caches of this
+        client warm in the background. Once started, changes made to type definitions through this
+        client also refresh the caches in the background, rather than making the caller wait.
+
+        :param poll_interval: number of seconds between each check for changes to type definitions
+        :param refresh_interval: number of seconds after which to fully refresh each cache, even if no
+                                 changes have been detected (by default, caches are only refreshed on changes)
+        :returns: the (running) refresher
+        """
+        if self._cache_refresher is not None:
+            self._cache_refresher.stop()
+        self._cache_refresher = CacheRefresher.for_client(
+            self, poll_interval=poll_interval, refresh_interval=refresh_interval
+        ).start()
+        return self._cache_refresher
+
+    def stop_cache_refresher(self) -> None:
+        """
+        Stop keeping the type definition caches of this client warm in the background.
+        """
+        if self._cache_refresher is not None:
+            self._cache_refresher.stop()
+            self._cache_refresher = None
+
+    @property
+    def cache_metrics_callback(self) -> Optional[MetricsCallback]:
+        """
+        Function to which the metrics of this client's caches are exported as they occur,
+        if one has been set (see set_cache_metrics_callback).
+        """
+        return self._cache_metrics_callback
+
+    def set_cache_metrics_callback(self, callback: Optional[MetricsCallback]) -> None:
+        """
+        Export the metrics of this client's caches (misses, and the number and duration of refreshes
+        and lookups from Atlan) to a function as they occur, for example to publish them to a metrics
+        system. See CacheStats for the metrics exported.
+
+        :param callback: function called with the name of the cache, the name of the metric and its
+                         value (or None to stop exporting metrics)
+        """
+        self._cache_metrics_callback = callback
+        for cache in self.caches:
+            cache.stats.callback = callback
+
+    def cache_stats(self) -> Dict[str, CacheStatsSnapshot]:
+        """
+        Retrieve statistics for each of this client's caches that has been used: the number of hits
+        and misses, the number and duration of refreshes and lookups from Atlan, the number of
+        translations held and the number of translations that could not be found being remembered.
+
+        :returns: the statistics of each cache, keyed by the name of the cache
+        """
+        return {
+            type(cache).__name__: cache.stats.snapshot(cache) for cache in self.caches
+        }
+
     @property
     def admin(self) -> AdminClient:
         if self._admin_client is None:
@@ -293,7 +535,8 @@ class AtlanClient(BaseSettings):
         return self._file_client
 
     def update_headers(self, header: Dict[str, str]):
-        self._session.headers.update(header)
+        for session in self._all_sessions():
+            session.headers.update(header)
 
     def _handle_file_download(self, raw_response: Any, file_path: str) -> str:
         try:
@@ -306,23 +549,46 @@ class AtlanClient(BaseSettings):
         return file_path
 
     def _call_api_internal(
-        self, api, path, params, binary_data=None, download_file_path=None
+        self,
+        api,
+        path,
+        params,
+        binary_data=None,
+        download_file_path=None,
+        stream_array_key=None,
     ):
         token = request_id_var.set(str(uuid.uuid4()))
+        session = self.session
+        # Streamed response that is not handed to the caller, so must be closed
+        # to release its connection (whether it results in an error or None)
+        unstreamed = None
         try:
             params["headers"]["X-Atlan-Request-Id"] = request_id_var.get()
             if binary_data:
-                response = self._session.request(
+                response = session.request(
                     api.method.value, path, data=binary_data, **params
                 )
+            elif stream_array_key:
+                response = session.request(
+                    api.method.value, path, **params, stream=True
+                )
+                if response is not None and response.status_code == api.expected_status:
+                    LOGGER.debug("HTTP Status: %s", response.status_code)
+                    # Decode the body incrementally, rather than reading it all into memory
+                    return JsonObjectStream(
+                        response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                        array_key=stream_array_key,
+                        on_close=response.close,
+                    )
+                unstreamed = response
             elif api.consumes == EVENT_STREAM and api.produces == EVENT_STREAM:
-                response = self._session.request(
+                response = session.request(
                     api.method.value, path, **params, stream=True
                 )
                 if download_file_path:
                     return self._handle_file_download(response.raw, download_file_path)
             else:
-                response = self._session.request(api.method.value, path, **params)
+                response = session.request(api.method.value, path, **params)
             if response is not None:
                 LOGGER.debug("HTTP Status: %s", response.status_code)
             if response is None:
@@ -393,6 +659,8 @@ class AtlanClient(BaseSettings):
                     )
                 )
         finally:
+            if unstreamed is not None:
+                unstreamed.close()
             request_id_var.reset(token)
 
     def _api_logger(self, api: API, path: str):
@@ -410,6 +678,20 @@ class AtlanClient(BaseSettings):
             self._api_logger(api, path)
         return self._call_api_internal(api, path, params)
 
+    def _call_api_streaming(
+        self,
+        api,
+        array_key: str,
+        query_params=None,
+        request_obj=None,
+        exclude_unset: bool = True,
+    ) -> Optional[JsonObjectStream]:
+        path = self._create_path(api)
+        params = self._create_params(api, query_params, request_obj, exclude_unset)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self._api_logger(api, path)
+        return self._call_api_internal(api, path, params, stream_array_key=array_key)
+
     def _create_path(self, api: API):
         if self.base_url == "INTERNAL":
             return urljoin(api.endpoint.service, api.path)
@@ -431,35 +713,48 @@ class AtlanClient(BaseSettings):
 
     def _s3_presigned_url_file_upload(self, api: API, upload_file: Any):
         path = self._create_path(api)
-        params = copy.deepcopy(self._request_params)
         # No need of Atlan's API token here
-        params["headers"].pop("authorization", None)
+        params: Dict[str, Any] = {"headers": {}}
         return self._call_api_internal(api, path, params, binary_data=upload_file)
 
     def _presigned_url_file_download(self, api: API, file_path: str):
         path = self._create_path(api)
-        params = copy.deepcopy(self._request_params)
         # No need of Atlan's API token here
-        params["headers"].pop("authorization", None)
+        params: Dict[str, Any] = {"headers": {}}
         return self._call_api_internal(api, path, params, download_file_path=file_path)
 
     def _create_params(
         self, api: API, query_params, request_obj, exclude_unset: bool = True
     ):
-        params = copy.deepcopy(self._request_params)
-        params["headers"]["Accept"] = api.consumes
-        params["headers"]["content-type"] = api.produces
+        params: Dict[str, Any] = {
+            "headers": {
+                **self._base_headers,
+                "Accept": api.consumes,
+                "content-type": api.produces,
+            }
+        }
         if query_params is not None:
             params["params"] = query_params
         if request_obj is not None:
+            if api.consumes == APPLICATION_ENCODED_FORM and not isinstance(
+                request_obj, AtlanObject
+            ):
+                params["data"] = request_obj
+                return params
+            # Serialize the body directly to bytes, in a single pass
             if isinstance(request_obj, AtlanObject):
-                params["data"] = request_obj.json(
+                data = request_obj.json_bytes(
                     by_alias=True, exclude_unset=exclude_unset
                 )
-            elif api.consumes == APPLICATION_ENCODED_FORM:
-                params["data"] = request_obj
             else:
-                params["data"] = json.dumps(request_obj)
+                data = json_bytes(request_obj)
+            if (
+                self.request_compression is not None
+                and len(data) >= self.request_compression_min_size
+            ):
+                data = compress(data, self.request_compression)
+                params["headers"]["Content-Encoding"] = self.request_compression.value
+            params["data"] = data
         return params
 
     @validate_arguments
@@ -1534,9 +1829,9 @@ class AtlanClient(BaseSettings):
         """Creates a context manger that can used to temporarily change parameters used for retrying connnections.
         The original Retry information will be restored when the context is exited."""
         if self.base_url == "INTERNAL":
-            adapter = self._session.adapters[HTTP_PREFIX]
+            adapter = self.session.adapters[HTTP_PREFIX]
         else:
-            adapter = self._session.adapters[HTTPS_PREFIX]
+            adapter = self.session.adapters[HTTPS_PREFIX]
         current_max = adapter.max_retries
         adapter.max_retries = max_retries
         LOGGER.debug(
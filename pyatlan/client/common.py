@@ -2,8 +2,12 @@
 # Copyright 2022 Atlan Pte. Ltd.
 from __future__ import annotations
 
-from typing import Any, Generator, Protocol, runtime_checkable
+import socket
+from enum import Enum
+from typing import Any, Generator, List, Optional, Protocol, Tuple, runtime_checkable
 
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
 HTTPS_PREFIX = "https://"
@@ -16,6 +20,59 @@ CONNECTION_RETRY = Retry(
 )
 
 
+class SessionStrategy(str, Enum):
+    """
+    How the HTTP sessions (and so the pools of connections) of a client are shared between threads.
+    """
+
+    # A single session, whose pool of connections is shared by every thread
+    SHARED = "shared"
+    # A separate session, with its own pool of connections, for each thread that makes calls
+    PER_THREAD = "per_thread"
+
+
+def tcp_keepalive_options(idle: int) -> List[Tuple[int, int, int]]:
+    """
+    Socket options that enable TCP keep-alive, where the platform supports them.
+
+    :param idle: seconds a connection is idle before (and between) each keep-alive probe
+    :returns: the socket options
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # TCP_KEEPIDLE is named TCP_KEEPALIVE on macOS
+    for name in ("TCP_KEEPIDLE", "TCP_KEEPALIVE", "TCP_KEEPINTVL"):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), idle))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter that can also enable TCP keep-alive on its pooled connections, so that idle
+    connections are not silently dropped (for example, by load balancers) between calls.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["tcp_keepalive"]
+
+    def __init__(self, tcp_keepalive: Optional[int] = None, **kwargs):
+        """
+        :param tcp_keepalive: seconds a connection is idle before each TCP keep-alive probe
+        (by default, TCP keep-alive is not enabled)
+        :param kwargs: any other parameters of the adapter (for example, its pool size)
+        """
+        # Must be set first, as the pool manager is initialized by the adapter's constructor
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.tcp_keepalive is not None:
+            kwargs["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                *tcp_keepalive_options(self.tcp_keepalive),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 @runtime_checkable
 class ApiCaller(Protocol):
     def _call_api(
@@ -23,6 +80,16 @@ class ApiCaller(Protocol):
     ):
         pass
 
+    def _call_api_streaming(
+        self,
+        api,
+        array_key: str,
+        query_params=None,
+        request_obj=None,
+        exclude_unset: bool = True,
+    ):
+        pass
+
     def max_retries(
         self, max_retries: Retry = CONNECTION_RETRY
     ) -> Generator[None, None, None]:
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import gzip
+from enum import Enum
+from typing import Union
+
+from pyatlan.errors import ErrorCode
+
+ZSTD_COMPRESSION = "compressing requests with zstd"
+# zlib's default level, which achieves most of the reduction in size of the slowest level
+GZIP_LEVEL = 6
+
+
+class Compression(str, Enum):
+    """
+    Encoding with which to compress the body of each request.
+    """
+
+    GZIP = "gzip"
+    # Requires the zstandard package to be installed
+    ZSTD = "zstd"
+
+
+def import_zstandard():
+    """
+    Import zstandard, which is an optional dependency only needed to compress requests with zstd.
+
+    :returns: the zstandard module
+    :raises InvalidRequestError: if zstandard is not installed
+    """
+    try:
+        import zstandard
+    except ImportError as err:
+        raise ErrorCode.MISSING_OPTIONAL_DEPENDENCY.exception_with_parameters(
+            "zstandard", ZSTD_COMPRESSION
+        ) from err
+    return zstandard
+
+
+def compress(body: Union[str, bytes], encoding: Compression) -> bytes:
+    """
+    Compress the body of a request.
+
+    :param body: body of the request (strings are encoded as UTF-8)
+    :param encoding: encoding with which to compress the body
+    :returns: the compressed body
+    :raises InvalidRequestError: if compressing with zstd, but zstandard is not installed
+    """
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    if encoding == Compression.ZSTD:
+        # Compressors are not thread-safe, so one is created for each body
+        return import_zstandard().ZstdCompressor().compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
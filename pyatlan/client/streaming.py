@@ -0,0 +1,181 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Optional
+
+from pyatlan.errors import ErrorCode
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Number of bytes to read from a response at a time
+STREAM_CHUNK_SIZE = 65536
+# Once this many characters have been consumed, they are dropped from the buffer
+COMPACT_THRESHOLD = 65536
+
+
+class JsonObjectStream:
+    """
+    Incrementally decodes a JSON object from chunks of its text, yielding the items of one
+    (potentially very large) array within it one at a time, so that only a single item needs
+    to be held in memory rather than the entire object. All other members of the object are
+    decoded as they are reached, and made available through fields.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        array_key: str,
+        on_close: Optional[Callable[[], None]] = None,
+        encoding: str = "utf-8",
+    ):
+        """
+        :param chunks: the text of the JSON object, in (arbitrarily-sized) chunks of bytes
+        :param array_key: key of the top-level member whose array items should be yielded
+        :param on_close: to call once the object has been fully decoded (or the stream is closed)
+        :param encoding: encoding of the bytes in the chunks
+        """
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._array_key = array_key
+        self._on_close = on_close
+        self._buffer = ""
+        self._pos = 0
+        self._exhausted = False
+        self._closed = False
+        self._lookahead: Deque[Any] = deque()
+        self._items = self._decode()
+        self.fields: Dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """
+        :returns: True once the entire object has been decoded (or the stream closed)
+        """
+        return self._closed
+
+    def has_items(self) -> bool:
+        """
+        Decodes up to (and including) the first item of the array, without consuming it.
+
+        :returns: True if the array has at least one item, otherwise False
+        """
+        if not self._lookahead:
+            item = next(self._items, _END)
+            if item is _END:
+                return False
+            self._lookahead.append(item)
+        return True
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        """
+        Decodes each item of the array in turn. Once every item has been yielded,
+        the remainder of the object is decoded (so fields is complete).
+
+        :returns: each item of the array
+        """
+        while self._lookahead:
+            yield self._lookahead.popleft()
+        yield from self._items
+
+    def close(self):
+        """
+        Stop decoding, releasing the underlying source of chunks.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._on_close:
+                self._on_close()
+
+    def _decode(self) -> Generator[Any, None, None]:
+        try:
+            self._expect("{")
+            if self._peek() == "}":
+                self._pos += 1
+                return
+            while True:
+                key = self._value()
+                self._expect(":")
+                if key == self._array_key and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._value()
+                            if self._expect(",", "]") == "]":
+                                break
+                else:
+                    self.fields[key] = self._value()
+                if self._expect(",", "}") == "}":
+                    return
+        finally:
+            self.close()
+
+    def _read(self, at_least: int = 1) -> bool:
+        """
+        Reads further chunks into the buffer, until at least the given number of characters
+        has been added (or there is nothing left to read).
+
+        :returns: True if any characters were added, otherwise False
+        """
+        if self._pos > COMPACT_THRESHOLD:
+            consumed, self._pos = self._pos, 0
+            self._buffer = self._buffer[consumed:]
+        added = 0
+        while added < at_least and not self._exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                text = self._text_decoder.decode(b"", final=True)
+            else:
+                text = self._text_decoder.decode(chunk)
+            self._buffer += text
+            added += len(text)
+        return added > 0
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                raise self._error("Unexpected end of content")
+
+    def _expect(self, *expected: str) -> str:
+        char = self._peek()
+        if char not in expected:
+            raise self._error(f"Expected one of {expected} but found {char!r}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as err:
+                # Most likely the value is incomplete: read at least as much again as is
+                # buffered, so that large values are not repeatedly re-decoded
+                if not self._read(len(self._buffer) - self._pos):
+                    raise self._error(str(err)) from err
+                continue
+            # A value ending exactly at the end of the buffer (for example, a number)
+            # may continue in the next chunk
+            if end == len(self._buffer) and self._read():
+                continue
+            self._pos = end
+            return value
+
+    def _error(self, detail: str):
+        self.close()
+        start = self._pos
+        excerpt = self._buffer[start:][:100]
+        return ErrorCode.JSON_ERROR.exception_with_parameters(excerpt, 200, detail)
+
+
+_END = object()
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
-from typing import List, Union
+from typing import TYPE_CHECKING, Dict, List, Union, cast
 
 from pydantic.v1 import ValidationError, validate_arguments
 
@@ -8,6 +8,7 @@ from pyatlan.client.common import ApiCaller
 from pyatlan.client.constants import (
     CREATE_TYPE_DEFS,
     DELETE_TYPE_DEF_BY_NAME,
+    GET_ALL_TYPE_DEF_HEADERS,
     GET_ALL_TYPE_DEFS,
     GET_TYPE_DEF_BY_NAME,
     UPDATE_TYPE_DEFS,
@@ -22,9 +23,20 @@ from pyatlan.model.typedef import (
     RelationshipDef,
     StructDef,
     TypeDef,
+    TypeDefHeader,
     TypeDefResponse,
 )
 
+if TYPE_CHECKING:
+    from pyatlan.client.atlan import AtlanClient
+
+# Categories of the type definitions that are cached, by type of type definition
+_CACHED_CATEGORIES: Dict[type, AtlanTypeCategory] = {
+    AtlanTagDef: AtlanTypeCategory.CLASSIFICATION,
+    CustomMetadataDef: AtlanTypeCategory.CUSTOM_METADATA,
+    EnumDef: AtlanTypeCategory.ENUM,
+}
+
 
 def _build_typedef_request(typedef: TypeDef) -> TypeDefResponse:
     if isinstance(typedef, AtlanTagDef):
@@ -64,19 +76,28 @@ def _build_typedef_request(typedef: TypeDef) -> TypeDefResponse:
     return payload
 
 
-def _refresh_caches(typedef: TypeDef) -> None:
-    if isinstance(typedef, AtlanTagDef):
+def _refresh_caches(typedef_type: type, client: ApiCaller) -> None:
+    # If the client is keeping its caches warm in the background,
+    # refresh them there rather than making the caller wait
+    refresher = getattr(client, "cache_refresher", None)
+    if refresher is not None and refresher.running:
+        if category := _CACHED_CATEGORIES.get(typedef_type):
+            refresher.invalidate(category)
+        return
+    # Refresh the caches of the client that made the change, not those of the default client
+    atlan_client = cast("AtlanClient", client)
+    if issubclass(typedef_type, AtlanTagDef):
         from pyatlan.cache.atlan_tag_cache import AtlanTagCache
 
-        AtlanTagCache.refresh_cache()
-    if isinstance(typedef, CustomMetadataDef):
+        AtlanTagCache.get_cache(atlan_client)._refresh_cache()
+    if issubclass(typedef_type, CustomMetadataDef):
         from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
 
-        CustomMetadataCache.refresh_cache()
-    if isinstance(typedef, EnumDef):
+        CustomMetadataCache.get_cache(atlan_client)._refresh_cache()
+    if issubclass(typedef_type, EnumDef):
         from pyatlan.cache.enum_cache import EnumCache
 
-        EnumCache.refresh_cache()
+        EnumCache.get_cache(atlan_client)._refresh_cache()
 
 
 class TypeDefFactory:
@@ -153,6 +174,31 @@ class TypeDefClient:
         )
         return TypeDefResponse(**raw_json)
 
+    @validate_arguments
+    def get_headers(
+        self, type_category: Union[AtlanTypeCategory, List[AtlanTypeCategory]]
+    ) -> List[TypeDefHeader]:
+        """
+        Retrieves only the headers (GUID, name and category) of the specified category type definitions in Atlan.
+        This is much cheaper than retrieving the full type definitions, for example to check whether any
+        type definitions have been added or removed.
+
+        :param type_category: category of type definitions for which to retrieve headers
+        :returns: list of the headers of the type definitions of the requested categories
+        :raises AtlanError: on any API communication issue
+        """
+        categories: List[str] = []
+        if isinstance(type_category, list):
+            categories.extend(map(lambda x: x.value, type_category))
+        else:
+            categories.append(type_category.value)
+        query_params = {"type": categories}
+        raw_json = self._client._call_api(
+            GET_ALL_TYPE_DEF_HEADERS.format_path_with_params(),
+            query_params,
+        )
+        return [TypeDefHeader(**header) for header in raw_json or []]
+
     @validate_arguments
     def get_by_name(self, name: str) -> TypeDef:
         """
@@ -180,7 +226,8 @@ class TypeDefClient:
         Create a new type definition in Atlan.
         Note: only custom metadata, enumerations (options), and Atlan tag type
         definitions are currently supported. Furthermore, if any of these are
-        created their respective cache will be force-refreshed.
+        created their respective cache will be force-refreshed (in the background, if a
+        cache refresher has been started on the client).
 
         :param typedef: type definition to create
         :returns: the resulting type definition that was created
@@ -192,7 +239,7 @@ class TypeDefClient:
         raw_json = self._client._call_api(
             CREATE_TYPE_DEFS, request_obj=payload, exclude_unset=True
         )
-        _refresh_caches(typedef)
+        _refresh_caches(type(typedef), self._client)
         return TypeDefResponse(**raw_json)
 
     @validate_arguments
@@ -201,7 +248,8 @@ class TypeDefClient:
         Update an existing type definition in Atlan.
         Note: only custom metadata, enumerations (options), and Atlan tag type
         definitions are currently supported. Furthermore, if any of these are
-        updated their respective cache will be force-refreshed.
+        updated their respective cache will be force-refreshed (in the background, if a
+        cache refresher has been started on the client).
 
         :param typedef: type definition to update
         :returns: the resulting type definition that was updated
@@ -213,7 +261,7 @@ class TypeDefClient:
         raw_json = self._client._call_api(
             UPDATE_TYPE_DEFS, request_obj=payload, exclude_unset=True
         )
-        _refresh_caches(typedef)
+        _refresh_caches(type(typedef), self._client)
         return TypeDefResponse(**raw_json)
 
     @validate_arguments
@@ -221,7 +269,8 @@ class TypeDefClient:
         """
         Delete the type definition.
         Furthermore, if an Atlan tag, enumeration or custom metadata is deleted their
-        respective cache will be force-refreshed.
+        respective cache will be force-refreshed (in the background, if a cache refresher
+        has been started on the client).
 
         :param name: internal hashed-string name of the type definition
         :param typedef_type: type of the type definition that is being deleted
@@ -232,13 +281,19 @@ class TypeDefClient:
         if typedef_type == CustomMetadataDef:
             from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
 
-            internal_name = CustomMetadataCache.get_id_for_name(name)
+            internal_name = CustomMetadataCache.get_cache(
+                cast("AtlanClient", self._client)
+            )._get_id_for_name(name)
         elif typedef_type == EnumDef:
             internal_name = name
         elif typedef_type == AtlanTagDef:
             from pyatlan.cache.atlan_tag_cache import AtlanTagCache
 
-            internal_name = str(AtlanTagCache.get_id_for_name(name))
+            internal_name = str(
+                AtlanTagCache.get_cache(
+                    cast("AtlanClient", self._client)
+                )._get_id_for_name(name)
+            )
         else:
             raise ErrorCode.UNABLE_TO_PURGE_TYPEDEF_OF_TYPE.exception_with_parameters(
                 typedef_type
@@ -250,15 +305,4 @@ class TypeDefClient:
         else:
             raise ErrorCode.TYPEDEF_NOT_FOUND_BY_NAME.exception_with_parameters(name)
 
-        if typedef_type == CustomMetadataDef:
-            from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
-
-            CustomMetadataCache.refresh_cache()
-        elif typedef_type == EnumDef:
-            from pyatlan.cache.enum_cache import EnumCache
-
-            EnumCache.refresh_cache()
-        elif typedef_type == AtlanTagDef:
-            from pyatlan.cache.atlan_tag_cache import AtlanTagCache
-
-            AtlanTagCache.refresh_cache()
+        _refresh_caches(typedef_type, self._client)
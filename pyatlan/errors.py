@@ -537,6 +537,42 @@ class ErrorCode(Enum):
         "Please double-check your provided data contract JSON.",
         InvalidRequestError,
     )
+    UNABLE_TO_RUN_BULK_WITH_SORTS = (
+        400,
+        "ATLAN-PYTHON-400-063",
+        "Unable to execute bulk search with user-defined sorting options.",
+        "Please ensure that no sorting options are included in your search request when performing a bulk search.",
+        InvalidRequestError,
+    )
+    OVERLAPPING_EXPORT_SLICES = (
+        400,
+        "ATLAN-PYTHON-400-064",
+        "Slices {0} and {1} overlap, so the same asset could be exported more than once.",
+        "Please ensure that none of the slices for an export is a prefix of another.",
+        InvalidRequestError,
+    )
+    MISSING_FIELDS_TO_PROJECT = (
+        400,
+        "ATLAN-PYTHON-400-065",
+        "No fields were provided onto which to project the search results.",
+        "You must provide at least one field when projecting the results of a search.",
+        InvalidRequestError,
+    )
+    MISSING_OPTIONAL_DEPENDENCY = (
+        400,
+        "ATLAN-PYTHON-400-066",
+        "The {0} package is required for {1}, but it is not installed.",
+        "Install the missing package into the same environment as pyatlan (for example, using pip).",
+        InvalidRequestError,
+    )
+    UNABLE_TO_PROJECT_FIELD = (
+        400,
+        "ATLAN-PYTHON-400-067",
+        "The {0} field cannot be projected, as its value is not returned under a key of its own in search "
+        "results. Instead, {1}.",
+        "Remove this field from the fields onto which the search results are projected.",
+        InvalidRequestError,
+    )
     AUTHENTICATION_PASSTHROUGH = (
         401,
         "ATLAN-PYTHON-401-000",
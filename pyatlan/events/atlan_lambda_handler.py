@@ -37,6 +37,9 @@ def process_event(handler: AtlanEventHandler, event, context):
         )
     atlan_event = json.loads(body)
     atlan_event = AtlanEvent(**atlan_event)
+    if refresher := handler.client.cache_refresher:
+        # Refresh any caches the event shows are stale, before handling it
+        refresher.observe(atlan_event)
     if handler.validate_prerequisites(atlan_event):
         if isinstance(atlan_event.payload, AtlanEventPayload) and isinstance(
             atlan_event.payload.asset, Asset
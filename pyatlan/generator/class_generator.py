@@ -650,14 +650,18 @@ class Generator:
             script.write(content)
 
     def render_init(self, assets: List[AssetInfo]):
-        asset_names = [asset.name for asset in assets]
-        asset_imports = [
-            f"from .{asset.module_name} import {asset.name}" for asset in assets
-        ]
-
         template = self.environment.get_template("init.jinja2")
+        attribute_types: Dict[str, str] = {}
+        for asset in assets:
+            entity_def = asset.entity_def
+            for attribute_def in (entity_def.attribute_defs or []) + (
+                entity_def.relationship_attribute_defs or []
+            ):
+                attribute_types.setdefault(
+                    to_snake_case(attribute_def["name"]), asset.name
+                )
         content = template.render(
-            {"asset_imports": asset_imports, "asset_names": asset_names}
+            {"assets": assets, "attribute_types": attribute_types}
         )
 
         init_path = ASSETS_DIR / "__init__.py"
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
+
+from pydantic.v1.fields import SHAPE_LIST, SHAPE_SET, SHAPE_SINGLETON, ModelField
+
+from pyatlan.errors import ErrorCode
+from pyatlan.model.assets import Asset, registry
+from pyatlan.model.fields.atlan_fields import AtlanField, CustomMetadataField
+from pyatlan.model.lazy import raw_location
+from pyatlan.model.utils import to_snake_case
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+ARROW_EXPORT = "exporting search results to Arrow or Parquet"
+
+
+def import_pyarrow():
+    """
+    Import pyarrow, which is an optional dependency only needed to export to Arrow or Parquet.
+
+    :returns: the pyarrow module
+    :raises InvalidRequestError: if pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError as err:
+        raise ErrorCode.MISSING_OPTIONAL_DEPENDENCY.exception_with_parameters(
+            "pyarrow", ARROW_EXPORT
+        ) from err
+    return pyarrow
+
+
+def import_parquet():
+    """
+    Import the Parquet module of pyarrow.
+
+    :returns: the pyarrow.parquet module
+    :raises InvalidRequestError: if pyarrow is not installed
+    """
+    import_pyarrow()
+    import pyarrow.parquet
+
+    return pyarrow.parquet
+
+
+@lru_cache(maxsize=None)
+def _model_field(nested: bool, key: str) -> Optional[ModelField]:
+    """
+    Find the definition of an attribute, from the asset classes. Only the asset type that defines
+    the attribute is imported, and the result (including that no asset class defines it) is cached.
+
+    :param nested: whether the attribute is nested within the attributes of an asset
+    :param key: name of the attribute, as it appears in the raw JSON of an asset
+    :returns: the definition of the attribute, or None if no asset class defines it
+    """
+    name = to_snake_case(key)
+    if not nested:
+        return Asset.__fields__.get(name)
+    if (asset_type := registry.get_for_attribute(name)) is None:
+        return None
+    return asset_type.Attributes.__fields__.get(name)  # type: ignore[attr-defined]
+
+
+def _scalar_type(python_type: Any) -> Optional[pa.DataType]:
+    pa = import_pyarrow()
+    if isinstance(python_type, type):
+        # bool must be checked before int, as it is a subclass of int
+        if issubclass(python_type, bool):
+            return pa.bool_()
+        if issubclass(python_type, Enum) or issubclass(python_type, str):
+            return pa.string()
+        if issubclass(python_type, int):
+            return pa.int64()
+        if issubclass(python_type, float):
+            return pa.float64()
+        if issubclass(python_type, datetime):
+            # Times are returned by a search as epoch milliseconds
+            return pa.timestamp("ms", tz="UTC")
+    return None
+
+
+def _encode_json(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def arrow_type(field: AtlanField) -> Tuple[pa.DataType, Optional[Callable[[Any], Any]]]:
+    """
+    Derive the Arrow type of a field from the definition of the attribute in the asset classes.
+    Scalar values (and lists or sets of them) map to the equivalent Arrow type, while any other
+    values (for example, relationships, structs and custom metadata) are encoded as JSON strings.
+
+    :param field: the field whose type to derive
+    :returns: the Arrow type of the field, and a function to encode each of its values (if needed)
+    """
+    pa = import_pyarrow()
+    model_field = (
+        None
+        if isinstance(field, CustomMetadataField)
+        else _model_field(*raw_location(field))
+    )
+    if model_field is not None:
+        scalar_type = _scalar_type(model_field.type_)
+        if scalar_type is not None:
+            if model_field.shape == SHAPE_SINGLETON:
+                return scalar_type, None
+            if model_field.shape in (SHAPE_LIST, SHAPE_SET):
+                return pa.list_(scalar_type), None
+    return pa.string(), _encode_json
+
+
+class ArrowConverter:
+    """
+    Converts rows of projected search results into Arrow record batches, with a schema
+    derived from the definitions of the projected attributes in the asset classes.
+    """
+
+    def __init__(self, fields: Sequence[AtlanField], columns: Sequence[str]):
+        """
+        :param fields: fields that were projected, in order
+        :param columns: name of the column for each field, in order
+        :raises InvalidRequestError: if pyarrow is not installed
+        """
+        self._pa = import_pyarrow()
+        types = [arrow_type(field) for field in fields]
+        self._encoders = [encoder for _, encoder in types]
+        self._schema = self._pa.schema(
+            [
+                self._pa.field(column, data_type)
+                for column, (data_type, _) in zip(columns, types)
+            ]
+        )
+
+    @property
+    def schema(self) -> pa.Schema:
+        return self._schema
+
+    def record_batch(self, rows: List[Tuple]) -> pa.RecordBatch:
+        """
+        Convert rows of projected values into a record batch.
+
+        :param rows: each row of projected values (in the same order as the fields)
+        :returns: a record batch of the rows, in the schema of the converter
+        """
+        pa = self._pa
+        arrays = []
+        for index, (encoder, field) in enumerate(zip(self._encoders, self._schema)):
+            values = [row[index] for row in rows]
+            if encoder:
+                values = [encoder(value) for value in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from importlib import import_module
+from threading import RLock
+from typing import Any, Dict, Iterator, Mapping, MutableMapping, Optional, Set
+
+from pydantic.v1.typing import update_model_forward_refs
+
+
+class AssetTypes(Mapping[str, type]):
+    """
+    Namespace of every asset type, against which the forward references of asset attributes are
+    resolved. Only the asset types that are actually referred to are imported.
+    """
+
+    def __init__(self, registry: "AssetRegistry"):
+        """
+        :param registry: registry of the asset types
+        """
+        self._registry = registry
+
+    def __getitem__(self, name: str) -> type:
+        if name not in self._registry.modules:
+            raise KeyError(name)
+        return self._registry.load(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._registry.modules)
+
+    def __len__(self) -> int:
+        return len(self._registry.modules)
+
+
+class AssetRegistry:
+    """
+    Imports each asset type from its module only when it is first used, rather than importing every
+    asset type up-front, and resolves the forward references of its attributes at that point.
+    Asset types that have been used are published into the namespace of the package, so that
+    subsequent uses of them do not go through the registry at all.
+    """
+
+    def __init__(
+        self,
+        package: str,
+        namespace: MutableMapping[str, Any],
+        modules: Dict[str, str],
+        attributes: Optional[Dict[str, str]] = None,
+    ):
+        """
+        :param package: name of the package containing the modules of the asset types
+        :param namespace: namespace of the package, into which to publish each asset type once used
+        :param modules: name of the module (within the package) that defines each asset type, by type name
+        :param attributes: name of an asset type that defines each attribute, by attribute name
+        """
+        self.package = package
+        self.modules = modules
+        self.attributes = attributes or {}
+        self._namespace = namespace
+        self._types = AssetTypes(self)
+        self._lock = RLock()
+        self._resolved: Set[type] = set()
+
+    def load(self, name: str) -> type:
+        """
+        Import an asset type, without resolving the forward references of its attributes.
+
+        :param name: name of the asset type
+        :returns: the asset type
+        """
+        module = import_module(f"{self.package}.{self.modules[name]}")
+        return getattr(module, name)
+
+    def get(self, name: str) -> type:
+        """
+        Import an asset type (if not already imported), ready to be used.
+
+        :param name: name of the asset type
+        :returns: the asset type
+        :raises AttributeError: if there is no asset type with the given name
+        """
+        if name not in self.modules:
+            raise AttributeError(f"module {self.package!r} has no attribute {name!r}")
+        asset_type = self.load(name)
+        self.ensure_resolved(asset_type.Attributes)  # type: ignore[attr-defined]
+        self._namespace[name] = asset_type
+        return asset_type
+
+    def get_for_attribute(self, name: str) -> Optional[type]:
+        """
+        Import (only) an asset type that defines an attribute, if not already imported.
+
+        :param name: name of the attribute, as defined on the Attributes of the asset type
+        :returns: an asset type that defines the attribute, or None if no asset type defines it
+        """
+        type_name = self.attributes.get(name)
+        return None if type_name is None else self.get(type_name)
+
+    def ensure_resolved(self, attributes_type: type) -> None:
+        """
+        Resolve the forward references of the attributes of an asset type, if not already resolved.
+        This applies equally to asset types imported directly from their module (rather than through
+        the package), as it is done the first time that the attributes are constructed.
+
+        :param attributes_type: attributes of the asset type
+        """
+        if attributes_type in self._resolved:
+            return
+        with self._lock:
+            if attributes_type not in self._resolved:
+                update_model_forward_refs(
+                    attributes_type,
+                    attributes_type.__fields__.values(),  # type: ignore[attr-defined]
+                    attributes_type.__config__.json_encoders,  # type: ignore[attr-defined]
+                    self._types,  # type: ignore[arg-type]
+                )
+                self._resolved.add(attributes_type)
+
+    def load_all(self) -> None:
+        """
+        Import every asset type, for example to enumerate all of them through Asset's subclasses.
+        """
+        for name in self.modules:
+            self.get(name)
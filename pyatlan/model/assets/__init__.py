@@ -1,522 +1,1867 @@
 # Copyright 2022 Atlan Pte. Ltd.
 # isort: skip_file
-from .referenceable import Referenceable
-from .asset import Asset
-from .task import Task
-from .data_set import DataSet
-from .tag_attachment import TagAttachment
-from .connection import Connection
-from .workflow import Workflow
-from .process import Process
-from .atlas_glossary_category import AtlasGlossaryCategory
-from .stakeholder_title import StakeholderTitle
-from .badge import Badge
-from .access_control import AccessControl
-from .namespace import Namespace
-from .workflow_run import WorkflowRun
-from .catalog import Catalog
-from .atlas_glossary import AtlasGlossary
-from .auth_policy import AuthPolicy
-from .process_execution import ProcessExecution
-from .atlas_glossary_term import AtlasGlossaryTerm
-from .auth_service import AuthService
-from .cloud import Cloud
-from .infrastructure import Infrastructure
-from .b_i_process import BIProcess
-from .dbt_process import DbtProcess
-from .column_process import ColumnProcess
-from .persona import Persona
-from .purpose import Purpose
-from .collection import Collection
-from .folder import Folder
-from .airflow import Airflow
-from .data_contract import DataContract
-from .object_store import ObjectStore
-from .data_quality import DataQuality
-from .b_i import BI
-from .saa_s import SaaS
-from .resource import Resource
-from .multi_dimensional_dataset import MultiDimensionalDataset
-from .data_mesh import DataMesh
-from .s_q_l import SQL
-from .event_store import EventStore
-from .no_s_q_l import NoSQL
-from .matillion import Matillion
-from .dbt import Dbt
-from .insight import Insight
-from .a_p_i import API
-from .spark import Spark
-from .tag import Tag
-from .schema_registry import SchemaRegistry
-from .google import Google
-from .azure import Azure
-from .a_w_s import AWS
-from .dbt_column_process import DbtColumnProcess
-from .stakeholder import Stakeholder
-from .airflow_dag import AirflowDag
-from .airflow_task import AirflowTask
-from .s3 import S3
-from .a_d_l_s import ADLS
-from .g_c_s import GCS
-from .monte_carlo import MonteCarlo
-from .metric import Metric
-from .soda import Soda
-from .preset import Preset
-from .mode import Mode
-from .sigma import Sigma
-from .tableau import Tableau
-from .looker import Looker
-from .domo import Domo
-from .redash import Redash
-from .sisense import Sisense
-from .data_studio import DataStudio
-from .metabase import Metabase
-from .quick_sight import QuickSight
-from .thoughtspot import Thoughtspot
-from .power_b_i import PowerBI
-from .micro_strategy import MicroStrategy
-from .cognos import Cognos
-from .qlik import Qlik
-from .cognite import Cognite
-from .salesforce import Salesforce
-from .readme_template import ReadmeTemplate
-from .readme import Readme
-from .file import File
-from .link import Link
-from .cube import Cube
-from .cube_hierarchy import CubeHierarchy
-from .cube_field import CubeField
-from .cube_dimension import CubeDimension
-from .data_domain import DataDomain
-from .data_product import DataProduct
-from .table import Table
-from .query import Query
-from .schema import Schema
-from .snowflake_pipe import SnowflakePipe
-from .view import View
-from .materialised_view import MaterialisedView
-from .function import Function
-from .table_partition import TablePartition
-from .column import Column
-from .snowflake_stream import SnowflakeStream
-from .databricks_unity_catalog_tag import DatabricksUnityCatalogTag
-from .database import Database
-from .calculation_view import CalculationView
-from .procedure import Procedure
-from .snowflake_tag import SnowflakeTag
-from .kafka import Kafka
-from .azure_service_bus import AzureServiceBus
-from .cosmos_mongo_d_b import CosmosMongoDB
-from .dynamo_d_b import DynamoDB
-from .mongo_d_b import MongoDB
-from .matillion_group import MatillionGroup
-from .matillion_job import MatillionJob
-from .matillion_project import MatillionProject
-from .matillion_component import MatillionComponent
-from .dbt_model_column import DbtModelColumn
-from .dbt_tag import DbtTag
-from .dbt_test import DbtTest
-from .dbt_model import DbtModel
-from .dbt_metric import DbtMetric
-from .dbt_source import DbtSource
-from .a_p_i_spec import APISpec
-from .a_p_i_path import APIPath
-from .spark_job import SparkJob
-from .schema_registry_subject import SchemaRegistrySubject
-from .data_studio_asset import DataStudioAsset
-from .s3_bucket import S3Bucket
-from .s3_object import S3Object
-from .a_d_l_s_account import ADLSAccount
-from .a_d_l_s_container import ADLSContainer
-from .a_d_l_s_object import ADLSObject
-from .g_c_s_object import GCSObject
-from .g_c_s_bucket import GCSBucket
-from .m_c_incident import MCIncident
-from .m_c_monitor import MCMonitor
-from .soda_check import SodaCheck
-from .preset_chart import PresetChart
-from .preset_dataset import PresetDataset
-from .preset_dashboard import PresetDashboard
-from .preset_workspace import PresetWorkspace
-from .mode_report import ModeReport
-from .mode_query import ModeQuery
-from .mode_chart import ModeChart
-from .mode_workspace import ModeWorkspace
-from .mode_collection import ModeCollection
-from .sigma_dataset_column import SigmaDatasetColumn
-from .sigma_dataset import SigmaDataset
-from .sigma_workbook import SigmaWorkbook
-from .sigma_data_element_field import SigmaDataElementField
-from .sigma_page import SigmaPage
-from .sigma_data_element import SigmaDataElement
-from .tableau_workbook import TableauWorkbook
-from .tableau_datasource_field import TableauDatasourceField
-from .tableau_calculated_field import TableauCalculatedField
-from .tableau_project import TableauProject
-from .tableau_metric import TableauMetric
-from .tableau_site import TableauSite
-from .tableau_datasource import TableauDatasource
-from .tableau_dashboard import TableauDashboard
-from .tableau_flow import TableauFlow
-from .tableau_worksheet import TableauWorksheet
-from .looker_look import LookerLook
-from .looker_dashboard import LookerDashboard
-from .looker_folder import LookerFolder
-from .looker_tile import LookerTile
-from .looker_model import LookerModel
-from .looker_explore import LookerExplore
-from .looker_project import LookerProject
-from .looker_query import LookerQuery
-from .looker_field import LookerField
-from .looker_view import LookerView
-from .domo_dataset import DomoDataset
-from .domo_card import DomoCard
-from .domo_dataset_column import DomoDatasetColumn
-from .domo_dashboard import DomoDashboard
-from .redash_dashboard import RedashDashboard
-from .redash_query import RedashQuery
-from .redash_visualization import RedashVisualization
-from .sisense_folder import SisenseFolder
-from .sisense_widget import SisenseWidget
-from .sisense_datamodel import SisenseDatamodel
-from .sisense_datamodel_table import SisenseDatamodelTable
-from .sisense_dashboard import SisenseDashboard
-from .metabase_question import MetabaseQuestion
-from .metabase_collection import MetabaseCollection
-from .metabase_dashboard import MetabaseDashboard
-from .quick_sight_folder import QuickSightFolder
-from .quick_sight_dashboard_visual import QuickSightDashboardVisual
-from .quick_sight_analysis_visual import QuickSightAnalysisVisual
-from .quick_sight_dataset_field import QuickSightDatasetField
-from .quick_sight_analysis import QuickSightAnalysis
-from .quick_sight_dashboard import QuickSightDashboard
-from .quick_sight_dataset import QuickSightDataset
-from .thoughtspot_worksheet import ThoughtspotWorksheet
-from .thoughtspot_liveboard import ThoughtspotLiveboard
-from .thoughtspot_table import ThoughtspotTable
-from .thoughtspot_column import ThoughtspotColumn
-from .thoughtspot_view import ThoughtspotView
-from .thoughtspot_dashlet import ThoughtspotDashlet
-from .thoughtspot_answer import ThoughtspotAnswer
-from .power_b_i_report import PowerBIReport
-from .power_b_i_measure import PowerBIMeasure
-from .power_b_i_column import PowerBIColumn
-from .power_b_i_table import PowerBITable
-from .power_b_i_tile import PowerBITile
-from .power_b_i_datasource import PowerBIDatasource
-from .power_b_i_workspace import PowerBIWorkspace
-from .power_b_i_dataset import PowerBIDataset
-from .power_b_i_dashboard import PowerBIDashboard
-from .power_b_i_dataflow import PowerBIDataflow
-from .power_b_i_page import PowerBIPage
-from .micro_strategy_report import MicroStrategyReport
-from .micro_strategy_project import MicroStrategyProject
-from .micro_strategy_metric import MicroStrategyMetric
-from .micro_strategy_cube import MicroStrategyCube
-from .micro_strategy_dossier import MicroStrategyDossier
-from .micro_strategy_fact import MicroStrategyFact
-from .micro_strategy_document import MicroStrategyDocument
-from .micro_strategy_attribute import MicroStrategyAttribute
-from .micro_strategy_visualization import MicroStrategyVisualization
-from .cognos_exploration import CognosExploration
-from .cognos_dashboard import CognosDashboard
-from .cognos_report import CognosReport
-from .cognos_module import CognosModule
-from .cognos_file import CognosFile
-from .cognos_folder import CognosFolder
-from .cognos_package import CognosPackage
-from .cognos_datasource import CognosDatasource
-from .qlik_space import QlikSpace
-from .qlik_app import QlikApp
-from .qlik_chart import QlikChart
-from .qlik_dataset import QlikDataset
-from .qlik_sheet import QlikSheet
-from .cognite_event import CogniteEvent
-from .cognite_asset import CogniteAsset
-from .cognite_sequence import CogniteSequence
-from .cognite3_d_model import Cognite3DModel
-from .cognite_time_series import CogniteTimeSeries
-from .cognite_file import CogniteFile
-from .salesforce_object import SalesforceObject
-from .salesforce_field import SalesforceField
-from .salesforce_organization import SalesforceOrganization
-from .salesforce_dashboard import SalesforceDashboard
-from .salesforce_report import SalesforceReport
-from .snowflake_dynamic_table import SnowflakeDynamicTable
-from .mongo_d_b_collection import MongoDBCollection
-from .dynamo_d_b_secondary_index import DynamoDBSecondaryIndex
-from .dynamo_dbtable import DynamoDBTable
-from .mongo_d_b_database import MongoDBDatabase
-from .kafka_topic import KafkaTopic
-from .kafka_consumer_group import KafkaConsumerGroup
-from .azure_service_bus_namespace import AzureServiceBusNamespace
-from .azure_service_bus_topic import AzureServiceBusTopic
-from .cosmos_mongo_d_b_collection import CosmosMongoDBCollection
-from .cosmos_mongo_d_b_database import CosmosMongoDBDatabase
-from .qlik_stream import QlikStream
-from .dynamo_d_b_local_secondary_index import DynamoDBLocalSecondaryIndex
-from .dynamo_d_b_global_secondary_index import DynamoDBGlobalSecondaryIndex
-from .azure_event_hub import AzureEventHub
-from .azure_event_hub_consumer_group import AzureEventHubConsumerGroup
+from typing import TYPE_CHECKING, Any, List
 
+from pyatlan.model.asset_registry import AssetRegistry
 
-# Update asset forward references:
-localns = locals()
-Referenceable.Attributes.update_forward_refs(**localns)
-Asset.Attributes.update_forward_refs(**localns)
-Task.Attributes.update_forward_refs(**localns)
-DataSet.Attributes.update_forward_refs(**localns)
-TagAttachment.Attributes.update_forward_refs(**localns)
-Connection.Attributes.update_forward_refs(**localns)
-Workflow.Attributes.update_forward_refs(**localns)
-Process.Attributes.update_forward_refs(**localns)
-AtlasGlossaryCategory.Attributes.update_forward_refs(**localns)
-StakeholderTitle.Attributes.update_forward_refs(**localns)
-Badge.Attributes.update_forward_refs(**localns)
-AccessControl.Attributes.update_forward_refs(**localns)
-Namespace.Attributes.update_forward_refs(**localns)
-WorkflowRun.Attributes.update_forward_refs(**localns)
-Catalog.Attributes.update_forward_refs(**localns)
-AtlasGlossary.Attributes.update_forward_refs(**localns)
-AuthPolicy.Attributes.update_forward_refs(**localns)
-ProcessExecution.Attributes.update_forward_refs(**localns)
-AtlasGlossaryTerm.Attributes.update_forward_refs(**localns)
-AuthService.Attributes.update_forward_refs(**localns)
-Cloud.Attributes.update_forward_refs(**localns)
-Infrastructure.Attributes.update_forward_refs(**localns)
-BIProcess.Attributes.update_forward_refs(**localns)
-DbtProcess.Attributes.update_forward_refs(**localns)
-ColumnProcess.Attributes.update_forward_refs(**localns)
-Persona.Attributes.update_forward_refs(**localns)
-Purpose.Attributes.update_forward_refs(**localns)
-Collection.Attributes.update_forward_refs(**localns)
-Folder.Attributes.update_forward_refs(**localns)
-Airflow.Attributes.update_forward_refs(**localns)
-DataContract.Attributes.update_forward_refs(**localns)
-ObjectStore.Attributes.update_forward_refs(**localns)
-DataQuality.Attributes.update_forward_refs(**localns)
-BI.Attributes.update_forward_refs(**localns)
-SaaS.Attributes.update_forward_refs(**localns)
-Resource.Attributes.update_forward_refs(**localns)
-MultiDimensionalDataset.Attributes.update_forward_refs(**localns)
-DataMesh.Attributes.update_forward_refs(**localns)
-SQL.Attributes.update_forward_refs(**localns)
-EventStore.Attributes.update_forward_refs(**localns)
-NoSQL.Attributes.update_forward_refs(**localns)
-Matillion.Attributes.update_forward_refs(**localns)
-Dbt.Attributes.update_forward_refs(**localns)
-Insight.Attributes.update_forward_refs(**localns)
-API.Attributes.update_forward_refs(**localns)
-Spark.Attributes.update_forward_refs(**localns)
-Tag.Attributes.update_forward_refs(**localns)
-SchemaRegistry.Attributes.update_forward_refs(**localns)
-Google.Attributes.update_forward_refs(**localns)
-Azure.Attributes.update_forward_refs(**localns)
-AWS.Attributes.update_forward_refs(**localns)
-DbtColumnProcess.Attributes.update_forward_refs(**localns)
-Stakeholder.Attributes.update_forward_refs(**localns)
-AirflowDag.Attributes.update_forward_refs(**localns)
-AirflowTask.Attributes.update_forward_refs(**localns)
-S3.Attributes.update_forward_refs(**localns)
-ADLS.Attributes.update_forward_refs(**localns)
-GCS.Attributes.update_forward_refs(**localns)
-MonteCarlo.Attributes.update_forward_refs(**localns)
-Metric.Attributes.update_forward_refs(**localns)
-Soda.Attributes.update_forward_refs(**localns)
-Preset.Attributes.update_forward_refs(**localns)
-Mode.Attributes.update_forward_refs(**localns)
-Sigma.Attributes.update_forward_refs(**localns)
-Tableau.Attributes.update_forward_refs(**localns)
-Looker.Attributes.update_forward_refs(**localns)
-Domo.Attributes.update_forward_refs(**localns)
-Redash.Attributes.update_forward_refs(**localns)
-Sisense.Attributes.update_forward_refs(**localns)
-DataStudio.Attributes.update_forward_refs(**localns)
-Metabase.Attributes.update_forward_refs(**localns)
-QuickSight.Attributes.update_forward_refs(**localns)
-Thoughtspot.Attributes.update_forward_refs(**localns)
-PowerBI.Attributes.update_forward_refs(**localns)
-MicroStrategy.Attributes.update_forward_refs(**localns)
-Cognos.Attributes.update_forward_refs(**localns)
-Qlik.Attributes.update_forward_refs(**localns)
-Cognite.Attributes.update_forward_refs(**localns)
-Salesforce.Attributes.update_forward_refs(**localns)
-ReadmeTemplate.Attributes.update_forward_refs(**localns)
-Readme.Attributes.update_forward_refs(**localns)
-File.Attributes.update_forward_refs(**localns)
-Link.Attributes.update_forward_refs(**localns)
-Cube.Attributes.update_forward_refs(**localns)
-CubeHierarchy.Attributes.update_forward_refs(**localns)
-CubeField.Attributes.update_forward_refs(**localns)
-CubeDimension.Attributes.update_forward_refs(**localns)
-DataDomain.Attributes.update_forward_refs(**localns)
-DataProduct.Attributes.update_forward_refs(**localns)
-Table.Attributes.update_forward_refs(**localns)
-Query.Attributes.update_forward_refs(**localns)
-Schema.Attributes.update_forward_refs(**localns)
-SnowflakePipe.Attributes.update_forward_refs(**localns)
-View.Attributes.update_forward_refs(**localns)
-MaterialisedView.Attributes.update_forward_refs(**localns)
-Function.Attributes.update_forward_refs(**localns)
-TablePartition.Attributes.update_forward_refs(**localns)
-Column.Attributes.update_forward_refs(**localns)
-SnowflakeStream.Attributes.update_forward_refs(**localns)
-DatabricksUnityCatalogTag.Attributes.update_forward_refs(**localns)
-Database.Attributes.update_forward_refs(**localns)
-CalculationView.Attributes.update_forward_refs(**localns)
-Procedure.Attributes.update_forward_refs(**localns)
-SnowflakeTag.Attributes.update_forward_refs(**localns)
-Kafka.Attributes.update_forward_refs(**localns)
-AzureServiceBus.Attributes.update_forward_refs(**localns)
-CosmosMongoDB.Attributes.update_forward_refs(**localns)
-DynamoDB.Attributes.update_forward_refs(**localns)
-MongoDB.Attributes.update_forward_refs(**localns)
-MatillionGroup.Attributes.update_forward_refs(**localns)
-MatillionJob.Attributes.update_forward_refs(**localns)
-MatillionProject.Attributes.update_forward_refs(**localns)
-MatillionComponent.Attributes.update_forward_refs(**localns)
-DbtModelColumn.Attributes.update_forward_refs(**localns)
-DbtTag.Attributes.update_forward_refs(**localns)
-DbtTest.Attributes.update_forward_refs(**localns)
-DbtModel.Attributes.update_forward_refs(**localns)
-DbtMetric.Attributes.update_forward_refs(**localns)
-DbtSource.Attributes.update_forward_refs(**localns)
-APISpec.Attributes.update_forward_refs(**localns)
-APIPath.Attributes.update_forward_refs(**localns)
-SparkJob.Attributes.update_forward_refs(**localns)
-SchemaRegistrySubject.Attributes.update_forward_refs(**localns)
-DataStudioAsset.Attributes.update_forward_refs(**localns)
-S3Bucket.Attributes.update_forward_refs(**localns)
-S3Object.Attributes.update_forward_refs(**localns)
-ADLSAccount.Attributes.update_forward_refs(**localns)
-ADLSContainer.Attributes.update_forward_refs(**localns)
-ADLSObject.Attributes.update_forward_refs(**localns)
-GCSObject.Attributes.update_forward_refs(**localns)
-GCSBucket.Attributes.update_forward_refs(**localns)
-MCIncident.Attributes.update_forward_refs(**localns)
-MCMonitor.Attributes.update_forward_refs(**localns)
-SodaCheck.Attributes.update_forward_refs(**localns)
-PresetChart.Attributes.update_forward_refs(**localns)
-PresetDataset.Attributes.update_forward_refs(**localns)
-PresetDashboard.Attributes.update_forward_refs(**localns)
-PresetWorkspace.Attributes.update_forward_refs(**localns)
-ModeReport.Attributes.update_forward_refs(**localns)
-ModeQuery.Attributes.update_forward_refs(**localns)
-ModeChart.Attributes.update_forward_refs(**localns)
-ModeWorkspace.Attributes.update_forward_refs(**localns)
-ModeCollection.Attributes.update_forward_refs(**localns)
-SigmaDatasetColumn.Attributes.update_forward_refs(**localns)
-SigmaDataset.Attributes.update_forward_refs(**localns)
-SigmaWorkbook.Attributes.update_forward_refs(**localns)
-SigmaDataElementField.Attributes.update_forward_refs(**localns)
-SigmaPage.Attributes.update_forward_refs(**localns)
-SigmaDataElement.Attributes.update_forward_refs(**localns)
-TableauWorkbook.Attributes.update_forward_refs(**localns)
-TableauDatasourceField.Attributes.update_forward_refs(**localns)
-TableauCalculatedField.Attributes.update_forward_refs(**localns)
-TableauProject.Attributes.update_forward_refs(**localns)
-TableauMetric.Attributes.update_forward_refs(**localns)
-TableauSite.Attributes.update_forward_refs(**localns)
-TableauDatasource.Attributes.update_forward_refs(**localns)
-TableauDashboard.Attributes.update_forward_refs(**localns)
-TableauFlow.Attributes.update_forward_refs(**localns)
-TableauWorksheet.Attributes.update_forward_refs(**localns)
-LookerLook.Attributes.update_forward_refs(**localns)
-LookerDashboard.Attributes.update_forward_refs(**localns)
-LookerFolder.Attributes.update_forward_refs(**localns)
-LookerTile.Attributes.update_forward_refs(**localns)
-LookerModel.Attributes.update_forward_refs(**localns)
-LookerExplore.Attributes.update_forward_refs(**localns)
-LookerProject.Attributes.update_forward_refs(**localns)
-LookerQuery.Attributes.update_forward_refs(**localns)
-LookerField.Attributes.update_forward_refs(**localns)
-LookerView.Attributes.update_forward_refs(**localns)
-DomoDataset.Attributes.update_forward_refs(**localns)
-DomoCard.Attributes.update_forward_refs(**localns)
-DomoDatasetColumn.Attributes.update_forward_refs(**localns)
-DomoDashboard.Attributes.update_forward_refs(**localns)
-RedashDashboard.Attributes.update_forward_refs(**localns)
-RedashQuery.Attributes.update_forward_refs(**localns)
-RedashVisualization.Attributes.update_forward_refs(**localns)
-SisenseFolder.Attributes.update_forward_refs(**localns)
-SisenseWidget.Attributes.update_forward_refs(**localns)
-SisenseDatamodel.Attributes.update_forward_refs(**localns)
-SisenseDatamodelTable.Attributes.update_forward_refs(**localns)
-SisenseDashboard.Attributes.update_forward_refs(**localns)
-MetabaseQuestion.Attributes.update_forward_refs(**localns)
-MetabaseCollection.Attributes.update_forward_refs(**localns)
-MetabaseDashboard.Attributes.update_forward_refs(**localns)
-QuickSightFolder.Attributes.update_forward_refs(**localns)
-QuickSightDashboardVisual.Attributes.update_forward_refs(**localns)
-QuickSightAnalysisVisual.Attributes.update_forward_refs(**localns)
-QuickSightDatasetField.Attributes.update_forward_refs(**localns)
-QuickSightAnalysis.Attributes.update_forward_refs(**localns)
-QuickSightDashboard.Attributes.update_forward_refs(**localns)
-QuickSightDataset.Attributes.update_forward_refs(**localns)
-ThoughtspotWorksheet.Attributes.update_forward_refs(**localns)
-ThoughtspotLiveboard.Attributes.update_forward_refs(**localns)
-ThoughtspotTable.Attributes.update_forward_refs(**localns)
-ThoughtspotColumn.Attributes.update_forward_refs(**localns)
-ThoughtspotView.Attributes.update_forward_refs(**localns)
-ThoughtspotDashlet.Attributes.update_forward_refs(**localns)
-ThoughtspotAnswer.Attributes.update_forward_refs(**localns)
-PowerBIReport.Attributes.update_forward_refs(**localns)
-PowerBIMeasure.Attributes.update_forward_refs(**localns)
-PowerBIColumn.Attributes.update_forward_refs(**localns)
-PowerBITable.Attributes.update_forward_refs(**localns)
-PowerBITile.Attributes.update_forward_refs(**localns)
-PowerBIDatasource.Attributes.update_forward_refs(**localns)
-PowerBIWorkspace.Attributes.update_forward_refs(**localns)
-PowerBIDataset.Attributes.update_forward_refs(**localns)
-PowerBIDashboard.Attributes.update_forward_refs(**localns)
-PowerBIDataflow.Attributes.update_forward_refs(**localns)
-PowerBIPage.Attributes.update_forward_refs(**localns)
-MicroStrategyReport.Attributes.update_forward_refs(**localns)
-MicroStrategyProject.Attributes.update_forward_refs(**localns)
-MicroStrategyMetric.Attributes.update_forward_refs(**localns)
-MicroStrategyCube.Attributes.update_forward_refs(**localns)
-MicroStrategyDossier.Attributes.update_forward_refs(**localns)
-MicroStrategyFact.Attributes.update_forward_refs(**localns)
-MicroStrategyDocument.Attributes.update_forward_refs(**localns)
-MicroStrategyAttribute.Attributes.update_forward_refs(**localns)
-MicroStrategyVisualization.Attributes.update_forward_refs(**localns)
-CognosExploration.Attributes.update_forward_refs(**localns)
-CognosDashboard.Attributes.update_forward_refs(**localns)
-CognosReport.Attributes.update_forward_refs(**localns)
-CognosModule.Attributes.update_forward_refs(**localns)
-CognosFile.Attributes.update_forward_refs(**localns)
-CognosFolder.Attributes.update_forward_refs(**localns)
-CognosPackage.Attributes.update_forward_refs(**localns)
-CognosDatasource.Attributes.update_forward_refs(**localns)
-QlikSpace.Attributes.update_forward_refs(**localns)
-QlikApp.Attributes.update_forward_refs(**localns)
-QlikChart.Attributes.update_forward_refs(**localns)
-QlikDataset.Attributes.update_forward_refs(**localns)
-QlikSheet.Attributes.update_forward_refs(**localns)
-CogniteEvent.Attributes.update_forward_refs(**localns)
-CogniteAsset.Attributes.update_forward_refs(**localns)
-CogniteSequence.Attributes.update_forward_refs(**localns)
-Cognite3DModel.Attributes.update_forward_refs(**localns)
-CogniteTimeSeries.Attributes.update_forward_refs(**localns)
-CogniteFile.Attributes.update_forward_refs(**localns)
-SalesforceObject.Attributes.update_forward_refs(**localns)
-SalesforceField.Attributes.update_forward_refs(**localns)
-SalesforceOrganization.Attributes.update_forward_refs(**localns)
-SalesforceDashboard.Attributes.update_forward_refs(**localns)
-SalesforceReport.Attributes.update_forward_refs(**localns)
-SnowflakeDynamicTable.Attributes.update_forward_refs(**localns)
-MongoDBCollection.Attributes.update_forward_refs(**localns)
-DynamoDBSecondaryIndex.Attributes.update_forward_refs(**localns)
-DynamoDBTable.Attributes.update_forward_refs(**localns)
-MongoDBDatabase.Attributes.update_forward_refs(**localns)
-KafkaTopic.Attributes.update_forward_refs(**localns)
-KafkaConsumerGroup.Attributes.update_forward_refs(**localns)
-AzureServiceBusNamespace.Attributes.update_forward_refs(**localns)
-AzureServiceBusTopic.Attributes.update_forward_refs(**localns)
-CosmosMongoDBCollection.Attributes.update_forward_refs(**localns)
-CosmosMongoDBDatabase.Attributes.update_forward_refs(**localns)
-QlikStream.Attributes.update_forward_refs(**localns)
-DynamoDBLocalSecondaryIndex.Attributes.update_forward_refs(**localns)
-DynamoDBGlobalSecondaryIndex.Attributes.update_forward_refs(**localns)
-AzureEventHub.Attributes.update_forward_refs(**localns)
-AzureEventHubConsumerGroup.Attributes.update_forward_refs(**localns)
+if TYPE_CHECKING:
+    from .task import Task
+    from .data_set import DataSet
+    from .tag_attachment import TagAttachment
+    from .connection import Connection
+    from .workflow import Workflow
+    from .process import Process
+    from .atlas_glossary_category import AtlasGlossaryCategory
+    from .stakeholder_title import StakeholderTitle
+    from .badge import Badge
+    from .access_control import AccessControl
+    from .namespace import Namespace
+    from .workflow_run import WorkflowRun
+    from .catalog import Catalog
+    from .atlas_glossary import AtlasGlossary
+    from .auth_policy import AuthPolicy
+    from .process_execution import ProcessExecution
+    from .atlas_glossary_term import AtlasGlossaryTerm
+    from .auth_service import AuthService
+    from .cloud import Cloud
+    from .infrastructure import Infrastructure
+    from .b_i_process import BIProcess
+    from .dbt_process import DbtProcess
+    from .column_process import ColumnProcess
+    from .persona import Persona
+    from .purpose import Purpose
+    from .collection import Collection
+    from .folder import Folder
+    from .airflow import Airflow
+    from .data_contract import DataContract
+    from .object_store import ObjectStore
+    from .data_quality import DataQuality
+    from .b_i import BI
+    from .saa_s import SaaS
+    from .resource import Resource
+    from .multi_dimensional_dataset import MultiDimensionalDataset
+    from .data_mesh import DataMesh
+    from .s_q_l import SQL
+    from .event_store import EventStore
+    from .no_s_q_l import NoSQL
+    from .matillion import Matillion
+    from .dbt import Dbt
+    from .insight import Insight
+    from .a_p_i import API
+    from .spark import Spark
+    from .tag import Tag
+    from .schema_registry import SchemaRegistry
+    from .google import Google
+    from .azure import Azure
+    from .a_w_s import AWS
+    from .dbt_column_process import DbtColumnProcess
+    from .stakeholder import Stakeholder
+    from .airflow_dag import AirflowDag
+    from .airflow_task import AirflowTask
+    from .s3 import S3
+    from .a_d_l_s import ADLS
+    from .g_c_s import GCS
+    from .monte_carlo import MonteCarlo
+    from .metric import Metric
+    from .soda import Soda
+    from .preset import Preset
+    from .mode import Mode
+    from .sigma import Sigma
+    from .tableau import Tableau
+    from .looker import Looker
+    from .domo import Domo
+    from .redash import Redash
+    from .sisense import Sisense
+    from .data_studio import DataStudio
+    from .metabase import Metabase
+    from .quick_sight import QuickSight
+    from .thoughtspot import Thoughtspot
+    from .power_b_i import PowerBI
+    from .micro_strategy import MicroStrategy
+    from .cognos import Cognos
+    from .qlik import Qlik
+    from .cognite import Cognite
+    from .salesforce import Salesforce
+    from .readme_template import ReadmeTemplate
+    from .readme import Readme
+    from .file import File
+    from .link import Link
+    from .cube import Cube
+    from .cube_hierarchy import CubeHierarchy
+    from .cube_field import CubeField
+    from .cube_dimension import CubeDimension
+    from .data_domain import DataDomain
+    from .data_product import DataProduct
+    from .table import Table
+    from .query import Query
+    from .schema import Schema
+    from .snowflake_pipe import SnowflakePipe
+    from .view import View
+    from .materialised_view import MaterialisedView
+    from .function import Function
+    from .table_partition import TablePartition
+    from .column import Column
+    from .snowflake_stream import SnowflakeStream
+    from .databricks_unity_catalog_tag import DatabricksUnityCatalogTag
+    from .database import Database
+    from .calculation_view import CalculationView
+    from .procedure import Procedure
+    from .snowflake_tag import SnowflakeTag
+    from .kafka import Kafka
+    from .azure_service_bus import AzureServiceBus
+    from .cosmos_mongo_d_b import CosmosMongoDB
+    from .dynamo_d_b import DynamoDB
+    from .mongo_d_b import MongoDB
+    from .matillion_group import MatillionGroup
+    from .matillion_job import MatillionJob
+    from .matillion_project import MatillionProject
+    from .matillion_component import MatillionComponent
+    from .dbt_model_column import DbtModelColumn
+    from .dbt_tag import DbtTag
+    from .dbt_test import DbtTest
+    from .dbt_model import DbtModel
+    from .dbt_metric import DbtMetric
+    from .dbt_source import DbtSource
+    from .a_p_i_spec import APISpec
+    from .a_p_i_path import APIPath
+    from .spark_job import SparkJob
+    from .schema_registry_subject import SchemaRegistrySubject
+    from .data_studio_asset import DataStudioAsset
+    from .s3_bucket import S3Bucket
+    from .s3_object import S3Object
+    from .a_d_l_s_account import ADLSAccount
+    from .a_d_l_s_container import ADLSContainer
+    from .a_d_l_s_object import ADLSObject
+    from .g_c_s_object import GCSObject
+    from .g_c_s_bucket import GCSBucket
+    from .m_c_incident import MCIncident
+    from .m_c_monitor import MCMonitor
+    from .soda_check import SodaCheck
+    from .preset_chart import PresetChart
+    from .preset_dataset import PresetDataset
+    from .preset_dashboard import PresetDashboard
+    from .preset_workspace import PresetWorkspace
+    from .mode_report import ModeReport
+    from .mode_query import ModeQuery
+    from .mode_chart import ModeChart
+    from .mode_workspace import ModeWorkspace
+    from .mode_collection import ModeCollection
+    from .sigma_dataset_column import SigmaDatasetColumn
+    from .sigma_dataset import SigmaDataset
+    from .sigma_workbook import SigmaWorkbook
+    from .sigma_data_element_field import SigmaDataElementField
+    from .sigma_page import SigmaPage
+    from .sigma_data_element import SigmaDataElement
+    from .tableau_workbook import TableauWorkbook
+    from .tableau_datasource_field import TableauDatasourceField
+    from .tableau_calculated_field import TableauCalculatedField
+    from .tableau_project import TableauProject
+    from .tableau_metric import TableauMetric
+    from .tableau_site import TableauSite
+    from .tableau_datasource import TableauDatasource
+    from .tableau_dashboard import TableauDashboard
+    from .tableau_flow import TableauFlow
+    from .tableau_worksheet import TableauWorksheet
+    from .looker_look import LookerLook
+    from .looker_dashboard import LookerDashboard
+    from .looker_folder import LookerFolder
+    from .looker_tile import LookerTile
+    from .looker_model import LookerModel
+    from .looker_explore import LookerExplore
+    from .looker_project import LookerProject
+    from .looker_query import LookerQuery
+    from .looker_field import LookerField
+    from .looker_view import LookerView
+    from .domo_dataset import DomoDataset
+    from .domo_card import DomoCard
+    from .domo_dataset_column import DomoDatasetColumn
+    from .domo_dashboard import DomoDashboard
+    from .redash_dashboard import RedashDashboard
+    from .redash_query import RedashQuery
+    from .redash_visualization import RedashVisualization
+    from .sisense_folder import SisenseFolder
+    from .sisense_widget import SisenseWidget
+    from .sisense_datamodel import SisenseDatamodel
+    from .sisense_datamodel_table import SisenseDatamodelTable
+    from .sisense_dashboard import SisenseDashboard
+    from .metabase_question import MetabaseQuestion
+    from .metabase_collection import MetabaseCollection
+    from .metabase_dashboard import MetabaseDashboard
+    from .quick_sight_folder import QuickSightFolder
+    from .quick_sight_dashboard_visual import QuickSightDashboardVisual
+    from .quick_sight_analysis_visual import QuickSightAnalysisVisual
+    from .quick_sight_dataset_field import QuickSightDatasetField
+    from .quick_sight_analysis import QuickSightAnalysis
+    from .quick_sight_dashboard import QuickSightDashboard
+    from .quick_sight_dataset import QuickSightDataset
+    from .thoughtspot_worksheet import ThoughtspotWorksheet
+    from .thoughtspot_liveboard import ThoughtspotLiveboard
+    from .thoughtspot_table import ThoughtspotTable
+    from .thoughtspot_column import ThoughtspotColumn
+    from .thoughtspot_view import ThoughtspotView
+    from .thoughtspot_dashlet import ThoughtspotDashlet
+    from .thoughtspot_answer import ThoughtspotAnswer
+    from .power_b_i_report import PowerBIReport
+    from .power_b_i_measure import PowerBIMeasure
+    from .power_b_i_column import PowerBIColumn
+    from .power_b_i_table import PowerBITable
+    from .power_b_i_tile import PowerBITile
+    from .power_b_i_datasource import PowerBIDatasource
+    from .power_b_i_workspace import PowerBIWorkspace
+    from .power_b_i_dataset import PowerBIDataset
+    from .power_b_i_dashboard import PowerBIDashboard
+    from .power_b_i_dataflow import PowerBIDataflow
+    from .power_b_i_page import PowerBIPage
+    from .micro_strategy_report import MicroStrategyReport
+    from .micro_strategy_project import MicroStrategyProject
+    from .micro_strategy_metric import MicroStrategyMetric
+    from .micro_strategy_cube import MicroStrategyCube
+    from .micro_strategy_dossier import MicroStrategyDossier
+    from .micro_strategy_fact import MicroStrategyFact
+    from .micro_strategy_document import MicroStrategyDocument
+    from .micro_strategy_attribute import MicroStrategyAttribute
+    from .micro_strategy_visualization import MicroStrategyVisualization
+    from .cognos_exploration import CognosExploration
+    from .cognos_dashboard import CognosDashboard
+    from .cognos_report import CognosReport
+    from .cognos_module import CognosModule
+    from .cognos_file import CognosFile
+    from .cognos_folder import CognosFolder
+    from .cognos_package import CognosPackage
+    from .cognos_datasource import CognosDatasource
+    from .qlik_space import QlikSpace
+    from .qlik_app import QlikApp
+    from .qlik_chart import QlikChart
+    from .qlik_dataset import QlikDataset
+    from .qlik_sheet import QlikSheet
+    from .cognite_event import CogniteEvent
+    from .cognite_asset import CogniteAsset
+    from .cognite_sequence import CogniteSequence
+    from .cognite3_d_model import Cognite3DModel
+    from .cognite_time_series import CogniteTimeSeries
+    from .cognite_file import CogniteFile
+    from .salesforce_object import SalesforceObject
+    from .salesforce_field import SalesforceField
+    from .salesforce_organization import SalesforceOrganization
+    from .salesforce_dashboard import SalesforceDashboard
+    from .salesforce_report import SalesforceReport
+    from .snowflake_dynamic_table import SnowflakeDynamicTable
+    from .mongo_d_b_collection import MongoDBCollection
+    from .dynamo_d_b_secondary_index import DynamoDBSecondaryIndex
+    from .dynamo_dbtable import DynamoDBTable
+    from .mongo_d_b_database import MongoDBDatabase
+    from .kafka_topic import KafkaTopic
+    from .kafka_consumer_group import KafkaConsumerGroup
+    from .azure_service_bus_namespace import AzureServiceBusNamespace
+    from .azure_service_bus_topic import AzureServiceBusTopic
+    from .cosmos_mongo_d_b_collection import CosmosMongoDBCollection
+    from .cosmos_mongo_d_b_database import CosmosMongoDBDatabase
+    from .qlik_stream import QlikStream
+    from .dynamo_d_b_local_secondary_index import DynamoDBLocalSecondaryIndex
+    from .dynamo_d_b_global_secondary_index import DynamoDBGlobalSecondaryIndex
+    from .azure_event_hub import AzureEventHub
+    from .azure_event_hub_consumer_group import AzureEventHubConsumerGroup
+
+# Asset types are only imported (and the forward references of their attributes resolved)
+# when first used, from the module that defines each of them:
+registry = AssetRegistry(
+    __name__,
+    globals(),
+    {
+        "Referenceable": "referenceable",
+        "Asset": "asset",
+        "Task": "task",
+        "DataSet": "data_set",
+        "TagAttachment": "tag_attachment",
+        "Connection": "connection",
+        "Workflow": "workflow",
+        "Process": "process",
+        "AtlasGlossaryCategory": "atlas_glossary_category",
+        "StakeholderTitle": "stakeholder_title",
+        "Badge": "badge",
+        "AccessControl": "access_control",
+        "Namespace": "namespace",
+        "WorkflowRun": "workflow_run",
+        "Catalog": "catalog",
+        "AtlasGlossary": "atlas_glossary",
+        "AuthPolicy": "auth_policy",
+        "ProcessExecution": "process_execution",
+        "AtlasGlossaryTerm": "atlas_glossary_term",
+        "AuthService": "auth_service",
+        "Cloud": "cloud",
+        "Infrastructure": "infrastructure",
+        "BIProcess": "b_i_process",
+        "DbtProcess": "dbt_process",
+        "ColumnProcess": "column_process",
+        "Persona": "persona",
+        "Purpose": "purpose",
+        "Collection": "collection",
+        "Folder": "folder",
+        "Airflow": "airflow",
+        "DataContract": "data_contract",
+        "ObjectStore": "object_store",
+        "DataQuality": "data_quality",
+        "BI": "b_i",
+        "SaaS": "saa_s",
+        "Resource": "resource",
+        "MultiDimensionalDataset": "multi_dimensional_dataset",
+        "DataMesh": "data_mesh",
+        "SQL": "s_q_l",
+        "EventStore": "event_store",
+        "NoSQL": "no_s_q_l",
+        "Matillion": "matillion",
+        "Dbt": "dbt",
+        "Insight": "insight",
+        "API": "a_p_i",
+        "Spark": "spark",
+        "Tag": "tag",
+        "SchemaRegistry": "schema_registry",
+        "Google": "google",
+        "Azure": "azure",
+        "AWS": "a_w_s",
+        "DbtColumnProcess": "dbt_column_process",
+        "Stakeholder": "stakeholder",
+        "AirflowDag": "airflow_dag",
+        "AirflowTask": "airflow_task",
+        "S3": "s3",
+        "ADLS": "a_d_l_s",
+        "GCS": "g_c_s",
+        "MonteCarlo": "monte_carlo",
+        "Metric": "metric",
+        "Soda": "soda",
+        "Preset": "preset",
+        "Mode": "mode",
+        "Sigma": "sigma",
+        "Tableau": "tableau",
+        "Looker": "looker",
+        "Domo": "domo",
+        "Redash": "redash",
+        "Sisense": "sisense",
+        "DataStudio": "data_studio",
+        "Metabase": "metabase",
+        "QuickSight": "quick_sight",
+        "Thoughtspot": "thoughtspot",
+        "PowerBI": "power_b_i",
+        "MicroStrategy": "micro_strategy",
+        "Cognos": "cognos",
+        "Qlik": "qlik",
+        "Cognite": "cognite",
+        "Salesforce": "salesforce",
+        "ReadmeTemplate": "readme_template",
+        "Readme": "readme",
+        "File": "file",
+        "Link": "link",
+        "Cube": "cube",
+        "CubeHierarchy": "cube_hierarchy",
+        "CubeField": "cube_field",
+        "CubeDimension": "cube_dimension",
+        "DataDomain": "data_domain",
+        "DataProduct": "data_product",
+        "Table": "table",
+        "Query": "query",
+        "Schema": "schema",
+        "SnowflakePipe": "snowflake_pipe",
+        "View": "view",
+        "MaterialisedView": "materialised_view",
+        "Function": "function",
+        "TablePartition": "table_partition",
+        "Column": "column",
+        "SnowflakeStream": "snowflake_stream",
+        "DatabricksUnityCatalogTag": "databricks_unity_catalog_tag",
+        "Database": "database",
+        "CalculationView": "calculation_view",
+        "Procedure": "procedure",
+        "SnowflakeTag": "snowflake_tag",
+        "Kafka": "kafka",
+        "AzureServiceBus": "azure_service_bus",
+        "CosmosMongoDB": "cosmos_mongo_d_b",
+        "DynamoDB": "dynamo_d_b",
+        "MongoDB": "mongo_d_b",
+        "MatillionGroup": "matillion_group",
+        "MatillionJob": "matillion_job",
+        "MatillionProject": "matillion_project",
+        "MatillionComponent": "matillion_component",
+        "DbtModelColumn": "dbt_model_column",
+        "DbtTag": "dbt_tag",
+        "DbtTest": "dbt_test",
+        "DbtModel": "dbt_model",
+        "DbtMetric": "dbt_metric",
+        "DbtSource": "dbt_source",
+        "APISpec": "a_p_i_spec",
+        "APIPath": "a_p_i_path",
+        "SparkJob": "spark_job",
+        "SchemaRegistrySubject": "schema_registry_subject",
+        "DataStudioAsset": "data_studio_asset",
+        "S3Bucket": "s3_bucket",
+        "S3Object": "s3_object",
+        "ADLSAccount": "a_d_l_s_account",
+        "ADLSContainer": "a_d_l_s_container",
+        "ADLSObject": "a_d_l_s_object",
+        "GCSObject": "g_c_s_object",
+        "GCSBucket": "g_c_s_bucket",
+        "MCIncident": "m_c_incident",
+        "MCMonitor": "m_c_monitor",
+        "SodaCheck": "soda_check",
+        "PresetChart": "preset_chart",
+        "PresetDataset": "preset_dataset",
+        "PresetDashboard": "preset_dashboard",
+        "PresetWorkspace": "preset_workspace",
+        "ModeReport": "mode_report",
+        "ModeQuery": "mode_query",
+        "ModeChart": "mode_chart",
+        "ModeWorkspace": "mode_workspace",
+        "ModeCollection": "mode_collection",
+        "SigmaDatasetColumn": "sigma_dataset_column",
+        "SigmaDataset": "sigma_dataset",
+        "SigmaWorkbook": "sigma_workbook",
+        "SigmaDataElementField": "sigma_data_element_field",
+        "SigmaPage": "sigma_page",
+        "SigmaDataElement": "sigma_data_element",
+        "TableauWorkbook": "tableau_workbook",
+        "TableauDatasourceField": "tableau_datasource_field",
+        "TableauCalculatedField": "tableau_calculated_field",
+        "TableauProject": "tableau_project",
+        "TableauMetric": "tableau_metric",
+        "TableauSite": "tableau_site",
+        "TableauDatasource": "tableau_datasource",
+        "TableauDashboard": "tableau_dashboard",
+        "TableauFlow": "tableau_flow",
+        "TableauWorksheet": "tableau_worksheet",
+        "LookerLook": "looker_look",
+        "LookerDashboard": "looker_dashboard",
+        "LookerFolder": "looker_folder",
+        "LookerTile": "looker_tile",
+        "LookerModel": "looker_model",
+        "LookerExplore": "looker_explore",
+        "LookerProject": "looker_project",
+        "LookerQuery": "looker_query",
+        "LookerField": "looker_field",
+        "LookerView": "looker_view",
+        "DomoDataset": "domo_dataset",
+        "DomoCard": "domo_card",
+        "DomoDatasetColumn": "domo_dataset_column",
+        "DomoDashboard": "domo_dashboard",
+        "RedashDashboard": "redash_dashboard",
+        "RedashQuery": "redash_query",
+        "RedashVisualization": "redash_visualization",
+        "SisenseFolder": "sisense_folder",
+        "SisenseWidget": "sisense_widget",
+        "SisenseDatamodel": "sisense_datamodel",
+        "SisenseDatamodelTable": "sisense_datamodel_table",
+        "SisenseDashboard": "sisense_dashboard",
+        "MetabaseQuestion": "metabase_question",
+        "MetabaseCollection": "metabase_collection",
+        "MetabaseDashboard": "metabase_dashboard",
+        "QuickSightFolder": "quick_sight_folder",
+        "QuickSightDashboardVisual": "quick_sight_dashboard_visual",
+        "QuickSightAnalysisVisual": "quick_sight_analysis_visual",
+        "QuickSightDatasetField": "quick_sight_dataset_field",
+        "QuickSightAnalysis": "quick_sight_analysis",
+        "QuickSightDashboard": "quick_sight_dashboard",
+        "QuickSightDataset": "quick_sight_dataset",
+        "ThoughtspotWorksheet": "thoughtspot_worksheet",
+        "ThoughtspotLiveboard": "thoughtspot_liveboard",
+        "ThoughtspotTable": "thoughtspot_table",
+        "ThoughtspotColumn": "thoughtspot_column",
+        "ThoughtspotView": "thoughtspot_view",
+        "ThoughtspotDashlet": "thoughtspot_dashlet",
+        "ThoughtspotAnswer": "thoughtspot_answer",
+        "PowerBIReport": "power_b_i_report",
+        "PowerBIMeasure": "power_b_i_measure",
+        "PowerBIColumn": "power_b_i_column",
+        "PowerBITable": "power_b_i_table",
+        "PowerBITile": "power_b_i_tile",
+        "PowerBIDatasource": "power_b_i_datasource",
+        "PowerBIWorkspace": "power_b_i_workspace",
+        "PowerBIDataset": "power_b_i_dataset",
+        "PowerBIDashboard": "power_b_i_dashboard",
+        "PowerBIDataflow": "power_b_i_dataflow",
+        "PowerBIPage": "power_b_i_page",
+        "MicroStrategyReport": "micro_strategy_report",
+        "MicroStrategyProject": "micro_strategy_project",
+        "MicroStrategyMetric": "micro_strategy_metric",
+        "MicroStrategyCube": "micro_strategy_cube",
+        "MicroStrategyDossier": "micro_strategy_dossier",
+        "MicroStrategyFact": "micro_strategy_fact",
+        "MicroStrategyDocument": "micro_strategy_document",
+        "MicroStrategyAttribute": "micro_strategy_attribute",
+        "MicroStrategyVisualization": "micro_strategy_visualization",
+        "CognosExploration": "cognos_exploration",
+        "CognosDashboard": "cognos_dashboard",
+        "CognosReport": "cognos_report",
+        "CognosModule": "cognos_module",
+        "CognosFile": "cognos_file",
+        "CognosFolder": "cognos_folder",
+        "CognosPackage": "cognos_package",
+        "CognosDatasource": "cognos_datasource",
+        "QlikSpace": "qlik_space",
+        "QlikApp": "qlik_app",
+        "QlikChart": "qlik_chart",
+        "QlikDataset": "qlik_dataset",
+        "QlikSheet": "qlik_sheet",
+        "CogniteEvent": "cognite_event",
+        "CogniteAsset": "cognite_asset",
+        "CogniteSequence": "cognite_sequence",
+        "Cognite3DModel": "cognite3_d_model",
+        "CogniteTimeSeries": "cognite_time_series",
+        "CogniteFile": "cognite_file",
+        "SalesforceObject": "salesforce_object",
+        "SalesforceField": "salesforce_field",
+        "SalesforceOrganization": "salesforce_organization",
+        "SalesforceDashboard": "salesforce_dashboard",
+        "SalesforceReport": "salesforce_report",
+        "SnowflakeDynamicTable": "snowflake_dynamic_table",
+        "MongoDBCollection": "mongo_d_b_collection",
+        "DynamoDBSecondaryIndex": "dynamo_d_b_secondary_index",
+        "DynamoDBTable": "dynamo_dbtable",
+        "MongoDBDatabase": "mongo_d_b_database",
+        "KafkaTopic": "kafka_topic",
+        "KafkaConsumerGroup": "kafka_consumer_group",
+        "AzureServiceBusNamespace": "azure_service_bus_namespace",
+        "AzureServiceBusTopic": "azure_service_bus_topic",
+        "CosmosMongoDBCollection": "cosmos_mongo_d_b_collection",
+        "CosmosMongoDBDatabase": "cosmos_mongo_d_b_database",
+        "QlikStream": "qlik_stream",
+        "DynamoDBLocalSecondaryIndex": "dynamo_d_b_local_secondary_index",
+        "DynamoDBGlobalSecondaryIndex": "dynamo_d_b_global_secondary_index",
+        "AzureEventHub": "azure_event_hub",
+        "AzureEventHubConsumerGroup": "azure_event_hub_consumer_group",
+    },
+    # An asset type that defines each attribute, so that looking up an attribute
+    # only imports that one type:
+    {
+        "qualified_name": "Referenceable",
+        "meanings": "Referenceable",
+        "name": "Asset",
+        "display_name": "Asset",
+        "description": "Asset",
+        "user_description": "Asset",
+        "tenant_id": "Asset",
+        "certificate_status": "Asset",
+        "certificate_status_message": "Asset",
+        "certificate_updated_by": "Asset",
+        "certificate_updated_at": "Asset",
+        "announcement_title": "Asset",
+        "announcement_message": "Asset",
+        "announcement_type": "Asset",
+        "announcement_updated_at": "Asset",
+        "announcement_updated_by": "Asset",
+        "owner_users": "Asset",
+        "owner_groups": "Asset",
+        "admin_users": "Asset",
+        "admin_groups": "Asset",
+        "viewer_users": "Asset",
+        "viewer_groups": "Asset",
+        "connector_name": "Asset",
+        "connection_name": "Asset",
+        "connection_qualified_name": "Asset",
+        "has_lineage": "Asset",
+        "is_discoverable": "Asset",
+        "is_editable": "Asset",
+        "sub_type": "Asset",
+        "view_score": "Asset",
+        "popularity_score": "Asset",
+        "source_owners": "Asset",
+        "source_created_by": "Asset",
+        "source_created_at": "Asset",
+        "source_updated_at": "Asset",
+        "source_updated_by": "Asset",
+        "source_url": "Asset",
+        "source_embed_url": "Asset",
+        "last_sync_workflow_name": "Asset",
+        "last_sync_run_at": "Asset",
+        "last_sync_run": "Asset",
+        "admin_roles": "Asset",
+        "source_read_count": "Asset",
+        "source_read_user_count": "Asset",
+        "source_last_read_at": "Asset",
+        "last_row_changed_at": "Asset",
+        "source_total_cost": "Asset",
+        "source_cost_unit": "Asset",
+        "source_read_query_cost": "Asset",
+        "source_read_recent_user_list": "Asset",
+        "source_read_recent_user_record_list": "Asset",
+        "source_read_top_user_list": "Asset",
+        "source_read_top_user_record_list": "Asset",
+        "source_read_popular_query_record_list": "Asset",
+        "source_read_expensive_query_record_list": "Asset",
+        "source_read_slow_query_record_list": "Asset",
+        "source_query_compute_cost_list": "Asset",
+        "source_query_compute_cost_record_list": "Asset",
+        "dbt_qualified_name": "Asset",
+        "asset_dbt_workflow_last_updated": "Asset",
+        "asset_dbt_alias": "Asset",
+        "asset_dbt_meta": "Asset",
+        "asset_dbt_unique_id": "Asset",
+        "asset_dbt_account_name": "Asset",
+        "asset_dbt_project_name": "Asset",
+        "asset_dbt_package_name": "Asset",
+        "asset_dbt_job_name": "Asset",
+        "asset_dbt_job_schedule": "Asset",
+        "asset_dbt_job_status": "Asset",
+        "asset_dbt_test_status": "Asset",
+        "asset_dbt_job_schedule_cron_humanized": "Asset",
+        "asset_dbt_job_last_run": "Asset",
+        "asset_dbt_job_last_run_url": "Asset",
+        "asset_dbt_job_last_run_created_at": "Asset",
+        "asset_dbt_job_last_run_updated_at": "Asset",
+        "asset_dbt_job_last_run_dequed_at": "Asset",
+        "asset_dbt_job_last_run_started_at": "Asset",
+        "asset_dbt_job_last_run_total_duration": "Asset",
+        "asset_dbt_job_last_run_total_duration_humanized": "Asset",
+        "asset_dbt_job_last_run_queued_duration": "Asset",
+        "asset_dbt_job_last_run_queued_duration_humanized": "Asset",
+        "asset_dbt_job_last_run_run_duration": "Asset",
+        "asset_dbt_job_last_run_run_duration_humanized": "Asset",
+        "asset_dbt_job_last_run_git_branch": "Asset",
+        "asset_dbt_job_last_run_git_sha": "Asset",
+        "asset_dbt_job_last_run_status_message": "Asset",
+        "asset_dbt_job_last_run_owner_thread_id": "Asset",
+        "asset_dbt_job_last_run_executed_by_thread_id": "Asset",
+        "asset_dbt_job_last_run_artifacts_saved": "Asset",
+        "asset_dbt_job_last_run_artifact_s3_path": "Asset",
+        "asset_dbt_job_last_run_has_docs_generated": "Asset",
+        "asset_dbt_job_last_run_has_sources_generated": "Asset",
+        "asset_dbt_job_last_run_notifications_sent": "Asset",
+        "asset_dbt_job_next_run": "Asset",
+        "asset_dbt_job_next_run_humanized": "Asset",
+        "asset_dbt_environment_name": "Asset",
+        "asset_dbt_environment_dbt_version": "Asset",
+        "asset_dbt_tags": "Asset",
+        "asset_dbt_semantic_layer_proxy_url": "Asset",
+        "asset_dbt_source_freshness_criteria": "Asset",
+        "sample_data_url": "Asset",
+        "asset_tags": "Asset",
+        "asset_mc_incident_names": "Asset",
+        "asset_mc_incident_qualified_names": "Asset",
+        "asset_mc_monitor_names": "Asset",
+        "asset_mc_monitor_qualified_names": "Asset",
+        "asset_mc_monitor_statuses": "Asset",
+        "asset_mc_monitor_types": "Asset",
+        "asset_mc_monitor_schedule_types": "Asset",
+        "asset_mc_incident_types": "Asset",
+        "asset_mc_incident_sub_types": "Asset",
+        "asset_mc_incident_severities": "Asset",
+        "asset_mc_incident_states": "Asset",
+        "asset_mc_last_sync_run_at": "Asset",
+        "starred_by": "Asset",
+        "starred_details_list": "Asset",
+        "starred_count": "Asset",
+        "asset_soda_d_q_status": "Asset",
+        "asset_soda_check_count": "Asset",
+        "asset_soda_last_sync_run_at": "Asset",
+        "asset_soda_last_scan_at": "Asset",
+        "asset_soda_check_statuses": "Asset",
+        "asset_soda_source_url": "Asset",
+        "asset_icon": "Asset",
+        "is_partial": "Asset",
+        "is_a_i_generated": "Asset",
+        "asset_cover_image": "Asset",
+        "asset_theme_hex": "Asset",
+        "has_contract": "Asset",
+        "schema_registry_subjects": "Asset",
+        "data_contract_latest_certified": "Asset",
+        "output_port_data_products": "Asset",
+        "readme": "Asset",
+        "data_contract_latest": "Asset",
+        "mc_monitors": "Asset",
+        "files": "Asset",
+        "mc_incidents": "Asset",
+        "links": "Asset",
+        "metrics": "Asset",
+        "input_port_data_products": "Asset",
+        "soda_checks": "Asset",
+        "task_recipient": "Task",
+        "task_type": "Task",
+        "task_requestor": "Task",
+        "task_is_read": "Task",
+        "task_requestor_comment": "Task",
+        "task_related_asset_guid": "Task",
+        "task_proposals": "Task",
+        "task_expires_at": "Task",
+        "task_actions": "Task",
+        "task_execution_comment": "Task",
+        "task_execution_action": "Task",
+        "task_created_by": "Task",
+        "task_updated_by": "Task",
+        "tag_qualified_name": "TagAttachment",
+        "tag_attachment_string_value": "TagAttachment",
+        "category": "Connection",
+        "sub_category": "Connection",
+        "host": "Connection",
+        "port": "Connection",
+        "allow_query": "Connection",
+        "allow_query_preview": "Connection",
+        "query_preview_config": "Connection",
+        "query_config": "Connection",
+        "credential_strategy": "Connection",
+        "preview_credential_strategy": "Connection",
+        "policy_strategy": "Connection",
+        "policy_strategy_for_sample_preview": "Connection",
+        "query_username_strategy": "Connection",
+        "row_limit": "Connection",
+        "query_timeout": "Connection",
+        "default_credential_guid": "Connection",
+        "connector_icon": "Connection",
+        "connector_image": "Connection",
+        "source_logo": "Connection",
+        "is_sample_data_preview_enabled": "Connection",
+        "popularity_insights_timeframe": "Connection",
+        "has_popularity_insights": "Connection",
+        "connection_dbt_environments": "Connection",
+        "connection_s_s_o_credential_guid": "Connection",
+        "use_object_storage": "Connection",
+        "object_storage_upload_threshold": "Connection",
+        "vector_embeddings_enabled": "Connection",
+        "vector_embeddings_updated_at": "Connection",
+        "workflow_template_guid": "Workflow",
+        "workflow_type": "Workflow",
+        "workflow_config": "Workflow",
+        "workflow_status": "Workflow",
+        "workflow_run_expires_in": "Workflow",
+        "workflow_created_by": "Workflow",
+        "workflow_updated_by": "Workflow",
+        "workflow_deleted_at": "Workflow",
+        "inputs": "Process",
+        "outputs": "Process",
+        "code": "Process",
+        "sql": "Process",
+        "ast": "Process",
+        "matillion_component": "Process",
+        "airflow_tasks": "Process",
+        "column_processes": "Process",
+        "spark_jobs": "Process",
+        "short_description": "AtlasGlossaryCategory",
+        "long_description": "AtlasGlossaryCategory",
+        "additional_attributes": "AtlasGlossaryCategory",
+        "category_type": "AtlasGlossaryCategory",
+        "terms": "AtlasGlossaryCategory",
+        "anchor": "AtlasGlossaryCategory",
+        "parent_category": "AtlasGlossaryCategory",
+        "children_categories": "AtlasGlossaryCategory",
+        "stakeholder_title_domain_qualified_names": "StakeholderTitle",
+        "stakeholders": "StakeholderTitle",
+        "badge_conditions": "Badge",
+        "badge_metadata_attribute": "Badge",
+        "is_access_control_enabled": "AccessControl",
+        "deny_custom_metadata_guids": "AccessControl",
+        "deny_asset_tabs": "AccessControl",
+        "deny_asset_filters": "AccessControl",
+        "channel_link": "AccessControl",
+        "deny_asset_types": "AccessControl",
+        "deny_navigation_pages": "AccessControl",
+        "default_navigation": "AccessControl",
+        "display_preferences": "AccessControl",
+        "policies": "AccessControl",
+        "children_folders": "Namespace",
+        "children_queries": "Namespace",
+        "workflow_run_workflow_guid": "WorkflowRun",
+        "workflow_run_type": "WorkflowRun",
+        "workflow_run_on_asset_guid": "WorkflowRun",
+        "workflow_run_comment": "WorkflowRun",
+        "workflow_run_config": "WorkflowRun",
+        "workflow_run_status": "WorkflowRun",
+        "workflow_run_expires_at": "WorkflowRun",
+        "workflow_run_created_by": "WorkflowRun",
+        "workflow_run_updated_by": "WorkflowRun",
+        "workflow_run_deleted_at": "WorkflowRun",
+        "input_to_processes": "Catalog",
+        "output_from_airflow_tasks": "Catalog",
+        "input_to_spark_jobs": "Catalog",
+        "output_from_spark_jobs": "Catalog",
+        "input_to_airflow_tasks": "Catalog",
+        "output_from_processes": "Catalog",
+        "language": "AtlasGlossary",
+        "usage": "AtlasGlossary",
+        "glossary_type": "AtlasGlossary",
+        "categories": "AtlasGlossary",
+        "policy_type": "AuthPolicy",
+        "policy_service_name": "AuthPolicy",
+        "policy_category": "AuthPolicy",
+        "policy_sub_category": "AuthPolicy",
+        "policy_users": "AuthPolicy",
+        "policy_groups": "AuthPolicy",
+        "policy_roles": "AuthPolicy",
+        "policy_actions": "AuthPolicy",
+        "policy_resources": "AuthPolicy",
+        "policy_resource_category": "AuthPolicy",
+        "policy_priority": "AuthPolicy",
+        "is_policy_enabled": "AuthPolicy",
+        "policy_mask_type": "AuthPolicy",
+        "policy_validity_schedule": "AuthPolicy",
+        "policy_resource_signature": "AuthPolicy",
+        "policy_delegate_admin": "AuthPolicy",
+        "policy_conditions": "AuthPolicy",
+        "access_control": "AuthPolicy",
+        "examples": "AtlasGlossaryTerm",
+        "abbreviation": "AtlasGlossaryTerm",
+        "term_type": "AtlasGlossaryTerm",
+        "valid_values_for": "AtlasGlossaryTerm",
+        "valid_values": "AtlasGlossaryTerm",
+        "see_also": "AtlasGlossaryTerm",
+        "is_a": "AtlasGlossaryTerm",
+        "antonyms": "AtlasGlossaryTerm",
+        "assigned_entities": "AtlasGlossaryTerm",
+        "classifies": "AtlasGlossaryTerm",
+        "preferred_to_terms": "AtlasGlossaryTerm",
+        "preferred_terms": "AtlasGlossaryTerm",
+        "translation_terms": "AtlasGlossaryTerm",
+        "synonyms": "AtlasGlossaryTerm",
+        "replaced_by": "AtlasGlossaryTerm",
+        "replacement_terms": "AtlasGlossaryTerm",
+        "translated_terms": "AtlasGlossaryTerm",
+        "auth_service_type": "AuthService",
+        "tag_service": "AuthService",
+        "auth_service_is_enabled": "AuthService",
+        "auth_service_config": "AuthService",
+        "auth_service_policy_last_sync": "AuthService",
+        "dbt_process_job_status": "DbtProcess",
+        "dbt_alias": "DbtProcess",
+        "dbt_meta": "DbtProcess",
+        "dbt_unique_id": "DbtProcess",
+        "dbt_account_name": "DbtProcess",
+        "dbt_project_name": "DbtProcess",
+        "dbt_package_name": "DbtProcess",
+        "dbt_job_name": "DbtProcess",
+        "dbt_job_schedule": "DbtProcess",
+        "dbt_job_status": "DbtProcess",
+        "dbt_job_schedule_cron_humanized": "DbtProcess",
+        "dbt_job_last_run": "DbtProcess",
+        "dbt_job_next_run": "DbtProcess",
+        "dbt_job_next_run_humanized": "DbtProcess",
+        "dbt_environment_name": "DbtProcess",
+        "dbt_environment_dbt_version": "DbtProcess",
+        "dbt_tags": "DbtProcess",
+        "dbt_connection_context": "DbtProcess",
+        "dbt_semantic_layer_proxy_url": "DbtProcess",
+        "process": "ColumnProcess",
+        "persona_groups": "Persona",
+        "persona_users": "Persona",
+        "role_id": "Persona",
+        "purpose_atlan_tags": "Purpose",
+        "icon": "Collection",
+        "icon_type": "Collection",
+        "parent_qualified_name": "Folder",
+        "collection_qualified_name": "Folder",
+        "parent": "Folder",
+        "airflow_tags": "Airflow",
+        "airflow_run_version": "Airflow",
+        "airflow_run_open_lineage_version": "Airflow",
+        "airflow_run_name": "Airflow",
+        "airflow_run_type": "Airflow",
+        "airflow_run_start_time": "Airflow",
+        "airflow_run_end_time": "Airflow",
+        "airflow_run_open_lineage_state": "Airflow",
+        "data_contract_json": "DataContract",
+        "data_contract_version": "DataContract",
+        "data_contract_asset_guid": "DataContract",
+        "data_contract_asset_latest": "DataContract",
+        "data_contract_asset_certified": "DataContract",
+        "data_contract_previous_version": "DataContract",
+        "data_contract_next_version": "DataContract",
+        "link": "Resource",
+        "is_global": "Resource",
+        "reference": "Resource",
+        "resource_metadata": "Resource",
+        "cube_name": "MultiDimensionalDataset",
+        "cube_qualified_name": "MultiDimensionalDataset",
+        "cube_dimension_name": "MultiDimensionalDataset",
+        "cube_dimension_qualified_name": "MultiDimensionalDataset",
+        "cube_hierarchy_name": "MultiDimensionalDataset",
+        "cube_hierarchy_qualified_name": "MultiDimensionalDataset",
+        "parent_domain_qualified_name": "DataMesh",
+        "super_domain_qualified_name": "DataMesh",
+        "query_count": "SQL",
+        "query_user_count": "SQL",
+        "query_user_map": "SQL",
+        "query_count_updated_at": "SQL",
+        "database_name": "SQL",
+        "database_qualified_name": "SQL",
+        "schema_name": "SQL",
+        "schema_qualified_name": "SQL",
+        "table_name": "SQL",
+        "table_qualified_name": "SQL",
+        "view_name": "SQL",
+        "view_qualified_name": "SQL",
+        "calculation_view_name": "SQL",
+        "calculation_view_qualified_name": "SQL",
+        "is_profiled": "SQL",
+        "last_profiled_at": "SQL",
+        "dbt_sources": "SQL",
+        "sql_dbt_models": "SQL",
+        "sql_dbt_sources": "SQL",
+        "dbt_models": "SQL",
+        "dbt_tests": "SQL",
+        "no_s_q_l_schema_definition": "NoSQL",
+        "matillion_version": "Matillion",
+        "api_spec_type": "API",
+        "api_spec_version": "API",
+        "api_spec_name": "API",
+        "api_spec_qualified_name": "API",
+        "api_external_docs": "API",
+        "api_is_auth_optional": "API",
+        "spark_run_version": "Spark",
+        "spark_run_open_lineage_version": "Spark",
+        "spark_run_start_time": "Spark",
+        "spark_run_end_time": "Spark",
+        "spark_run_open_lineage_state": "Spark",
+        "tag_id": "Tag",
+        "tag_attributes": "Tag",
+        "tag_allowed_values": "Tag",
+        "mapped_atlan_tag_name": "Tag",
+        "schema_registry_schema_type": "SchemaRegistry",
+        "schema_registry_schema_id": "SchemaRegistry",
+        "google_service": "Google",
+        "google_project_name": "Google",
+        "google_project_id": "Google",
+        "google_project_number": "Google",
+        "google_location": "Google",
+        "google_location_type": "Google",
+        "google_labels": "Google",
+        "google_tags": "Google",
+        "azure_resource_id": "Azure",
+        "azure_location": "Azure",
+        "adls_account_secondary_location": "Azure",
+        "azure_tags": "Azure",
+        "aws_arn": "AWS",
+        "aws_partition": "AWS",
+        "aws_service": "AWS",
+        "aws_region": "AWS",
+        "aws_account_id": "AWS",
+        "aws_resource_id": "AWS",
+        "aws_owner_name": "AWS",
+        "aws_owner_id": "AWS",
+        "aws_tags": "AWS",
+        "dbt_column_process_job_status": "DbtColumnProcess",
+        "stakeholder_domain_qualified_name": "Stakeholder",
+        "stakeholder_title_guid": "Stakeholder",
+        "stakeholder_title": "Stakeholder",
+        "stakeholder_data_domain": "Stakeholder",
+        "airflow_dag_schedule": "AirflowDag",
+        "airflow_dag_schedule_delta": "AirflowDag",
+        "airflow_task_operator_class": "AirflowTask",
+        "airflow_dag_name": "AirflowTask",
+        "airflow_dag_qualified_name": "AirflowTask",
+        "airflow_task_connection_id": "AirflowTask",
+        "airflow_task_sql": "AirflowTask",
+        "airflow_task_retry_number": "AirflowTask",
+        "airflow_task_pool": "AirflowTask",
+        "airflow_task_pool_slots": "AirflowTask",
+        "airflow_task_queue": "AirflowTask",
+        "airflow_task_priority_weight": "AirflowTask",
+        "airflow_task_trigger_rule": "AirflowTask",
+        "airflow_dag": "AirflowTask",
+        "s3_e_tag": "S3",
+        "s3_encryption": "S3",
+        "adls_account_qualified_name": "ADLS",
+        "gcs_storage_class": "GCS",
+        "gcs_encryption_type": "GCS",
+        "gcs_e_tag": "GCS",
+        "gcs_requester_pays": "GCS",
+        "gcs_access_control": "GCS",
+        "gcs_meta_generation_id": "GCS",
+        "mc_labels": "MonteCarlo",
+        "mc_asset_qualified_names": "MonteCarlo",
+        "metric_type": "Metric",
+        "metric_s_q_l": "Metric",
+        "metric_filters": "Metric",
+        "metric_time_grains": "Metric",
+        "metric_timestamp_column": "Metric",
+        "assets": "Metric",
+        "metric_dimension_columns": "Metric",
+        "preset_workspace_id": "Preset",
+        "preset_workspace_qualified_name": "Preset",
+        "preset_dashboard_id": "Preset",
+        "preset_dashboard_qualified_name": "Preset",
+        "mode_id": "Mode",
+        "mode_token": "Mode",
+        "mode_workspace_name": "Mode",
+        "mode_workspace_username": "Mode",
+        "mode_workspace_qualified_name": "Mode",
+        "mode_report_name": "Mode",
+        "mode_report_qualified_name": "Mode",
+        "mode_query_name": "Mode",
+        "mode_query_qualified_name": "Mode",
+        "sigma_workbook_qualified_name": "Sigma",
+        "sigma_workbook_name": "Sigma",
+        "sigma_page_qualified_name": "Sigma",
+        "sigma_page_name": "Sigma",
+        "sigma_data_element_qualified_name": "Sigma",
+        "sigma_data_element_name": "Sigma",
+        "domo_id": "Domo",
+        "domo_owner_id": "Domo",
+        "redash_is_published": "Redash",
+        "metabase_collection_name": "Metabase",
+        "metabase_collection_qualified_name": "Metabase",
+        "quick_sight_id": "QuickSight",
+        "quick_sight_sheet_id": "QuickSight",
+        "quick_sight_sheet_name": "QuickSight",
+        "thoughtspot_chart_type": "Thoughtspot",
+        "thoughtspot_question_text": "Thoughtspot",
+        "thoughtspot_join_count": "Thoughtspot",
+        "thoughtspot_column_count": "Thoughtspot",
+        "power_b_i_is_hidden": "PowerBI",
+        "power_b_i_table_qualified_name": "PowerBI",
+        "power_b_i_format_string": "PowerBI",
+        "power_b_i_endorsement": "PowerBI",
+        "micro_strategy_project_qualified_name": "MicroStrategy",
+        "micro_strategy_project_name": "MicroStrategy",
+        "micro_strategy_cube_qualified_names": "MicroStrategy",
+        "micro_strategy_cube_names": "MicroStrategy",
+        "micro_strategy_report_qualified_names": "MicroStrategy",
+        "micro_strategy_report_names": "MicroStrategy",
+        "micro_strategy_is_certified": "MicroStrategy",
+        "micro_strategy_certified_by": "MicroStrategy",
+        "micro_strategy_certified_at": "MicroStrategy",
+        "micro_strategy_location": "MicroStrategy",
+        "cognos_id": "Cognos",
+        "cognos_path": "Cognos",
+        "cognos_parent_name": "Cognos",
+        "cognos_parent_qualified_name": "Cognos",
+        "cognos_version": "Cognos",
+        "cognos_type": "Cognos",
+        "cognos_is_hidden": "Cognos",
+        "cognos_is_disabled": "Cognos",
+        "cognos_default_screen_tip": "Cognos",
+        "qlik_id": "Qlik",
+        "qlik_q_r_i": "Qlik",
+        "qlik_space_id": "Qlik",
+        "qlik_space_qualified_name": "Qlik",
+        "qlik_app_id": "Qlik",
+        "qlik_app_qualified_name": "Qlik",
+        "qlik_owner_id": "Qlik",
+        "qlik_is_published": "Qlik",
+        "organization_qualified_name": "Salesforce",
+        "api_name": "Salesforce",
+        "asset": "Readme",
+        "file_type": "File",
+        "file_path": "File",
+        "file_assets": "File",
+        "cube_dimension_count": "Cube",
+        "cube_dimensions": "Cube",
+        "cube_field_count": "CubeHierarchy",
+        "cube_fields": "CubeHierarchy",
+        "cube_dimension": "CubeHierarchy",
+        "cube_parent_field_name": "CubeField",
+        "cube_parent_field_qualified_name": "CubeField",
+        "cube_field_level": "CubeField",
+        "cube_field_measure_expression": "CubeField",
+        "cube_sub_field_count": "CubeField",
+        "cube_parent_field": "CubeField",
+        "cube_hierarchy": "CubeField",
+        "cube_nested_fields": "CubeField",
+        "cube_hierarchy_count": "CubeDimension",
+        "cube_hierarchies": "CubeDimension",
+        "cube": "CubeDimension",
+        "data_products": "DataDomain",
+        "parent_domain": "DataDomain",
+        "sub_domains": "DataDomain",
+        "data_product_status": "DataProduct",
+        "daap_status": "DataProduct",
+        "data_product_criticality": "DataProduct",
+        "daap_criticality": "DataProduct",
+        "data_product_sensitivity": "DataProduct",
+        "daap_sensitivity": "DataProduct",
+        "data_product_visibility": "DataProduct",
+        "daap_visibility": "DataProduct",
+        "data_product_assets_d_s_l": "DataProduct",
+        "data_product_assets_playbook_filter": "DataProduct",
+        "data_product_score_value": "DataProduct",
+        "data_product_score_updated_at": "DataProduct",
+        "daap_visibility_users": "DataProduct",
+        "daap_visibility_groups": "DataProduct",
+        "data_domain": "DataProduct",
+        "output_ports": "DataProduct",
+        "input_ports": "DataProduct",
+        "column_count": "Table",
+        "row_count": "Table",
+        "size_bytes": "Table",
+        "alias": "Table",
+        "is_temporary": "Table",
+        "is_query_preview": "Table",
+        "external_location": "Table",
+        "external_location_region": "Table",
+        "external_location_format": "Table",
+        "is_partitioned": "Table",
+        "partition_strategy": "Table",
+        "partition_count": "Table",
+        "partition_list": "Table",
+        "is_sharded": "Table",
+        "columns": "Table",
+        "facts": "Table",
+        "atlan_schema": "Table",
+        "partitions": "Table",
+        "queries": "Table",
+        "dimensions": "Table",
+        "raw_query": "Query",
+        "long_raw_query": "Query",
+        "raw_query_text": "Query",
+        "default_schema_qualified_name": "Query",
+        "default_database_qualified_name": "Query",
+        "variables_schema_base64": "Query",
+        "is_private": "Query",
+        "is_sql_snippet": "Query",
+        "is_visual_query": "Query",
+        "visual_builder_schema_base64": "Query",
+        "tables": "Query",
+        "views": "Query",
+        "table_count": "Schema",
+        "views_count": "Schema",
+        "linked_schema_qualified_name": "Schema",
+        "snowflake_tags": "Schema",
+        "functions": "Schema",
+        "database": "Schema",
+        "procedures": "Schema",
+        "materialised_views": "Schema",
+        "snowflake_dynamic_tables": "Schema",
+        "snowflake_pipes": "Schema",
+        "snowflake_streams": "Schema",
+        "calculation_views": "Schema",
+        "definition": "SnowflakePipe",
+        "snowflake_pipe_is_auto_ingest_enabled": "SnowflakePipe",
+        "snowflake_pipe_notification_channel_name": "SnowflakePipe",
+        "refresh_mode": "MaterialisedView",
+        "refresh_method": "MaterialisedView",
+        "staleness": "MaterialisedView",
+        "stale_since_date": "MaterialisedView",
+        "function_definition": "Function",
+        "function_return_type": "Function",
+        "function_arguments": "Function",
+        "function_language": "Function",
+        "function_type": "Function",
+        "function_is_external": "Function",
+        "function_is_secure": "Function",
+        "function_is_memoizable": "Function",
+        "function_schema": "Function",
+        "constraint": "TablePartition",
+        "parent_table": "TablePartition",
+        "child_table_partitions": "TablePartition",
+        "parent_table_partition": "TablePartition",
+        "data_type": "Column",
+        "sub_data_type": "Column",
+        "raw_data_type_definition": "Column",
+        "order": "Column",
+        "nested_column_count": "Column",
+        "is_partition": "Column",
+        "partition_order": "Column",
+        "is_clustered": "Column",
+        "is_primary": "Column",
+        "is_foreign": "Column",
+        "is_indexed": "Column",
+        "is_sort": "Column",
+        "is_dist": "Column",
+        "is_pinned": "Column",
+        "pinned_by": "Column",
+        "pinned_at": "Column",
+        "precision": "Column",
+        "default_value": "Column",
+        "is_nullable": "Column",
+        "numeric_scale": "Column",
+        "max_length": "Column",
+        "validations": "Column",
+        "parent_column_qualified_name": "Column",
+        "parent_column_name": "Column",
+        "column_distinct_values_count": "Column",
+        "column_distinct_values_count_long": "Column",
+        "column_histogram": "Column",
+        "column_max": "Column",
+        "column_min": "Column",
+        "column_mean": "Column",
+        "column_sum": "Column",
+        "column_median": "Column",
+        "column_standard_deviation": "Column",
+        "column_unique_values_count": "Column",
+        "column_unique_values_count_long": "Column",
+        "column_average": "Column",
+        "column_average_length": "Column",
+        "column_duplicate_values_count": "Column",
+        "column_duplicate_values_count_long": "Column",
+        "column_maximum_string_length": "Column",
+        "column_maxs": "Column",
+        "column_minimum_string_length": "Column",
+        "column_mins": "Column",
+        "column_missing_values_count": "Column",
+        "column_missing_values_count_long": "Column",
+        "column_missing_values_percentage": "Column",
+        "column_uniqueness_percentage": "Column",
+        "column_variance": "Column",
+        "column_top_values": "Column",
+        "column_depth_level": "Column",
+        "snowflake_dynamic_table": "Column",
+        "view": "Column",
+        "nested_columns": "Column",
+        "data_quality_metric_dimensions": "Column",
+        "dbt_model_columns": "Column",
+        "table": "Column",
+        "column_dbt_model_columns": "Column",
+        "materialised_view": "Column",
+        "calculation_view": "Column",
+        "parent_column": "Column",
+        "metric_timestamps": "Column",
+        "foreign_key_to": "Column",
+        "foreign_key_from": "Column",
+        "dbt_metrics": "Column",
+        "table_partition": "Column",
+        "snowflake_stream_type": "SnowflakeStream",
+        "snowflake_stream_source_type": "SnowflakeStream",
+        "snowflake_stream_mode": "SnowflakeStream",
+        "snowflake_stream_is_stale": "SnowflakeStream",
+        "snowflake_stream_stale_after": "SnowflakeStream",
+        "schema_count": "Database",
+        "schemas": "Database",
+        "calculation_view_version_id": "CalculationView",
+        "calculation_view_activated_by": "CalculationView",
+        "calculation_view_activated_at": "CalculationView",
+        "azure_service_bus_namespace_qualified_name": "AzureServiceBus",
+        "azure_service_bus_namespace_name": "AzureServiceBus",
+        "dynamo_d_b_status": "DynamoDB",
+        "dynamo_d_b_partition_key": "DynamoDB",
+        "dynamo_d_b_sort_key": "DynamoDB",
+        "dynamo_d_b_read_capacity_units": "DynamoDB",
+        "dynamo_d_b_write_capacity_units": "DynamoDB",
+        "matillion_project_count": "MatillionGroup",
+        "matillion_projects": "MatillionGroup",
+        "matillion_job_type": "MatillionJob",
+        "matillion_job_path": "MatillionJob",
+        "matillion_job_component_count": "MatillionJob",
+        "matillion_job_schedule": "MatillionJob",
+        "matillion_project_name": "MatillionJob",
+        "matillion_project_qualified_name": "MatillionJob",
+        "matillion_project": "MatillionJob",
+        "matillion_components": "MatillionJob",
+        "matillion_versions": "MatillionProject",
+        "matillion_environments": "MatillionProject",
+        "matillion_project_job_count": "MatillionProject",
+        "matillion_group_name": "MatillionProject",
+        "matillion_group_qualified_name": "MatillionProject",
+        "matillion_jobs": "MatillionProject",
+        "matillion_group": "MatillionProject",
+        "matillion_component_id": "MatillionComponent",
+        "matillion_component_implementation_id": "MatillionComponent",
+        "matillion_component_linked_job": "MatillionComponent",
+        "matillion_component_last_run_status": "MatillionComponent",
+        "matillion_component_last_five_run_status": "MatillionComponent",
+        "matillion_component_sqls": "MatillionComponent",
+        "matillion_job_name": "MatillionComponent",
+        "matillion_job_qualified_name": "MatillionComponent",
+        "matillion_process": "MatillionComponent",
+        "matillion_job": "MatillionComponent",
+        "dbt_model_qualified_name": "DbtModelColumn",
+        "dbt_model_column_data_type": "DbtModelColumn",
+        "dbt_model_column_order": "DbtModelColumn",
+        "sql_column": "DbtModelColumn",
+        "dbt_model": "DbtModelColumn",
+        "dbt_model_column_sql_columns": "DbtModelColumn",
+        "dbt_test_status": "DbtTest",
+        "dbt_test_state": "DbtTest",
+        "dbt_test_error": "DbtTest",
+        "dbt_test_raw_s_q_l": "DbtTest",
+        "dbt_test_compiled_s_q_l": "DbtTest",
+        "dbt_test_raw_code": "DbtTest",
+        "dbt_test_compiled_code": "DbtTest",
+        "dbt_test_language": "DbtTest",
+        "sql_assets": "DbtTest",
+        "dbt_status": "DbtModel",
+        "dbt_error": "DbtModel",
+        "dbt_raw_s_q_l": "DbtModel",
+        "dbt_compiled_s_q_l": "DbtModel",
+        "dbt_stats": "DbtModel",
+        "dbt_materialization_type": "DbtModel",
+        "dbt_model_compile_started_at": "DbtModel",
+        "dbt_model_compile_completed_at": "DbtModel",
+        "dbt_model_execute_started_at": "DbtModel",
+        "dbt_model_execute_completed_at": "DbtModel",
+        "dbt_model_execution_time": "DbtModel",
+        "dbt_model_run_generated_at": "DbtModel",
+        "dbt_model_run_elapsed_time": "DbtModel",
+        "dbt_model_sql_assets": "DbtModel",
+        "sql_asset": "DbtModel",
+        "dbt_metric_filters": "DbtMetric",
+        "dbt_metric_filter_columns": "DbtMetric",
+        "dbt_state": "DbtSource",
+        "dbt_freshness_criteria": "DbtSource",
+        "api_spec_terms_of_service_url": "APISpec",
+        "api_spec_contact_email": "APISpec",
+        "api_spec_contact_name": "APISpec",
+        "api_spec_contact_url": "APISpec",
+        "api_spec_license_name": "APISpec",
+        "api_spec_license_url": "APISpec",
+        "api_spec_contract_version": "APISpec",
+        "api_spec_service_alias": "APISpec",
+        "api_paths": "APISpec",
+        "api_path_summary": "APIPath",
+        "api_path_raw_u_r_i": "APIPath",
+        "api_path_is_templated": "APIPath",
+        "api_path_available_operations": "APIPath",
+        "api_path_available_response_codes": "APIPath",
+        "api_path_is_ingress_exposed": "APIPath",
+        "api_spec": "APIPath",
+        "spark_app_name": "SparkJob",
+        "spark_master": "SparkJob",
+        "schema_registry_subject_base_name": "SchemaRegistrySubject",
+        "schema_registry_subject_is_key_schema": "SchemaRegistrySubject",
+        "schema_registry_subject_schema_compatibility": "SchemaRegistrySubject",
+        "schema_registry_subject_latest_schema_version": "SchemaRegistrySubject",
+        "schema_registry_subject_latest_schema_definition": "SchemaRegistrySubject",
+        "schema_registry_subject_governing_asset_qualified_names": "SchemaRegistrySubject",
+        "data_studio_asset_type": "DataStudioAsset",
+        "data_studio_asset_title": "DataStudioAsset",
+        "data_studio_asset_owner": "DataStudioAsset",
+        "is_trashed_data_studio_asset": "DataStudioAsset",
+        "s3_object_count": "S3Bucket",
+        "s3_bucket_versioning_enabled": "S3Bucket",
+        "objects": "S3Bucket",
+        "s3_object_last_modified_time": "S3Object",
+        "s3_bucket_name": "S3Object",
+        "s3_bucket_qualified_name": "S3Object",
+        "s3_object_size": "S3Object",
+        "s3_object_storage_class": "S3Object",
+        "s3_object_key": "S3Object",
+        "s3_object_content_type": "S3Object",
+        "s3_object_content_disposition": "S3Object",
+        "s3_object_version_id": "S3Object",
+        "bucket": "S3Object",
+        "adls_e_tag": "ADLSAccount",
+        "adls_encryption_type": "ADLSAccount",
+        "adls_account_resource_group": "ADLSAccount",
+        "adls_account_subscription": "ADLSAccount",
+        "adls_account_performance": "ADLSAccount",
+        "adls_account_replication": "ADLSAccount",
+        "adls_account_kind": "ADLSAccount",
+        "adls_primary_disk_state": "ADLSAccount",
+        "adls_account_provision_state": "ADLSAccount",
+        "adls_account_access_tier": "ADLSAccount",
+        "adls_containers": "ADLSAccount",
+        "adls_container_url": "ADLSContainer",
+        "adls_container_lease_state": "ADLSContainer",
+        "adls_container_lease_status": "ADLSContainer",
+        "adls_container_encryption_scope": "ADLSContainer",
+        "adls_container_version_level_immutability_support": "ADLSContainer",
+        "adls_object_count": "ADLSContainer",
+        "adls_objects": "ADLSContainer",
+        "adls_account": "ADLSContainer",
+        "adls_object_url": "ADLSObject",
+        "adls_object_version_id": "ADLSObject",
+        "adls_object_type": "ADLSObject",
+        "adls_object_size": "ADLSObject",
+        "adls_object_access_tier": "ADLSObject",
+        "adls_object_access_tier_last_modified_time": "ADLSObject",
+        "adls_object_archive_status": "ADLSObject",
+        "adls_object_server_encrypted": "ADLSObject",
+        "adls_object_version_level_immutability_support": "ADLSObject",
+        "adls_object_cache_control": "ADLSObject",
+        "adls_object_content_type": "ADLSObject",
+        "adls_object_content_m_d5_hash": "ADLSObject",
+        "adls_object_content_language": "ADLSObject",
+        "adls_object_lease_status": "ADLSObject",
+        "adls_object_lease_state": "ADLSObject",
+        "adls_object_metadata": "ADLSObject",
+        "adls_container_qualified_name": "ADLSObject",
+        "adls_container": "ADLSObject",
+        "gcs_bucket_name": "GCSObject",
+        "gcs_bucket_qualified_name": "GCSObject",
+        "gcs_object_size": "GCSObject",
+        "gcs_object_key": "GCSObject",
+        "gcs_object_media_link": "GCSObject",
+        "gcs_object_hold_type": "GCSObject",
+        "gcs_object_generation_id": "GCSObject",
+        "gcs_object_c_r_c32_c_hash": "GCSObject",
+        "gcs_object_m_d5_hash": "GCSObject",
+        "gcs_object_data_last_modified_time": "GCSObject",
+        "gcs_object_content_type": "GCSObject",
+        "gcs_object_content_encoding": "GCSObject",
+        "gcs_object_content_disposition": "GCSObject",
+        "gcs_object_content_language": "GCSObject",
+        "gcs_object_retention_expiration_date": "GCSObject",
+        "gcs_bucket": "GCSObject",
+        "gcs_object_count": "GCSBucket",
+        "gcs_bucket_versioning_enabled": "GCSBucket",
+        "gcs_bucket_retention_locked": "GCSBucket",
+        "gcs_bucket_retention_period": "GCSBucket",
+        "gcs_bucket_retention_effective_time": "GCSBucket",
+        "gcs_bucket_lifecycle_rules": "GCSBucket",
+        "gcs_bucket_retention_policy": "GCSBucket",
+        "gcs_objects": "GCSBucket",
+        "mc_incident_id": "MCIncident",
+        "mc_incident_type": "MCIncident",
+        "mc_incident_sub_types": "MCIncident",
+        "mc_incident_severity": "MCIncident",
+        "mc_incident_state": "MCIncident",
+        "mc_incident_warehouse": "MCIncident",
+        "mc_monitor": "MCIncident",
+        "mc_incident_assets": "MCIncident",
+        "mc_monitor_id": "MCMonitor",
+        "mc_monitor_status": "MCMonitor",
+        "mc_monitor_type": "MCMonitor",
+        "mc_monitor_warehouse": "MCMonitor",
+        "mc_monitor_schedule_type": "MCMonitor",
+        "mc_monitor_namespace": "MCMonitor",
+        "mc_monitor_rule_type": "MCMonitor",
+        "mc_monitor_rule_custom_sql": "MCMonitor",
+        "mc_monitor_rule_schedule_config": "MCMonitor",
+        "mc_monitor_rule_schedule_config_humanized": "MCMonitor",
+        "mc_monitor_alert_condition": "MCMonitor",
+        "mc_monitor_rule_next_execution_time": "MCMonitor",
+        "mc_monitor_rule_previous_execution_time": "MCMonitor",
+        "mc_monitor_rule_comparisons": "MCMonitor",
+        "mc_monitor_rule_is_snoozed": "MCMonitor",
+        "mc_monitor_breach_rate": "MCMonitor",
+        "mc_monitor_incident_count": "MCMonitor",
+        "mc_monitor_assets": "MCMonitor",
+        "soda_check_id": "SodaCheck",
+        "soda_check_evaluation_status": "SodaCheck",
+        "soda_check_definition": "SodaCheck",
+        "soda_check_last_scan_at": "SodaCheck",
+        "soda_check_incident_count": "SodaCheck",
+        "soda_check_columns": "SodaCheck",
+        "soda_check_assets": "SodaCheck",
+        "preset_chart_description_markdown": "PresetChart",
+        "preset_chart_form_data": "PresetChart",
+        "preset_dashboard": "PresetChart",
+        "preset_dataset_datasource_name": "PresetDataset",
+        "preset_dataset_id": "PresetDataset",
+        "preset_dataset_type": "PresetDataset",
+        "preset_dashboard_changed_by_name": "PresetDashboard",
+        "preset_dashboard_changed_by_url": "PresetDashboard",
+        "preset_dashboard_is_managed_externally": "PresetDashboard",
+        "preset_dashboard_is_published": "PresetDashboard",
+        "preset_dashboard_thumbnail_url": "PresetDashboard",
+        "preset_dashboard_chart_count": "PresetDashboard",
+        "preset_datasets": "PresetDashboard",
+        "preset_charts": "PresetDashboard",
+        "preset_workspace": "PresetDashboard",
+        "preset_workspace_public_dashboards_allowed": "PresetWorkspace",
+        "preset_workspace_cluster_id": "PresetWorkspace",
+        "preset_workspace_hostname": "PresetWorkspace",
+        "preset_workspace_is_in_maintenance_mode": "PresetWorkspace",
+        "preset_workspace_region": "PresetWorkspace",
+        "preset_workspace_status": "PresetWorkspace",
+        "preset_workspace_deployment_id": "PresetWorkspace",
+        "preset_workspace_dashboard_count": "PresetWorkspace",
+        "preset_workspace_dataset_count": "PresetWorkspace",
+        "preset_dashboards": "PresetWorkspace",
+        "mode_collection_token": "ModeReport",
+        "mode_report_published_at": "ModeReport",
+        "mode_query_count": "ModeReport",
+        "mode_chart_count": "ModeReport",
+        "mode_query_preview": "ModeReport",
+        "mode_is_public": "ModeReport",
+        "mode_is_shared": "ModeReport",
+        "mode_queries": "ModeReport",
+        "mode_collections": "ModeReport",
+        "mode_raw_query": "ModeQuery",
+        "mode_report_import_count": "ModeQuery",
+        "mode_charts": "ModeQuery",
+        "mode_report": "ModeQuery",
+        "mode_chart_type": "ModeChart",
+        "mode_query": "ModeChart",
+        "mode_collection_count": "ModeWorkspace",
+        "mode_collection_type": "ModeCollection",
+        "mode_collection_state": "ModeCollection",
+        "mode_workspace": "ModeCollection",
+        "mode_reports": "ModeCollection",
+        "sigma_dataset_qualified_name": "SigmaDatasetColumn",
+        "sigma_dataset_name": "SigmaDatasetColumn",
+        "sigma_dataset": "SigmaDatasetColumn",
+        "sigma_dataset_column_count": "SigmaDataset",
+        "sigma_dataset_columns": "SigmaDataset",
+        "sigma_page_count": "SigmaWorkbook",
+        "sigma_pages": "SigmaWorkbook",
+        "sigma_data_element_field_is_hidden": "SigmaDataElementField",
+        "sigma_data_element_field_formula": "SigmaDataElementField",
+        "sigma_data_element": "SigmaDataElementField",
+        "sigma_data_element_count": "SigmaPage",
+        "sigma_data_elements": "SigmaPage",
+        "sigma_workbook": "SigmaPage",
+        "sigma_data_element_query": "SigmaDataElement",
+        "sigma_data_element_type": "SigmaDataElement",
+        "sigma_data_element_field_count": "SigmaDataElement",
+        "sigma_page": "SigmaDataElement",
+        "sigma_data_element_fields": "SigmaDataElement",
+        "site_qualified_name": "TableauWorkbook",
+        "project_qualified_name": "TableauWorkbook",
+        "top_level_project_name": "TableauWorkbook",
+        "top_level_project_qualified_name": "TableauWorkbook",
+        "project_hierarchy": "TableauWorkbook",
+        "project": "TableauWorkbook",
+        "dashboards": "TableauWorkbook",
+        "worksheets": "TableauWorkbook",
+        "datasources": "TableauWorkbook",
+        "workbook_qualified_name": "TableauDatasourceField",
+        "datasource_qualified_name": "TableauDatasourceField",
+        "fully_qualified_name": "TableauDatasourceField",
+        "tableau_datasource_field_data_category": "TableauDatasourceField",
+        "tableau_datasource_field_role": "TableauDatasourceField",
+        "tableau_datasource_field_data_type": "TableauDatasourceField",
+        "upstream_tables": "TableauDatasourceField",
+        "tableau_datasource_field_formula": "TableauDatasourceField",
+        "tableau_datasource_field_bin_size": "TableauDatasourceField",
+        "upstream_columns": "TableauDatasourceField",
+        "upstream_fields": "TableauDatasourceField",
+        "datasource_field_type": "TableauDatasourceField",
+        "datasource": "TableauDatasourceField",
+        "data_category": "TableauCalculatedField",
+        "role": "TableauCalculatedField",
+        "tableau_data_type": "TableauCalculatedField",
+        "formula": "TableauCalculatedField",
+        "is_top_level_project": "TableauProject",
+        "workbooks": "TableauProject",
+        "flows": "TableauProject",
+        "child_projects": "TableauProject",
+        "parent_project": "TableauProject",
+        "site": "TableauProject",
+        "projects": "TableauSite",
+        "is_published": "TableauDatasource",
+        "has_extracts": "TableauDatasource",
+        "is_certified": "TableauDatasource",
+        "certifier": "TableauDatasource",
+        "certification_note": "TableauDatasource",
+        "certifier_display_name": "TableauDatasource",
+        "upstream_datasources": "TableauDatasource",
+        "workbook": "TableauDatasource",
+        "fields": "TableauDatasource",
+        "input_fields": "TableauFlow",
+        "output_fields": "TableauFlow",
+        "output_steps": "TableauFlow",
+        "datasource_fields": "TableauWorksheet",
+        "calculated_fields": "TableauWorksheet",
+        "folder_name": "LookerLook",
+        "source_user_id": "LookerLook",
+        "source_view_count": "LookerLook",
+        "sourcelast_updater_id": "LookerLook",
+        "source_last_accessed_at": "LookerLook",
+        "source_last_viewed_at": "LookerLook",
+        "source_content_metadata_id": "LookerLook",
+        "source_query_id": "LookerLook",
+        "model_name": "LookerLook",
+        "query": "LookerLook",
+        "folder": "LookerLook",
+        "tile": "LookerLook",
+        "model": "LookerLook",
+        "dashboard": "LookerLook",
+        "source_metadata_id": "LookerDashboard",
+        "tiles": "LookerDashboard",
+        "looks": "LookerDashboard",
+        "source_creator_id": "LookerFolder",
+        "source_child_count": "LookerFolder",
+        "source_parent_i_d": "LookerFolder",
+        "looker_sub_folders": "LookerFolder",
+        "looker_parent_folder": "LookerFolder",
+        "lookml_link_id": "LookerTile",
+        "merge_result_id": "LookerTile",
+        "note_text": "LookerTile",
+        "query_i_d": "LookerTile",
+        "result_maker_i_d": "LookerTile",
+        "subtitle_text": "LookerTile",
+        "look_id": "LookerTile",
+        "look": "LookerTile",
+        "project_name": "LookerModel",
+        "explores": "LookerModel",
+        "source_connection_name": "LookerExplore",
+        "sql_table_name": "LookerExplore",
+        "models": "LookerProject",
+        "looker_parent_projects": "LookerProject",
+        "looker_child_projects": "LookerProject",
+        "source_definition": "LookerQuery",
+        "source_definition_database": "LookerQuery",
+        "source_definition_schema": "LookerQuery",
+        "looker_explore_qualified_name": "LookerField",
+        "looker_view_qualified_name": "LookerField",
+        "looker_field_data_type": "LookerField",
+        "looker_times_used": "LookerField",
+        "explore": "LookerField",
+        "looker_view_file_path": "LookerView",
+        "looker_view_file_name": "LookerView",
+        "domo_dataset_row_count": "DomoDataset",
+        "domo_dataset_column_count": "DomoDataset",
+        "domo_dataset_card_count": "DomoDataset",
+        "domo_dataset_last_run": "DomoDataset",
+        "domo_dataset_columns": "DomoDataset",
+        "domo_cards": "DomoDataset",
+        "domo_card_type": "DomoCard",
+        "domo_card_type_value": "DomoCard",
+        "domo_card_dashboard_count": "DomoCard",
+        "domo_dashboards": "DomoCard",
+        "domo_dataset": "DomoCard",
+        "domo_dataset_column_type": "DomoDatasetColumn",
+        "domo_dataset_qualified_name": "DomoDatasetColumn",
+        "domo_dashboard_card_count": "DomoDashboard",
+        "domo_dashboard_parent": "DomoDashboard",
+        "domo_dashboard_children": "DomoDashboard",
+        "redash_dashboard_widget_count": "RedashDashboard",
+        "redash_query_s_q_l": "RedashQuery",
+        "redash_query_parameters": "RedashQuery",
+        "redash_query_schedule": "RedashQuery",
+        "redash_query_last_execution_runtime": "RedashQuery",
+        "redash_query_last_executed_at": "RedashQuery",
+        "redash_query_schedule_humanized": "RedashQuery",
+        "redash_visualizations": "RedashQuery",
+        "redash_visualization_type": "RedashVisualization",
+        "redash_query_name": "RedashVisualization",
+        "redash_query_qualified_name": "RedashVisualization",
+        "redash_query": "RedashVisualization",
+        "sisense_folder_parent_folder_qualified_name": "SisenseFolder",
+        "sisense_child_folders": "SisenseFolder",
+        "sisense_widgets": "SisenseFolder",
+        "sisense_dashboards": "SisenseFolder",
+        "sisense_parent_folder": "SisenseFolder",
+        "sisense_widget_column_count": "SisenseWidget",
+        "sisense_widget_sub_type": "SisenseWidget",
+        "sisense_widget_size": "SisenseWidget",
+        "sisense_widget_dashboard_qualified_name": "SisenseWidget",
+        "sisense_widget_folder_qualified_name": "SisenseWidget",
+        "sisense_datamodel_tables": "SisenseWidget",
+        "sisense_folder": "SisenseWidget",
+        "sisense_dashboard": "SisenseWidget",
+        "sisense_datamodel_table_count": "SisenseDatamodel",
+        "sisense_datamodel_server": "SisenseDatamodel",
+        "sisense_datamodel_revision": "SisenseDatamodel",
+        "sisense_datamodel_last_build_time": "SisenseDatamodel",
+        "sisense_datamodel_last_successful_build_time": "SisenseDatamodel",
+        "sisense_datamodel_last_publish_time": "SisenseDatamodel",
+        "sisense_datamodel_type": "SisenseDatamodel",
+        "sisense_datamodel_relation_type": "SisenseDatamodel",
+        "sisense_datamodel_qualified_name": "SisenseDatamodelTable",
+        "sisense_datamodel_table_column_count": "SisenseDatamodelTable",
+        "sisense_datamodel_table_type": "SisenseDatamodelTable",
+        "sisense_datamodel_table_expression": "SisenseDatamodelTable",
+        "sisense_datamodel_table_is_materialized": "SisenseDatamodelTable",
+        "sisense_datamodel_table_is_hidden": "SisenseDatamodelTable",
+        "sisense_datamodel_table_schedule": "SisenseDatamodelTable",
+        "sisense_datamodel_table_live_query_settings": "SisenseDatamodelTable",
+        "sisense_datamodel": "SisenseDatamodelTable",
+        "sisense_dashboard_folder_qualified_name": "SisenseDashboard",
+        "sisense_dashboard_widget_count": "SisenseDashboard",
+        "sisense_datamodels": "SisenseDashboard",
+        "metabase_dashboard_count": "MetabaseQuestion",
+        "metabase_query_type": "MetabaseQuestion",
+        "metabase_query": "MetabaseQuestion",
+        "metabase_dashboards": "MetabaseQuestion",
+        "metabase_collection": "MetabaseQuestion",
+        "metabase_slug": "MetabaseCollection",
+        "metabase_color": "MetabaseCollection",
+        "metabase_namespace": "MetabaseCollection",
+        "metabase_is_personal_collection": "MetabaseCollection",
+        "metabase_questions": "MetabaseCollection",
+        "metabase_question_count": "MetabaseDashboard",
+        "quick_sight_folder_type": "QuickSightFolder",
+        "quick_sight_folder_hierarchy": "QuickSightFolder",
+        "quick_sight_dashboards": "QuickSightFolder",
+        "quick_sight_datasets": "QuickSightFolder",
+        "quick_sight_analyses": "QuickSightFolder",
+        "quick_sight_dashboard_qualified_name": "QuickSightDashboardVisual",
+        "quick_sight_dashboard": "QuickSightDashboardVisual",
+        "quick_sight_analysis_qualified_name": "QuickSightAnalysisVisual",
+        "quick_sight_analysis": "QuickSightAnalysisVisual",
+        "quick_sight_dataset_field_type": "QuickSightDatasetField",
+        "quick_sight_dataset_qualified_name": "QuickSightDatasetField",
+        "quick_sight_dataset": "QuickSightDatasetField",
+        "quick_sight_analysis_status": "QuickSightAnalysis",
+        "quick_sight_analysis_calculated_fields": "QuickSightAnalysis",
+        "quick_sight_analysis_parameter_declarations": "QuickSightAnalysis",
+        "quick_sight_analysis_filter_groups": "QuickSightAnalysis",
+        "quick_sight_analysis_visuals": "QuickSightAnalysis",
+        "quick_sight_analysis_folders": "QuickSightAnalysis",
+        "quick_sight_dashboard_published_version_number": "QuickSightDashboard",
+        "quick_sight_dashboard_last_published_time": "QuickSightDashboard",
+        "quick_sight_dashboard_folders": "QuickSightDashboard",
+        "quick_sight_dashboard_visuals": "QuickSightDashboard",
+        "quick_sight_dataset_import_mode": "QuickSightDataset",
+        "quick_sight_dataset_column_count": "QuickSightDataset",
+        "quick_sight_dataset_folders": "QuickSightDataset",
+        "quick_sight_dataset_fields": "QuickSightDataset",
+        "thoughtspot_columns": "ThoughtspotWorksheet",
+        "thoughtspot_dashlets": "ThoughtspotLiveboard",
+        "thoughtspot_table_qualified_name": "ThoughtspotColumn",
+        "thoughtspot_view_qualified_name": "ThoughtspotColumn",
+        "thoughtspot_worksheet_qualified_name": "ThoughtspotColumn",
+        "thoughtspot_column_data_type": "ThoughtspotColumn",
+        "thoughtspot_column_type": "ThoughtspotColumn",
+        "thoughtspot_table": "ThoughtspotColumn",
+        "thoughtspot_view": "ThoughtspotColumn",
+        "thoughtspot_worksheet": "ThoughtspotColumn",
+        "thoughtspot_liveboard_name": "ThoughtspotDashlet",
+        "thoughtspot_liveboard_qualified_name": "ThoughtspotDashlet",
+        "thoughtspot_liveboard": "ThoughtspotDashlet",
+        "workspace_qualified_name": "PowerBIReport",
+        "dataset_qualified_name": "PowerBIReport",
+        "web_url": "PowerBIReport",
+        "page_count": "PowerBIReport",
+        "workspace": "PowerBIReport",
+        "pages": "PowerBIReport",
+        "dataset": "PowerBIReport",
+        "power_b_i_measure_expression": "PowerBIMeasure",
+        "power_b_i_is_external_measure": "PowerBIMeasure",
+        "power_b_i_column_data_category": "PowerBIColumn",
+        "power_b_i_column_data_type": "PowerBIColumn",
+        "power_b_i_sort_by_column": "PowerBIColumn",
+        "power_b_i_column_summarize_by": "PowerBIColumn",
+        "power_b_i_table_source_expressions": "PowerBITable",
+        "power_b_i_table_column_count": "PowerBITable",
+        "power_b_i_table_measure_count": "PowerBITable",
+        "measures": "PowerBITable",
+        "dashboard_qualified_name": "PowerBITile",
+        "report": "PowerBITile",
+        "connection_details": "PowerBIDatasource",
+        "datasets": "PowerBIDatasource",
+        "report_count": "PowerBIWorkspace",
+        "dashboard_count": "PowerBIWorkspace",
+        "dataset_count": "PowerBIWorkspace",
+        "dataflow_count": "PowerBIWorkspace",
+        "reports": "PowerBIWorkspace",
+        "dataflows": "PowerBIWorkspace",
+        "tile_count": "PowerBIDashboard",
+        "report_qualified_name": "PowerBIPage",
+        "micro_strategy_report_type": "MicroStrategyReport",
+        "micro_strategy_metrics": "MicroStrategyReport",
+        "micro_strategy_project": "MicroStrategyReport",
+        "micro_strategy_attributes": "MicroStrategyReport",
+        "micro_strategy_reports": "MicroStrategyProject",
+        "micro_strategy_facts": "MicroStrategyProject",
+        "micro_strategy_visualizations": "MicroStrategyProject",
+        "micro_strategy_documents": "MicroStrategyProject",
+        "micro_strategy_cubes": "MicroStrategyProject",
+        "micro_strategy_dossiers": "MicroStrategyProject",
+        "micro_strategy_metric_expression": "MicroStrategyMetric",
+        "micro_strategy_attribute_qualified_names": "MicroStrategyMetric",
+        "micro_strategy_attribute_names": "MicroStrategyMetric",
+        "micro_strategy_fact_qualified_names": "MicroStrategyMetric",
+        "micro_strategy_fact_names": "MicroStrategyMetric",
+        "micro_strategy_metric_parent_qualified_names": "MicroStrategyMetric",
+        "micro_strategy_metric_parent_names": "MicroStrategyMetric",
+        "micro_strategy_metric_parents": "MicroStrategyMetric",
+        "micro_strategy_metric_children": "MicroStrategyMetric",
+        "micro_strategy_cube_type": "MicroStrategyCube",
+        "micro_strategy_cube_query": "MicroStrategyCube",
+        "micro_strategy_dossier_chapter_names": "MicroStrategyDossier",
+        "micro_strategy_fact_expressions": "MicroStrategyFact",
+        "micro_strategy_attribute_forms": "MicroStrategyAttribute",
+        "micro_strategy_visualization_type": "MicroStrategyVisualization",
+        "micro_strategy_dossier_qualified_name": "MicroStrategyVisualization",
+        "micro_strategy_dossier_name": "MicroStrategyVisualization",
+        "micro_strategy_dossier": "MicroStrategyVisualization",
+        "cognos_folder": "CognosExploration",
+        "cognos_folder_sub_folder_count": "CognosFolder",
+        "cognos_folder_child_objects_count": "CognosFolder",
+        "cognos_packages": "CognosFolder",
+        "cognos_reports": "CognosFolder",
+        "cognos_dashboards": "CognosFolder",
+        "cognos_sub_folders": "CognosFolder",
+        "cognos_modules": "CognosFolder",
+        "cognos_files": "CognosFolder",
+        "cognos_explorations": "CognosFolder",
+        "cognos_datasource_connection_string": "CognosDatasource",
+        "qlik_space_type": "QlikSpace",
+        "qlik_datasets": "QlikSpace",
+        "qlik_apps": "QlikSpace",
+        "qlik_has_section_access": "QlikApp",
+        "qlik_origin_app_id": "QlikApp",
+        "qlik_is_encrypted": "QlikApp",
+        "qlik_is_direct_query_mode": "QlikApp",
+        "qlik_app_static_byte_size": "QlikApp",
+        "qlik_space": "QlikApp",
+        "qlik_sheets": "QlikApp",
+        "qlik_chart_subtitle": "QlikChart",
+        "qlik_chart_footnote": "QlikChart",
+        "qlik_chart_orientation": "QlikChart",
+        "qlik_chart_type": "QlikChart",
+        "qlik_sheet": "QlikChart",
+        "qlik_dataset_technical_name": "QlikDataset",
+        "qlik_dataset_type": "QlikDataset",
+        "qlik_dataset_uri": "QlikDataset",
+        "qlik_dataset_subtype": "QlikDataset",
+        "qlik_sheet_is_approved": "QlikSheet",
+        "qlik_app": "QlikSheet",
+        "qlik_charts": "QlikSheet",
+        "cognite_asset": "CogniteEvent",
+        "cognite_events": "CogniteAsset",
+        "cognite_files": "CogniteAsset",
+        "cognite_timeseries": "CogniteAsset",
+        "cognite_sequences": "CogniteAsset",
+        "cognite3dmodels": "CogniteAsset",
+        "is_custom": "SalesforceObject",
+        "is_mergable": "SalesforceObject",
+        "is_queryable": "SalesforceObject",
+        "field_count": "SalesforceObject",
+        "lookup_fields": "SalesforceObject",
+        "organization": "SalesforceObject",
+        "object_qualified_name": "SalesforceField",
+        "inline_help_text": "SalesforceField",
+        "is_calculated": "SalesforceField",
+        "is_case_sensitive": "SalesforceField",
+        "is_encrypted": "SalesforceField",
+        "is_unique": "SalesforceField",
+        "picklist_values": "SalesforceField",
+        "is_polymorphic_foreign_key": "SalesforceField",
+        "default_value_formula": "SalesforceField",
+        "lookup_objects": "SalesforceField",
+        "object": "SalesforceField",
+        "source_id": "SalesforceOrganization",
+        "dashboard_type": "SalesforceDashboard",
+        "report_type": "SalesforceReport",
+        "detail_columns": "SalesforceReport",
+        "mongo_d_b_collection_subtype": "MongoDBCollection",
+        "mongo_d_b_collection_is_capped": "MongoDBCollection",
+        "mongo_d_b_collection_time_field": "MongoDBCollection",
+        "mongo_d_b_collection_time_granularity": "MongoDBCollection",
+        "mongo_d_b_collection_expire_after_seconds": "MongoDBCollection",
+        "mongo_d_b_collection_maximum_document_count": "MongoDBCollection",
+        "mongo_d_b_collection_max_size": "MongoDBCollection",
+        "mongo_d_b_collection_num_orphan_docs": "MongoDBCollection",
+        "mongo_d_b_collection_num_indexes": "MongoDBCollection",
+        "mongo_d_b_collection_total_index_size": "MongoDBCollection",
+        "mongo_d_b_collection_average_object_size": "MongoDBCollection",
+        "mongo_d_b_collection_schema_definition": "MongoDBCollection",
+        "mongo_d_b_database": "MongoDBCollection",
+        "dynamo_d_b_secondary_index_projection_type": "DynamoDBSecondaryIndex",
+        "dynamo_dbtable_g_s_i_count": "DynamoDBTable",
+        "dynamo_dbtable_l_s_i_count": "DynamoDBTable",
+        "dynamo_d_b_local_secondary_indexes": "DynamoDBTable",
+        "dynamo_d_b_global_secondary_indexes": "DynamoDBTable",
+        "mongo_d_b_database_collection_count": "MongoDBDatabase",
+        "mongo_d_b_collections": "MongoDBDatabase",
+        "kafka_topic_is_internal": "KafkaTopic",
+        "kafka_topic_compression_type": "KafkaTopic",
+        "kafka_topic_replication_factor": "KafkaTopic",
+        "kafka_topic_segment_bytes": "KafkaTopic",
+        "kafka_topic_retention_time_in_ms": "KafkaTopic",
+        "kafka_topic_partitions_count": "KafkaTopic",
+        "kafka_topic_size_in_bytes": "KafkaTopic",
+        "kafka_topic_record_count": "KafkaTopic",
+        "kafka_topic_cleanup_policy": "KafkaTopic",
+        "kafka_consumer_groups": "KafkaTopic",
+        "kafka_consumer_group_topic_consumption_properties": "KafkaConsumerGroup",
+        "kafka_consumer_group_member_count": "KafkaConsumerGroup",
+        "kafka_topic_names": "KafkaConsumerGroup",
+        "kafka_topic_qualified_names": "KafkaConsumerGroup",
+        "kafka_topics": "KafkaConsumerGroup",
+        "azure_service_bus_topics": "AzureServiceBusNamespace",
+        "azure_service_bus_namespace": "AzureServiceBusTopic",
+        "cosmos_mongo_d_b_database": "CosmosMongoDBCollection",
+        "cosmos_mongo_d_b_collections": "CosmosMongoDBDatabase",
+        "dynamo_dbtable": "DynamoDBLocalSecondaryIndex",
+        "azure_event_hub_status": "AzureEventHub",
+    },
+)
+
+# Every other asset type extends these, so they are always imported (in this order,
+# as they refer to each other):
+from .referenceable import Referenceable  # noqa: E402
+from .asset import Asset  # noqa: E402
+
+__all__ = list(registry.modules)
+
+
+def __getattr__(name: str) -> Any:
+    return registry.get(name)
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
+
+
+def load_all() -> None:
+    """
+    Import every asset type, for example to enumerate all of them through Asset's subclasses.
+    """
+    registry.load_all()
@@ -20,6 +20,8 @@ from pyatlan.model.fields.atlan_fields import (
     NumericField,
 )
 
+from . import registry
+
 
 class Referenceable(AtlanObject):
     """Description"""
@@ -70,10 +72,8 @@ class Referenceable(AtlanObject):
         from pyatlan.model.constants import DELETED_
 
         if self.classification_names:
-            return [
-                AtlanTagCache.get_name_for_id(tag_id) or DELETED_
-                for tag_id in self.classification_names
-            ]
+            names = AtlanTagCache.get_names_for_ids(self.classification_names)
+            return [names[tag_id] or DELETED_ for tag_id in self.classification_names]
         return []
 
     def __setattr__(self, name, value):
@@ -112,6 +112,11 @@ class Referenceable(AtlanObject):
             default=None, description=""
         )  # relationship
 
+        def __init__(__pydantic_self__, **data: Any) -> None:
+            # Asset types are imported lazily, so resolve any forward references on first use
+            registry.ensure_resolved(type(__pydantic_self__))
+            super().__init__(**data)
+
         def validate_required(self):
             pass
 
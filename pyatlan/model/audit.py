@@ -151,8 +151,17 @@ class CustomMetadataAttributesAuditDetail(AtlanObject):
         cm_id = values[TYPE_NAME]
         try:
             values[TYPE_NAME] = CustomMetadataCache.get_name_for_id(values[TYPE_NAME])
+            attr_names = CustomMetadataCache.get_attr_names_for_ids(
+                cm_id, values[ATTRIBUTES]
+            )
+            if missing := [
+                attr_id for attr_id, attr_name in attr_names.items() if not attr_name
+            ]:
+                raise ErrorCode.CM_ATTR_NOT_FOUND_BY_ID.exception_with_parameters(
+                    missing[0], cm_id
+                )
             attributes = {
-                CustomMetadataCache.get_attr_name_for_id(cm_id, attr_id): properties
+                attr_names[attr_id]: properties
                 for attr_id, properties in values[ATTRIBUTES].items()
             }
             archived_attributes = {
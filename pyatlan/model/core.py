@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from pydantic.v1 import BaseModel, Extra, Field, PrivateAttr, root_validator, validator
 
-from pyatlan.model.utils import encoders, to_camel_case
+from pyatlan.model.utils import encoders, json_bytes, to_camel_case
 
 if TYPE_CHECKING:
     from dataclasses import dataclass
@@ -15,10 +15,12 @@ else:
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 from pydantic.v1.generics import GenericModel
+from pydantic.v1.utils import ROOT_KEY
 
 from pyatlan.model.constants import DELETED_, DELETED_SENTINEL
 from pyatlan.model.enums import AnnouncementType, EntityStatus, SaveSemantic
 from pyatlan.model.structs import SourceTagAttachment
+from pyatlan.utils import CustomMetadataPlan
 
 
 class AtlanTagName:
@@ -102,6 +104,22 @@ class AtlanObject(BaseModel):
         alias_generator = to_camel_case
         allow_population_by_field_name = True
 
+    def json_bytes(self, **kwargs) -> bytes:
+        """
+        Serialize to JSON directly as UTF-8 bytes (as sent in the body of a request),
+        in a single pass and using orjson if it is installed.
+
+        :param kwargs: options of the serialization, as for dict() (for example, by_alias)
+        :returns: the JSON
+        """
+        if type(self).json is not BaseModel.json:
+            # Respect any customized serialization
+            return self.json(**kwargs).encode("utf-8")
+        data = self.dict(**kwargs)
+        if self.__custom_root_type__:
+            data = data[ROOT_KEY]
+        return json_bytes(data, default=type(self).__json_encoder__)
+
     @classmethod
     def _populate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -137,6 +155,20 @@ class SearchRequest(AtlanObject, ABC):
     size: Optional[int] = Field(
         default=None, description="How many results to include in each page of results."
     )
+    _custom_metadata_plan: Optional[CustomMetadataPlan] = PrivateAttr(default=None)
+
+    @property
+    def custom_metadata_plan(self) -> CustomMetadataPlan:
+        """
+        Plan for unflattening the custom metadata requested by this search, compiled once and
+        reused across every page of results (recompiled only if the requested attributes change).
+
+        :returns: the plan for unflattening the custom metadata in the results of this search
+        """
+        plan = self._custom_metadata_plan
+        if plan is None or plan.attributes != tuple(self.attributes or ()):
+            plan = self._custom_metadata_plan = CustomMetadataPlan(self.attributes)
+        return plan
 
 
 @dataclass
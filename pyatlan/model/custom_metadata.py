@@ -1,5 +1,5 @@
 from collections import UserDict
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 from pydantic.v1 import PrivateAttr
 
@@ -128,6 +128,18 @@ class CustomMetadataProxy:
                 attribs = CustomMetadataDict.get_deleted_sentinel()
             self._metadata[cm_name] = attribs
 
+    @staticmethod
+    def resolve(attr_ids: Dict[str, List[str]]):
+        """
+        Resolve the names of many custom metadata sets and attributes in a single pass, so that any that are
+        not yet cached are retrieved once, rather than once for each asset on which they appear.
+
+        :param attr_ids: Atlan-internal IDs of the attributes to resolve, keyed by the ID of their set
+        """
+        CustomMetadataCache.get_names_for_ids(attr_ids)
+        for set_id, ids in attr_ids.items():
+            CustomMetadataCache.get_attr_names_for_ids(set_id, ids)
+
     def get_custom_metadata(self, name: str) -> CustomMetadataDict:
         if self._metadata is None:
             self._metadata = {}
@@ -0,0 +1,306 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generator, List, Optional
+
+from pyatlan.errors import ErrorCode
+from pyatlan.model.assets import Asset, Referenceable
+from pyatlan.model.fluent_search import FluentSearch
+from pyatlan.model.search import Query, Range
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of slices into which to partition a search by GUID
+MAX_GUID_SLICES = 256
+# Number of leading (hexadecimal) characters of a GUID on which to partition it into slices
+GUID_SLICE_DIGITS = 4
+
+
+@dataclasses.dataclass
+class SearchSlice:
+    """
+    One disjoint part of a search: the assets matched by both the search and the slice's query.
+    """
+
+    name: str
+    query: Query
+
+
+@dataclasses.dataclass
+class SliceProgress:
+    """
+    Progress of exporting a single slice. The checkpoint fields (since and seen) capture
+    the creation time of the last asset exported and every asset exported with that same
+    creation time, which is enough to resume the slice without repeating or skipping any asset.
+    """
+
+    name: str
+    count: int = 0
+    processed: int = 0
+    since: Optional[int] = None
+    seen: List[str] = dataclasses.field(default_factory=list)
+    done: bool = False
+
+    def track(self, asset: Asset):
+        self.processed += 1
+        if asset.create_time != self.since:
+            self.since = asset.create_time
+            self.seen = []
+        self.seen.append(asset.guid)
+
+    def to_checkpoint(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Dict[str, Any]) -> SliceProgress:
+        return cls(**checkpoint)
+
+
+_SLICE_DONE = object()
+
+
+class SlicedExport:
+    """
+    Exports every asset matching a search, by partitioning the search into disjoint slices
+    that are each paged through (in bulk mode) concurrently, and merged into a single stream.
+    Progress is tracked per slice, and can be captured as a checkpoint from which a later
+    export can resume.
+    """
+
+    def __init__(
+        self,
+        client: AtlanClient,
+        search: FluentSearch,
+        slices: List[SearchSlice],
+        concurrency: int = 4,
+        buffer_size: int = 1000,
+    ):
+        """
+        Create a new sliced export.
+
+        :param client: client through which to search for the assets
+        :param search: the search for which to export every matching asset (no sorting can be specified)
+        :param slices: disjoint slices into which to partition the search
+        :param concurrency: maximum number of slices to export at the same time
+        :param buffer_size: maximum number of assets retrieved but not yet consumed, across all slices
+        """
+        names = [s.name for s in slices]
+        if len(set(names)) != len(names):
+            raise ErrorCode.INVALID_PARAMETER_VALUE.exception_with_parameters(
+                names, "slices", "uniquely-named slices"
+            )
+        self._client = client
+        self._search = search
+        self._slices = slices
+        self._concurrency = max(1, concurrency)
+        self._buffer_size = max(1, buffer_size)
+        self._progress: Dict[str, SliceProgress] = {
+            s.name: SliceProgress(name=s.name) for s in slices
+        }
+
+    @classmethod
+    def by_type(
+        cls, client: AtlanClient, search: FluentSearch, types: List[type], **kwargs
+    ) -> SlicedExport:
+        """
+        Partition the search into one slice per asset type.
+
+        :param client: client through which to search for the assets
+        :param search: the search for which to export every matching asset
+        :param types: asset types, one slice per type (assets of other types are not exported)
+        :returns: an export of the search sliced by asset type
+        """
+        slices = [
+            SearchSlice(name=t.__name__, query=Referenceable.TYPE_NAME.eq(t.__name__))
+            for t in types
+        ]
+        return cls(client, search, slices, **kwargs)
+
+    @classmethod
+    def by_qualified_name_prefix(
+        cls, client: AtlanClient, search: FluentSearch, prefixes: List[str], **kwargs
+    ) -> SlicedExport:
+        """
+        Partition the search into one slice per qualifiedName prefix
+        (for example, one per schema of a connection).
+
+        :param client: client through which to search for the assets
+        :param search: the search for which to export every matching asset
+        :param prefixes: qualifiedName prefixes, one slice per prefix (assets matching none are not exported)
+        :returns: an export of the search sliced by qualifiedName prefix
+        :raises InvalidRequestError: if any prefix is itself a prefix of another, as the slices would overlap
+        """
+        for prefix in prefixes:
+            for other in prefixes:
+                if prefix is not other and other.startswith(prefix):
+                    raise ErrorCode.OVERLAPPING_EXPORT_SLICES.exception_with_parameters(
+                        prefix, other
+                    )
+        slices = [
+            SearchSlice(
+                name=prefix, query=Referenceable.QUALIFIED_NAME.startswith(prefix)
+            )
+            for prefix in prefixes
+        ]
+        return cls(client, search, slices, **kwargs)
+
+    @classmethod
+    def by_guid(
+        cls, client: AtlanClient, search: FluentSearch, count: int, **kwargs
+    ) -> SlicedExport:
+        """
+        Partition the search into evenly-sized slices by contiguous ranges of each asset's
+        (uniformly-distributed) GUID, so that every matching asset is exported. The ranges
+        are split on the leading characters of the GUIDs, and differ in width by at most
+        one part in 65536.
+
+        :param client: client through which to search for the assets
+        :param search: the search for which to export every matching asset
+        :param count: number of slices into which to partition the search (at most 256)
+        :returns: an export of the search sliced by GUID
+        """
+        if not 1 <= count <= MAX_GUID_SLICES:
+            raise ErrorCode.INVALID_PARAMETER_VALUE.exception_with_parameters(
+                count, "count", f"1-{MAX_GUID_SLICES}"
+            )
+        width = 16**GUID_SLICE_DIGITS
+        # The first and last slices are open-ended, so that no GUID can fall outside them
+        bounds: List[Optional[str]] = [
+            f"{i * width // count:0{GUID_SLICE_DIGITS}x}" for i in range(1, count)
+        ]
+        bounds = [None, *bounds, None]
+        slices = [
+            SearchSlice(name=f"guid-{i}", query=_guid_range(bounds[i], bounds[i + 1]))
+            for i in range(count)
+        ]
+        return cls(client, search, slices, **kwargs)
+
+    @property
+    def progress(self) -> Dict[str, SliceProgress]:
+        """
+        :returns: progress of the export, keyed by slice name
+        """
+        return self._progress
+
+    def checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Capture the progress of the export, in a form that can be persisted (as JSON) and
+        later used to resume the export. The checkpoint only covers assets that have been
+        consumed from the export.
+
+        :returns: the progress of every slice, keyed by slice name
+        """
+        return {name: p.to_checkpoint() for name, p in self._progress.items()}
+
+    def execute(
+        self, resume_from: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Generator[Asset, None, None]:
+        """
+        Run the export, yielding every asset across all slices. Assets from different slices
+        are interleaved in the order they are retrieved.
+
+        :param resume_from: a checkpoint from a previous export of the same search and slices,
+        from which to resume (slices already completed will not be searched again)
+        :returns: every asset that matches the search, across all slices
+        :raises AtlanError: on any API communication issue (after which the export can be resumed)
+        """
+        if resume_from:
+            for name, checkpoint in resume_from.items():
+                if name in self._progress:
+                    self._progress[name] = SliceProgress.from_checkpoint(checkpoint)
+        pending = [s for s in self._slices if not self._progress[s.name].done]
+        if not pending:
+            return
+        buffer: queue.Queue = queue.Queue(maxsize=self._buffer_size)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._concurrency, len(pending)),
+            thread_name_prefix="pyatlan-export",
+        )
+        futures = [
+            executor.submit(self._export_slice, search_slice, buffer, stop)
+            for search_slice in pending
+        ]
+        remaining = len(pending)
+        try:
+            while remaining:
+                name, item = buffer.get()
+                if item is _SLICE_DONE:
+                    self._progress[name].done = True
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    self._progress[name].track(item)
+                    yield item
+        finally:
+            stop.set()
+            # Never start any slice still waiting for a worker
+            for future in futures:
+                future.cancel()
+            # Unblock any slice waiting for space in the buffer, so it can see the stop
+            while not buffer.empty():
+                buffer.get_nowait()
+            executor.shutdown(wait=True)
+
+    def __iter__(self) -> Generator[Asset, None, None]:
+        return self.execute()
+
+    def _slice_search(self, search_slice: SearchSlice) -> FluentSearch:
+        progress = self._progress[search_slice.name]
+        search = self._search.where(search_slice.query)
+        if progress.since is not None:
+            search = search.where(Referenceable.CREATE_TIME.gte(progress.since))
+        return search
+
+    def _export_slice(
+        self, search_slice: SearchSlice, buffer: queue.Queue, stop: threading.Event
+    ):
+        name = search_slice.name
+        if stop.is_set():
+            # The export has already finished (or failed), so do not start searching this slice
+            return
+        try:
+            progress = self._progress[name]
+            # Assets already exported at the creation time the slice resumes from
+            skip = set(progress.seen)
+            results = self._slice_search(search_slice).execute(self._client, bulk=True)
+            if not progress.count:
+                progress.count = results.count
+            for asset in results:
+                if asset.guid in skip:
+                    continue
+                if not self._put(buffer, (name, asset), stop):
+                    return
+            LOGGER.debug("Finished exporting slice: %s", name)
+            self._put(buffer, (name, _SLICE_DONE), stop)
+        except Exception as err:
+            LOGGER.debug("Failed exporting slice: %s", name)
+            self._put(buffer, (name, err), stop)
+
+    @staticmethod
+    def _put(buffer: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+def _guid_range(lower: Optional[str], upper: Optional[str]) -> Query:
+    if lower is None and upper is None:
+        return Referenceable.GUID.has_any_value()
+    return Range(  # type: ignore[call-arg]
+        field=Referenceable.GUID.keyword_field_name, gte=lower, lt=upper
+    )
+
+
+from pyatlan.client.atlan import AtlanClient  # noqa: E402
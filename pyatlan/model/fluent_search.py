@@ -4,12 +4,13 @@ import copy
 import dataclasses
 from typing import Dict, List, Optional, TypeVar, Union
 
-from pyatlan.client.asset import IndexSearchResults
+from pyatlan.client.asset import IndexSearchResults, ProjectionResults
 from pyatlan.errors import ErrorCode
 from pyatlan.model.aggregation import Aggregation
 from pyatlan.model.assets import Referenceable
 from pyatlan.model.enums import EntityStatus
 from pyatlan.model.fields.atlan_fields import AtlanField
+from pyatlan.model.lazy import raw_location
 from pyatlan.model.search import DSL, Bool, IndexSearchRequest, Query, SortItem, Term
 
 SelfQuery = TypeVar("SelfQuery", bound="CompoundQuery")
@@ -399,14 +400,67 @@ class FluentSearch(CompoundQuery):
         request = IndexSearchRequest(dsl=dsl)
         return client.asset.search(request).count
 
-    def execute(self, client: AtlanClient) -> IndexSearchResults:
+    def execute(
+        self,
+        client: AtlanClient,
+        prefetch: int = 0,
+        bulk: bool = False,
+        stream: bool = False,
+        lazy: bool = False,
+    ) -> IndexSearchResults:
         """
         Run the fluent search to retrieve assets that match the supplied criteria.
 
         :param client: client through which to retrieve the assets
+        :param prefetch: number of pages to fetch ahead (in the background) of the page
+        being processed while iterating; 0 (default) fetches each page only when it is needed
+        :param bulk: whether to page through the results by creation time rather than by offset,
+        to reliably iterate any number of results (no sorting can then be specified on the search)
+        :param stream: whether to decode each page incrementally while iterating, so that only
+        one asset at a time is held in memory rather than a whole page of them
+        :param lazy: whether to only build each full asset if any attribute beyond its GUID,
+        type name, qualified name, name and audit details is accessed or changed
         :returns: an iterable list of assets that match the supplied criteria, lazily-fetched
+        :raises InvalidRequestError: if bulk mode is requested for a search with sorting specified
         """
-        return client.asset.search(self.to_request())
+        return client.asset.search(
+            self.to_request(), prefetch=prefetch, bulk=bulk, stream=stream, lazy=lazy
+        )
+
+    def project(
+        self,
+        client: AtlanClient,
+        *fields: AtlanField,
+        prefetch: int = 0,
+        bulk: bool = False,
+        stream: bool = False,
+    ) -> ProjectionResults:
+        """
+        Run the fluent search, projecting each matching asset onto only the specified fields.
+        No assets are built: each result is a named tuple of the values of the fields, exactly
+        as they are returned by the search. This is far cheaper than retrieving assets when only
+        a handful of fields is needed from many results (for example, for reporting).
+
+        :param client: client through which to retrieve the results
+        :param fields: fields onto which to project each result (these are automatically included on the results)
+        :param prefetch: number of pages to fetch ahead (in the background) of the page being processed
+        :param bulk: whether to page through the results by creation time rather than by offset
+        :param stream: whether to decode each page incrementally while iterating
+        :returns: an iterable of named tuples, one per result, lazily-fetched
+        :raises InvalidRequestError: if no fields are specified, any field is not returned (under a key of its own)
+        in search results, or bulk mode is requested for a search with sorting specified
+        """
+        if not fields:
+            raise ErrorCode.MISSING_FIELDS_TO_PROJECT.exception_with_parameters()
+        search = self
+        for field in fields:
+            nested, key = raw_location(field)
+            if nested and key not in (search._includes_on_results or []):
+                search = search.include_on_results(field)
+        results = client.asset.search(
+            search.to_request(), prefetch=prefetch, bulk=bulk, stream=stream, lazy=True
+        )
+        return ProjectionResults(results, list(fields))
 
 
 from pyatlan.client.atlan import AtlanClient  # noqa: E402
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from __future__ import annotations
+
+import sys
+from typing import Any, ClassVar, Dict, List, Set, Tuple, Union
+
+from pydantic.v1 import ValidationError
+
+from pyatlan.errors import ErrorCode
+from pyatlan.model.assets import Asset
+from pyatlan.model.fields.atlan_fields import (
+    AtlanField,
+    InternalKeywordField,
+    InternalKeywordTextField,
+    InternalNumericField,
+)
+from pyatlan.utils import CustomMetadataPlan
+
+
+class LazyAsset:
+    """
+    Lightweight stand-in for an asset within search results. A few simple properties (such as
+    the GUID, type name, qualified name and name) are read directly from the raw JSON of the
+    result. The full asset is only built (and validated) the first time any other attribute
+    is accessed, or the first time any attribute is changed, after which the stand-in behaves
+    exactly like the asset (including for isinstance checks).
+    """
+
+    __slots__ = ("_entity", "_attributes", "_asset")
+
+    # Simple properties that can be read without building the asset:
+    # name of the property -> (whether it is nested within attributes, key in the raw JSON)
+    RAW_PROPERTIES: ClassVar[Dict[str, Tuple[bool, str]]] = {
+        "guid": (False, "guid"),
+        "type_name": (False, "typeName"),
+        "create_time": (False, "createTime"),
+        "update_time": (False, "updateTime"),
+        "created_by": (False, "createdBy"),
+        "updated_by": (False, "updatedBy"),
+        "qualified_name": (True, "qualifiedName"),
+        "name": (True, "name"),
+    }
+
+    # Attributes of the asset's class that are checked by isinstance (for pydantic models),
+    # so must be available without building the asset
+    CLASS_ATTRIBUTES: ClassVar[Set[str]] = {
+        "__config__",
+        "__fields__",
+        "__post_root_validators__",
+    }
+
+    def __init__(
+        self,
+        entity: Dict[str, Any],
+        attributes: Union[List[str], CustomMetadataPlan, None] = None,
+    ):
+        """
+        :param entity: raw JSON of the asset, as returned by the search
+        :param attributes: attributes requested by the search, or the search's plan for unflattening
+                           custom metadata (needed to interpret any custom metadata)
+        """
+        object.__setattr__(self, "_entity", entity)
+        object.__setattr__(self, "_attributes", attributes)
+        object.__setattr__(self, "_asset", None)
+
+    @property
+    def raw_json(self) -> Dict[str, Any]:
+        """
+        :returns: the raw JSON of the asset, as returned by the search (unaffected by any changes to the asset)
+        """
+        return self._entity
+
+    def raw_value(self, field: AtlanField) -> Any:
+        """
+        Read the value of a field directly from the raw JSON of the asset, without building the asset.
+
+        :param field: the field whose value to read
+        :returns: the value of the field as returned by the search (or None if it was not returned)
+        """
+        nested, key = raw_location(field)
+        source = self._entity.get("attributes") or {} if nested else self._entity
+        return source.get(key)
+
+    @property
+    def is_materialized(self) -> bool:
+        """
+        :returns: True if the full asset has already been built, otherwise False
+        """
+        return self._asset is not None
+
+    def materialize(self) -> Asset:
+        """
+        Build the full asset from the raw JSON of the result (only done once).
+
+        :returns: the full asset
+        :raises ApiError: if the raw JSON cannot be translated into an asset
+        """
+        if self._asset is None:
+            entity = self._entity
+            try:
+                plan = self._attributes
+                if not isinstance(plan, CustomMetadataPlan):
+                    plan = CustomMetadataPlan(plan)
+                plan.apply(entity)
+                asset = Asset._convert_to_real_type_(entity)
+            except ValidationError as err:
+                raise ErrorCode.JSON_ERROR.exception_with_parameters(
+                    entity, 200, str(err)
+                ) from err
+            object.__setattr__(self, "_asset", asset)
+        return self._asset
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        if self._asset is not None:
+            return type(self._asset)
+        type_name = self._entity.get("typeName")
+        asset_type = Asset._subtypes_.get(type_name) or getattr(
+            sys.modules["pyatlan.model.assets"], str(type_name), None
+        )
+        return asset_type if isinstance(asset_type, type) else Asset
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyAsset.__slots__:
+            raise AttributeError(name)
+        if self._asset is None and name in LazyAsset.CLASS_ATTRIBUTES:
+            return getattr(self.__class__, name)
+        if self._asset is None and name in LazyAsset.RAW_PROPERTIES:
+            nested, key = LazyAsset.RAW_PROPERTIES[name]
+            source = self._entity.get("attributes") or {} if nested else self._entity
+            return source.get(key)
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self.materialize(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self.materialize(), name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyAsset):
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __dir__(self):
+        return dir(self.materialize())
+
+    def __repr__(self) -> str:
+        if self._asset is not None:
+            return repr(self._asset)
+        return f"LazyAsset(type_name={self.type_name!r}, guid={self.guid!r})"
+
+    def __str__(self) -> str:
+        return str(self.materialize())
+
+
+# Internal fields whose values are not found under any key of the raw JSON of an asset (their
+# atlan_field_name is that of a different value), and what to use instead:
+# internal name of the field -> alternative
+UNLOCATABLE_FIELDS: Dict[str, str] = {
+    "__superTypeNames": "filter on the super types in the search itself (FluentSearch.super_types)",
+    "__propagatedClassificationNames": (
+        "retrieve the full assets, whose Atlan tags record whether each of them was propagated"
+    ),
+}
+
+
+def raw_location(field: AtlanField) -> Tuple[bool, str]:
+    """
+    Determine where the value of a field is found within the raw JSON of an asset.
+
+    :param field: the field to locate
+    :returns: whether the value is nested within the attributes of the asset, and the key of the value
+    :raises InvalidRequestError: if the value of the field is not found in the raw JSON of an asset
+    """
+    internal = (InternalKeywordField, InternalKeywordTextField, InternalNumericField)
+    if not isinstance(field, internal):
+        return True, field.atlan_field_name
+    if alternative := UNLOCATABLE_FIELDS.get(field.internal_field_name):
+        raise ErrorCode.UNABLE_TO_PROJECT_FIELD.exception_with_parameters(
+            field.internal_field_name, alternative
+        )
+    return False, field.atlan_field_name
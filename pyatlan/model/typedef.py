@@ -1185,3 +1185,16 @@ class TypeDefResponse(AtlanObject):
             if custom_name in name:
                 return True
         return False
+
+
+class TypeDefHeader(AtlanObject):
+    guid: Optional[str] = Field(
+        default=None,
+        description="Unique identifier that represents the type definition.",
+    )
+    name: Optional[str] = Field(
+        default=None, description="Unique name of the type definition."
+    )
+    category: Optional[str] = Field(
+        default=None, description="Type of the type definition."
+    )
@@ -1,6 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
+import json
+from typing import Any, Callable, Optional
 
+try:
+    import orjson
+except ImportError:
+    # Optional: only used (if installed) to serialize requests faster
+    orjson = None  # type: ignore[assignment]
 
 CAMEL_CASE_OVERRIDES = {
     "index_type_es_fields": "IndexTypeESFields",
@@ -25,6 +32,29 @@ def encoders():
     }
 
 
+def json_bytes(data: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize data to JSON, directly as UTF-8 bytes. Uses orjson if it is installed,
+    as it is several times faster than the standard library.
+
+    :param data: the data to serialize
+    :param default: function that converts any value that cannot otherwise be serialized
+    :returns: the JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                # Leave datetimes to the default function, to serialize them as pydantic would
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # For example, an integer too large for orjson: fall back to the standard library
+            pass
+    return json.dumps(data, default=default).encode("utf-8")
+
+
 def to_camel_case(value: str) -> str:
     if not isinstance(value, str):
         raise ValueError("Value must be a string")
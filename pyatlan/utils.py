@@ -13,7 +13,7 @@ from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
 from functools import reduce, wraps
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from pydantic.v1 import HttpUrl
 from pydantic.v1.dataclasses import dataclass
@@ -225,21 +225,75 @@ class HTTPStatus:
     SERVICE_UNAVAILABLE = 503
 
 
+# Matches the flattened (set ID, attribute ID) form in which custom metadata is requested in searches
+CUSTOM_METADATA_ATTRIBUTE = re.compile(r"(\w+)[.](\w+)")
+
+
+class CustomMetadataPlan:
+    """
+    Precompiled plan for unflattening the custom metadata attributes requested in a search. The requested
+    attributes are matched against the flattened custom metadata form only once, when the plan is created,
+    rather than for every entity in every page of results. The first time an entity with custom metadata
+    is unflattened, the names of all the requested custom metadata are resolved in a single pass through
+    the custom metadata cache, so that any not yet cached are retrieved once rather than once per asset.
+    """
+
+    def __init__(self, attributes: Optional[Iterable[str]]):
+        """
+        :param attributes: attributes requested in the search
+        """
+        self.attributes: Tuple[str, ...] = tuple(attributes or ())
+        # Each requested custom metadata attribute, as (flattened name, set ID, attribute ID)
+        self.targets: List[Tuple[str, str, str]] = [
+            (attribute, matched[1], matched[2])
+            for attribute in self.attributes
+            if (matched := CUSTOM_METADATA_ATTRIBUTE.match(attribute))
+        ]
+        self._resolved = False
+
+    def unflatten(
+        self, asset_attributes: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Unflatten the custom metadata in the attributes of an asset.
+
+        :param asset_attributes: attributes of the asset, as returned by the search
+        :returns: the custom metadata of the asset, keyed by set ID and then attribute ID
+        """
+        if not self.attributes or not asset_attributes:
+            return None
+        retval: Dict[str, Any] = {}
+        for attribute, set_id, attr_id in self.targets:
+            if attribute in asset_attributes:
+                retval.setdefault(set_id, {})[attr_id] = asset_attributes[attribute]
+        return retval
+
+    def apply(self, entity: Dict[str, Any]):
+        """
+        Unflatten the custom metadata in the attributes of an entity into its business attributes.
+
+        :param entity: JSON for a single result, as returned by the search
+        """
+        if custom_metadata := self.unflatten(entity.get("attributes")):
+            self._resolve()
+            entity["businessAttributes"] = custom_metadata
+
+    def _resolve(self):
+        if self._resolved:
+            return
+        from pyatlan.model.custom_metadata import CustomMetadataProxy
+
+        attr_ids: Dict[str, List[str]] = {}
+        for _, set_id, attr_id in self.targets:
+            attr_ids.setdefault(set_id, []).append(attr_id)
+        CustomMetadataProxy.resolve(attr_ids)
+        self._resolved = True
+
+
 def unflatten_custom_metadata(
     attributes: Optional[List[str]], asset_attributes: Optional[Dict[str, Any]]
 ) -> Optional[Dict[str, Any]]:
-    if not attributes or not asset_attributes:
-        return None
-    retval: Dict[str, Any] = {}
-    metadata_attribute = re.compile(r"(\w+)[.](\w+)")
-    for attribute_of_interest in attributes:
-        if matched := metadata_attribute.match(attribute_of_interest):
-            if attribute_of_interest in asset_attributes:
-                key = matched[1]
-                if key not in retval:
-                    retval[key] = {}
-                retval[key][matched[2]] = asset_attributes[attribute_of_interest]
-    return retval
+    return CustomMetadataPlan(attributes).unflatten(asset_attributes)
 
 
 def unflatten_custom_metadata_for_entity(
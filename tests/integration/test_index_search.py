@@ -8,7 +8,7 @@ from typing import Generator, Set
 import pytest
 
 from pyatlan.client.atlan import AtlanClient
-from pyatlan.model.assets import Asset, Table
+from pyatlan.model.assets import Asset, Table, load_all
 from pyatlan.model.assets.column import Column
 from pyatlan.model.enums import AtlanConnectorType, CertificateStatus, SortOrder
 from pyatlan.model.fluent_search import FluentSearch
@@ -102,6 +102,8 @@ def asset_tracker() -> Generator[AssetTracker, None, None]:
 
 
 def get_all_subclasses(cls):
+    # Asset types are imported lazily, so import all of them to find every subclass
+    load_all()
     all_subclasses = []
 
     for subclass in cls.__subclasses__():
@@ -320,7 +322,7 @@ def test_metric_aggregation(client: AtlanClient):
 def test_index_search_with_no_aggregation_results(client: AtlanClient):
     test_aggs = {"max_update_time": {"max": {"field": "__modificationTimestamp"}}}
     request = (
-        FluentSearch(aggregations=test_aggs).where(  # type:ignore[arg-type]
+        FluentSearch(aggregations=test_aggs).where(  # type: ignore[arg-type]
             Column.QUALIFIED_NAME.startswith("some-non-existent-column-qn")
         )
     ).to_request()
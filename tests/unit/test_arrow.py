@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import subprocess
+import sys
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pyatlan.client.asset import AssetClient
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common import ApiCaller
+from pyatlan.errors import ErrorCode, InvalidRequestError
+from pyatlan.model.assets import Asset, Table, registry
+from pyatlan.model.fluent_search import FluentSearch
+
+
+def entity(i: int):
+    return {
+        "typeName": "Table",
+        "guid": f"guid-{i}",
+        "createTime": 1000 * i,
+        "attributes": {
+            "qualifiedName": f"default/table-{i}",
+            "rowCount": i * 10,
+            "isPartitioned": i % 2 == 0,
+            "ownerUsers": [f"user-{i}"],
+            "sourceCreatedAt": 1700000000000 + i,
+            "certificateStatus": "VERIFIED",
+            "atlanSchema": {"guid": "schema", "typeName": "Schema"},
+        },
+    }
+
+
+def page_for(api, request_obj):
+    start, size = request_obj.dsl.from_, request_obj.dsl.size
+    return {
+        "approximateCount": 5,
+        "entities": [entity(i) for i in range(start, min(start + size, 5))],
+    }
+
+
+@pytest.fixture()
+def client():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api.side_effect = page_for
+    client = Mock(AtlanClient)
+    client.asset = AssetClient(mock_api_caller)
+    return client
+
+
+def projection(client):
+    return (
+        FluentSearch()
+        .where(Table.NAME.startswith("table"))
+        .page_size(2)
+        .project(
+            client,
+            Asset.GUID,
+            Asset.CREATE_TIME,
+            Table.ROW_COUNT,
+            Table.IS_PARTITIONED,
+            Table.OWNER_USERS,
+            Table.SOURCE_CREATED_AT,
+            Table.CERTIFICATE_STATUS,
+            Table.ATLAN_SCHEMA,
+        )
+    )
+
+
+def test_to_record_batches_derives_schema_and_batches_by_page(client):
+    pa = pytest.importorskip("pyarrow")
+
+    batches = list(projection(client).to_record_batches())
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert batches[0].schema == pa.schema(
+        [
+            ("guid", pa.string()),
+            ("create_time", pa.int64()),
+            ("row_count", pa.int64()),
+            ("is_partitioned", pa.bool_()),
+            ("owner_users", pa.list_(pa.string())),
+            ("source_created_at", pa.timestamp("ms", tz="UTC")),
+            ("certificate_status", pa.string()),
+            ("atlan_schema", pa.string()),
+        ]
+    )
+    row = batches[1].to_pylist()[1]
+    assert row["guid"] == "guid-3"
+    assert row["row_count"] == 30
+    assert row["is_partitioned"] is False
+    assert row["owner_users"] == ["user-3"]
+    assert row["source_created_at"] == datetime(
+        2023, 11, 14, 22, 13, 20, 3000, tzinfo=timezone.utc
+    )
+    assert row["atlan_schema"] == '{"guid": "schema", "typeName": "Schema"}'
+
+
+def test_to_arrow(client):
+    pytest.importorskip("pyarrow")
+
+    table = projection(client).to_arrow(batch_size=3)
+
+    assert table.num_rows == 5
+    assert table.column("row_count").to_pylist() == [0, 10, 20, 30, 40]
+
+
+def test_to_parquet(client, tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "tables.parquet"
+
+    projection(client).to_parquet(str(path))
+
+    table = parquet.read_table(str(path))
+    assert table.num_rows == 5
+    assert table.column("guid").to_pylist() == [f"guid-{i}" for i in range(5)]
+    assert parquet.ParquetFile(str(path)).num_row_groups == 3
+
+
+def test_without_pyarrow_raises_error(client):
+    with patch.dict(sys.modules, {"pyarrow": None}), pytest.raises(
+        InvalidRequestError, match=ErrorCode.MISSING_OPTIONAL_DEPENDENCY.error_id
+    ):
+        projection(client).to_arrow()
+
+
+ATTRIBUTE_LOOKUP_SCRIPT = """
+import sys
+
+from pyatlan.model.arrow import _model_field
+
+def loaded():
+    return {name for name in sys.modules if name.startswith("pyatlan.model.assets.")}
+
+before = loaded()
+assert "pyatlan.model.assets.s3_bucket" not in before
+
+assert _model_field(True, "s3ObjectCount").type_ is int
+assert "pyatlan.model.assets.s3_bucket" in loaded()
+assert "pyatlan.model.assets.tableau_project" not in loaded()
+
+before = loaded()
+assert _model_field(True, "notAnAttribute") is None
+assert loaded() == before
+"""
+
+
+def test_attribute_lookup_imports_only_the_type_that_defines_it():
+    # Run in a new interpreter, as this one has already imported every asset type
+    result = subprocess.run(
+        [sys.executable, "-c", ATTRIBUTE_LOOKUP_SCRIPT], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_every_indexed_attribute_is_defined_by_its_type():
+    for name, type_name in registry.attributes.items():
+        attributes = registry.get(type_name).Attributes  # type: ignore[attr-defined]
+        assert name in attributes.__fields__, f"{type_name}.{name}"
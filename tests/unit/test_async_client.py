@@ -0,0 +1,200 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import asyncio
+import threading
+from json import load
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pyatlan.client.aio import (
+    ITERATION_BATCH_SIZE,
+    AsyncAtlanClient,
+    AsyncSearchResults,
+)
+from pyatlan.client.asset import AssetClient
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common import HTTPS_PREFIX
+from pyatlan.errors import InvalidRequestError
+from pyatlan.model.assets import Table
+from pyatlan.model.fluent_search import FluentSearch
+
+TEST_DATA_DIR = Path(__file__).parent / "data"
+GET_BY_GUID_JSON = TEST_DATA_DIR / "asset_responses" / "get_by_guid.json"
+
+
+def search_page(*guids):
+    return {
+        "approximateCount": 3,
+        "entities": [
+            {
+                "typeName": "Table",
+                "guid": guid,
+                "attributes": {"name": guid, "qualifiedName": f"default/{guid}"},
+            }
+            for guid in guids
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def set_env(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+
+
+@pytest.fixture()
+def client():
+    return AtlanClient()
+
+
+@pytest.fixture()
+def get_by_guid_json():
+    with GET_BY_GUID_JSON.open() as input_file:
+        return load(input_file)
+
+
+def test_init_with_invalid_client_raises_error():
+    with pytest.raises(InvalidRequestError):
+        AsyncAtlanClient(client="not-a-client")
+
+
+def test_init_sizes_connection_pool(client):
+    sut = AsyncAtlanClient(client=client, max_concurrency=32)
+
+    assert sut.sync_client is client
+    assert client._session.adapters[HTTPS_PREFIX]._pool_maxsize == 32
+    sut.close()
+
+
+def test_get_by_guid_calls_in_flight_concurrently(client, get_by_guid_json):
+    async def run():
+        async with AsyncAtlanClient(client=client, max_concurrency=8) as sut:
+            return await asyncio.gather(
+                *(sut.asset.get_by_guid(guid=f"guid-{i}") for i in range(10))
+            )
+
+    with patch.object(AtlanClient, "_call_api", return_value=get_by_guid_json):
+        assets = asyncio.run(run())
+
+    assert len(assets) == 10
+    assert all(isinstance(asset, Table) for asset in assets)
+
+
+def test_search_iterates_all_pages(client):
+    request = FluentSearch().where(Table.NAME.eq("test")).page_size(2).to_request()
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as sut:
+            results = await sut.asset.search(request)
+            assert isinstance(results, AsyncSearchResults)
+            assert results.count == 3
+            return [asset.guid async for asset in results]
+
+    with patch.object(
+        AtlanClient,
+        "_call_api",
+        side_effect=[search_page("g1", "g2"), search_page("g3"), search_page()],
+    ):
+        guids = asyncio.run(run())
+
+    assert guids == ["g1", "g2", "g3"]
+
+
+def test_delegates_public_methods_only(client):
+    sut = AsyncAtlanClient(client=client)
+
+    assert asyncio.iscoroutinefunction(sut.typedef.get_all)
+    assert sut.typedef.get_all.__name__ == "get_all"
+    with pytest.raises(AttributeError):
+        sut.asset._handle_relationships
+    with pytest.raises(AttributeError):
+        sut.asset.not_a_method
+    sut.close()
+
+
+def test_search_passes_options_through(client):
+    request = FluentSearch().where(Table.NAME.eq("test")).to_request()
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as sut:
+            return await sut.asset.search(
+                request, prefetch=2, bulk=True, stream=True, lazy=True
+            )
+
+    with patch.object(AssetClient, "search") as mock_search:
+        results = asyncio.run(run())
+
+    mock_search.assert_called_once_with(
+        request, prefetch=2, bulk=True, stream=True, lazy=True
+    )
+    assert results.results is mock_search.return_value
+
+
+def test_search_with_prefetch_iterates_all_pages(client):
+    request = FluentSearch().where(Table.NAME.eq("test")).page_size(2).to_request()
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as sut:
+            results = await sut.asset.search(request, prefetch=2)
+            assert results.prefetch == 2
+            return [asset.guid async for asset in results]
+
+    with patch.object(
+        AtlanClient,
+        "_call_api",
+        side_effect=[search_page("g1", "g2"), search_page("g3"), search_page()],
+    ):
+        guids = asyncio.run(run())
+
+    assert guids == ["g1", "g2", "g3"]
+
+
+class StreamedResults:
+    stream = True
+    prefetch = 0
+
+    def __init__(self, count):
+        self.count = count
+        self.threads = set()
+        self.closed = False
+
+    def __iter__(self):
+        try:
+            for i in range(self.count):
+                self.threads.add(threading.current_thread().name)
+                yield i
+        finally:
+            self.closed = True
+
+
+def test_streamed_results_are_iterated_in_batches_off_the_event_loop(client):
+    streamed = StreamedResults(ITERATION_BATCH_SIZE * 2 + 1)
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as sut:
+            return [
+                result async for result in AsyncSearchResults(sut, streamed)
+            ], threading.current_thread().name
+
+    results, loop_thread = asyncio.run(run())
+
+    assert results == list(range(ITERATION_BATCH_SIZE * 2 + 1))
+    assert loop_thread not in streamed.threads
+    assert all(name.startswith("pyatlan-async") for name in streamed.threads)
+    assert streamed.closed
+
+
+def test_streamed_results_are_closed_when_iteration_stops_early(client):
+    streamed = StreamedResults(ITERATION_BATCH_SIZE * 2)
+
+    async def run():
+        async with AsyncAtlanClient(client=client) as sut:
+            results = AsyncSearchResults(sut, streamed).__aiter__()
+            first = await results.__anext__()
+            await results.aclose()
+            return first
+
+    assert asyncio.run(run()) == 0
+    assert streamed.closed
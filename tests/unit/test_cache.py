@@ -0,0 +1,856 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import gc
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, call
+
+import pytest
+
+from pyatlan.cache.atlan_tag_cache import AtlanTagCache
+from pyatlan.cache.custom_metadata_cache import CustomMetadataCache
+from pyatlan.cache.enum_cache import EnumCache
+from pyatlan.cache.group_cache import GroupCache
+from pyatlan.cache.policy import CachePolicy, NegativeCache, TranslationMap
+from pyatlan.cache.refresher import CacheRefresher
+from pyatlan.cache.single_flight import SingleFlight
+from pyatlan.cache.typedef_snapshot import (
+    FileTypeDefSnapshotStore,
+    SqliteTypeDefSnapshotStore,
+    TypeDefSnapshot,
+    fingerprint,
+)
+from pyatlan.cache.user_cache import UserCache
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.group import GroupClient
+from pyatlan.client.token import SERVICE_ACCOUNT_, TokenClient
+from pyatlan.client.typedef import TypeDefClient
+from pyatlan.client.user import UserClient
+from pyatlan.model.enums import AtlanTypeCategory
+from pyatlan.model.events import AtlanEvent
+from pyatlan.model.group import AtlanGroup
+from pyatlan.model.typedef import EnumDef, TypeDefHeader, TypeDefResponse
+from pyatlan.model.user import AtlanUser
+
+TENANT = "https://tenant.atlan.com/"
+TYPEDEFS_JSON = Path(__file__).parent / "data" / "typedefs.json"
+TAG_CATEGORIES = [AtlanTypeCategory.CLASSIFICATION, AtlanTypeCategory.STRUCT]
+
+
+@pytest.fixture(scope="module")
+def typedefs() -> TypeDefResponse:
+    with TYPEDEFS_JSON.open() as file:
+        return TypeDefResponse(**json.load(file))
+
+
+def headers_of(typedefs: TypeDefResponse, categories):
+    return [
+        TypeDefHeader(guid=typedef.guid, name=typedef.name, category=category.value)
+        for typedef in (*typedefs.atlan_tag_defs, *typedefs.struct_defs)
+        if (category := typedef.category) in categories
+    ]
+
+
+@pytest.fixture()
+def typedef_client(typedefs):
+    client = Mock(TypeDefClient)
+    client.get.return_value = typedefs
+    client.get_headers.side_effect = lambda type_category: headers_of(
+        typedefs, type_category
+    )
+    return client
+
+
+@pytest.fixture(params=["snapshots", "snapshots.db"])
+def snapshot(request, tmp_path) -> TypeDefSnapshot:
+    return TypeDefSnapshot.at(tmp_path / "nested" / request.param, tenant=TENANT)
+
+
+def age(snapshot: TypeDefSnapshot, categories, seconds: float):
+    entry = snapshot.store.load(snapshot._key(categories))
+    assert entry
+    if isinstance(snapshot.store, FileTypeDefSnapshotStore):
+        path = snapshot.store._path(snapshot._key(categories))
+        os.utime(path, (entry.saved_at - seconds, entry.saved_at - seconds))
+    else:
+        assert isinstance(snapshot.store, SqliteTypeDefSnapshotStore)
+        connection = snapshot.store._connect()
+        with connection:
+            connection.execute(
+                "UPDATE typedef_snapshot SET saved_at = ?",
+                (entry.saved_at - seconds,),
+            )
+        connection.close()
+
+
+@pytest.mark.parametrize(
+    "location, store_type",
+    [
+        ("snapshots", FileTypeDefSnapshotStore),
+        ("typedefs.sqlite", SqliteTypeDefSnapshotStore),
+        ("typedefs.DB", SqliteTypeDefSnapshotStore),
+    ],
+)
+def test_snapshot_at_selects_store(location, store_type, tmp_path):
+    sut = TypeDefSnapshot.at(tmp_path / location, tenant=TENANT)
+
+    assert isinstance(sut.store, store_type)
+
+
+def test_store_round_trip(snapshot):
+    store = snapshot.store
+
+    assert store.load("a") is None
+    store.save("a", '{"enumDefs": []}')
+    store.save("b", "other")
+    store.save("a", "replaced")
+
+    entry = store.load("a")
+    assert entry
+    assert entry.content == "replaced"
+    assert store.load("b").content == "other"  # type: ignore[union-attr]
+
+
+def test_cache_starts_from_snapshot(snapshot, typedef_client):
+    AtlanTagCache(typedef_client, snapshot=snapshot)._refresh_cache()
+    typedef_client.reset_mock()
+
+    sut = AtlanTagCache(typedef_client, snapshot=snapshot)
+
+    assert sut._get_id_for_name("Public") == "cTrLMeBjKNeRV7HzBSL11u"
+    assert sut._get_name_for_id("E1bxGBfXz4XsouhzmEJoaA") == "Highly Confidential"
+    typedef_client.get.assert_not_called()
+    typedef_client.get_headers.assert_not_called()
+
+
+def test_cache_miss_still_refreshes_from_atlan(snapshot, typedef_client):
+    AtlanTagCache(typedef_client, snapshot=snapshot)._refresh_cache()
+    typedef_client.reset_mock()
+    sut = AtlanTagCache(typedef_client, snapshot=snapshot)
+
+    assert sut._get_id_for_name("Does not exist") is None
+
+    typedef_client.get.assert_called_once_with(type_category=TAG_CATEGORIES)
+
+
+def test_stale_snapshot_is_not_used(snapshot, typedef_client):
+    AtlanTagCache(typedef_client, snapshot=snapshot)._refresh_cache()
+    age(snapshot, TAG_CATEGORIES, 600)
+    typedef_client.reset_mock()
+
+    sut = AtlanTagCache(typedef_client, snapshot=snapshot)
+
+    assert not sut.map_name_to_id
+    assert sut._get_id_for_name("Public") == "cTrLMeBjKNeRV7HzBSL11u"
+    typedef_client.get.assert_called_once_with(type_category=TAG_CATEGORIES)
+    typedef_client.get_headers.assert_not_called()
+    # Downloading the type definitions again replaces the snapshot, which is then used for max_age
+    assert AtlanTagCache(typedef_client, snapshot=snapshot).map_name_to_id
+    typedef_client.get.assert_called_once()
+
+
+def test_updated_typedefs_are_seen_once_snapshot_expires(
+    snapshot, typedefs, typedef_client
+):
+    AtlanTagCache(typedef_client, snapshot=snapshot)._refresh_cache()
+    renamed = typedefs.copy(deep=True)
+    public = next(t for t in renamed.atlan_tag_defs if t.display_name == "Public")
+    public.display_name = "Open"
+    # Renaming a tag changes none of the headers of the type definitions
+    assert headers_of(renamed, TAG_CATEGORIES) == headers_of(typedefs, TAG_CATEGORIES)
+    typedef_client.get.return_value = renamed
+
+    assert AtlanTagCache(typedef_client, snapshot=snapshot).map_name_to_id["Public"]
+    age(snapshot, TAG_CATEGORIES, 600)
+    sut = AtlanTagCache(typedef_client, snapshot=snapshot)
+
+    assert sut._get_id_for_name("Open") == "cTrLMeBjKNeRV7HzBSL11u"
+    assert sut._get_id_for_name("Public") is None
+
+
+def test_snapshots_are_kept_per_cache_and_tenant(snapshot, typedef_client, tmp_path):
+    AtlanTagCache(typedef_client, snapshot=snapshot)._refresh_cache()
+    typedef_client.reset_mock()
+    other_tenant = TypeDefSnapshot(
+        snapshot.store, tenant="https://other.atlan.com/", max_age=300
+    )
+
+    assert not AtlanTagCache(typedef_client, snapshot=other_tenant).map_name_to_id
+    assert not EnumCache(typedef_client, snapshot=snapshot).cache_by_name
+    assert not CustomMetadataCache(typedef_client, snapshot=snapshot).map_name_to_id
+    typedef_client.get.assert_not_called()
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    snapshot = TypeDefSnapshot.at(tmp_path, tenant=TENANT)
+    snapshot.store.save(snapshot._key(TAG_CATEGORIES), "{not json")
+
+    assert snapshot.load(TAG_CATEGORIES) is None
+
+
+def test_client_configures_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    monkeypatch.setenv("ATLAN_TYPEDEF_SNAPSHOT_PATH", str(tmp_path / "typedefs.db"))
+
+    sut = AtlanClient(typedef_snapshot_max_age=60)
+
+    assert sut.typedef_snapshot
+    assert isinstance(sut.typedef_snapshot.store, SqliteTypeDefSnapshotStore)
+    assert sut.typedef_snapshot.max_age == 60
+    assert sut.typedef_snapshot.tenant == "https://name.atlan.com"
+
+
+def test_client_without_snapshot(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+
+    assert AtlanClient().typedef_snapshot is None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("pyatlan.cache.policy.time", clock)
+    return clock
+
+
+def test_translation_map_expires_entries(clock):
+    sut = TranslationMap(CachePolicy(ttl=10), {"a": "1"})
+    clock.now += 5
+    sut["b"] = "2"
+
+    assert dict(sut) == {"a": "1", "b": "2"}
+    clock.now += 6
+    assert sut.get("a") is None
+    assert dict(sut) == {"b": "2"}
+    assert len(sut) == 1
+
+
+def test_translation_map_evicts_least_recently_used():
+    sut = TranslationMap(CachePolicy(max_entries=2), {"a": "1", "b": "2"})
+
+    assert sut["a"] == "1"
+    sut["c"] = "3"
+
+    assert dict(sut) == {"a": "1", "c": "3"}
+
+
+def test_translation_map_reorders_entries_under_its_lock():
+    sut = TranslationMap(CachePolicy(max_entries=2), {"a": "1", "b": "2"})
+    looked_up = threading.Event()
+
+    def look_up():
+        assert sut["a"] == "1"
+        looked_up.set()
+
+    with sut._lock:
+        thread = threading.Thread(target=look_up)
+        thread.start()
+        # The lookup waits for any other change to the entries to complete
+        assert not looked_up.wait(0.2)
+    thread.join()
+
+    assert looked_up.is_set()
+    assert list(sut) == ["b", "a"]
+
+
+def test_negative_cache_is_bounded_under_concurrent_lookups():
+    # Short-lived, so that lookups also remove expired translations
+    sut: NegativeCache[str] = NegativeCache(
+        CachePolicy(negative_ttl=0.0001, max_negative_entries=50)
+    )
+    counter = iter(range(1_000_000))
+
+    def use():
+        offset = next(counter)
+        for i in range(2000):
+            key = str((offset + i) % 100)
+            sut.add(key)
+            if key in sut:
+                sut.discard(str(i % 100))
+
+    errors = run_concurrently(use)
+
+    assert not errors
+    assert len(sut) <= 50
+
+
+def test_negative_cache_changes_under_its_lock():
+    sut: NegativeCache[str] = NegativeCache(CachePolicy(negative_ttl=10))
+    added = threading.Event()
+
+    def add():
+        sut.add("a")
+        added.set()
+
+    with sut._lock:
+        thread = threading.Thread(target=add)
+        thread.start()
+        # Remembering a translation waits for any other change to complete
+        assert not added.wait(0.2)
+    thread.join()
+
+    assert "a" in sut
+
+
+def test_misses_are_not_remembered_by_default():
+    assert CachePolicy().negative_ttl == 0
+    sut = NegativeCache(CachePolicy())
+
+    sut.add("a")
+
+    assert "a" not in sut
+
+
+def test_negative_cache_is_bounded_and_expires(clock):
+    sut = NegativeCache(CachePolicy(negative_ttl=10, max_negative_entries=2))
+    for key in ("a", "b", "c"):
+        sut.add(key)
+
+    assert "a" not in sut
+    assert "b" in sut and "c" in sut
+    clock.now += 11
+    assert "b" not in sut
+
+
+def test_negative_cache_can_be_disabled():
+    sut = NegativeCache(CachePolicy(negative_ttl=0))
+
+    sut.add("a")
+
+    assert "a" not in sut
+
+
+@pytest.fixture()
+def user_client():
+    users = [AtlanUser(id="guid-1", username="jsmith", email="jsmith@example.com")]
+    client = Mock(UserClient)
+    client.get_all.return_value = users
+    client.get_by_usernames.side_effect = lambda usernames, limit: [
+        user for user in users if user.username in usernames
+    ]
+    client.get_by_emails.side_effect = lambda emails, limit: [
+        user for user in users if user.email in emails
+    ]
+    client.get.return_value = Mock(records=[])
+    return client
+
+
+@pytest.fixture()
+def token_client():
+    client = Mock(TokenClient)
+    client.get_by_guid.return_value = None
+    return client
+
+
+def test_miss_is_remembered_for_negative_ttl(clock, user_client, token_client):
+    sut = UserCache(user_client, token_client, policy=CachePolicy(negative_ttl=30))
+
+    assert sut._get_id_for_name("unknown") is None
+    assert sut._get_id_for_name("unknown") is None
+    assert sut._get_name_for_id("unknown-guid") is None
+    assert sut._get_name_for_id("unknown-guid") is None
+    user_client.get_by_usernames.assert_called_once_with(usernames=["unknown"], limit=1)
+    user_client.get.assert_called_once_with(
+        limit=1, post_filter='{"id": {"$in": ["unknown-guid"]}}'
+    )
+
+    clock.now += 31
+    assert sut._get_id_for_name("unknown") is None
+    assert user_client.get_by_usernames.call_count == 2
+    user_client.get_all.assert_not_called()
+
+
+def test_expired_translations_are_refreshed(clock, typedef_client):
+    sut = AtlanTagCache(typedef_client, policy=CachePolicy(ttl=60))
+
+    assert sut._get_id_for_name("Public") == "cTrLMeBjKNeRV7HzBSL11u"
+    assert sut._get_id_for_name("Public") == "cTrLMeBjKNeRV7HzBSL11u"
+    assert typedef_client.get.call_count == 1
+
+    clock.now += 61
+    assert sut._get_id_for_name("Public") == "cTrLMeBjKNeRV7HzBSL11u"
+    assert typedef_client.get.call_count == 2
+
+
+def run_concurrently(target, count: int = 8):
+    errors = []
+
+    def run():
+        try:
+            target()
+        except Exception as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_concurrent_misses_share_one_refresh(typedefs, typedef_client):
+    def slow_get(type_category):
+        time.sleep(0.1)
+        return typedefs
+
+    typedef_client.get.side_effect = slow_get
+    sut = AtlanTagCache(typedef_client)
+    results = []
+
+    errors = run_concurrently(lambda: results.append(sut._get_id_for_name("Public")))
+
+    assert not errors
+    assert results == ["cTrLMeBjKNeRV7HzBSL11u"] * 8
+    assert typedef_client.get.call_count == 1
+
+
+def test_user_misses_look_up_only_missing_users(user_client, token_client):
+    sut = UserCache(user_client, token_client)
+
+    assert sut._get_id_for_email("jsmith@example.com") == "guid-1"
+    # Every translation of a user that was looked up is then cached
+    assert sut._get_id_for_name("jsmith") == "guid-1"
+    assert sut._get_name_for_id("guid-1") == "jsmith"
+    user_client.get_by_emails.assert_called_once_with(
+        emails=["jsmith@example.com"], limit=1
+    )
+    user_client.get_by_usernames.assert_not_called()
+    user_client.get_all.assert_not_called()
+
+
+def test_user_lookup_publishes_new_translations(user_client, token_client):
+    refreshed = AtlanUser(id="guid-2", username="jdoe", email="jdoe@example.com")
+    user_client.get_all.return_value = [refreshed]
+    sut = UserCache(user_client, token_client)
+    sut._refresh_cache()
+    published = sut.translations
+
+    assert sut._get_id_for_name("jsmith") == "guid-1"
+
+    # Translations are never changed once published, only replaced by a copy including the lookup
+    assert sut.translations is not published
+    assert "jsmith" not in published.map_name_to_id
+    assert sut._get_id_for_name("jdoe") == "guid-2"
+    assert sut._get_name_for_id("guid-1") == "jsmith"
+    user_client.get_by_usernames.assert_called_once()
+
+
+def test_api_token_translation_publishes_new_translations(user_client, token_client):
+    token_client.get_by_id.return_value = Mock(guid="token-guid")
+    sut = UserCache(user_client, token_client)
+    published = sut.translations
+
+    assert sut._get_id_for_name(f"{SERVICE_ACCOUNT_}client-id") == "token-guid"
+    assert sut._get_id_for_name(f"{SERVICE_ACCOUNT_}client-id") == "token-guid"
+
+    assert not published.map_name_to_id
+    token_client.get_by_id.assert_called_once_with(
+        client_id=f"{SERVICE_ACCOUNT_}client-id"
+    )
+
+
+def test_concurrent_user_misses_share_one_lookup(user_client, token_client):
+    lookup = user_client.get_by_usernames.side_effect
+
+    def slow_lookup(usernames, limit):
+        time.sleep(0.1)
+        return lookup(usernames, limit)
+
+    user_client.get_by_usernames.side_effect = slow_lookup
+    sut = UserCache(user_client, token_client)
+    results = []
+
+    errors = run_concurrently(lambda: results.append(sut._get_id_for_name("jsmith")))
+
+    assert not errors
+    assert results == ["guid-1"] * 8
+    assert user_client.get_by_usernames.call_count == 1
+
+
+@pytest.fixture()
+def group_client():
+    # More similarly-named groups than a search by (partial) name returns, with the exact match last
+    groups = [
+        AtlanGroup(id=f"group-{i}", name=f"data_team_{i}", alias=f"Data Team {i}")
+        for i in range(1, 25)
+    ]
+    groups.append(AtlanGroup(id="group-0", name="data_team", alias="Data Team"))
+
+    def get(limit, post_filter):
+        [(field, value)] = json.loads(post_filter).items()
+        matches = [group for group in groups if getattr(group, field) == value]
+        return Mock(records=matches[:limit])
+
+    client = Mock(GroupClient)
+    client.get.side_effect = get
+    client.get_by_name.side_effect = lambda alias: [
+        group for group in groups if alias.lower() in str(group.alias).lower()
+    ][:20]
+    return client
+
+
+def test_group_misses_look_up_only_missing_groups(group_client):
+    sut = GroupCache(group_client)
+
+    assert sut._get_id_for_alias("Data Team") == "group-0"
+    assert sut._get_name_for_id("group-2") == "data_team_2"
+    assert sut._get_id_for_name("unknown") is None
+    assert group_client.get.call_args_list == [
+        call(limit=1, post_filter='{"alias": "Data Team"}'),
+        call(limit=1, post_filter='{"id": "group-2"}'),
+        call(limit=1, post_filter='{"name": "unknown"}'),
+    ]
+    group_client.get_by_name.assert_not_called()
+    group_client.get_all.assert_not_called()
+
+
+def test_group_alias_lookup_matches_only_exact_alias(group_client):
+    sut = GroupCache(group_client)
+
+    assert sut._get_id_for_alias("Data_Team%") is None
+    assert sut._get_id_for_alias("Data Team 2") == "group-2"
+    # Only the group looked up is cached, not others whose alias contains it
+    assert "Data Team 21" not in sut.map_alias_to_id
+
+
+def test_miss_reuses_refresh_completed_since_it_missed(user_client, token_client):
+    sut = UserCache(user_client, token_client)
+    generation = sut.refresher.generation
+
+    sut._refresh_cache()
+    sut._refresh_cache(since=generation)
+    assert user_client.get_all.call_count == 1
+
+    # An explicit refresh always requests the latest users
+    sut._refresh_cache()
+    assert user_client.get_all.call_count == 2
+
+
+def test_refresh_error_is_shared_with_waiting_callers():
+    started = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("refresh failed")
+
+    sut = SingleFlight()
+    leader = threading.Thread(
+        target=lambda: run_concurrently(lambda: sut.run(refresh), 1)
+    )
+    leader.start()
+    started.wait()
+
+    errors = run_concurrently(lambda: sut.run(refresh, since=0), 4)
+    leader.join()
+
+    assert len(calls) == 1
+    assert [str(error) for error in errors] == ["refresh failed"] * 4
+    assert sut.generation == 0
+
+
+def test_refresh_publishes_a_complete_set_of_translations(typedef_client):
+    sut = AtlanTagCache(typedef_client)
+    sut._refresh_cache()
+    published = sut.translations
+
+    typedef_client.get.side_effect = ValueError("refresh failed")
+    with pytest.raises(ValueError):
+        sut._refresh_cache()
+    assert sut.translations is published
+
+    typedef_client.get.side_effect = None
+    sut._refresh_cache()
+    assert sut.translations is not published
+    # Readers still holding the previous translations see all of them
+    assert published.map_name_to_id["Public"] == "cTrLMeBjKNeRV7HzBSL11u"
+    assert published.map_id_to_name["cTrLMeBjKNeRV7HzBSL11u"] == "Public"
+
+
+def test_get_cache_only_locks_to_create_cache(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    client = AtlanClient()
+    lock = MagicMock()
+    client.caches._lock = lock
+
+    cache = UserCache.get_cache()
+    assert lock.__enter__.call_count == 1
+    assert UserCache.get_cache() is cache
+    assert UserCache.get_cache(client) is cache
+    assert lock.__enter__.call_count == 1
+    assert cache.user_client is client.user
+
+
+def test_caches_are_owned_by_their_client(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    first = AtlanClient()
+    second = AtlanClient()
+
+    cache = AtlanTagCache.get_cache(first)
+    assert AtlanTagCache in first.caches
+    assert AtlanTagCache not in second.caches
+    assert AtlanTagCache.get_cache(second) is not cache
+    assert AtlanTagCache.get_cache() is AtlanTagCache.get_cache(second)
+
+    released = weakref.ref(cache)
+    AtlanClient.set_default_client(second)
+    del first, cache
+    gc.collect()
+    assert released() is None
+
+
+def test_refresher_refreshes_only_when_typedefs_change(typedef_client):
+    cache = AtlanTagCache(typedef_client)
+    cache._refresh_cache()
+    sut = CacheRefresher(typedef_client, [cache])
+
+    sut.poll()
+    assert typedef_client.get.call_count == 1
+
+    typedef_client.get_headers.side_effect = None
+    typedef_client.get_headers.return_value = [
+        TypeDefHeader(guid="new", name="new", category="CLASSIFICATION")
+    ]
+    sut.poll()
+    assert typedef_client.get.call_count == 2
+    typedef_client.get_headers.assert_called_with(type_category=TAG_CATEGORIES)
+
+
+def test_refresher_refreshes_periodically(clock, monkeypatch, typedef_client):
+    monkeypatch.setattr("pyatlan.cache.refresher.time", clock)
+    cache = AtlanTagCache(typedef_client)
+    cache._refresh_cache()
+    sut = CacheRefresher(typedef_client, [cache], refresh_interval=60)
+
+    sut.poll()
+    clock.now += 30
+    sut.poll()
+    assert typedef_client.get.call_count == 1
+    clock.now += 30
+    sut.poll()
+    assert typedef_client.get.call_count == 2
+
+
+def test_invalidated_caches_are_refreshed_in_background(typedef_client):
+    tags = AtlanTagCache(typedef_client)
+    enums = EnumCache(typedef_client)
+    enums.fingerprint = fingerprint([])
+    enums._refresh_cache = Mock()  # type: ignore[method-assign]
+    sut = CacheRefresher(typedef_client, [tags, enums], poll_interval=60).start()
+    try:
+        sut.invalidate(AtlanTypeCategory.CLASSIFICATION)
+        for _ in range(50):
+            if typedef_client.get.called:
+                break
+            time.sleep(0.1)
+    finally:
+        sut.stop()
+
+    assert not sut.running
+    assert tags.map_name_to_id["Public"] == "cTrLMeBjKNeRV7HzBSL11u"
+    enums._refresh_cache.assert_not_called()
+
+
+def test_typedef_changes_invalidate_running_refresher():
+    refresher = Mock(CacheRefresher, running=True)
+    api_caller = Mock(AtlanClient, cache_refresher=refresher)
+    api_caller._call_api.return_value = {}
+    enum_def = EnumDef.create(name="Colours", values=["Red"])
+
+    TypeDefClient(api_caller).update(enum_def)
+
+    refresher.invalidate.assert_called_once_with(AtlanTypeCategory.ENUM)
+
+
+def test_typedef_changes_refresh_caches_of_their_own_client(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    first = AtlanClient()
+    second = AtlanClient()
+    AtlanClient.set_default_client(first)
+    first_cache = EnumCache.get_cache(first)
+    second_cache = EnumCache.get_cache(second)
+    monkeypatch.setattr(first_cache, "_refresh_cache", Mock())
+    monkeypatch.setattr(second_cache, "_refresh_cache", Mock())
+    monkeypatch.setattr(AtlanClient, "_call_api", Mock(return_value={}))
+
+    second.typedef.update(EnumDef.create(name="Colours", values=["Red"]))
+
+    second_cache._refresh_cache.assert_called_once_with()  # type: ignore[attr-defined]
+    first_cache._refresh_cache.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_event_for_unknown_custom_metadata_invalidates_cache(typedef_client):
+    cache = CustomMetadataCache(typedef_client)
+    cache._refresh_cache()
+    sut = Mock(CacheRefresher, caches=[cache])
+    event = AtlanEvent(
+        message={
+            "operationType": "BUSINESS_ATTRIBUTE_UPDATE",
+            "mutatedDetails": {"Monte Carlo": {}},
+        }
+    )
+
+    CacheRefresher.observe(sut, event)
+    sut.invalidate.assert_not_called()
+
+    event.payload.mutated_details = {"New Set": {}}  # type: ignore[union-attr]
+    CacheRefresher.observe(sut, event)
+    sut.invalidate.assert_called_once_with(AtlanTypeCategory.CUSTOM_METADATA)
+
+
+def test_bulk_tag_translation_refreshes_at_most_once(typedef_client):
+    sut = AtlanTagCache(typedef_client)
+
+    names = sut._get_names_for_ids(
+        ["cTrLMeBjKNeRV7HzBSL11u", "E1bxGBfXz4XsouhzmEJoaA", "unknown-1", "unknown-2"]
+    )
+
+    assert names == {
+        "cTrLMeBjKNeRV7HzBSL11u": "Public",
+        "E1bxGBfXz4XsouhzmEJoaA": "Highly Confidential",
+        "unknown-1": None,
+        "unknown-2": None,
+    }
+    assert sut._get_ids_for_names(["Public", "unknown"]) == {
+        "Public": "cTrLMeBjKNeRV7HzBSL11u",
+        "unknown": None,
+    }
+    assert typedef_client.get.call_count == 2
+    # Translations that could not be found are remembered
+    sut._get_names_for_ids(["unknown-1", "unknown-2"])
+    assert typedef_client.get.call_count == 2
+
+
+def test_bulk_custom_metadata_attribute_translation(typedefs, typedef_client):
+    cm = typedefs.custom_metadata_defs[0]
+    attr_ids = [str(attr.name) for attr in cm.attribute_defs]
+    sut = CustomMetadataCache(typedef_client)
+
+    names = sut._get_attr_names_for_ids(cm.name, [*attr_ids, "unknown"])
+
+    assert names == {
+        **{str(attr.name): attr.display_name for attr in cm.attribute_defs},
+        "unknown": None,
+    }
+    assert sut._get_names_for_ids([cm.name]) == {cm.name: cm.display_name}
+    typedef_client.get.assert_called_once()
+
+
+def test_bulk_user_translation_looks_up_missing_users_together(
+    user_client, token_client
+):
+    user_client.get.return_value = Mock(
+        records=[AtlanUser(id="guid-2", username="jdoe", email="jdoe@example.com")]
+    )
+    token_client.get_by_guid.side_effect = lambda guid: (
+        Mock(client_id="token") if guid == "token-guid" else None
+    )
+    sut = UserCache(user_client, token_client)
+
+    names = sut._get_names_for_ids(["guid-2", "token-guid", "unknown-guid"])
+    ids = sut._get_ids_for_names(["jdoe", "jsmith", "unknown"])
+
+    assert names == {
+        "guid-2": "jdoe",
+        "token-guid": "service-account-token",
+        "unknown-guid": None,
+    }
+    assert ids == {"jdoe": "guid-2", "jsmith": "guid-1", "unknown": None}
+    user_client.get.assert_called_once_with(
+        limit=3,
+        post_filter='{"id": {"$in": ["guid-2", "token-guid", "unknown-guid"]}}',
+    )
+    user_client.get_by_usernames.assert_called_once_with(
+        usernames=["jsmith", "unknown"], limit=2
+    )
+    user_client.get_all.assert_not_called()
+
+
+def test_stats_count_hits_misses_and_refreshes(typedef_client):
+    metrics = []
+    sut = AtlanTagCache(
+        typedef_client,
+        metrics_callback=lambda cache, metric, value: metrics.append((cache, metric)),
+    )
+
+    assert sut._get_name_for_id("cTrLMeBjKNeRV7HzBSL11u") == "Public"
+    assert sut._get_name_for_id("cTrLMeBjKNeRV7HzBSL11u") == "Public"
+    assert sut._get_name_for_id("unknown") is None
+
+    stats = sut.stats.snapshot(sut)
+    # A miss, the refresh it triggered and then a hit; a further hit; two misses either side of
+    # the refresh for the unknown ID, after which it is remembered as not found
+    assert (stats.hits, stats.misses, stats.refreshes) == (2, 3, 2)
+    assert stats.refresh_errors == 0
+    assert stats.last_refresh_seconds is not None
+    assert stats.entries["map_id_to_name"] == len(sut.map_id_to_name) > 0
+    assert stats.negative_entries == 1
+    assert stats.hit_ratio == pytest.approx(0.4)
+    assert metrics.count(("AtlanTagCache", "miss")) == 3
+    assert metrics.count(("AtlanTagCache", "refresh")) == 2
+
+
+def test_stats_count_failed_refreshes_and_lookups(user_client, token_client):
+    user_client.get_all.side_effect = ValueError("boom")
+    metrics = []
+    sut = UserCache(
+        user_client,
+        token_client,
+        metrics_callback=lambda cache, metric, value: metrics.append(metric),
+    )
+
+    with pytest.raises(ValueError):
+        sut._refresh_cache()
+    assert sut._get_id_for_name("jsmith") == "guid-1"
+
+    stats = sut.stats.snapshot(sut)
+    assert (stats.refreshes, stats.refresh_errors) == (1, 1)
+    assert (stats.lookups, stats.lookup_errors) == (1, 0)
+    assert metrics == ["refresh_error", "miss", "lookup"]
+
+
+def test_metrics_callback_errors_do_not_fail_lookups(typedef_client):
+    def callback(cache, metric, value):
+        raise RuntimeError("unavailable")
+
+    sut = AtlanTagCache(typedef_client, metrics_callback=callback)
+
+    assert sut._get_name_for_id("cTrLMeBjKNeRV7HzBSL11u") == "Public"
+
+
+def test_client_reports_stats_of_its_caches(monkeypatch, typedef_client):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "stats")
+    client = AtlanClient()
+    cache = client.caches.get(AtlanTagCache, lambda _: AtlanTagCache(typedef_client))
+    callback = Mock()
+
+    client.set_cache_metrics_callback(callback)
+    cache._get_name_for_id("cTrLMeBjKNeRV7HzBSL11u")
+    stats = client.cache_stats()
+
+    assert "AtlanTagCache" in stats
+    assert "EnumCache" not in stats
+    assert stats["AtlanTagCache"].refreshes == 1
+    assert client.cache_metrics_callback is callback
+    callback.assert_any_call("AtlanTagCache", "miss", 1)
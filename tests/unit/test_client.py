@@ -1,17 +1,37 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
-from json import load, loads
+import gzip
+import logging
+import socket
+import threading
+import time
+from json import dumps, load, loads
 from pathlib import Path
 from unittest.mock import DEFAULT, Mock, call, patch
 
 import pytest
+import requests
 from pydantic.v1 import ValidationError
 
-from pyatlan.client.asset import AssetClient, Batch, CustomMetadataHandling
+from pyatlan.client.asset import (
+    AssetClient,
+    Batch,
+    CustomMetadataHandling,
+    IndexSearchResults,
+    ParallelBatch,
+)
 from pyatlan.client.atlan import AtlanClient
-from pyatlan.client.common import ApiCaller
+from pyatlan.client.common import (
+    HTTP_PREFIX,
+    HTTPS_PREFIX,
+    ApiCaller,
+    SessionStrategy,
+)
+from pyatlan.client.compression import Compression
+from pyatlan.client.constants import BULK_UPDATE, GET_ALL_TYPE_DEFS, INDEX_SEARCH
 from pyatlan.client.group import GroupClient
 from pyatlan.client.search_log import SearchLogClient
+from pyatlan.client.streaming import JsonObjectStream
 from pyatlan.client.typedef import TypeDefClient
 from pyatlan.client.user import UserClient
 from pyatlan.errors import (
@@ -25,6 +45,7 @@ from pyatlan.model.assets import (
     AtlasGlossary,
     AtlasGlossaryCategory,
     AtlasGlossaryTerm,
+    Connection,
     DataDomain,
     DataProduct,
     Table,
@@ -36,11 +57,13 @@ from pyatlan.model.enums import (
     CertificateStatus,
     LineageDirection,
     SaveSemantic,
+    SortOrder,
 )
 from pyatlan.model.fluent_search import FluentSearch
 from pyatlan.model.group import GroupRequest
+from pyatlan.model.lazy import LazyAsset
 from pyatlan.model.lineage import LineageListRequest
-from pyatlan.model.response import AssetMutationResponse
+from pyatlan.model.response import AssetMutationResponse, MutatedEntities
 from pyatlan.model.search import Bool, Term
 from pyatlan.model.search_log import SearchLogRequest
 from pyatlan.model.typedef import EnumDef
@@ -1391,6 +1414,328 @@ def test_index_search_with_no_aggregation_results(
     mock_api_caller.reset_mock()
 
 
+def _search_page_for(request_obj, total: int):
+    start, size = request_obj.dsl.from_, request_obj.dsl.size
+    return {
+        SEARCH_COUNT: total,
+        "entities": [
+            {
+                "typeName": "Table",
+                "guid": f"guid-{i}",
+                "attributes": {"name": f"table-{i}", "qualifiedName": f"qn-{i}"},
+            }
+            for i in range(start, min(start + size, total))
+        ],
+    }
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_index_search_iterates_all_pages_in_order(prefetch):
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api.side_effect = lambda api, request_obj: (
+        _search_page_for(request_obj, total=11)
+    )
+    request = (
+        FluentSearch().where(Table.NAME.startswith("table")).page_size(2)
+    ).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, prefetch=prefetch)
+
+    assert results.prefetch == prefetch
+    assert [asset.guid for asset in results] == [f"guid-{i}" for i in range(11)]
+    # One call per page, plus one to find the empty page (sequential paging only)
+    assert mock_api_caller._call_api.call_count == (7 if prefetch == 0 else 6)
+
+
+def test_index_search_prefetch_continues_past_underestimated_count():
+    mock_api_caller = Mock(spec=ApiCaller)
+
+    def page_for(api, request_obj):
+        page = _search_page_for(request_obj, total=7)
+        page[SEARCH_COUNT] = 2
+        return page
+
+    mock_api_caller._call_api.side_effect = page_for
+    request = (
+        FluentSearch().where(Table.NAME.startswith("table")).page_size(2)
+    ).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, prefetch=2)
+
+    assert [asset.guid for asset in results] == [f"guid-{i}" for i in range(7)]
+
+
+def test_index_search_prefetch_does_not_change_original_criteria():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api.side_effect = lambda api, request_obj: (
+        _search_page_for(request_obj, total=5)
+    )
+    request = (
+        FluentSearch().where(Table.NAME.startswith("table")).page_size(2)
+    ).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, prefetch=2)
+    for _ in results:
+        pass
+
+    assert request.dsl.from_ == 0
+    assert request.dsl.size == 2
+
+
+def _streamed(page, chunk_size=16):
+    # As returned by the API, with the count and aggregations after the entities
+    raw = dumps(
+        {
+            "entities": page.get("entities", []),
+            SEARCH_COUNT: page.get(SEARCH_COUNT, 0),
+            "aggregations": {},
+        }
+    ).encode()
+    return JsonObjectStream(
+        (raw[i : i + chunk_size] for i in range(0, len(raw), chunk_size)),  # noqa: E203
+        array_key="entities",
+    )
+
+
+def test_index_search_stream_iterates_all_pages_in_order():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api_streaming.side_effect = (
+        lambda api, array_key, request_obj: _streamed(
+            _search_page_for(request_obj, total=11)
+        )
+    )
+    request = (
+        FluentSearch().where(Table.NAME.startswith("table")).page_size(4)
+    ).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, stream=True)
+
+    assert results.stream
+    assert [asset.guid for asset in results] == [f"guid-{i}" for i in range(11)]
+    assert results.count == 11
+    mock_api_caller._call_api.assert_not_called()
+    assert mock_api_caller._call_api_streaming.call_count == 4
+
+
+def test_index_search_stream_count_reads_rest_of_page():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api_streaming.side_effect = (
+        lambda api, array_key, request_obj: _streamed(
+            _search_page_for(request_obj, total=5)
+        )
+    )
+    request = (
+        FluentSearch().where(Table.NAME.startswith("table")).page_size(3)
+    ).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, stream=True)
+    guids = []
+    for asset in results:
+        guids.append(asset.guid)
+        if len(guids) == 1:
+            assert results.count == 5
+            assert [asset.guid for asset in results.current_page()] == [
+                "guid-1",
+                "guid-2",
+            ]
+
+    assert guids == [f"guid-{i}" for i in range(5)]
+    assert results.aggregations is not None
+
+
+def test_index_search_stream_with_no_results():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api_streaming.return_value = _streamed({SEARCH_COUNT: 0})
+    request = FluentSearch().where(Table.NAME.startswith("table")).to_request()
+
+    results = AssetClient(mock_api_caller).search(criteria=request, stream=True)
+
+    assert list(results) == []
+    assert results.count == 0
+    assert not results.next_page()
+
+
+class TestIndexSearchBulk:
+    # Several assets share each creation time, to exercise paging across ties
+    ASSETS = [
+        {"guid": f"guid-{i:02d}", "createTime": 1000 + (i // 3)} for i in range(14)
+    ]
+
+    @staticmethod
+    def _since(query):
+        if isinstance(query, Bool):
+            for condition in query.filter:
+                if getattr(condition, "field", None) == "__timestamp":
+                    return condition.gte
+        return 0
+
+    def _page_for(self, api, request_obj, count=None):
+        dsl = request_obj.dsl
+        since = self._since(dsl.query)
+        matches = sorted(
+            (asset for asset in self.ASSETS if asset["createTime"] >= since),
+            key=lambda asset: (asset["createTime"], asset["guid"]),
+        )
+        return {
+            SEARCH_COUNT: len(self.ASSETS) if count is None else count,
+            "entities": [
+                {
+                    "typeName": "Table",
+                    "guid": asset["guid"],
+                    "createTime": asset["createTime"],
+                    "attributes": {"name": asset["guid"], "qualifiedName": "qn"},
+                }
+                for asset in matches[dsl.from_ : dsl.from_ + dsl.size]  # noqa: E203
+            ],
+        }
+
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 4, 20])
+    def test_bulk_iterates_every_asset_once(self, page_size):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api.side_effect = self._page_for
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).page_size(page_size)
+        ).to_request()
+
+        results = AssetClient(mock_api_caller).search(criteria=request, bulk=True)
+
+        assert results.bulk
+        assert [sort.field for sort in request.dsl.sort] == ["__timestamp", "__guid"]
+        assert [asset.guid for asset in results] == [
+            asset["guid"] for asset in self.ASSETS
+        ]
+        for call_args in mock_api_caller._call_api.call_args_list:
+            dsl = call_args.kwargs["request_obj"].dsl
+            # Offsets never grow beyond the assets sharing a single creation time
+            assert dsl.from_ < 3
+
+    @pytest.mark.parametrize("page_size", [1, 3, 20])
+    def test_bulk_stream_iterates_every_asset_once(self, page_size):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api_streaming.side_effect = (
+            lambda api, array_key, request_obj: _streamed(
+                self._page_for(api, request_obj)
+            )
+        )
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).page_size(page_size)
+        ).to_request()
+
+        results = AssetClient(mock_api_caller).search(
+            criteria=request, bulk=True, stream=True
+        )
+
+        assert [asset.guid for asset in results] == [
+            asset["guid"] for asset in self.ASSETS
+        ]
+
+    @pytest.mark.parametrize(
+        "sort",
+        [
+            Table.NAME.order(SortOrder.ASCENDING),
+            Table.CREATE_TIME.order(SortOrder.DESCENDING),
+            Table.GUID.order(SortOrder.DESCENDING),
+        ],
+    )
+    def test_bulk_with_sorts_raises_invalid_request_error(self, sort):
+        mock_api_caller = Mock(spec=ApiCaller)
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).sort(sort)
+        ).to_request()
+
+        with pytest.raises(
+            InvalidRequestError,
+            match="ATLAN-PYTHON-400-063 Unable to execute bulk search with user-defined sorting options.",
+        ):
+            AssetClient(mock_api_caller).search(criteria=request, bulk=True)
+        mock_api_caller._call_api.assert_not_called()
+
+    def test_search_switches_to_bulk_beyond_threshold(self):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api.side_effect = lambda api, request_obj: (
+            self._page_for(
+                api,
+                request_obj,
+                count=IndexSearchResults.MASS_EXTRACT_THRESHOLD + 1,
+            )
+        )
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).page_size(5)
+        ).to_request()
+
+        results = AssetClient(mock_api_caller).search(criteria=request)
+
+        assert results.bulk
+        assert mock_api_caller._call_api.call_count == 2
+        assert [sort.field for sort in request.dsl.sort] == ["__timestamp", "__guid"]
+
+    def test_search_switching_to_bulk_keeps_options_and_is_logged(self, caplog):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api.side_effect = lambda api, request_obj: (
+            self._page_for(
+                api,
+                request_obj,
+                count=IndexSearchResults.MASS_EXTRACT_THRESHOLD + 1,
+            )
+        )
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).page_size(5)
+        ).to_request()
+
+        with caplog.at_level(logging.INFO, logger="pyatlan"):
+            results = AssetClient(mock_api_caller).search(
+                criteria=request, prefetch=2, lazy=True
+            )
+
+        assert results.bulk
+        assert results.prefetch == 2
+        assert all(isinstance(asset, LazyAsset) for asset in results.current_page())
+        assert "re-running search in bulk mode" in caplog.text
+
+    @pytest.mark.parametrize(
+        "sort",
+        [
+            Table.NAME.order(SortOrder.ASCENDING),
+            Table.CREATE_TIME.order(SortOrder.DESCENDING),
+            Table.GUID.order(SortOrder.DESCENDING),
+        ],
+    )
+    def test_search_with_sorts_does_not_switch_to_bulk(self, sort):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api.side_effect = lambda api, request_obj: (
+            self._page_for(
+                api,
+                request_obj,
+                count=IndexSearchResults.MASS_EXTRACT_THRESHOLD + 1,
+            )
+        )
+        request = (
+            FluentSearch().where(Table.NAME.startswith("guid")).sort(sort)
+        ).to_request()
+        sorts = list(request.dsl.sort)
+
+        results = AssetClient(mock_api_caller).search(criteria=request)
+
+        assert not results.bulk
+        assert mock_api_caller._call_api.call_count == 1
+        assert request.dsl.sort == sorts
+
+    def test_bulk_with_its_own_sorts_is_allowed(self):
+        mock_api_caller = Mock(spec=ApiCaller)
+        mock_api_caller._call_api.side_effect = self._page_for
+        request = (
+            FluentSearch()
+            .where(Table.NAME.startswith("guid"))
+            .sort(Table.CREATE_TIME.order(SortOrder.ASCENDING))
+        ).to_request()
+
+        results = AssetClient(mock_api_caller).search(criteria=request, bulk=True)
+
+        assert [asset.guid for asset in results] == [
+            asset["guid"] for asset in self.ASSETS
+        ]
+
+
 def test_asset_get_by_guid_without_asset_type(mock_api_caller, get_by_guid_json):
     client = AssetClient(mock_api_caller)
     mock_api_caller._call_api.side_effect = [get_by_guid_json]
@@ -1772,6 +2117,229 @@ class TestBatch:
         assert 0 == len(sut.created)
         assert 0 == len(sut.updated)
 
+    @staticmethod
+    def save_rejecting(*bad_names):
+        def save(batch, **kwargs):
+            if any(asset.name in bad_names for asset in batch):
+                raise ErrorCode.INVALID_REQUEST_PASSTHROUGH.exception_with_parameters(
+                    "bad", "stuff"
+                )
+            return AssetMutationResponse(
+                mutated_entities=MutatedEntities(CREATE=list(batch))
+            )
+
+        return save
+
+    @staticmethod
+    def tables(count):
+        return [
+            Table.updater(qualified_name=f"default/t{i}", name=f"t{i}")
+            for i in range(count)
+        ]
+
+    def test_split_on_failure_isolates_failed_assets(self, mock_asset_client):
+        mock_asset_client.save.side_effect = self.save_rejecting("t2", "t5")
+        tables = self.tables(8)
+        sut = Batch(
+            client=mock_asset_client,
+            max_size=8,
+            capture_failures=True,
+            split_on_failure=True,
+        )
+
+        for table in tables[:-1]:
+            sut.add(table)
+        response = sut.add(tables[-1])
+
+        assert [[tables[2]], [tables[5]]] == [f.failed_assets for f in sut.failures]
+        expected = [t.name for t in tables if t.name not in ("t2", "t5")]
+        assert expected == [asset.name for asset in sut.created]
+        assert response
+        assert expected == [asset.name for asset in response.mutated_entities.CREATE]
+
+    def test_split_on_failure_raises_for_failed_asset(self, mock_asset_client):
+        mock_asset_client.save.side_effect = self.save_rejecting("t3")
+        sut = Batch(client=mock_asset_client, max_size=4, split_on_failure=True)
+
+        with pytest.raises(InvalidRequestError):
+            for table in self.tables(4):
+                sut.add(table)
+        assert ["t0", "t1", "t2"] == [asset.name for asset in sut.created]
+
+    def test_adaptive_size_shrinks_when_slow_and_grows_back_when_fast(
+        self, mock_asset_client
+    ):
+        mock_asset_client.save.side_effect = self.save_rejecting()
+        sut = Batch(
+            client=mock_asset_client, max_size=8, adaptive=True, target_latency=0.0
+        )
+
+        for table in self.tables(8 + 4 + 2):
+            sut.add(table)
+        assert 1 == sut.size
+        assert [8, 4, 2] == [
+            len(c.args[0]) for c in mock_asset_client.save.call_args_list
+        ]
+
+        sut._target_latency = 60.0
+        sizes = []
+        for table in self.tables(1 + 2 + 3 + 5):
+            sut.add(table)
+            sizes.append(sut.size)
+        assert 8 == sut.size
+        assert [2, 3, 5, 8] == sorted(set(sizes))
+
+    def test_max_payload_bytes_saves_before_max_size(self, mock_asset_client):
+        mock_asset_client.save.side_effect = self.save_rejecting()
+        tables = self.tables(6)
+        size = len(tables[0].json(by_alias=True, exclude_unset=True))
+        sut = Batch(client=mock_asset_client, max_size=10, max_payload_bytes=size * 2)
+
+        for table in tables:
+            sut.add(table)
+
+        assert [2, 2, 2] == [
+            len(c.args[0]) for c in mock_asset_client.save.call_args_list
+        ]
+
+
+class TestParallelBatch:
+    @staticmethod
+    def mutation_response(created):
+        response = Mock(spec=AssetMutationResponse)
+        mutated_entities = Mock()
+        mutated_entities.CREATE = list(created)
+        mutated_entities.UPDATE = []
+        response.attach_mock(mutated_entities, "mutated_entities")
+        return response
+
+    def test_add_saves_every_batch(self, mock_asset_client):
+        mock_asset_client.save.side_effect = lambda batch, **kwargs: (
+            self.mutation_response(batch)
+        )
+        tables = [Mock(Table) for _ in range(25)]
+
+        with ParallelBatch(client=mock_asset_client, max_size=4, max_workers=3) as sut:
+            for table in tables:
+                assert sut.add(table) is None
+
+        assert 7 == mock_asset_client.save.call_count
+        saved = [a for c in mock_asset_client.save.call_args_list for a in c.args[0]]
+        assert sorted(map(id, saved)) == sorted(map(id, tables))
+        assert len(tables) == len(sut.created)
+        assert 0 == len(sut.failures)
+
+    def test_connection_saved_after_earlier_and_before_later_batches(
+        self, mock_asset_client
+    ):
+        lock = threading.Lock()
+        events = []
+
+        def save(batch, **kwargs):
+            with lock:
+                events.append(("start", batch[0]))
+            time.sleep(0.01)
+            with lock:
+                events.append(("end", batch[0]))
+            return self.mutation_response(batch)
+
+        mock_asset_client.save.side_effect = save
+        before = [Mock(Table) for _ in range(4)]
+        connection = Mock(Connection)
+        after = [Mock(Table) for _ in range(4)]
+
+        sut = ParallelBatch(client=mock_asset_client, max_size=1, max_workers=4)
+        for asset in before + [connection] + after:
+            sut.add(asset)
+        sut.close()
+
+        start = events.index(("start", connection))
+        end = events.index(("end", connection))
+        assert end == start + 1
+        assert {asset for _, asset in events[:start]} == set(before)
+        assert {asset for _, asset in events[end:]} - {connection} == set(after)
+
+    def test_add_blocks_when_max_pending_batches_reached(self, mock_asset_client):
+        release = threading.Event()
+
+        def save(batch, **kwargs):
+            release.wait(timeout=5)
+            return self.mutation_response(batch)
+
+        mock_asset_client.save.side_effect = save
+        sut = ParallelBatch(
+            client=mock_asset_client, max_size=1, max_workers=1, max_pending=1
+        )
+        sut.add(Mock(Table))
+        blocked = threading.Thread(target=sut.add, args=(Mock(Table),))
+        blocked.start()
+
+        blocked.join(timeout=0.1)
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(timeout=5)
+        assert not blocked.is_alive()
+        sut.close()
+        assert 2 == len(sut.created)
+
+    def test_failure_captured(self, mock_asset_client):
+        exception = ErrorCode.INVALID_REQUEST_PASSTHROUGH.exception_with_parameters(
+            "bad", "stuff"
+        )
+        mock_asset_client.save.side_effect = exception
+        tables = [Mock(Table), Mock(Table)]
+
+        with ParallelBatch(
+            client=mock_asset_client, max_size=2, capture_failures=True
+        ) as sut:
+            for table in tables:
+                sut.add(table)
+
+        assert 1 == len(sut.failures)
+        assert tables == sut.failures[0].failed_assets
+        assert exception == sut.failures[0].failure_reason
+
+    def test_failure_not_captured_raised_on_flush(self, mock_asset_client):
+        mock_asset_client.save.side_effect = (
+            ErrorCode.INVALID_REQUEST_PASSTHROUGH.exception_with_parameters(
+                "bad", "stuff"
+            )
+        )
+        sut = ParallelBatch(client=mock_asset_client, max_size=1)
+        sut.add(Mock(Table))
+
+        with pytest.raises(AtlanError):
+            sut.close()
+        assert 0 == len(sut.failures)
+        assert 0 == len(sut.created)
+
+    @pytest.mark.parametrize("capture_failures", [True, False])
+    def test_non_atlan_error_raised_on_flush(self, mock_asset_client, capture_failures):
+        mock_asset_client.save.side_effect = requests.ConnectionError("dropped")
+        sut = ParallelBatch(
+            client=mock_asset_client, max_size=1, capture_failures=capture_failures
+        )
+        sut.add(Mock(Table))
+
+        with pytest.raises(requests.ConnectionError, match="dropped"):
+            sut.close()
+        assert 0 == len(sut.failures)
+        assert 0 == len(sut.created)
+
+    def test_non_atlan_error_raised_on_add(self, mock_asset_client):
+        mock_asset_client.save.side_effect = KeyError("mutatedEntities")
+        sut = ParallelBatch(client=mock_asset_client, max_size=1, max_workers=1)
+        sut.add(Mock(Table))
+        sut._wait_for_pending()
+
+        with pytest.raises(KeyError):
+            sut.add(Mock(Table))
+        mock_asset_client.save.side_effect = lambda batch, **kwargs: (
+            self.mutation_response(batch)
+        )
+        sut.close()
+        assert 1 == len(sut.created)
+
 
 class TestBulkRequest:
     SEE_ALSO = "seeAlso"
@@ -1994,3 +2562,175 @@ class TestBulkRequest:
         assert request_json
         assert request_json["attributes"]["certificateStatus"] is None
         assert request_json["attributes"]["certificateStatusMessage"] is None
+
+
+def test_session_pools_connections_by_default(client):
+    adapter = client.session.adapters[HTTPS_PREFIX]
+
+    assert client.session is client._session
+    assert adapter._pool_connections == 10
+    assert adapter._pool_maxsize == 10
+    assert adapter._pool_block is False
+    assert client.session.headers["Connection"] == "keep-alive"
+
+
+def test_session_uses_configured_connection_pool(monkeypatch):
+    monkeypatch.setenv("ATLAN_HTTP_POOL_MAXSIZE", "50")
+    client = AtlanClient(
+        http_pool_size=2,
+        http_pool_block=True,
+        http_keep_alive=False,
+        http_tcp_keepalive=30,
+    )
+
+    for prefix in (HTTPS_PREFIX, HTTP_PREFIX):
+        adapter = client.session.adapters[prefix]
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 50
+        assert adapter._pool_block is True
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    assert client.session.headers["Connection"] == "close"
+
+
+def test_invalid_connection_pool_raises_error():
+    with pytest.raises(ValidationError):
+        AtlanClient(http_pool_maxsize=0)
+
+
+def test_size_connection_pool_only_grows_pool(client):
+    client.size_connection_pool(5)
+    assert client.session.adapters[HTTPS_PREFIX]._pool_maxsize == 10
+
+    client.size_connection_pool(32)
+    assert client.http_pool_maxsize == 32
+    for prefix in (HTTPS_PREFIX, HTTP_PREFIX):
+        assert client.session.adapters[prefix]._pool_maxsize == 32
+
+
+def test_shared_session_is_used_by_every_thread(client):
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(client.session))
+    thread.start()
+    thread.join()
+
+    assert sessions == [client.session]
+
+
+def test_per_thread_sessions():
+    client = AtlanClient(session_strategy=SessionStrategy.PER_THREAD)
+    client.update_headers({"x-before": "1"})
+    main_session = client.session
+    sessions = []
+
+    def use_session():
+        sessions.append(client.session)
+        sessions.append(client.session)
+        client.update_headers({"x-after": "2"})
+
+    thread = threading.Thread(target=use_session)
+    thread.start()
+    thread.join()
+
+    assert main_session is client.session
+    assert sessions[0] is sessions[1]
+    assert sessions[0] is not main_session
+    assert sessions[0].headers["x-before"] == "1"
+    assert main_session.headers["x-after"] == "2"
+    assert sessions[0].adapters[HTTPS_PREFIX] is not main_session.adapters[HTTPS_PREFIX]
+
+
+def test_call_api_uses_session_of_current_thread():
+    client = AtlanClient(session_strategy=SessionStrategy.PER_THREAD)
+    response = Mock(status_code=200, content=dumps({"entities": []}).encode())
+    response.text = response.content.decode()
+    response.json.return_value = {"entities": []}
+
+    with patch.object(client.session, "request", return_value=response) as request:
+        client._call_api(GET_ALL_TYPE_DEFS)
+
+    assert request.call_count == 1
+
+
+def test_streamed_response_is_left_open_for_the_caller(client):
+    response = Mock(status_code=200)
+    response.iter_content.return_value = iter([b'{"entities": []}'])
+
+    with patch.object(client.session, "request", return_value=response):
+        stream = client._call_api_streaming(INDEX_SEARCH, array_key="entities")
+
+    response.close.assert_not_called()
+    assert stream
+    stream.close()
+    response.close.assert_called_once_with()
+
+
+def test_streamed_response_is_closed_when_service_unavailable(client):
+    response = Mock(status_code=503)
+
+    with patch.object(client.session, "request", return_value=response):
+        assert client._call_api_streaming(INDEX_SEARCH, array_key="entities") is None
+
+    response.close.assert_called_once_with()
+
+
+def test_streamed_response_is_closed_on_error(client):
+    response = Mock(
+        status_code=400,
+        text=dumps({"errorCode": "ATLAS-400-00-001", "errorMessage": "Bad request"}),
+    )
+
+    with patch.object(client.session, "request", return_value=response):
+        with pytest.raises(InvalidRequestError, match="Bad request"):
+            client._call_api_streaming(INDEX_SEARCH, array_key="entities")
+
+    response.close.assert_called_once_with()
+
+
+def test_requests_are_not_compressed_by_default(client):
+    request = BulkRequest(entities=[Table.updater(name="t", qualified_name="qn")])
+
+    params = client._create_params(BULK_UPDATE, None, request)
+
+    assert loads(params["data"]) == loads(
+        request.json(by_alias=True, exclude_unset=True)
+    )
+    assert "Content-Encoding" not in params["headers"]
+
+
+def test_large_requests_are_compressed():
+    client = AtlanClient(request_compression=Compression.GZIP)
+    entities = [Table.updater(name=f"t{i}", qualified_name=f"qn{i}") for i in range(50)]
+    request = BulkRequest(entities=entities)
+
+    params = client._create_params(BULK_UPDATE, None, request)
+
+    assert params["headers"]["Content-Encoding"] == "gzip"
+    assert loads(gzip.decompress(params["data"])) == loads(
+        request.json(by_alias=True, exclude_unset=True)
+    )
+
+
+def test_small_requests_are_not_compressed():
+    client = AtlanClient(request_compression="gzip", request_compression_min_size=1000)
+
+    params = client._create_params(BULK_UPDATE, None, {"entities": []})
+
+    assert loads(params["data"]) == {"entities": []}
+    assert "Content-Encoding" not in params["headers"]
+
+
+def test_zstd_compression_without_zstandard_raises_error():
+    with patch.dict("sys.modules", {"zstandard": None}):
+        with pytest.raises(InvalidRequestError, match="zstandard"):
+            AtlanClient(request_compression=Compression.ZSTD)
+
+
+def test_create_params_does_not_share_headers_between_calls(client):
+    first = client._create_params(GET_ALL_TYPE_DEFS, None, None)
+    first["headers"]["X-Atlan-Request-Id"] = "123"
+
+    second = client._create_params(GET_ALL_TYPE_DEFS, None, None)
+
+    assert second["headers"]["authorization"] == "Bearer abkj"
+    assert "X-Atlan-Request-Id" not in second["headers"]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import no_type_check
-from unittest.mock import call
+import json
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, no_type_check
+from unittest.mock import call, patch
 
 import pytest
 from pydantic.v1 import Field
 
-from pyatlan.model.core import AtlanObject, AtlanTag, AtlanTagName
+from pyatlan.model.assets import Table
+from pyatlan.model.core import AtlanObject, AtlanTag, AtlanTagName, BulkRequest
+from pyatlan.model.enums import CertificateStatus
 
 DISPLAY_TEXT = "Something"
 
@@ -174,3 +178,55 @@ class TestAtlanObjectExtraFields:
         assert response.attributes.old_attr == "oldValueAttr"
         assert response.__atlan_extra__ == {"new": "newValue"}
         assert response.attributes.__atlan_extra__ == {"newAttr": "newValueAttr"}
+
+
+class Sample(AtlanObject):
+    display_name: str
+    updated_at: Optional[datetime] = None
+    status: Optional[CertificateStatus] = None
+    counts: Dict[int, List[str]] = Field(default_factory=dict)
+
+
+class SampleRoot(AtlanObject):
+    __root__: List[Sample]
+
+
+class TestAtlanObjectJsonBytes:
+    @pytest.fixture(params=[True, False], ids=["orjson", "json"])
+    def use_orjson(self, request):
+        if request.param:
+            yield
+        else:
+            with patch("pyatlan.model.utils.orjson", None):
+                yield
+
+    @pytest.mark.parametrize(
+        "sut",
+        [
+            Sample(
+                display_name="ünïcödé",
+                updated_at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                status=CertificateStatus.VERIFIED,
+                counts={1: ["a"], 2: []},
+            ),
+            SampleRoot(__root__=[Sample(display_name="a"), Sample(display_name="b")]),
+            BulkRequest[Table](
+                entities=[Table.updater(name="t", qualified_name="default/t")]
+            ),
+        ],
+    )
+    def test_json_bytes_matches_json(self, sut, use_orjson):
+        json_bytes = sut.json_bytes(by_alias=True, exclude_unset=True)
+
+        assert isinstance(json_bytes, bytes)
+        assert json.loads(json_bytes) == json.loads(
+            sut.json(by_alias=True, exclude_unset=True)
+        )
+
+    def test_json_bytes_respects_custom_json(self):
+        sut = Table.updater(name="t", qualified_name="default/t")
+
+        with patch.object(Table, "json", return_value='{"custom": true}') as json_:
+            assert sut.json_bytes(by_alias=True) == b'{"custom": true}'
+
+        json_.assert_called_once_with(by_alias=True)
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import json
+import uuid
+from itertools import islice
+from unittest.mock import Mock
+
+import pytest
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.errors import ErrorCode, InvalidRequestError
+from pyatlan.model.assets import Asset, Column, Table, View
+from pyatlan.model.export import SlicedExport
+from pyatlan.model.fluent_search import FluentSearch
+
+
+def make_asset(asset_type, type_name, i):
+    asset = asset_type(guid=f"{type_name}-{i:02d}", create_time=1000 + i // 2)
+    asset.qualified_name = f"default/{type_name}-{i:02d}"
+    return asset
+
+
+# Several assets of each type share a creation time, to exercise resuming across ties
+ASSETS = {
+    type_name: [make_asset(asset_type, type_name, i) for i in range(count)]
+    for type_name, asset_type, count in (
+        ("Table", Table, 5),
+        ("View", View, 3),
+        ("Column", Column, 8),
+    )
+}
+SEARCH = FluentSearch().where(FluentSearch.active_assets())
+
+
+class FakeResults:
+    def __init__(self, assets):
+        self._assets = assets
+
+    @property
+    def count(self):
+        return len(self._assets)
+
+    def __iter__(self):
+        return iter(self._assets)
+
+
+def search_for(request, **kwargs):
+    assert kwargs["bulk"]
+    query = json.dumps(request.dsl.query.to_dict())
+    since = 0
+    if '"__timestamp": {"gte": ' in query:
+        since = int(query.split('"__timestamp": {"gte": ')[1].split("}")[0])
+    for type_name, assets in ASSETS.items():
+        if f'"{type_name}"' in query:
+            return FakeResults([a for a in assets if a.create_time >= since])
+    return FakeResults([])
+
+
+@pytest.fixture()
+def client():
+    client = Mock(AtlanClient)
+    client.asset.search.side_effect = search_for
+    return client
+
+
+def test_by_type_exports_every_slice(client):
+    sut = SlicedExport.by_type(client, SEARCH, [Table, View, Column], concurrency=2)
+
+    guids = [asset.guid for asset in sut.execute()]
+
+    expected = [asset.guid for assets in ASSETS.values() for asset in assets]
+    assert sorted(guids) == sorted(expected)
+    for type_name, assets in ASSETS.items():
+        progress = sut.progress[type_name]
+        assert progress.done
+        assert progress.count == len(assets)
+        assert progress.processed == len(assets)
+
+
+def test_by_qualified_name_prefix_with_overlapping_prefixes_raises_error(client):
+    with pytest.raises(
+        InvalidRequestError,
+        match=ErrorCode.OVERLAPPING_EXPORT_SLICES.error_id,
+    ):
+        SlicedExport.by_qualified_name_prefix(
+            client, SEARCH, ["default/snowflake/1", "default/snowflake/1/DB"]
+        )
+
+
+def test_by_guid_single_slice_covers_every_guid(client):
+    sut = SlicedExport.by_guid(client, SEARCH, 1)
+
+    assert [s.query for s in sut._slices] == [Asset.GUID.has_any_value()]
+
+
+@pytest.mark.parametrize("count", [2, 5, 16, 20, 256])
+def test_by_guid_covers_every_guid_once_in_even_slices(client, count):
+    sut = SlicedExport.by_guid(client, SEARCH, count)
+
+    ranges = [search_slice.query for search_slice in sut._slices]
+    assert len(ranges) == count
+    assert ranges[0].gte is None
+    assert ranges[-1].lt is None
+    assert all(r.lt == after.gte for r, after in zip(ranges, ranges[1:]))
+    widths = [int(r.lt or "10000", 16) - int(r.gte or "0000", 16) for r in ranges]
+    assert max(widths) - min(widths) <= 1
+    guids = [str(uuid.UUID(int=i * (2**128 - 1) // 999)) for i in range(1000)]
+    for guid in guids:
+        matches = [
+            r for r in ranges if (r.gte or "") <= guid and (r.lt is None or guid < r.lt)
+        ]
+        assert len(matches) == 1
+
+
+def test_resume_from_checkpoint_exports_remaining_assets(client):
+    sut = SlicedExport.by_type(client, SEARCH, [Table, View, Column], buffer_size=1)
+    exported = [asset.guid for asset in islice(sut.execute(), 7)]
+    checkpoint = json.loads(json.dumps(sut.checkpoint()))
+
+    resumed = SlicedExport.by_type(client, SEARCH, [Table, View, Column])
+    exported.extend(asset.guid for asset in resumed.execute(resume_from=checkpoint))
+
+    expected = [asset.guid for assets in ASSETS.values() for asset in assets]
+    assert sorted(exported) == sorted(expected)
+    assert all(progress.done for progress in resumed.progress.values())
+
+
+def test_stopping_early_searches_no_further_slices(client):
+    sut = SlicedExport.by_type(
+        client, SEARCH, [Table, View, Column], concurrency=1, buffer_size=1
+    )
+
+    exported = sut.execute()
+    next(exported)
+    exported.close()
+
+    assert 1 == client.asset.search.call_count
+
+
+def test_failure_in_slice_is_raised_without_searching_further_slices(client):
+    error = ErrorCode.ERROR_PASSTHROUGH.exception_with_parameters("500", "failed")
+    client.asset.search.side_effect = error
+    sut = SlicedExport.by_type(client, SEARCH, [Table, View, Column], concurrency=1)
+
+    with pytest.raises(type(error)):
+        list(sut.execute())
+    assert 1 == client.asset.search.call_count
+
+
+def test_failure_in_slice_is_raised(client):
+    error = ErrorCode.ERROR_PASSTHROUGH.exception_with_parameters("500", "failed")
+    client.asset.search.side_effect = error
+    sut = SlicedExport.by_type(client, SEARCH, [Table, View])
+
+    with pytest.raises(type(error)):
+        list(sut.execute())
+    assert not any(progress.done for progress in sut.progress.values())
@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+from unittest.mock import Mock
+
+import pytest
+
+from pyatlan.client.asset import AssetClient
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.common import ApiCaller
+from pyatlan.errors import ApiError, ErrorCode, InvalidRequestError
+from pyatlan.model.assets import Asset, Column, Table
+from pyatlan.model.fluent_search import FluentSearch
+from pyatlan.model.lazy import LazyAsset
+
+
+def entity(i: int = 0, **attributes):
+    return {
+        "typeName": "Table",
+        "guid": f"guid-{i}",
+        "createTime": 1000 + i,
+        "updatedBy": "someone",
+        "attributes": {
+            "name": f"table-{i}",
+            "qualifiedName": f"default/table-{i}",
+            **attributes,
+        },
+    }
+
+
+def test_raw_properties_do_not_materialize():
+    sut = LazyAsset(entity(1))
+
+    assert sut.guid == "guid-1"
+    assert sut.type_name == "Table"
+    assert sut.qualified_name == "default/table-1"
+    assert sut.name == "table-1"
+    assert sut.create_time == 1001
+    assert sut.update_time is None
+    assert sut.updated_by == "someone"
+    assert isinstance(sut, Table)
+    assert isinstance(sut, Asset)
+    assert not isinstance(sut, Column)
+    assert repr(sut) == "LazyAsset(type_name='Table', guid='guid-1')"
+    assert not sut.is_materialized
+
+
+def test_other_attribute_materializes():
+    sut = LazyAsset(entity(1, rowCount=42))
+
+    assert sut.row_count == 42
+    assert sut.is_materialized
+    assert sut.materialize() == Asset._convert_to_real_type_(entity(1, rowCount=42))
+    assert type(sut.materialize()) is Table
+
+
+def test_change_materializes_and_is_visible():
+    sut = LazyAsset(entity(1))
+
+    sut.name = "renamed"
+
+    assert sut.is_materialized
+    assert sut.name == "renamed"
+    assert sut.materialize().name == "renamed"
+
+
+def test_invalid_entity_raises_error_on_materialize():
+    sut = LazyAsset(entity(1, rowCount="not-a-number"))
+
+    assert sut.guid == "guid-1"
+    with pytest.raises(ApiError, match=ErrorCode.JSON_ERROR.error_id):
+        sut.row_count
+
+
+def page_for(api, request_obj):
+    start, size = request_obj.dsl.from_, request_obj.dsl.size
+    return {
+        "approximateCount": 5,
+        "entities": [
+            entity(i, rowCount=i * 10) for i in range(start, min(start + size, 5))
+        ],
+    }
+
+
+def test_search_lazy_returns_lazy_assets_across_pages():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api.side_effect = page_for
+    request = FluentSearch().where(Table.NAME.startswith("table")).page_size(2)
+
+    results = AssetClient(mock_api_caller).search(request.to_request(), lazy=True)
+    assets = list(results)
+
+    assert results.lazy
+    assert [asset.qualified_name for asset in assets] == [
+        f"default/table-{i}" for i in range(5)
+    ]
+    assert all(type(asset) is LazyAsset for asset in assets)
+    assert not any(asset.is_materialized for asset in assets)
+
+
+@pytest.fixture()
+def client():
+    mock_api_caller = Mock(spec=ApiCaller)
+    mock_api_caller._call_api.side_effect = page_for
+    client = Mock(AtlanClient)
+    client.asset = AssetClient(mock_api_caller)
+    return client
+
+
+def test_project_returns_named_tuples(client):
+    search = FluentSearch().where(Table.NAME.startswith("table")).page_size(2)
+
+    results = search.project(
+        client, Asset.GUID, Asset.QUALIFIED_NAME, Table.ROW_COUNT, Table.COLUMN_COUNT
+    )
+    rows = list(results)
+
+    assert results.columns == ["guid", "qualified_name", "row_count", "column_count"]
+    assert results.count == 5
+    assert rows[1] == ("guid-1", "default/table-1", 10, None)
+    assert rows[1].qualified_name == "default/table-1"
+    assert rows[4].row_count == 40
+    request = client.asset._client._call_api.call_args.kwargs["request_obj"]
+    assert {"qualifiedName", "rowCount", "columnCount"} <= set(request.attributes)
+    assert "guid" not in request.attributes
+
+
+def test_project_to_columns(client):
+    search = FluentSearch().where(Table.NAME.startswith("table"))
+
+    columns = search.project(client, Asset.GUID, Table.ROW_COUNT).to_columns()
+
+    assert columns == {
+        "guid": [f"guid-{i}" for i in range(5)],
+        "row_count": [i * 10 for i in range(5)],
+    }
+
+
+def test_project_without_fields_raises_error(client):
+    with pytest.raises(
+        InvalidRequestError, match=ErrorCode.MISSING_FIELDS_TO_PROJECT.error_id
+    ):
+        FluentSearch().where(Table.NAME.startswith("table")).project(client)
+
+
+@pytest.mark.parametrize("field", [Asset.SUPER_TYPE_NAMES, Asset.PROPAGATED_ATLAN_TAGS])
+def test_project_field_not_in_results_raises_error(client, field):
+    search = FluentSearch().where(Table.NAME.startswith("table"))
+
+    with pytest.raises(
+        InvalidRequestError, match=ErrorCode.UNABLE_TO_PROJECT_FIELD.error_id
+    ):
+        search.project(client, Asset.GUID, field)
+    client.asset._client._call_api.assert_not_called()
+    with pytest.raises(
+        InvalidRequestError, match=ErrorCode.UNABLE_TO_PROJECT_FIELD.error_id
+    ):
+        LazyAsset(entity(1)).raw_value(field)
+
+
+def test_project_internal_fields_from_their_own_keys(client):
+    def page_with_tags(api, request_obj):
+        page = page_for(api, request_obj)
+        for raw in page["entities"]:
+            raw.update(status="ACTIVE", classificationNames=["PII"])
+        return page
+
+    client.asset._client._call_api.side_effect = page_with_tags
+    search = FluentSearch().where(Table.NAME.startswith("table"))
+
+    rows = list(search.project(client, Asset.ATLAN_TAGS, Asset.STATUS, Asset.NAME))
+
+    assert rows[0] == (["PII"], "ACTIVE", "table-0")
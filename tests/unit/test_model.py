@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 Atlan Pte. Ltd.
 import json
+import subprocess
+import sys
 from datetime import datetime
 from inspect import signature
 from pathlib import Path
@@ -150,6 +152,7 @@ from pyatlan.model.assets import (
     ThoughtspotDashlet,
     ThoughtspotLiveboard,
     View,
+    load_all,
 )
 from pyatlan.model.constants import DELETED_
 from pyatlan.model.core import Announcement
@@ -502,6 +505,8 @@ def load_json(filename):
 
 
 def get_all_subclasses(cls):
+    # Asset types are imported lazily, so import all of them to find every subclass
+    load_all()
     all_subclasses = []
 
     for subclass in cls.__subclasses__():
@@ -881,15 +886,13 @@ def test_atlan_tag_names(monkeypatch):
     tag_name = "Issue"
     tag_id = "123"
 
-    def get_name_for_id(value):
-        if value == tag_id:
-            return tag_name
-        return ""
+    def get_names_for_ids(values):
+        return {value: tag_name if value == tag_id else None for value in values}
 
     monkeypatch.setattr(
         pyatlan.cache.atlan_tag_cache.AtlanTagCache,
-        "get_name_for_id",
-        get_name_for_id,
+        "get_names_for_ids",
+        get_names_for_ids,
     )
 
     referenceable = Referenceable()
@@ -905,3 +908,44 @@ def test_create_for_modification_on_asset_raises_exception():
         "class. Please invoke on a specific asset type",
     ):
         Asset.create_for_modification(qualified_name="", name="")
+
+
+LAZY_IMPORT_SCRIPT = """
+import sys
+
+import pyatlan.model.assets as assets
+from pyatlan.model.assets import Asset
+
+assert "pyatlan.model.assets.s3_bucket" not in sys.modules
+assert "pyatlan.model.assets.s3_object" not in sys.modules
+
+bucket = Asset._convert_to_real_type_(
+    {
+        "typeName": "S3Bucket",
+        "attributes": {"qualifiedName": "q", "objects": [{"typeName": "S3Object"}]},
+    }
+)
+assert type(bucket) is assets.S3Bucket
+assert type(bucket.objects[0]) is assets.S3Object
+assert "S3Bucket" in vars(assets)
+
+from pyatlan.model.assets.tableau_project import TableauProject
+
+project = TableauProject(attributes={"workbooks": [{"typeName": "TableauWorkbook"}]})
+assert type(project.workbooks[0]) is assets.TableauWorkbook
+"""
+
+
+def test_asset_types_are_imported_lazily():
+    # Run in a new interpreter, as this one has already imported every asset type
+    result = subprocess.run(
+        [sys.executable, "-c", LAZY_IMPORT_SCRIPT], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_unknown_asset_type_raises_attribute_error():
+    import pyatlan.model.assets
+
+    with pytest.raises(AttributeError):
+        pyatlan.model.assets.NotAnAssetType
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2022 Atlan Pte. Ltd.
+import gzip
+import json
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import Response
+from urllib3 import HTTPResponse
+
+from pyatlan.client.atlan import AtlanClient
+from pyatlan.client.constants import INDEX_SEARCH
+from pyatlan.client.streaming import JsonObjectStream
+from pyatlan.errors import ApiError, ErrorCode
+from pyatlan.model.assets import Table
+from pyatlan.model.fluent_search import FluentSearch
+
+DOCUMENT = {
+    "queryType": "INDEX",
+    "searchParameters": {"attributes": ["name", "ünïcödé"], "nested": [[1], {}]},
+    "entities": [
+        {"guid": f"guid-{i}", "name": "é" * i, "count": 1234567890, "ok": i % 2 == 0}
+        for i in range(20)
+    ],
+    "approximateCount": 98765,
+    "aggregations": {"type": {"buckets": []}},
+}
+
+
+def chunked(text: str, size: int):
+    raw = text.encode("utf-8")
+    return [raw[i : i + size] for i in range(0, len(raw), size)]  # noqa: E203
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 1000000])
+def test_decodes_items_and_fields(chunk_size):
+    closed = Mock()
+    sut = JsonObjectStream(
+        chunked(json.dumps(DOCUMENT, ensure_ascii=False, indent=1), chunk_size),
+        array_key="entities",
+        on_close=closed,
+    )
+
+    assert sut.has_items()
+    assert sut.fields == {
+        "queryType": "INDEX",
+        "searchParameters": DOCUMENT["searchParameters"],
+    }
+    assert list(sut) == DOCUMENT["entities"]
+    assert sut.fields == {k: v for k, v in DOCUMENT.items() if k != "entities"}
+    assert sut.done
+    closed.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "text, fields",
+    [
+        ("{}", {}),
+        ('{"entities": []}', {}),
+        ('{"approximateCount": 0}', {"approximateCount": 0}),
+        ('{"entities": null, "approximateCount": 0}', {"entities": None}),
+    ],
+)
+def test_without_items(text, fields):
+    sut = JsonObjectStream(chunked(text, 3), array_key="entities")
+
+    assert not sut.has_items()
+    assert list(sut) == []
+    assert fields.items() <= sut.fields.items()
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"entities": [{"guid": "a"}, {"gu', '{"entities": [1 2]}', '["entities"]', ""],
+)
+def test_invalid_content_raises_error(text):
+    sut = JsonObjectStream(chunked(text, 4), array_key="entities")
+
+    with pytest.raises(ApiError, match=ErrorCode.JSON_ERROR.error_id):
+        list(sut)
+    assert sut.done
+
+
+def test_close_before_end_releases_source():
+    closed = Mock()
+    sut = JsonObjectStream(
+        chunked(json.dumps(DOCUMENT), 10), array_key="entities", on_close=closed
+    )
+    items = iter(sut)
+    next(items)
+
+    items.close()
+
+    closed.assert_called_once()
+
+
+def test_call_api_streaming_decodes_response_incrementally(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    client = AtlanClient()
+    response = Mock(status_code=INDEX_SEARCH.expected_status)
+    response.iter_content.return_value = chunked(json.dumps(DOCUMENT), 50)
+    request = FluentSearch().where(Table.NAME.eq("test")).to_request()
+
+    with patch.object(client._session, "request", return_value=response) as request_:
+        page = client._call_api_streaming(
+            INDEX_SEARCH, array_key="entities", request_obj=request
+        )
+        assert request_.call_args.kwargs["stream"] is True
+
+    assert isinstance(page, JsonObjectStream)
+    assert list(page) == DOCUMENT["entities"]
+    response.close.assert_called_once()
+
+
+def test_call_api_streaming_decompresses_response_incrementally(monkeypatch):
+    monkeypatch.setenv("ATLAN_BASE_URL", "https://name.atlan.com")
+    monkeypatch.setenv("ATLAN_API_KEY", "abkj")
+    client = AtlanClient()
+    response = Response()
+    response.status_code = INDEX_SEARCH.expected_status
+    response.raw = HTTPResponse(
+        body=BytesIO(gzip.compress(json.dumps(DOCUMENT).encode("utf-8"))),
+        headers={"Content-Encoding": "gzip"},
+        preload_content=False,
+    )
+    request = FluentSearch().where(Table.NAME.eq("test")).to_request()
+
+    with patch.object(client._session, "request", return_value=response):
+        page = client._call_api_streaming(
+            INDEX_SEARCH, array_key="entities", request_obj=request
+        )
+
+    assert list(page) == DOCUMENT["entities"]
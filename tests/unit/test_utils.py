@@ -5,8 +5,10 @@ from unittest.mock import patch
 import pytest
 
 from pyatlan.errors import InvalidRequestError
+from pyatlan.model.search import DSL, IndexSearchRequest, Term
 from pyatlan.utils import (
     ComparisonCategory,
+    CustomMetadataPlan,
     get_base_type,
     is_comparable_type,
     list_attributes_to_params,
@@ -114,6 +116,66 @@ def test_unflatten_custom_metadata_for_entity_when_empty_dict_returned_does_not_
     )
 
 
+@patch("pyatlan.model.custom_metadata.CustomMetadataCache")
+def test_custom_metadata_plan_resolves_names_once(mock_cm_cache):
+    plan = CustomMetadataPlan(
+        ["name", "set1.attr1", "set1.attr2", "set2.attr3", "set1.attr1.extra"]
+    )
+    entities = [
+        {"attributes": {"name": "dave"}},
+        {"attributes": {"set1.attr1": 1, "set2.attr3": "a"}},
+        {"attributes": {"set1.attr2": 2}},
+    ]
+
+    assert plan.targets == [
+        ("set1.attr1", "set1", "attr1"),
+        ("set1.attr2", "set1", "attr2"),
+        ("set2.attr3", "set2", "attr3"),
+        ("set1.attr1.extra", "set1", "attr1"),
+    ]
+    for entity in entities:
+        plan.apply(entity)
+
+    assert "businessAttributes" not in entities[0]
+    assert entities[1]["businessAttributes"] == {
+        "set1": {"attr1": 1},
+        "set2": {"attr3": "a"},
+    }
+    assert entities[2]["businessAttributes"] == {"set1": {"attr2": 2}}
+    mock_cm_cache.get_names_for_ids.assert_called_once()
+    assert set(mock_cm_cache.get_names_for_ids.call_args[0][0]) == {"set1", "set2"}
+    assert mock_cm_cache.get_attr_names_for_ids.call_count == 2
+    mock_cm_cache.get_attr_names_for_ids.assert_any_call(
+        "set1", ["attr1", "attr2", "attr1"]
+    )
+    mock_cm_cache.get_attr_names_for_ids.assert_any_call("set2", ["attr3"])
+
+
+@patch("pyatlan.model.custom_metadata.CustomMetadataCache")
+def test_custom_metadata_plan_does_not_resolve_without_custom_metadata(
+    mock_cm_cache,
+):
+    plan = CustomMetadataPlan(["name", "set1.attr1"])
+
+    plan.apply({"attributes": {"name": "dave"}})
+
+    mock_cm_cache.get_names_for_ids.assert_not_called()
+    mock_cm_cache.get_attr_names_for_ids.assert_not_called()
+
+
+def test_search_request_reuses_custom_metadata_plan():
+    request = IndexSearchRequest(
+        dsl=DSL(query=Term.with_state("ACTIVE")), attributes=["name", "set1.attr1"]
+    )
+
+    plan = request.custom_metadata_plan
+
+    assert request.custom_metadata_plan is plan
+    request.attributes = ["set2.attr2"]
+    assert request.custom_metadata_plan is not plan
+    assert request.custom_metadata_plan.targets == [("set2.attr2", "set2", "attr2")]
+
+
 @pytest.mark.parametrize("entity", [({"attributes": {"name": "dave"}}), ({})])
 @patch("pyatlan.utils.unflatten_custom_metadata")
 def test_unflatten_custom_metadata_for_entity_when_none_returned_does_not_modify(